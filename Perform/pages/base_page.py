@@ -6,14 +6,31 @@ from datetime import datetime # Importa la clase datetime para trabajar con fech
 import os # Importa el módulo os para interactuar con el sistema operativo (rutas de archivos, directorios)
 from typing import List, Dict, Union, Callable, Tuple, Optional, Any # Importa tipos para mejorar la legibilidad y validación del código
 from Perform.utils.config import LOGGER_DIR # Importa la ruta del directorio de logs desde config.py
+from Perform.utils.config import ESPERAS_FIJAS_HABILITADAS, POSTCONDICION_TIMEOUT_MS, DOM_ESTABLE_QUIETUD_MS # Configuración del motor de esperas por postcondición
+from Perform.utils.config import CAPTURAS_FORMATO, CAPTURAS_CALIDAD, CAPTURAS_ESCALA, CAPTURAS_RECORTE_ELEMENTO, CAPTURAS_RECORTE_TIMEOUT_MS # Formato y recorte de las capturas
 from Perform.utils.logger import setup_logger # Importa la función setup_logger desde logger.py
+from Perform.utils.excel_cache import cache_workbooks, iterar_filas_hoja, normalizar_encabezado # Caché LRU y lectura en streaming de libros Excel
+from Perform.utils.csv_index import cache_indices_csv # Índice de desplazamientos por fila para archivos CSV
+from Perform.utils.xml_stream import iterar_registros_xml # Lectura incremental de registros XML con iterparse
+from Perform.utils.json_stream import iterar_registros_json, contar_registros_json # Lectura en streaming de arrays JSON y NDJSON
+from Perform.utils.data_source import DataSource # Tabla columnar unificada con caché binaria mapeada en memoria
+from Perform.utils.wait_budget import contabilidad_esperas, CATEGORIA_ESPERA_FIJA, CATEGORIA_AUTO_ESPERA, CATEGORIA_CAPTURA # Presupuesto de esperas por test y por método
+from Perform.utils.column_validation import extraer_columna, validar_columna_numerica as validar_valores_columna # Validación de columnas numéricas en bloque
+from Perform.utils.table_index import cache_indices_tabla # Índices de búsqueda por tabla, invalidados al cambiar su contenido
+from Perform.utils.table_snapshot import TableSnapshot # Instantánea de tablas extraída en una sola llamada, con diff por hash
+from Perform.utils.table_pagination import recorrer_tabla_paginada # Lectura completa de tablas paginadas (API de DataTables o recorrido en el navegador)
+from Perform.utils.evidence import politica_capturas # Política de evidencias y escritura de capturas en segundo plano
 import logging # Importa el módulo logging para configurar y usar loggers
-import openpyxl # Librería para hacer uso del excel (para archivos .xlsx)
 import csv # Importa la librería csv para manejar archivos CSV (para archivos .csv)
 import json # Importa la librería json para manejar archivos JSON
 import xml.etree.ElementTree as ET # Importa el módulo para trabajar con XML
 import math
 
+# Las aserciones 'expect' se contabilizan como auto-espera en el presupuesto de esperas (wait_budget).
+expect = contabilidad_esperas.envolver_expect(expect)
+# Las acciones de Locator (click, fill, check...) esperan la accionabilidad del elemento: también cuentan como auto-espera.
+contabilidad_esperas.instrumentar_acciones(Locator)
+
 class Funciones_Globales:
     
     #1- Creamos una función incial 'Constructor'-----ES IMPORTANTE TENER ESTE INICIADOR-----
@@ -53,24 +70,66 @@ class Funciones_Globales:
         return f"{timestamp}_{prefijo}"
     
     #3- Función para tomar captura de pantalla
-    def tomar_captura(self, nombre_base, directorio):
+    def tomar_captura(self, nombre_base, directorio, elemento: Optional[Locator] = None, formato: Optional[str] = None,
+                      calidad: Optional[int] = None, escala: Optional[str] = None, fallo: bool = False):
         """
         Toma una captura de pantalla de la página y la guarda en el directorio especificado.
         Por defecto, usa SCREENSHOT_DIR de config.py.
 
+        Solo la obtención de la imagen ocurre en el hilo del test: la escritura a disco la realiza
+        en segundo plano `escritor_capturas`, que se vacía en el teardown de los fixtures.
+        Qué capturas se toman y se guardan lo decide `config.CAPTURAS_POLITICA` ('always', 'on_failure'
+        o 'last_N') según `fallo`: con 'on_failure' solo se toman las capturas con `fallo=True` y con 'last_N'
+        las capturas de pasos correctos solo se escriben si después hay una captura con `fallo=True` o falla el test.
+        Con `config.CAPTURAS_DEDUPLICADAS` la imagen se guarda por contenido en '<directorio>/blobs/' y el
+        nombre con fecha queda registrado en '<directorio>/manifest.jsonl' apuntando a su blob.
+
+        El formato, la calidad y la escala se toman de config.py (`CAPTURAS_FORMATO`, `CAPTURAS_CALIDAD`,
+        `CAPTURAS_ESCALA`) salvo que se indiquen en la llamada. Si se pasa `elemento` y está activo
+        `CAPTURAS_RECORTE_ELEMENTO`, las capturas de pasos correctos se recortan a ese elemento.
+
         Args:
             nombre_base (str): El nombre base para el archivo de la captura de pantalla.
             directorio (str): El directorio donde se guardará la captura. Por defecto, SCREENSHOT_DIR.
+            elemento (Optional[Locator]): Elemento sobre el que actúa el paso, para recortar la captura.
+            formato (Optional[str]): 'png' o 'jpeg'. Por defecto, `CAPTURAS_FORMATO`.
+            calidad (Optional[int]): Calidad JPEG (0-100). Por defecto, `CAPTURAS_CALIDAD`.
+            escala (Optional[str]): 'css' o 'device'. Por defecto, `CAPTURAS_ESCALA`. Solo reduce la resolución
+                en perfiles con `device_scale_factor` mayor que 1 (los móviles emulados), no en escritorio.
+            fallo (bool): `True` si la captura documenta un paso fallido (rutas de error y bloques `except`).
+                Las capturas de fallo nunca se recortan al elemento.
         """
         try:
+            if not politica_capturas.debe_capturar(fallo):
+                self.logger.debug(f"Captura '{nombre_base}' omitida por la política de capturas '{politica_capturas.politica}'.")
+                return
+
             if not os.path.exists(directorio):
                 os.makedirs(directorio)
                 self.logger.info(f"\n Directorio creado para capturas de pantalla: {directorio}") #
 
+            formato = formato or CAPTURAS_FORMATO
+            opciones = {"type": formato, "scale": escala or CAPTURAS_ESCALA}
+            if formato == "jpeg":
+                opciones["quality"] = CAPTURAS_CALIDAD if calidad is None else calidad
             nombre_archivo = self._generar_nombre_archivo_con_timestamp(nombre_base) #
-            ruta_completa = os.path.join(directorio, f"{nombre_archivo}.png") # Cambiado a .png para mejor calidad
-            self.page.screenshot(path=ruta_completa) #
-            self.logger.info(f"\n 📸 Captura de pantalla guardada en: {ruta_completa}") #
+            ruta_completa = os.path.join(directorio, f"{nombre_archivo}.{'jpg' if formato == 'jpeg' else 'png'}")
+            with contabilidad_esperas.medir(CATEGORIA_CAPTURA):
+                datos_captura = None
+                if elemento is not None and CAPTURAS_RECORTE_ELEMENTO and not fallo:
+                    try:
+                        # is_visible no espera: si el elemento ya no está (p. ej. un modal cerrado) se captura la página.
+                        if elemento.is_visible():
+                            datos_captura = elemento.screenshot(timeout=CAPTURAS_RECORTE_TIMEOUT_MS, **opciones)
+                    except Error:
+                        datos_captura = None
+                if datos_captura is None:
+                    datos_captura = self.page.screenshot(**opciones) # Solo bytes: la escritura a disco se delega al hilo escritor
+                encolada = politica_capturas.registrar(ruta_completa, datos_captura, fallo)
+            if encolada:
+                self.logger.info(f"\n 📸 Captura de pantalla encolada para guardarse en: {ruta_completa}") #
+            else:
+                self.logger.debug(f"📸 Captura '{nombre_base}' retenida en memoria (política '{politica_capturas.politica}').")
         except Exception as e:
             self.logger.error(f"\n ❌ Error al tomar captura de pantalla '{nombre_base}': {e}") #
         
@@ -85,13 +144,61 @@ class Funciones_Globales:
         """
         self.logger.debug(f"\n Esperando fijo por {tiempo} segundos...") #
         try:
-            time.sleep(tiempo) #
+            with contabilidad_esperas.medir(CATEGORIA_ESPERA_FIJA):
+                time.sleep(tiempo) #
             self.logger.info(f"Espera fija de {tiempo} segundos completada.") #
         except TypeError:
             self.logger.error(f"\n ❌ Error: El tiempo de espera debe ser un número. Se recibió: {tiempo}") #
         except Exception as e:
             self.logger.error(f"\n ❌ Ocurrió un error inesperado durante la espera fija: {e}") #
         
+    #4.1- Función interna que aplica la pausa de observación posterior a una acción.
+    # Es solo una pausa visual opcional (ESPERAS_FIJAS_HABILITADAS): la sincronización con la página se hace
+    # con postcondiciones (_exigir_postcondicion, expect), nunca con esta pausa.
+    def _espera_post_accion(self, tiempo: Union[int, float] = 0):
+        """
+        Aplica la pausa de observación posterior a una acción. Nunca lanza excepciones, ya que se usa en bloques `finally`.
+
+        Args:
+            tiempo (Union[int, float]): Pausa en segundos (solo si `ESPERAS_FIJAS_HABILITADAS`).
+        """
+        try:
+            if ESPERAS_FIJAS_HABILITADAS and tiempo and tiempo > 0:
+                self.esperar_fijo(tiempo)
+            elif tiempo and tiempo > 0:
+                self.logger.debug(f"Espera fija de {tiempo} segundos omitida (ESPERAS_FIJAS_HABILITADAS=False).")
+        except Exception as e:
+            self.logger.warning(f"\n⚠️ No se pudo aplicar la espera posterior a la acción: {e}")
+
+    #4.2- Función interna que exige la postcondición declarada por una acción.
+    # Se llama solo cuando la acción terminó sin errores: si la postcondición no se cumple, el paso falla.
+    def _exigir_postcondicion(self, postcondicion: Any, nombre_base: str, directorio: str, nombre_paso: str = "") -> None:
+        """
+        Espera a que se cumpla `postcondicion` (ver `esperar_postcondicion`). Si es `None`, no hace nada.
+
+        Raises:
+            AssertionError: Si la postcondición no se cumple dentro de `POSTCONDICION_TIMEOUT_MS`.
+        """
+        if postcondicion is None:
+            return
+        if not self.esperar_postcondicion(postcondicion, nombre_paso=nombre_paso):
+            self.logger.error(f"\n❌ {nombre_paso}: La postcondición '{postcondicion}' no se cumplió tras la acción.")
+            self.tomar_captura(f"{nombre_base}_postcondicion_no_cumplida", directorio, fallo=True)
+            raise AssertionError(f"\nLa postcondición '{postcondicion}' no se cumplió en {POSTCONDICION_TIMEOUT_MS} ms.")
+
+    #4.3- Función interna que espera (con reintentos) a que un checkbox quede en el estado indicado.
+    def _checkbox_en_estado(self, checkbox: Locator, marcado: bool, timeout_ms: Optional[int] = None) -> bool:
+        """
+        Returns:
+            bool: `True` si el checkbox alcanzó el estado `marcado` dentro del tiempo máximo
+                  (por defecto `POSTCONDICION_TIMEOUT_MS`), `False` en caso contrario.
+        """
+        try:
+            expect(checkbox).to_be_checked(checked=marcado, timeout=POSTCONDICION_TIMEOUT_MS if timeout_ms is None else timeout_ms)
+            return True
+        except AssertionError:
+            return False
+
     #5- Función para indicar el tiempo que se tardará en hacer el scroll
     def scroll_pagina(self, horz, vert, tiempo: Union[int, float] = 0.5):
         """
@@ -112,7 +219,7 @@ class Funciones_Globales:
             duration_scroll_action = end_time_scroll_action - start_time_scroll_action
             self.logger.info(f"PERFORMANCE: Duración de la acción de scroll (Playwright API): {duration_scroll_action:.4f} segundos.")
             
-            self.esperar_fijo(tiempo) # Reutiliza la función esperar_fijo para el log y manejo de errores
+            self._espera_post_accion(tiempo) # Espera fija opcional tras el scroll (ver ESPERAS_FIJAS_HABILITADAS)
             self.logger.info(f"Scroll completado (H: {horz}, V: {vert}).") #
         except Exception as e:
             self.logger.error(f"❌ Error al realizar scroll en la página: {e}") #
@@ -187,7 +294,7 @@ class Funciones_Globales:
             # o si el siguiente paso en la prueba requiere un breve momento después
             # de la aparición del elemento. Considera si esta espera es estrictamente
             # necesaria para la lógica de la prueba o si es solo para observación.
-            self.esperar_fijo(tiempo) 
+            self._espera_post_accion(tiempo) 
 
             return True
 
@@ -202,7 +309,7 @@ class Funciones_Globales:
             )
             self.logger.warning(error_msg)
             # Toma una captura de pantalla en caso de timeout para depuración.
-            self.tomar_captura(f"{nombre_base}_NO_visible_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_NO_visible_timeout", directorio, fallo=True)
             return False
 
         except Error as e:
@@ -214,7 +321,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # exc_info=True para incluir la traza completa.
             # Toma una captura de pantalla para el error de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright", directorio, fallo=True)
             raise # Re-lanza la excepción para asegurar que la prueba falle.
 
         except Exception as e:
@@ -225,7 +332,7 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa critical para errores graves y exc_info.
             # Toma una captura para errores inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
@@ -297,7 +404,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla en caso de fallo por timeout para depuración.
-            self.tomar_captura(f"{nombre_base}_fallo_no_visible_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_no_visible_timeout", directorio, fallo=True)
             raise # Re-lanza la excepción para que la prueba falle.
 
         except AssertionError as e:
@@ -308,7 +415,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_no_visible_assertion", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_no_visible_assertion", directorio, fallo=True)
             raise # Re-lanza la excepción para que la prueba falle.
             
         except Error as e:
@@ -319,7 +426,7 @@ class Funciones_Globales:
                 f"Posibles causas: Selector inválido, problema de contexto de la página. Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_no_visible", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_no_visible", directorio, fallo=True)
             raise # Re-lanza la excepción para que la prueba falle.
 
         except Exception as e:
@@ -329,7 +436,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_no_visible", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_no_visible", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
@@ -420,7 +527,7 @@ class Funciones_Globales:
             # Realiza una **espera fija** después de la verificación. Esto puede ser útil para
             # propósitos de sincronización con el siguiente paso de la prueba o para permitir
             # una observación visual si la prueba se ejecuta en modo interactivo.
-            self.esperar_fijo(tiempo)
+            self._espera_post_accion(tiempo)
 
         except TimeoutError as e:
             # Este bloque se ejecuta si el elemento no se hizo visible O no contenía el texto esperado
@@ -434,7 +541,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout para depuración.
-            self.tomar_captura(f"{nombre_base}_fallo_verificacion_texto_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_verificacion_texto_timeout", directorio, fallo=True)
             raise # Re-lanza la excepción para asegurar que la prueba falle.
 
         except AssertionError as e:
@@ -446,7 +553,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.tomar_captura(f"{nombre_base}_fallo_verificacion_texto_contenido", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_verificacion_texto_contenido", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         except Error as e:
@@ -458,7 +565,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_verificacion_texto", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_verificacion_texto", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -470,11 +577,11 @@ class Funciones_Globales:
             # Usa `critical` para errores graves e `exc_info=True` para incluir la traza completa.
             self.logger.critical(error_msg, exc_info=True)
             # Toma una captura para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_verificacion_texto", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_verificacion_texto", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
     # 9- Función para rellenar campo de texto, tomar capturas y medir rendimiento
-    def rellenar_campo_de_texto(self, selector: Union[str, Page.locator], texto, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
+    def rellenar_campo_de_texto(self, selector: Union[str, Page.locator], texto, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5, postcondicion: Any = None):
         """
         Rellena un campo de texto con el valor especificado y toma capturas de pantalla
         en puntos clave de la operación. Esta función incluye una **medición de rendimiento**
@@ -493,6 +600,11 @@ class Funciones_Globales:
                                         después de rellenar el campo. Es útil para pausas visuales
                                         o para permitir que la interfaz de usuario (UI) reaccione
                                         antes de la siguiente acción. Por defecto, `0.5` segundos.
+            postcondicion (Any, opcional): Postcondición que debe cumplirse tras la acción (ver `esperar_postcondicion`):
+                                           un Locator que debe quedar visible, "red_inactiva", "dom_estable",
+                                           "pagina_cargada", "dom_cargado" o una función que devuelva `True`.
+                                           Si se indica, sustituye a la espera fija `tiempo` y, si no se cumple, el paso
+                                           falla con `AssertionError`. Por defecto `None`.
 
         Raises:
             TimeoutError: Si la operación de `.fill()` excede el tiempo de espera, lo que indica
@@ -515,7 +627,7 @@ class Funciones_Globales:
             # excelente durante la ejecución de la prueba o el debugging.
             locator.highlight()
             # Toma una captura de pantalla del estado del campo *antes* de introducir el texto.
-            self.tomar_captura(f"{nombre_base}_antes_de_rellenar_texto", directorio)
+            self.tomar_captura(f"{nombre_base}_antes_de_rellenar_texto", directorio, elemento=locator)
 
             # --- Medición de rendimiento: Inicio de la operación de rellenado ---
             # Registra el momento exacto en que comenzamos la operación de 'fill'.
@@ -538,7 +650,7 @@ class Funciones_Globales:
             self.logger.info(f"\n✔ ÉXITO: Campo '{selector}' rellenado con éxito con el texto: '{texto}'.")
 
             # Toma una captura de pantalla del estado del campo *después* de introducir el texto.
-            self.tomar_captura(f"{nombre_base}_despues_de_rellenar_texto", directorio)
+            self.tomar_captura(f"{nombre_base}_despues_de_rellenar_texto", directorio, elemento=locator)
 
         except TimeoutError as e:
             # Este bloque se ejecuta si la operación `locator.fill()` no pudo completarse
@@ -551,7 +663,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa para depuración.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_error_timeout_rellenar", directorio)
+            self.tomar_captura(f"{nombre_base}_error_timeout_rellenar", directorio, fallo=True)
             # Re-lanza la excepción como un Error de Playwright para mantener la coherencia en el manejo de errores.
             raise Error(error_msg) from e
 
@@ -565,7 +677,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_rellenar", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_rellenar", directorio, fallo=True)
             raise # Re-lanza la excepción para que la prueba se marque como fallida.
 
         except Exception as e:
@@ -577,16 +689,19 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel 'critical' para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_rellenar", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_rellenar", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # El bloque `finally` se ejecuta siempre, independientemente de si la operación fue exitosa
             # o si se produjo una excepción.
-            # Aplica una espera fija después de la operación. Esta espera es útil para permitir
+            # Sin postcondición declarada, aplica la pausa de observación opcional. Esta espera es útil para permitir
             # que la UI se actualice completamente o para propósitos de observación visual.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            if postcondicion is None:
+                self._espera_post_accion(tiempo)
+
+        # La postcondición declarada se exige solo si la acción terminó sin errores: si no se cumple, el paso falla.
+        self._exigir_postcondicion(postcondicion, nombre_base, directorio)
 
     # 10- Función para rellenar campo numérico positivo y hacer captura de la imagen con medición de rendimiento
     def rellenar_campo_numerico_positivo(self, selector: Union[str, Page.locator], valor_numerico: Union[int, float], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
@@ -623,14 +738,14 @@ class Funciones_Globales:
         if not isinstance(valor_numerico, (int, float)):
             error_msg = f"\n❌ ERROR: El valor proporcionado '{valor_numerico}' no es un tipo numérico (int o float) válido."
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_valor_no_numerico", directorio)
+            self.tomar_captura(f"{nombre_base}_error_valor_no_numerico", directorio, fallo=True)
             raise ValueError(error_msg)
 
         # 2. Valida que el 'valor_numerico' sea positivo (mayor o igual a cero).
         if valor_numerico < 0:
             error_msg = f"\n❌ ERROR: El valor numérico '{valor_numerico}' no es positivo. Se esperaba un número mayor o igual a cero."
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_valor_negativo", directorio)
+            self.tomar_captura(f"{nombre_base}_error_valor_negativo", directorio, fallo=True)
             raise ValueError(error_msg)
 
         # Convierte el valor numérico a una cadena para poder rellenar el campo de texto.
@@ -645,7 +760,7 @@ class Funciones_Globales:
         else:
             error_msg = f"\n❌ ERROR: El selector proporcionado '{type(selector)}' no es una cadena ni un objeto Locator válido."
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_tipo_selector_numerico", directorio)
+            self.tomar_captura(f"{nombre_base}_error_tipo_selector_numerico", directorio, fallo=True)
             raise TypeError(error_msg)
 
         try:
@@ -688,7 +803,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_error_timeout_numerico", directorio)
+            self.tomar_captura(f"{nombre_base}_error_timeout_numerico", directorio, fallo=True)
             # Re-lanza la excepción como un Error de Playwright para mantener la coherencia.
             raise Error(error_msg) from e
 
@@ -702,7 +817,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_numerico", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_numerico", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -713,16 +828,15 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_numerico", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_numerico", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esta espera es útil para
+            # Aplica la espera posterior a la operación (postcondición declarada o espera fija opcional). Esta espera es útil para
             # observar los cambios en la UI o para dar tiempo a la aplicación a procesar
             # la entrada antes de la siguiente acción de la prueba.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            self._espera_post_accion(tiempo)
                 
     # 11- Función para validar el título de una página con medición de rendimiento
     def validar_titulo_de_web(self, titulo_esperado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
@@ -783,7 +897,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_fallo_titulo_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_titulo_timeout", directorio, fallo=True)
             raise # Re-lanza la excepción para que la prueba falle.
 
         except AssertionError as e:
@@ -795,7 +909,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.tomar_captura(f"{nombre_base}_fallo_titulo_no_coincide", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_titulo_no_coincide", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -806,7 +920,7 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura para errores inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_titulo", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_titulo", directorio, fallo=True)
             raise # Re-lanza la excepción.
         
     # 12- Función para validar URL actual con medición de rendimiento
@@ -903,7 +1017,7 @@ class Funciones_Globales:
             raise # Re-lanza la excepción.
         
     # 13- Función para hacer click en un elemento, con capturas y medición de rendimiento
-    def hacer_click_en_elemento(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, texto_esperado: str = None, tiempo: Union[int, float] = 0.5):
+    def hacer_click_en_elemento(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, texto_esperado: str = None, tiempo: Union[int, float] = 0.5, postcondicion: Any = None):
         """
         Realiza un click en un elemento de la página web. La función incluye
         validaciones opcionales del texto del elemento, toma capturas de pantalla
@@ -926,6 +1040,11 @@ class Funciones_Globales:
                                         elemento esté clicable y para la aserción de texto (si aplica).
                                         También es el tiempo de espera fijo después del clic.
                                         Por defecto, `5.0` segundos.
+            postcondicion (Any, opcional): Postcondición que debe cumplirse tras la acción (ver `esperar_postcondicion`):
+                                           un Locator que debe quedar visible, "red_inactiva", "dom_estable",
+                                           "pagina_cargada", "dom_cargado" o una función que devuelva `True`.
+                                           Si se indica, sustituye a la espera fija `tiempo` y, si no se cumple, el paso
+                                           falla con `AssertionError`. Por defecto `None`.
 
         Raises:
             TimeoutError: Si el elemento no está visible, habilitado o clicable a tiempo,
@@ -945,7 +1064,7 @@ class Funciones_Globales:
             # Resalta visualmente el elemento en el navegador. Útil para depuración y visualización.
             locator.highlight()
             # Toma una captura de pantalla del estado de la página *antes* de realizar el clic.
-            self.tomar_captura(f"{nombre_base}_antes_click", directorio)
+            self.tomar_captura(f"{nombre_base}_antes_click", directorio, elemento=locator)
 
             # Si se proporciona 'texto_esperado', valida que el elemento contenga ese texto.
             # Esta aserción también espera a que el texto esté presente.
@@ -979,7 +1098,7 @@ class Funciones_Globales:
 
             self.logger.info(f"\n✔ ÉXITO: Click realizado exitosamente en el elemento con selector '{selector}'.")
             # Toma una captura de pantalla del estado de la página *después* de realizar el clic.
-            self.tomar_captura(f"{nombre_base}_despues_click", directorio)
+            self.tomar_captura(f"{nombre_base}_despues_click", directorio, elemento=locator)
 
         except TimeoutError as e:
             # Captura específica para errores de tiempo de espera de Playwright.
@@ -993,7 +1112,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_error_timeout_click", directorio)
+            self.tomar_captura(f"{nombre_base}_error_timeout_click", directorio, fallo=True)
             # Re-lanza la excepción como un Error de Playwright para mantener la coherencia.
             raise Error(error_msg) from e
 
@@ -1007,7 +1126,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_click", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_click", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -1018,19 +1137,22 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_click", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_click", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esta espera es útil para
+            # Sin postcondición declarada, aplica la pausa de observación opcional. Esta espera es útil para
             # observar los cambios en la UI que ocurran después del clic (ej., una navegación,
             # un modal apareciendo) o para dar tiempo a la aplicación a procesar la acción.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            if postcondicion is None:
+                self._espera_post_accion(tiempo)
+
+        # La postcondición declarada se exige solo si la acción terminó sin errores: si no se cumple, el paso falla.
+        self._exigir_postcondicion(postcondicion, nombre_base, directorio)
 
     # 14- Función para hacer doble click en un elemento, con capturas y medición de rendimiento
-    def hacer_doble_click_en_elemento(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, texto_esperado: str = None, tiempo: Union[int, float] = 0.5):
+    def hacer_doble_click_en_elemento(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, texto_esperado: str = None, tiempo: Union[int, float] = 0.5, postcondicion: Any = None):
         """
         Realiza un **doble click** en un elemento de la página web. La función incluye
         validaciones opcionales del texto del elemento, toma capturas de pantalla
@@ -1053,6 +1175,11 @@ class Funciones_Globales:
                                         elemento esté clicable y para la aserción de texto (si aplica).
                                         También es el tiempo de espera fijo después del doble clic.
                                         Por defecto, `5.0` segundos. (Se cambió de 1 a 5 para consistencia)
+            postcondicion (Any, opcional): Postcondición que debe cumplirse tras la acción (ver `esperar_postcondicion`):
+                                           un Locator que debe quedar visible, "red_inactiva", "dom_estable",
+                                           "pagina_cargada", "dom_cargado" o una función que devuelva `True`.
+                                           Si se indica, sustituye a la espera fija `tiempo` y, si no se cumple, el paso
+                                           falla con `AssertionError`. Por defecto `None`.
 
         Raises:
             TimeoutError: Si el elemento no está visible, habilitado o doble-clicable a tiempo,
@@ -1072,7 +1199,7 @@ class Funciones_Globales:
             # Resalta visualmente el elemento en el navegador. Útil para depuración y visualización.
             locator.highlight()
             # Toma una captura de pantalla del estado de la página *antes* de realizar el doble clic.
-            self.tomar_captura(f"{nombre_base}_antes_doble_click", directorio)
+            self.tomar_captura(f"{nombre_base}_antes_doble_click", directorio, elemento=locator)
 
             # Si se proporciona 'texto_esperado', valida que el elemento contenga ese texto.
             # Esta aserción también espera a que el texto esté presente.
@@ -1106,7 +1233,7 @@ class Funciones_Globales:
 
             self.logger.info(f"\n✔ ÉXITO: Doble click realizado exitosamente en el elemento con selector '{selector}'.")
             # Toma una captura de pantalla del estado de la página *después* de realizar el doble clic.
-            self.tomar_captura(f"{nombre_base}_despues_doble_click", directorio)
+            self.tomar_captura(f"{nombre_base}_despues_doble_click", directorio, elemento=locator)
 
         except TimeoutError as e:
             # Captura específica para errores de tiempo de espera de Playwright.
@@ -1120,7 +1247,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_error_timeout_doble_click", directorio)
+            self.tomar_captura(f"{nombre_base}_error_timeout_doble_click", directorio, fallo=True)
             # Re-lanza la excepción como un Error de Playwright para mantener la coherencia.
             raise Error(error_msg) from e
 
@@ -1134,7 +1261,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_doble_click", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_doble_click", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -1145,15 +1272,18 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_doble_click", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_doble_click", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esta espera es útil para
+            # Sin postcondición declarada, aplica la pausa de observación opcional. Esta espera es útil para
             # observar los cambios en la UI que ocurran después del doble clic.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            if postcondicion is None:
+                self._espera_post_accion(tiempo)
+
+        # La postcondición declarada se exige solo si la acción terminó sin errores: si no se cumple, el paso falla.
+        self._exigir_postcondicion(postcondicion, nombre_base, directorio)
                 
     # 15- Función para hacer hover sobre un elemento, con capturas y medición de rendimiento
     def hacer_hover_en_elemento(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
@@ -1228,7 +1358,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_error_timeout_hover", directorio)
+            self.tomar_captura(f"{nombre_base}_error_timeout_hover", directorio, fallo=True)
             # Re-lanza la excepción como un Error de Playwright para mantener la coherencia.
             raise Error(error_msg) from e
 
@@ -1242,7 +1372,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_hover", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_hover", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -1253,15 +1383,14 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_hover", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_hover", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esto es útil para
+            # Aplica la espera posterior a la operación (postcondición declarada o espera fija opcional). Esto es útil para
             # observar los cambios en la UI que puedan activarse por el hover (ej., tooltips, menús).
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            self._espera_post_accion(tiempo)
 
     # 16- Función para verificar si un elemento está habilitado (enabled) con medición de rendimiento
     def verificar_elemento_habilitado(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
@@ -1339,7 +1468,7 @@ class Funciones_Globales:
             )
             self.logger.warning(error_msg) # Usa 'warning' ya que la función devuelve False en lugar de fallar la prueba.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_NO_habilitado_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_NO_habilitado_timeout", directorio, fallo=True)
             return False
 
         except AssertionError as e:
@@ -1353,7 +1482,7 @@ class Funciones_Globales:
             )
             self.logger.warning(error_msg) # Usa 'warning' aquí también.
             # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.tomar_captura(f"{nombre_base}_NO_habilitado_fallo", directorio)
+            self.tomar_captura(f"{nombre_base}_NO_habilitado_fallo", directorio, fallo=True)
             return False
 
         except Error as e:
@@ -1365,7 +1494,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_habilitado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_habilitado", directorio, fallo=True)
             raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
 
         except Exception as e:
@@ -1376,15 +1505,14 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_habilitado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_habilitado", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # El bloque `finally` se ejecuta siempre.
-            # Aplica una espera fija después de la operación. Puede ser útil para observar
+            # Aplica la espera posterior a la operación (postcondición declarada o espera fija opcional). Puede ser útil para observar
             # el estado del elemento o esperar efectos secundarios en la UI.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            self._espera_post_accion(tiempo)
 
     # 17- Función para mover el mouse a coordenadas X, Y y hacer clic, con medición de rendimiento
     def mouse_mueve_y_hace_clic_xy(self, x: int, y: int, nombre_base: str, directorio: str, tiempo: Union[int, float] = 1.0):
@@ -1419,7 +1547,7 @@ class Funciones_Globales:
         if not isinstance(x, int) or not isinstance(y, int):
             error_msg = f"\n❌ ERROR: Las coordenadas X ({x}) e Y ({y}) deben ser números enteros."
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_coordenadas_invalidas", directorio)
+            self.tomar_captura(f"{nombre_base}_error_coordenadas_invalidas", directorio, fallo=True)
             raise ValueError(error_msg)
 
         try:
@@ -1460,7 +1588,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla en el momento del fallo.
-            self.tomar_captura(f"{nombre_base}_error_playwright_mouse_click_xy", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_mouse_click_xy", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         except Exception as e:
@@ -1471,18 +1599,17 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_mouse_click_xy", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_mouse_click_xy", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esto es útil para observar
+            # Aplica la espera posterior a la operación (postcondición declarada o espera fija opcional). Esto es útil para observar
             # los cambios visuales que el clic en las coordenadas pueda haber provocado.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            self._espera_post_accion(tiempo)
 
     # 18- Función para marcar un checkbox, con verificación y medición de rendimiento
-    def marcar_checkbox(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
+    def marcar_checkbox(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5, postcondicion: Any = None):
         """
         Marca un checkbox especificado por su selector y verifica que se haya marcado
         correctamente. Esta función toma capturas de pantalla antes y después de la
@@ -1500,6 +1627,11 @@ class Funciones_Globales:
                                         checkbox sea marcado y para que su estado sea verificado.
                                         También es el tiempo de espera fijo después de la operación.
                                         Por defecto, `5.0` segundos (se ajustó de 0.5 para robustez).
+            postcondicion (Any, opcional): Postcondición que debe cumplirse tras la acción (ver `esperar_postcondicion`):
+                                           un Locator que debe quedar visible, "red_inactiva", "dom_estable",
+                                           "pagina_cargada", "dom_cargado" o una función que devuelva `True`.
+                                           Si se indica, sustituye a la espera fija `tiempo` y, si no se cumple, el paso
+                                           falla con `AssertionError`. Por defecto `None`.
 
         Raises:
             AssertionError: Si el checkbox no puede ser marcado o no se verifica como marcado
@@ -1522,7 +1654,7 @@ class Funciones_Globales:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
             locator.highlight()
             # Toma una captura de pantalla del estado de la página *antes* de marcar el checkbox.
-            self.tomar_captura(f"{nombre_base}_antes_marcar_checkbox", directorio)
+            self.tomar_captura(f"{nombre_base}_antes_marcar_checkbox", directorio, elemento=locator)
             
             # Marca el checkbox. Playwright esperará automáticamente a que sea interactuable.
             locator.check()
@@ -1540,7 +1672,7 @@ class Funciones_Globales:
 
             self.logger.info(f"\n✔ ÉXITO: Checkbox con selector '{selector}' marcado y verificado exitosamente.")
             # Toma una captura de pantalla del estado de la página *después* de marcar el checkbox.
-            self.tomar_captura(f"{nombre_base}_despues_marcar_checkbox", directorio)
+            self.tomar_captura(f"{nombre_base}_despues_marcar_checkbox", directorio, elemento=locator)
 
         except TimeoutError as e:
             # Captura específica para cuando la operación de marcar o la verificación fallan por tiempo.
@@ -1554,7 +1686,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_marcar", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_marcar", directorio, fallo=True)
             # Re-lanza la excepción como un AssertionError para que la prueba falle claramente.
             raise AssertionError(f"\nCheckbox no marcado/verificado (Timeout): {selector}") from e
 
@@ -1566,7 +1698,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_marcar", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_marcar", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright con checkbox: {selector}") from e # Re-lanza.
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -1576,18 +1708,21 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_marcar", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_inesperado_marcar", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esto puede ser útil para
+            # Sin postcondición declarada, aplica la pausa de observación opcional. Esto puede ser útil para
             # observar cualquier cambio adicional en la UI provocado por el cambio de estado del checkbox.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            if postcondicion is None:
+                self._espera_post_accion(tiempo)
+
+        # La postcondición declarada se exige solo si la acción terminó sin errores: si no se cumple, el paso falla.
+        self._exigir_postcondicion(postcondicion, nombre_base, directorio)
 
     # 19- Función para desmarcar un checkbox, con verificación y medición de rendimiento
-    def desmarcar_checkbox(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5):
+    def desmarcar_checkbox(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5, postcondicion: Any = None):
         """
         Desmarca un checkbox especificado por su selector y verifica que se haya desmarcado
         correctamente. Esta función toma capturas de pantalla antes y después de la acción,
@@ -1605,6 +1740,11 @@ class Funciones_Globales:
                                         checkbox sea desmarcado y para que su estado sea verificado.
                                         También es el tiempo de espera fijo después de la operación.
                                         Por defecto, `5.0` segundos (se ajustó de 0.5 para robustez).
+            postcondicion (Any, opcional): Postcondición que debe cumplirse tras la acción (ver `esperar_postcondicion`):
+                                           un Locator que debe quedar visible, "red_inactiva", "dom_estable",
+                                           "pagina_cargada", "dom_cargado" o una función que devuelva `True`.
+                                           Si se indica, sustituye a la espera fija `tiempo` y, si no se cumple, el paso
+                                           falla con `AssertionError`. Por defecto `None`.
 
         Raises:
             AssertionError: Si el checkbox no puede ser desmarcado o no se verifica como desmarcado
@@ -1627,7 +1767,7 @@ class Funciones_Globales:
             # Resalta visualmente el elemento en el navegador. Útil para depuración.
             locator.highlight()
             # Toma una captura de pantalla del estado de la página *antes* de desmarcar el checkbox.
-            self.tomar_captura(f"{nombre_base}_antes_desmarcar_checkbox", directorio)
+            self.tomar_captura(f"{nombre_base}_antes_desmarcar_checkbox", directorio, elemento=locator)
             
             # Desmarca el checkbox. Playwright esperará automáticamente a que sea interactuable.
             locator.uncheck()
@@ -1645,7 +1785,7 @@ class Funciones_Globales:
 
             self.logger.info(f"\n✔ ÉXITO: Checkbox con selector '{selector}' desmarcado y verificado exitosamente.")
             # Toma una captura de pantalla del estado de la página *después* de desmarcar el checkbox.
-            self.tomar_captura(f"{nombre_base}_despues_desmarcar_checkbox", directorio)
+            self.tomar_captura(f"{nombre_base}_despues_desmarcar_checkbox", directorio, elemento=locator)
 
         except TimeoutError as e:
             # Captura específica para cuando la operación de desmarcar o la verificación fallan por tiempo.
@@ -1659,7 +1799,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_desmarcar", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_desmarcar", directorio, fallo=True)
             # Re-lanza la excepción como un AssertionError para que la prueba falle claramente.
             raise AssertionError(f"\nCheckbox no desmarcado/verificado (Timeout): {selector}") from e
 
@@ -1671,7 +1811,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True)
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_desmarcar", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_desmarcar", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright con checkbox: {selector}") from e # Re-lanza.
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -1681,15 +1821,18 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_desmarcar", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_inesperado_desmarcar", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija después de la operación. Esto puede ser útil para
+            # Sin postcondición declarada, aplica la pausa de observación opcional. Esto puede ser útil para
             # observar cualquier cambio adicional en la UI provocado por el cambio de estado del checkbox.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            if postcondicion is None:
+                self._espera_post_accion(tiempo)
+
+        # La postcondición declarada se exige solo si la acción terminó sin errores: si no se cumple, el paso falla.
+        self._exigir_postcondicion(postcondicion, nombre_base, directorio)
                 
     # 20- Función para verificar el valor de un campo de texto con medición de rendimiento
     def verificar_valor_campo(self, selector: Union[str, Page.locator], valor_esperado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
@@ -1777,7 +1920,7 @@ class Funciones_Globales:
             )
             self.logger.warning(error_msg) # Usa 'warning' ya que la función devuelve False.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_campo", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_campo", directorio, fallo=True)
             return False
 
         except AssertionError as e:
@@ -1794,7 +1937,7 @@ class Funciones_Globales:
             )
             self.logger.warning(error_msg) # Usa 'warning' aquí también.
             # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.tomar_captura(f"{nombre_base}_fallo_verificar_valor_campo", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_verificar_valor_campo", directorio, fallo=True)
             return False
 
         except Error as e:
@@ -1806,7 +1949,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_campo", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_campo", directorio, fallo=True)
             raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
 
         except Exception as e:
@@ -1817,15 +1960,14 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_campo", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_campo", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # El bloque `finally` se ejecuta siempre.
-            # Aplica una espera fija después de la operación. Puede ser útil para observar
+            # Aplica la espera posterior a la operación (postcondición declarada o espera fija opcional). Puede ser útil para observar
             # el estado del elemento o esperar efectos secundarios en la UI.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            self._espera_post_accion(tiempo)
 
     # 21- Función para verificar el valor de un campo numérico (entero) con medición de rendimiento
     def verificar_valor_campo_numerico_int(self, selector: Union[str, Page.locator], valor_numerico_esperado: int, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
@@ -1871,7 +2013,7 @@ class Funciones_Globales:
                 f"pero se recibió un tipo: {type(valor_numerico_esperado).__name__} con valor '{valor_numerico_esperado}'."
             )
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_tipo_valor_int", directorio)
+            self.tomar_captura(f"{nombre_base}_error_tipo_valor_int", directorio, fallo=True)
             raise TypeError(error_msg) # Se eleva un TypeError para un tipo de dato incorrecto.
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
@@ -1931,7 +2073,7 @@ class Funciones_Globales:
             )
             self.logger.warning(error_msg) # Usa 'warning' ya que la función devuelve False.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_int", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_int", directorio, fallo=True)
             return False
 
         except AssertionError as e:
@@ -1953,7 +2095,7 @@ class Funciones_Globales:
             )
             self.logger.warning(error_msg) # Usa 'warning' aquí también.
             # Toma una captura de pantalla en el momento del fallo de aserción.
-            self.tomar_captura(f"{nombre_base}_fallo_verificar_valor_int", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_verificar_valor_int", directorio, fallo=True)
             return False
 
         except Error as e:
@@ -1965,7 +2107,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_int", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_int", directorio, fallo=True)
             raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
 
         except Exception as e:
@@ -1976,15 +2118,14 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_int", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_int", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # El bloque `finally` se ejecuta siempre.
-            # Aplica una espera fija después de la operación. Puede ser útil para observar
+            # Aplica la espera posterior a la operación (postcondición declarada o espera fija opcional). Puede ser útil para observar
             # el estado del elemento o esperar efectos secundarios en la UI.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            self._espera_post_accion(tiempo)
 
     # 22- Función para verificar el valor de un campo numérico (flotante) con medición de rendimiento
     def verificar_valor_campo_numerico_float(self, selector: Union[str, Page.locator], valor_numerico_esperado: float, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5, tolerancia: float = 1e-6) -> bool:
@@ -2032,7 +2173,7 @@ class Funciones_Globales:
                 f"pero se recibió un tipo: {type(valor_numerico_esperado).__name__} con valor '{valor_numerico_esperado}'."
             )
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_tipo_valor_float", directorio)
+            self.tomar_captura(f"{nombre_base}_error_tipo_valor_float", directorio, fallo=True)
             raise TypeError(error_msg) # Se eleva un TypeError para un tipo de dato incorrecto.
         
         if not isinstance(tolerancia, float) or tolerancia < 0:
@@ -2041,7 +2182,7 @@ class Funciones_Globales:
                 f"pero se recibió un tipo: {type(tolerancia).__name__} con valor '{tolerancia}'."
             )
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_tipo_tolerancia_float", directorio)
+            self.tomar_captura(f"{nombre_base}_error_tipo_tolerancia_float", directorio, fallo=True)
             raise TypeError(error_msg)
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
@@ -2090,7 +2231,7 @@ class Funciones_Globales:
                     f"Diferencia: {abs(actual_value_float - valor_numerico_esperado):.10f} (Tolerancia: {tolerancia})."
                 )
                 self.logger.warning(error_msg)
-                self.tomar_captura(f"{nombre_base}_fallo_inexactitud_float", directorio)
+                self.tomar_captura(f"{nombre_base}_fallo_inexactitud_float", directorio, fallo=True)
                 return False
 
         except TimeoutError as e:
@@ -2111,7 +2252,7 @@ class Funciones_Globales:
                 f"Valor actual (si disponible): '{actual_value_str_on_timeout}'. Detalles: {e}"
             )
             self.logger.warning(error_msg)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_float", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_valor_float", directorio, fallo=True)
             return False
 
         except ValueError:
@@ -2121,7 +2262,7 @@ class Funciones_Globales:
                 f"no pudo ser convertido a flotante para comparación. Se esperaba '{valor_numerico_esperado}'."
             )
             self.logger.warning(error_msg)
-            self.tomar_captura(f"{nombre_base}_fallo_valor_no_float", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_valor_no_float", directorio, fallo=True)
             return False
 
         except Error as e:
@@ -2133,7 +2274,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_float", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_verificar_valor_float", directorio, fallo=True)
             raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
 
         except Exception as e:
@@ -2144,15 +2285,14 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_float", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_verificar_valor_float", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # El bloque `finally` se ejecuta siempre.
-            # Aplica una espera fija después de la operación. Puede ser útil para observar
+            # Aplica la espera posterior a la operación (postcondición declarada o espera fija opcional). Puede ser útil para observar
             # el estado del elemento o esperar efectos secundarios en la UI.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            self._espera_post_accion(tiempo)
 
     # 23- Función para verificar el texto 'alt' de una imagen con medición de rendimiento
     def verificar_alt_imagen(self, selector: Union[str, Page.locator], texto_alt_esperado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
@@ -2233,7 +2373,7 @@ class Funciones_Globales:
                 )
                 self.logger.warning(error_msg) # Usa 'warning' ya que la función devuelve False.
                 # Toma una captura de pantalla si el texto 'alt' no coincide.
-                self.tomar_captura(f"{nombre_base}_alt_error", directorio)
+                self.tomar_captura(f"{nombre_base}_alt_error", directorio, fallo=True)
                 return False
 
         except TimeoutError as e:
@@ -2245,7 +2385,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla en el momento del fallo por timeout.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_alt_imagen", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_alt_imagen", directorio, fallo=True)
             return False
 
         except Error as e:
@@ -2257,7 +2397,7 @@ class Funciones_Globales:
             )
             self.logger.error(error_msg, exc_info=True) # Registra el error con la traza completa.
             # Toma una captura de pantalla para el error específico de Playwright.
-            self.tomar_captura(f"{nombre_base}_error_playwright_alt_imagen", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_alt_imagen", directorio, fallo=True)
             raise # Re-lanza la excepción porque esto es un fallo de ejecución, no una verificación de estado.
 
         except Exception as e:
@@ -2268,15 +2408,14 @@ class Funciones_Globales:
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
             # Toma una captura de pantalla para errores completamente inesperados.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_alt_imagen", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_alt_imagen", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # El bloque `finally` se ejecuta siempre.
-            # Aplica una espera fija después de la operación. Puede ser útil para observar
+            # Aplica la espera posterior a la operación (postcondición declarada o espera fija opcional). Puede ser útil para observar
             # el estado del elemento o esperar efectos secundarios en la UI.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            self._espera_post_accion(tiempo)
                 
     # 24- Función para verificar que una imagen se cargue exitosamente (sin enlaces rotos) con pruebas de rendimiento.
     def verificar_carga_exitosa_imagen(self, selector: Union[str, Page.locator], nombre_base: str, directorio: str, tiempo_espera_red: Union[int, float] = 10.0, tiempo: Union[int, float] = 0.5) -> bool:
@@ -2338,7 +2477,7 @@ class Funciones_Globales:
             if not image_url:
                 error_msg = f"\n❌ FALLO: El atributo 'src' de la imagen con selector '{selector}' está vacío o no existe."
                 self.logger.error(error_msg)
-                self.tomar_captura(f"{nombre_base}_src_vacio", directorio)
+                self.tomar_captura(f"{nombre_base}_src_vacio", directorio, fallo=True)
                 return False
 
             self.logger.info(f"\nURL de la imagen a verificar: {image_url}")
@@ -2366,7 +2505,7 @@ class Funciones_Globales:
             else:
                 # Si el estado HTTP no es un 2xx (indica un problema de carga)
                 self.logger.error(f"\n❌ FALLO: La imagen con URL '{image_url}' cargó con un estado de error: {response.status}.")
-                self.tomar_captura(f"{nombre_base}_carga_fallida_status_{response.status}", directorio)
+                self.tomar_captura(f"{nombre_base}_carga_fallida_status_{response.status}", directorio, fallo=True)
                 return False
 
         except TimeoutError as e:
@@ -2380,7 +2519,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.warning(error_msg, exc_info=True) # Usa 'warning' ya que la función devuelve False.
-            self.tomar_captura(f"{nombre_base}_timeout_verificacion", directorio)
+            self.tomar_captura(f"{nombre_base}_timeout_verificacion", directorio, fallo=True)
             return False
 
         except Error as e: # Captura errores específicos de Playwright (ej., selector inválido, no es un elemento de imagen)
@@ -2390,7 +2529,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright", directorio, fallo=True)
             return False
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -2400,14 +2539,13 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Usa nivel crítico para errores graves.
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija al final de la operación, útil para observación.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            # Aplica la espera posterior a la operación (espera fija opcional, útil para observación).
+            self._espera_post_accion(tiempo)
     
     # 25- Función para cargar archivo(s) con medición de rendimiento
     def cargar_archivo(self, selector: Union[str, Locator], nombre_base: str, directorio: str, base_dir: str, file_names: Union[str, List[str]], tiempo: Union[int, float] = 0.5) -> bool:
@@ -2457,7 +2595,7 @@ class Funciones_Globales:
             if not os.path.exists(full_path):
                 error_msg = f"\n❌ Error: El archivo no existe en la ruta especificada: '{full_path}'."
                 self.logger.error(error_msg, exc_info=True)
-                self.tomar_captura(f"{nombre_base}_archivo_no_encontrado", directorio)
+                self.tomar_captura(f"{nombre_base}_archivo_no_encontrado", directorio, fallo=True)
                 raise FileNotFoundError(error_msg) # Elevar un error específico si el archivo no se encuentra.
 
         # Asegura que 'selector' sea un objeto Locator de Playwright para un uso consistente.
@@ -2516,7 +2654,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True) # Usa 'error' porque un timeout al cargar archivos es un fallo crítico.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_cargar_archivo", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_cargar_archivo", directorio, fallo=True)
             return False
 
         except Error as e:
@@ -2529,7 +2667,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_cargar_archivo", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_cargar_archivo", directorio, fallo=True)
             raise # Re-lanza la excepción porque es un fallo de ejecución.
 
         except Exception as e:
@@ -2541,14 +2679,13 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_cargar_archivo", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_cargar_archivo", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija al final de la operación, útil para observación.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            # Aplica la espera posterior a la operación (espera fija opcional, útil para observación).
+            self._espera_post_accion(tiempo)
         
     # 26- Función para remover carga de archivo(s) con medición de rendimiento
     def remover_carga_de_archivo(self, selector: Union[str, Locator], nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
@@ -2628,7 +2765,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True) # Usa 'error' porque un timeout es un fallo crítico.
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_remocion_archivo", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_remocion_archivo", directorio, fallo=True)
             return False
 
         except Error as e:
@@ -2640,7 +2777,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_remocion_archivo", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_remocion_archivo", directorio, fallo=True)
             raise # Re-lanza la excepción porque es un fallo de ejecución.
 
         except Exception as e:
@@ -2651,14 +2788,13 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_remocion_archivo", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_remocion_archivo", directorio, fallo=True)
             raise # Re-lanza la excepción.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija al final de la operación, útil para observación.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            # Aplica la espera posterior a la operación (espera fija opcional, útil para observación).
+            self._espera_post_accion(tiempo)
         
     # 27- Función para contar filas y columnas de una tabla con pruebas de rendimiento
     def obtener_dimensiones_tabla(self, selector: Locator, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> Tuple[int, int]:
@@ -2768,7 +2904,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.warning(error_msg, exc_info=True) # Usa 'warning' ya que devuelve un valor indicativo de fallo.
-            self.tomar_captura(f"{nombre_base}_dimensiones_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_dimensiones_timeout", directorio, fallo=True)
             return (-1, -1) # Retorna valores indicativos de fallo.
 
         except Error as e:
@@ -2779,7 +2915,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dimensiones_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_dimensiones_error_playwright", directorio, fallo=True)
             raise # Relanzar porque es un error de ejecución de Playwright, no un fallo de aserción.
 
         except Exception as e:
@@ -2789,14 +2925,13 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Nivel crítico para errores muy graves.
-            self.tomar_captura(f"{nombre_base}_dimensiones_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_dimensiones_error_inesperado", directorio, fallo=True)
             raise # Relanzar por ser un error inesperado.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija al final de la operación, útil para observación.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            # Aplica la espera posterior a la operación (espera fija opcional, útil para observación).
+            self._espera_post_accion(tiempo)
         
     # 28- Función para buscar datos parcial e imprimir la fila con pruebas de rendimiento
     def busqueda_coincidencia_e_imprimir_fila(self, table_selector: Locator, texto_buscado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
@@ -2804,6 +2939,8 @@ class Funciones_Globales:
         Busca una **coincidencia parcial de texto** dentro de las filas de una tabla
         especificada por un Playwright Locator. Si encuentra el texto, resalta la fila
         y registra su contenido. Mide el rendimiento de esta operación de búsqueda.
+        La búsqueda se resuelve en un índice de trigramas de la tabla (`cache_indices_tabla`), que se
+        reutiliza entre búsquedas y se reconstruye automáticamente cuando la tabla cambia.
 
         Args:
             table_selector (Locator): El **Locator de Playwright** que representa el elemento
@@ -2847,31 +2984,27 @@ class Funciones_Globales:
             table_selector.highlight()
             self.tomar_captura(f"{nombre_base}_antes_busqueda_coincidencia", directorio) # Captura antes de buscar.
 
-            # 2. Obtener todas las filas de datos de la tabla
-            # Se buscan filas `<tr>` dentro de un `<tbody>` para enfocar la búsqueda en los datos.
+            # 2. Obtener el índice de búsqueda de las filas `<tr>` del `<tbody>`. Se construye con una sola
+            # extracción y se reutiliza entre búsquedas hasta que el contenido de la tabla cambia.
             filas = table_selector.locator("tbody tr")
-            num_filas = filas.count()
-            self.logger.debug(f"\nNúmero de filas de datos encontradas en la tabla: {num_filas}.")
-
-            # 3. Iterar sobre cada fila para buscar la coincidencia
-            for i in range(num_filas):
-                fila = filas.nth(i) # Obtiene el Locator para la fila actual.
-                fila_texto = fila.text_content() # Obtiene todo el texto visible de la fila.
-                self.logger.debug(f"\nAnalizando fila {i+1}: '{fila_texto}'.")
-
-                # Realizar la búsqueda de coincidencia parcial sin distinguir mayúsculas/minúsculas.
-                if texto_buscado.lower() in fila_texto.lower():
-                    self.logger.info(f"\n✅ ÉXITO: Texto '{texto_buscado}' encontrado (coincidencia parcial) en la fila {i+1}.")
-                    self.logger.info(f"Contenido completo de la fila: '{fila_texto}'")
-                    fila.highlight() # Resalta la fila donde se encontró la coincidencia.
-                    self.tomar_captura(f"{nombre_base}_coincidencia_parcial_encontrada_fila_{i+1}", directorio)
-                    encontrado = True
-                    # Si solo se necesita encontrar la primera coincidencia y terminar, descomentar el 'break'
-                    # break 
+            start_time_indice = time.time()
+            indice, desde_cache = cache_indices_tabla.obtener(table_selector)
+            self.logger.info(f"PERFORMANCE: Índice de búsqueda de la tabla {'reutilizado desde la caché' if desde_cache else 'construido'} "
+                             f"({len(indice)} filas) en {time.time() - start_time_indice:.4f} segundos.")
+
+            # 3. Buscar la coincidencia parcial (sin distinguir mayúsculas/minúsculas) en el índice.
+            # Solo se vuelve al navegador para resaltar y capturar las filas encontradas.
+            for i in indice.buscar_parcial(texto_buscado):
+                fila_texto = indice.filas[i]
+                self.logger.info(f"\n✅ ÉXITO: Texto '{texto_buscado}' encontrado (coincidencia parcial) en la fila {i+1}.")
+                self.logger.info(f"Contenido completo de la fila: '{fila_texto}'")
+                filas.nth(i).highlight() # Resalta la fila donde se encontró la coincidencia.
+                self.tomar_captura(f"{nombre_base}_coincidencia_parcial_encontrada_fila_{i+1}", directorio)
+                encontrado = True
             
             if not encontrado:
                 self.logger.info(f"\nℹ️ Texto '{texto_buscado}' (coincidencia parcial) NO encontrado en ninguna fila de la tabla.")
-                self.tomar_captura(f"{nombre_base}_coincidencia_parcial_no_encontrada", directorio)
+                self.tomar_captura(f"{nombre_base}_coincidencia_parcial_no_encontrada", directorio, fallo=True)
 
             # --- Medición de rendimiento: Fin de la búsqueda en la tabla ---
             # Registra el tiempo una vez que se ha completado la iteración sobre todas las filas (o hasta la primera coincidencia si se usa break).
@@ -2892,7 +3025,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.warning(error_msg, exc_info=True) # Usa 'warning' ya que devuelve False.
-            self.tomar_captura(f"{nombre_base}_busqueda_coincidencia_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_busqueda_coincidencia_timeout", directorio, fallo=True)
             return False
 
         except Error as e:
@@ -2904,7 +3037,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_busqueda_coincidencia_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_busqueda_coincidencia_error_playwright", directorio, fallo=True)
             raise # Relanzar porque es un error de ejecución de Playwright.
 
         except Exception as e:
@@ -2915,14 +3048,13 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Nivel crítico para errores muy graves.
-            self.tomar_captura(f"{nombre_base}_busqueda_coincidencia_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_busqueda_coincidencia_error_inesperado", directorio, fallo=True)
             raise # Relanzar por ser un error inesperado.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija al final de la operación, útil para observación.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            # Aplica la espera posterior a la operación (espera fija opcional, útil para observación).
+            self._espera_post_accion(tiempo)
         
     # 29- Función para buscar datos exacto e imprimir la fila con pruebas de rendimiento
     def busqueda_estricta_imprimir_fila(self, table_selector: Locator, texto_buscado: str, nombre_base: str, directorio: str, tiempo: Union[int, float] = 0.5) -> bool:
@@ -2931,6 +3063,8 @@ class Funciones_Globales:
         especificada por un Playwright Locator. Si encuentra el texto, resalta la celda
         y la fila correspondiente, y registra el contenido completo de la fila.
         Mide el rendimiento de esta operación de búsqueda estricta.
+        La búsqueda se resuelve en la tabla hash de celdas del índice de la tabla (`cache_indices_tabla`),
+        que se reutiliza entre búsquedas y se reconstruye automáticamente cuando la tabla cambia.
 
         Args:
             table_selector (Locator): El **Locator de Playwright** que representa el elemento
@@ -2975,43 +3109,28 @@ class Funciones_Globales:
             table_selector.highlight()
             self.tomar_captura(f"{nombre_base}_antes_busqueda_estricta", directorio) # Captura antes de buscar.
 
-            # 2. Obtener todas las filas de datos de la tabla
-            # Se buscan filas `<tr>` dentro de un `tbody` para enfocar la búsqueda en los datos.
+            # 2. Obtener el índice de búsqueda de las celdas `td` de las filas del `tbody`. Se construye con
+            # una sola extracción y se reutiliza entre búsquedas hasta que el contenido de la tabla cambia.
             filas = table_selector.locator("tbody tr")
-            num_filas = filas.count()
-            self.logger.debug(f"\nNúmero de filas de datos encontradas en la tabla: {num_filas}.")
-
-            # 3. Iterar sobre cada fila y cada celda para buscar la coincidencia exacta
-            for i in range(num_filas):
-                fila = filas.nth(i) # Obtiene el Locator para la fila actual.
-                celdas = fila.locator("td") # Asumiendo celdas de datos son 'td'.
-                num_celdas = celdas.count()
-                fila_texto_completo = "" # Para reconstruir y loggear el contenido completo de la fila.
-                self.logger.debug(f"\nAnalizando fila {i+1} para búsqueda estricta.")
-
-                for j in range(num_celdas):
-                    celda = celdas.nth(j) # Obtiene el Locator para la celda actual.
-                    celda_texto = celda.text_content().strip() # Obtiene el texto de la celda y elimina espacios en blanco alrededor.
-                    fila_texto_completo += celda_texto + " | " # Concatenar para imprimir la fila completa en el log.
-
-                    # Realizar la búsqueda de coincidencia estricta.
-                    if celda_texto == texto_buscado: # Coincidencia estricta
-                        self.logger.info(f"\n✅ ÉXITO: Texto '{texto_buscado}' encontrado (coincidencia estricta) en la celda {j+1} de la fila {i+1}.")
-                        self.logger.info(f"Contenido completo de la fila: '{fila_texto_completo.strip(' | ')}'")
-                        celda.highlight() # Resaltar la celda donde se encontró la coincidencia.
-                        fila.highlight() # También resaltar la fila para mejor visibilidad.
-                        self.tomar_captura(f"{nombre_base}_coincidencia_estricta_encontrada_fila_{i+1}_celda_{j+1}", directorio)
-                        encontrado = True
-                        # Si solo se necesita encontrar la primera coincidencia y terminar, descomentar ambos 'break'.
-                        # break # Rompe el bucle de celdas.
-                
-                if encontrado:
-                    # break # Rompe el bucle de filas si se encontró una coincidencia y se desea parar.
-                    pass # Si se desea seguir buscando en otras filas, manteniendo el 'encontrado' en True.
+            start_time_indice = time.time()
+            indice, desde_cache = cache_indices_tabla.obtener(table_selector)
+            self.logger.info(f"PERFORMANCE: Índice de búsqueda de la tabla {'reutilizado desde la caché' if desde_cache else 'construido'} "
+                             f"({len(indice)} filas) en {time.time() - start_time_indice:.4f} segundos.")
+
+            # 3. Buscar la coincidencia estricta (celda recortada igual al texto) en la tabla hash del índice.
+            # Solo se vuelve al navegador para resaltar y capturar las celdas encontradas.
+            for i, j in indice.buscar_exacto(texto_buscado):
+                fila = filas.nth(i)
+                self.logger.info(f"\n✅ ÉXITO: Texto '{texto_buscado}' encontrado (coincidencia estricta) en la celda {j+1} de la fila {i+1}.")
+                self.logger.info(f"Contenido completo de la fila: '{' | '.join(indice.celdas[i])}'")
+                fila.locator("td").nth(j).highlight() # Resaltar la celda donde se encontró la coincidencia.
+                fila.highlight() # También resaltar la fila para mejor visibilidad.
+                self.tomar_captura(f"{nombre_base}_coincidencia_estricta_encontrada_fila_{i+1}_celda_{j+1}", directorio)
+                encontrado = True
 
             if not encontrado:
                 self.logger.info(f"\nℹ️ Texto '{texto_buscado}' (coincidencia estricta) NO encontrado en ninguna celda de la tabla.")
-                self.tomar_captura(f"{nombre_base}_coincidencia_estricta_no_encontrada", directorio)
+                self.tomar_captura(f"{nombre_base}_coincidencia_estricta_no_encontrada", directorio, fallo=True)
 
             # --- Medición de rendimiento: Fin de la búsqueda estricta en la tabla ---
             # Registra el tiempo una vez que se ha completado la iteración sobre todas las celdas/filas.
@@ -3032,7 +3151,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.warning(error_msg, exc_info=True) # Usa 'warning' ya que devuelve False.
-            self.tomar_captura(f"{nombre_base}_busqueda_estricta_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_busqueda_estricta_timeout", directorio, fallo=True)
             return False
 
         except Error as e:
@@ -3044,7 +3163,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_busqueda_estricta_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_busqueda_estricta_error_playwright", directorio, fallo=True)
             raise # Relanzar porque es un error de ejecución de Playwright.
 
         except Exception as e:
@@ -3055,22 +3174,23 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Nivel crítico para errores muy graves.
-            self.tomar_captura(f"{nombre_base}_busqueda_estricta_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_busqueda_estricta_error_inesperado", directorio, fallo=True)
             raise # Relanzar por ser un error inesperado.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
-            # Aplica una espera fija al final de la operación, útil para observación.
-            if tiempo > 0:
-                self.esperar_fijo(tiempo)
+            # Aplica la espera posterior a la operación (espera fija opcional, útil para observación).
+            self._espera_post_accion(tiempo)
         
     # 30- Función para validar que todos los valores en una columna específica de una tabla sean numéricos, con pruebas de rendimiento
-    def verificar_precios_son_numeros(self, tabla_selector: Locator, columna_nombre: str, nombre_base: str, directorio: str, tiempo_espera_celda: Union[int, float] = 0.5, tiempo_general_timeout: Union[int, float] = 15.0) -> bool:
+    def verificar_precios_son_numeros(self, tabla_selector: Locator, columna_nombre: str, nombre_base: str, directorio: str, tiempo_espera_celda: Union[int, float] = 0.5, tiempo_general_timeout: Union[int, float] = 15.0, max_capturas_invalidos: int = 10) -> bool:
         """
         Verifica que todos los valores en una **columna específica** de una tabla HTML
         sean **numéricos válidos**. Esto es crucial para la integridad de los datos
         mostrados en la UI, especialmente para precios o cantidades.
         Mide el rendimiento de esta operación de validación.
+        La columna se extrae completa con un único `evaluate` y se valida en bloque
+        (`column_validation.validar_columna_numerica`), sin una llamada al navegador por celda.
 
         Args:
             tabla_selector (Locator): El **Locator de Playwright** que representa el elemento
@@ -3089,6 +3209,8 @@ class Funciones_Globales:
                                                         para que la tabla y su `<tbody>` estén
                                                         visibles y listos para la interacción.
                                                         Por defecto, `15.0` segundos.
+            max_capturas_invalidos (int): Número máximo de celdas no numéricas que se resaltan y
+                                          capturan (el log las incluye todas). Por defecto, `10`.
 
         Returns:
             bool: `True` si todos los valores en la columna especificada son numéricos válidos;
@@ -3125,33 +3247,22 @@ class Funciones_Globales:
             self.logger.info("\n✅ Al menos la primera fila de datos en la tabla es visible.")
             self.tomar_captura(f"{nombre_base}_tabla_visible_para_verificacion", directorio) # Captura el estado inicial.
 
-            # 3. Encontrar el índice de la columna por su nombre
-            # Primero, asegurar que los encabezados existan y sean visibles.
-            headers = tabla_selector.locator("th")
-            self.logger.debug(f"\nEsperando que los encabezados (th) de la tabla sean visibles (timeout: {tiempo_general_timeout}s).")
-            expect(headers.first).to_be_visible()
-
-            col_index = -1
-            header_texts = []
-            for i in range(headers.count()):
-                header_text = headers.nth(i).text_content().strip()
-                header_texts.append(header_text)
-                if header_text == columna_nombre:
-                    col_index = i
-            
+            # 3. Extraer en una sola llamada los encabezados (th) y el texto de toda la columna.
+            start_time_extraccion = time.time()
+            header_texts, col_index, textos_columna = extraer_columna(tabla_selector, columna_nombre)
+            self.logger.info(f"PERFORMANCE: Tiempo de extracción de la columna '{columna_nombre}' en una sola llamada: {time.time() - start_time_extraccion:.4f} segundos.")
             self.logger.info(f"\n🔍 Cabeceras encontradas: {header_texts}")
 
-            if col_index == -1:
+            if textos_columna is None:
                 self.logger.error(f"\n❌ Error: No se encontró la columna '{columna_nombre}' en la tabla. Cabeceras disponibles: {header_texts}")
-                self.tomar_captura(f"{nombre_base}_columna_no_encontrada", directorio)
+                self.tomar_captura(f"{nombre_base}_columna_no_encontrada", directorio, fallo=True)
                 # No lanzamos una excepción aquí, ya que el retorno False es suficiente para indicar el fallo lógico.
                 return False
 
             self.logger.info(f"\n🔍 Columna '{columna_nombre}' encontrada en el índice: {col_index}")
 
-            # 4. Obtener todas las filas de la tabla (solo las de datos dentro de tbody)
-            rows = tbody_locator.locator("tr")
-            num_rows = rows.count()
+            # 4. Validar toda la columna en bloque (conversión a array de floats con máscara de fallos)
+            num_rows = len(textos_columna)
             if num_rows == 0:
                 self.logger.warning("\n⚠️ Advertencia: La tabla no contiene filas de datos para verificar.")
                 self.tomar_captura(f"{nombre_base}_tabla_vacia_no_precios", directorio)
@@ -3159,30 +3270,15 @@ class Funciones_Globales:
 
             self.logger.info(f"\n🔍 Se encontraron {num_rows} filas de datos para verificar precios.")
 
-            all_prices_are_numbers = True
-            for i in range(num_rows):
-                row_locator = rows.nth(i)
-                # Se busca la celda correspondiente al índice de la columna dentro de la fila actual.
-                price_cell = row_locator.locator(f"td").nth(col_index)
-                
-                # Es crucial esperar a que la celda de precio sea visible si las filas se renderizan dinámicamente
-                # o el contenido de las celdas aparece con un retardo.
-                self.logger.debug(f"\n Esperando que la celda de precio en la fila {i+1} esté visible (timeout: {tiempo_espera_celda}s).")
-                expect(price_cell).to_be_visible() # Convertir a milisegundos
-                
-                price_text = price_cell.text_content().strip() # Obtener texto y limpiar espacios.
-                price_cell.highlight() # Resaltar la celda actual para depuración visual.
-
-                self.logger.debug(f"\n Procesando fila {i+1}, texto de precio: '{price_text}'")
-
-                try:
-                    float(price_text) # Intentar convertir el texto a un número flotante.
-                    self.logger.debug(f"\n ✅ '{price_text}' es un número válido.")
-                except ValueError:
-                    self.logger.error(f"\n ❌ Error: El valor '{price_text}' en la fila {i+1} de la columna '{columna_nombre}' no es un número válido.")
-                    self.tomar_captura(f"{nombre_base}_precio_invalido_fila_{i+1}", directorio)
-                    all_prices_are_numbers = False
-                    # Continuamos el bucle para reportar todos los valores no numéricos, no solo el primero.
+            resultado = validar_valores_columna(textos_columna)
+            all_prices_are_numbers = resultado.ok
+            # Se informan todos los valores no numéricos; solo los primeros se resaltan y capturan.
+            rows = tbody_locator.locator("tr")
+            for n, i in enumerate(resultado.invalidos):
+                self.logger.error(f"\n ❌ Error: El valor '{textos_columna[i]}' en la fila {i+1} de la columna '{columna_nombre}' no es un número válido.")
+                if n < max_capturas_invalidos:
+                    rows.nth(i).locator("td").nth(col_index).highlight() # Resaltar la celda inválida para depuración visual.
+                    self.tomar_captura(f"{nombre_base}_precio_invalido_fila_{i+1}", directorio, fallo=True)
 
             # --- Medición de rendimiento: Fin de la validación ---
             end_time_validation = time.time()
@@ -3206,7 +3302,7 @@ class Funciones_Globales:
                 f"Error: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_timeout_verificacion_precios", directorio)
+            self.tomar_captura(f"{nombre_base}_timeout_verificacion_precios", directorio, fallo=True)
             # Elevar AssertionError para que la prueba falle claramente cuando la tabla no está lista.
             raise AssertionError(f"\nElementos de la tabla no disponibles a tiempo para verificación de precios: {tabla_selector}") from e
         
@@ -3217,7 +3313,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Nivel crítico porque un error de Playwright es un problema fundamental.
-            self.tomar_captura(f"{nombre_base}_playwright_error_verificacion_precios", directorio)
+            self.tomar_captura(f"{nombre_base}_playwright_error_verificacion_precios", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright al verificar precios en la tabla: {tabla_selector}") from e
         
         except Exception as e:
@@ -3227,15 +3323,14 @@ class Funciones_Globales:
                 f"Error: {type(e).__name__}: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_excepcion_inesperada", directorio)
+            self.tomar_captura(f"{nombre_base}_excepcion_inesperada", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al verificar precios en la tabla: {tabla_selector}") from e
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
             # Se puede eliminar la espera fija si la prueba se basa puramente en el retorno de la función.
             # Sin embargo, se mantiene por si se desea una pausa visual al final de la ejecución.
-            if tiempo_general_timeout > 0: # Usamos el tiempo_general_timeout para la espera final
-                self.esperar_fijo(tiempo_general_timeout / 5.0) # Espera un tiempo más corto al final, por ejemplo.
+            self._espera_post_accion(tiempo_general_timeout / 5.0) # Espera un tiempo más corto al final, por ejemplo.
         
     # 31- Función para extraer y retornar el valor de un elemento dado su Playwright Locator, con pruebas de rendimiento
     def obtener_valor_elemento(self, selector: Locator, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5) -> Optional[str]:
@@ -3319,7 +3414,7 @@ class Funciones_Globales:
                 self.tomar_captura(f"{nombre_base}_valor_extraido_exito", directorio)
             else:
                 self.logger.warning(f"\n❌ No se pudo extraer ningún valor significativo del elemento '{selector}'.")
-                self.tomar_captura(f"{nombre_base}_fallo_extraccion_valor_no_encontrado", directorio)
+                self.tomar_captura(f"{nombre_base}_fallo_extraccion_valor_no_encontrado", directorio, fallo=True)
             
             # --- Medición de rendimiento: Fin de la extracción del valor ---
             end_time_extraction = time.time()
@@ -3338,7 +3433,7 @@ class Funciones_Globales:
                 f"para extraer su valor. Detalles: {e}"
             )
             self.logger.error(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_extraccion_valor", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_extraccion_valor", directorio, fallo=True)
             # Elevar AssertionError para indicar un fallo de prueba claro.
             raise AssertionError(f"\nElemento no disponible para extracción de valor: {selector}") from e
 
@@ -3348,7 +3443,7 @@ class Funciones_Globales:
                 f"\n❌ FALLO (Error de Playwright): Ocurrió un error de Playwright al intentar extraer el valor de '{selector}'. Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True) # Nivel crítico para errores de Playwright.
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_extraccion_valor", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_extraccion_valor", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright al extraer valor: {selector}") from e
 
         except Exception as e:
@@ -3357,14 +3452,13 @@ class Funciones_Globales:
                 f"\n❌ FALLO (Error Inesperado): Ocurrió un error desconocido al intentar extraer el valor de '{selector}'. Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_extraccion_valor", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_inesperado_extraccion_valor", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al extraer valor: {selector}") from e
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
             # Puedes eliminar esta espera si no es necesaria para la observación.
-            if tiempo_espera_elemento > 0:
-                self.esperar_fijo(tiempo_espera_elemento / 5.0) # Una pequeña espera al final.
+            self._espera_post_accion(tiempo_espera_elemento / 5.0) # Una pequeña espera al final.
         
     # 32- Función para verificar que los encabezados de las columnas de una tabla sean correctos y estén presentes, con pruebas de rendimiento
     def verificar_encabezados_tabla(self, tabla_selector: Locator, encabezados_esperados: List[str], nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0) -> bool:
@@ -3439,7 +3533,7 @@ class Funciones_Globales:
                 self.logger.error(f"\n❌ --> FALLO: El número de encabezados '<th>' encontrados ({num_encabezados_actuales}) "
                                   f"no coincide con el número de encabezados esperados ({num_encabezados_esperados}).\n"
                                   f"Actuales: {actual_texts}\nEsperados: {encabezados_esperados}")
-                self.tomar_captura(f"{nombre_base}_cantidad_encabezados_incorrecta", directorio)
+                self.tomar_captura(f"{nombre_base}_cantidad_encabezados_incorrecta", directorio, fallo=True)
                 return False
 
             # 5. Iterar y comparar el texto de cada encabezado
@@ -3456,7 +3550,7 @@ class Funciones_Globales:
                 else:
                     self.logger.error(f"\n ❌ FALLO: Encabezado {i+1} esperado era '{encabezado_esperado}', pero se encontró '{texto_encabezado_actual}'.")
                     encabezado_locator.highlight() # Resaltar el encabezado incorrecto.
-                    self.tomar_captura(f"{nombre_base}_encabezado_incorrecto_{i+1}", directorio)
+                    self.tomar_captura(f"{nombre_base}_encabezado_incorrecto_{i+1}", directorio, fallo=True)
                     todos_correctos = False
                     # No es necesario un time.sleep() aquí si solo queremos el log y la captura.
 
@@ -3471,7 +3565,7 @@ class Funciones_Globales:
                 return True
             else:
                 self.logger.error("\n❌ FALLO: Uno o más encabezados de columna son incorrectos o no están en el orden esperado.")
-                self.tomar_captura(f"{nombre_base}_encabezados_verificados_fallo", directorio)
+                self.tomar_captura(f"{nombre_base}_encabezados_verificados_fallo", directorio, fallo=True)
                 return False
 
         except TimeoutError as e:
@@ -3485,7 +3579,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_verificar_encabezados_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_verificar_encabezados_timeout", directorio, fallo=True)
             # Elevar AssertionError para que la prueba falle claramente cuando la tabla no está lista.
             raise AssertionError(f"\nElementos de encabezado de tabla no disponibles a tiempo: {tabla_selector}") from e
 
@@ -3497,7 +3591,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Nivel crítico para errores de Playwright.
-            self.tomar_captura(f"{nombre_base}_verificar_encabezados_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_verificar_encabezados_error_playwright", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright al verificar encabezados de tabla: {tabla_selector}") from e # Relanzar.
 
         except Exception as e:
@@ -3507,21 +3601,26 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_verificar_encabezados_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_verificar_encabezados_error_inesperado", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al verificar encabezados de tabla: {tabla_selector}") from e # Relanzar.
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
             # Puedes eliminar esta espera si no es necesaria para la observación.
-            if tiempo_espera_tabla > 0:
-                self.esperar_fijo(tiempo_espera_tabla / 5.0) # Una pequeña espera al final, por ejemplo.
+            self._espera_post_accion(tiempo_espera_tabla / 5.0) # Una pequeña espera al final, por ejemplo.
         
     # 33- Función para verificar los datos de las filas de una tabla, con pruebas de rendimiento integradas.
-    def verificar_datos_filas_tabla(self, tabla_selector: Locator, datos_filas_esperados: List[Dict[str, Union[str, bool, int, float]]], nombre_base: str, directorio: str, tiempo_espera_general: Union[int, float] = 0.5) -> bool:
+    def verificar_datos_filas_tabla(self, tabla_selector: Locator, datos_filas_esperados: List[Dict[str, Union[str, bool, int, float]]], nombre_base: str, directorio: str, tiempo_espera_general: Union[int, float] = 0.5, max_capturas_discrepancias: int = 10) -> bool:
         """
         Verifica que los datos de las filas de una tabla HTML coincidan con los datos esperados.
         La función compara el número de filas, el texto de las celdas y el estado de los checkboxes
         en columnas específicas. Mide el rendimiento de todo el proceso de verificación.
+        La tabla se extrae completa con un único `evaluate` en un `TableSnapshot` y se compara en Python
+        por hash de fila (`TableSnapshot.diferencias`): se informa de todas las filas faltantes, sobrantes,
+        reordenadas o con valores distintos, y solo las discrepancias se resaltan y se capturan.
+        Se comparan todas las columnas que aparecen en alguna fila esperada. Un valor esperado booleano se
+        compara con el estado del checkbox de la celda; en la columna 'Select', cualquier otro valor solo
+        exige que la celda tenga checkbox (sin verificar su estado).
 
         Args:
             tabla_selector (Locator): El **Locator de Playwright** que representa el elemento
@@ -3539,6 +3638,8 @@ class Funciones_Globales:
                                                         para que la tabla, sus encabezados y
                                                         las filas estén visibles y listos para
                                                         la interacción. Por defecto, `15.0` segundos.
+            max_capturas_discrepancias (int): Número máximo de filas con discrepancias que se resaltan y
+                                              capturan (el informe en el log las incluye todas). Por defecto, `10`.
 
         Returns:
             bool: `True` si todos los datos de las filas y los estados de los checkboxes
@@ -3565,33 +3666,31 @@ class Funciones_Globales:
             tabla_selector.highlight()
             self.logger.info("\n✅ Tabla visible. Procediendo a verificar los datos.")
 
-            # 2. Obtener los encabezados para mapear los índices de las columnas
-            header_locators = tabla_selector.locator("thead th")
-            self.logger.debug(f"\nEsperando que los encabezados (th) de la tabla sean visibles (timeout: {tiempo_espera_general}s).")
-            expect(header_locators.first).to_be_visible()
-            headers = [h.text_content().strip() for h in header_locators.all()]
-            
-            if not headers:
-                self.logger.error(f"\n❌ --> FALLO: No se encontraron encabezados en la tabla con locator '{tabla_selector}'. No se pueden verificar los datos de las filas.")
-                self.tomar_captura(f"{nombre_base}_no_headers_para_datos_filas", directorio)
-                return False
-            self.logger.info(f"\n🔍 Encabezados de la tabla encontrados: {headers}")
-
-            # 3. Obtener todas las filas del cuerpo de la tabla (excluyendo thead)
+            # 2. Extraer la tabla completa (encabezados, textos y checkboxes) en un solo viaje al navegador.
+            # Se espera primero a las filas con auto-espera; la comparación se hace después en Python.
             tbody_locator = tabla_selector.locator("tbody")
-            self.logger.debug(f"\nEsperando que el tbody de la tabla sea visible (timeout: {tiempo_espera_general}s).")
-            expect(tbody_locator).to_be_visible()
-
             row_locators = tbody_locator.locator("tr")
-            # Esperar a que al menos la primera fila de datos sea visible si se esperan filas.
             if len(datos_filas_esperados) > 0:
                 self.logger.debug(f"\nEsperando que al menos la primera fila de datos sea visible (timeout: {tiempo_espera_general}s).")
                 expect(row_locators.first).to_be_visible()
 
-            num_filas_actuales = row_locators.count()
+            # --- Medición de rendimiento: Extracción de la tabla ---
+            start_time_snapshot = time.time()
+            snapshot = TableSnapshot.desde_tabla(tabla_selector)
+            duration_snapshot = time.time() - start_time_snapshot
+            self.logger.info(f"PERFORMANCE: Tiempo de extracción de la tabla '{tabla_selector}' ({len(snapshot)} filas) en una sola llamada: {duration_snapshot:.4f} segundos.")
+
+            headers = snapshot.encabezados
+            if not headers:
+                self.logger.error(f"\n❌ --> FALLO: No se encontraron encabezados en la tabla con locator '{tabla_selector}'. No se pueden verificar los datos de las filas.")
+                self.tomar_captura(f"{nombre_base}_no_headers_para_datos_filas", directorio, fallo=True)
+                return False
+            self.logger.info(f"\n🔍 Encabezados de la tabla encontrados: {headers}")
+
+            num_filas_actuales = len(snapshot)
             num_filas_esperadas = len(datos_filas_esperados)
 
-            # 4. Comparar el número total de filas
+            # 3. Comparar el número total de filas
             if num_filas_actuales == 0 and num_filas_esperadas == 0:
                 self.logger.info("\n✅ ÉXITO: No se esperaban filas y no se encontraron filas en la tabla. Verificación completada.")
                 self.tomar_captura(f"{nombre_base}_no_rows_expected_and_found", directorio)
@@ -3599,97 +3698,35 @@ class Funciones_Globales:
                 return True
             
             if num_filas_actuales != num_filas_esperadas:
+                # No se detiene aquí: el informe de diferencias indica qué filas faltan o sobran.
                 self.logger.error(f"\n❌ --> FALLO: El número de filas encontradas ({num_filas_actuales}) "
                                   f"no coincide con el número de filas esperadas ({num_filas_esperadas}).")
-                self.tomar_captura(f"{nombre_base}_cantidad_filas_incorrecta", directorio)
-                return False
-            self.logger.info(f"\n🔍 Número de filas actual y esperado coinciden: {num_filas_actuales} filas.")
-
-            # --- Variable principal para el retorno ---
-            todos_los_datos_correctos = True 
-
-            # 5. Iterar sobre cada fila esperada y verificar sus datos
-            for i in range(num_filas_esperadas):
-                fila_actual_locator = row_locators.nth(i)
-                datos_fila_esperada = datos_filas_esperados[i]
-                self.logger.info(f"\n  Verificando Fila {i+1} (Datos esperados: {datos_fila_esperada})...")
-                fila_actual_locator.highlight() # Resaltar la fila actual en la captura para debug.
-
-                # Bandera para saber si la fila actual tiene algún fallo
-                fila_actual_correcta = True 
+                self.tomar_captura(f"{nombre_base}_cantidad_filas_incorrecta", directorio, fallo=True)
+            else:
+                self.logger.info(f"\n🔍 Número de filas actual y esperado coinciden: {num_filas_actuales} filas.")
+
+            # 4. Comparar todas las filas por hash: filas faltantes, sobrantes, reordenadas y con valores distintos.
+            start_time_diff = time.time()
+            diferencias = snapshot.diferencias(datos_filas_esperados)
+            self.logger.info(f"PERFORMANCE: Tiempo de comparación en memoria de {num_filas_esperadas} filas esperadas: {time.time() - start_time_diff:.4f} segundos.")
+            todos_los_datos_correctos = diferencias.ok
+            for linea in diferencias.lineas_informe():
+                if todos_los_datos_correctos:
+                    self.logger.debug(f"\n  {linea}")
+                else:
+                    self.logger.error(f"\n  ❌ {linea}")
 
-                # Iterar sobre las columnas esperadas para esta fila
-                for col_name, expected_value in datos_fila_esperada.items():
-                    try:
-                        # Encontrar el índice de la columna por su nombre
-                        if col_name not in headers:
-                            self.logger.error(f"\n  ❌ FALLO: Columna '{col_name}' esperada para la Fila {i+1} no encontrada en los encabezados de la tabla. Encabezados actuales: {headers}")
-                            self.tomar_captura(f"{nombre_base}_fila_{i+1}_columna_{col_name}_no_encontrada", directorio)
-                            todos_los_datos_correctos = False # Falla general
-                            fila_actual_correcta = False # Falla en esta fila
-                            continue # Pasa a la siguiente columna esperada o fila
-
-                        col_index = headers.index(col_name)
-                        
-                        # Localizar la celda específica (td) dentro de la fila por su índice
-                        celda_locator = fila_actual_locator.locator("td").nth(col_index)
-                        
-                        # Asegurarse de que la celda esté visible antes de interactuar.
-                        expect(celda_locator).to_be_visible() # Timeout para celda individual
-
-                        if col_name == "Select": # Lógica específica para el checkbox en la columna "Select"
-                            checkbox_locator = celda_locator.locator("input[type='checkbox']")
-                            if checkbox_locator.count() == 0: # Si no se encuentra el checkbox dentro de la celda
-                                self.logger.error(f"\n  ❌ FALLO: Checkbox no encontrado en la columna '{col_name}' de la Fila {i+1}.")
-                                celda_locator.highlight() # Resaltar la celda donde se esperaba el checkbox
-                                self.tomar_captura(f"{nombre_base}_fila_{i+1}_no_checkbox", directorio)
-                                todos_los_datos_correctos = False
-                                fila_actual_correcta = False
-                            elif isinstance(expected_value, bool): # Si se espera un estado específico (True/False)
-                                if checkbox_locator.is_checked() != expected_value:
-                                    self.logger.error(f"\n  ❌ FALLO: El checkbox de la Fila {i+1}, Columna '{col_name}' estaba "
-                                                      f"{'marcado' if checkbox_locator.is_checked() else 'desmarcado'}, se esperaba {'marcado' if expected_value else 'desmarcado'}.")
-                                    checkbox_locator.highlight() # Resaltar el checkbox incorrecto
-                                    self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_estado_incorrecto", directorio)
-                                    todos_los_datos_correctos = False
-                                    fila_actual_correcta = False
-                                else:
-                                    self.logger.info(f"\n  ✅ Fila {i+1}, Columna '{col_name}': Checkbox presente y estado correcto ({'marcado' if expected_value else 'desmarcado'}).")
-                            else: # Si se espera que el checkbox exista, pero no se especificó un estado booleano
-                                self.logger.info(f"\n  ✅ Fila {i+1}, Columna '{col_name}': Checkbox presente (estado no verificado explícitamente).")
-                        else: # Para otras columnas de texto (no checkbox)
-                            actual_value = celda_locator.text_content().strip()
-                            # Aseguramos que expected_value también sea una cadena para la comparación, eliminando espacios.
-                            if actual_value != str(expected_value).strip(): 
-                                self.logger.error(f"\n  ❌ FALLO: Fila {i+1}, Columna '{col_name}'. Se esperaba '{expected_value}', se encontró '{actual_value}'.")
-                                celda_locator.highlight() # Resaltar la celda con el dato incorrecto
-                                self.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_incorrecta", directorio)
-                                todos_los_datos_correctos = False
-                                fila_actual_correcta = False
-                            else:
-                                self.logger.info(f"\n  ✅ Fila {i+1}, Columna '{col_name}': '{actual_value}' coincide con lo esperado.")
-                        
-                    except TimeoutError as cell_timeout_e:
-                        self.logger.error(f"\n  ❌ FALLO (Timeout): La celda de la Fila {i+1}, Columna '{col_name}' no se volvió visible a tiempo. Detalles: {cell_timeout_e}")
-                        self.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_timeout", directorio)
-                        todos_los_datos_correctos = False
-                        fila_actual_correcta = False
-                    except Error as col_playwright_e:
-                        self.logger.error(f"\n  ❌ FALLO (Playwright): Error de Playwright al verificar la columna '{col_name}' de la Fila {i+1}. Detalles: {col_playwright_e}")
-                        self.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_playwright_error", directorio)
-                        todos_los_datos_correctos = False
-                        fila_actual_correcta = False
-                    except Exception as col_e:
-                        self.logger.error(f"\n  ❌ ERROR INESPERADO al verificar la columna '{col_name}' de la Fila {i+1}: {col_e}", exc_info=True)
-                        self.tomar_captura(f"{nombre_base}_fila_{i+1}_col_{col_name}_error_inesperado", directorio)
-                        todos_los_datos_correctos = False
-                        fila_actual_correcta = False
-                        # Podrías decidir si quieres continuar con el resto de las columnas/filas
-                        # o si este error debe detener la verificación.
-
-                # Pausa solo si la fila actual tuvo algún fallo para que la captura sea más útil
-                if not fila_actual_correcta:
-                    self.esperar_fijo(1) # Pausa de 1 segundo para visualización si hay un fallo en la fila.
+            # 5. Solo las primeras discrepancias se resaltan y se capturan en el navegador.
+            for j, i, columnas_distintas in diferencias.discrepancias[:max_capturas_discrepancias]:
+                try:
+                    for col_name in columnas_distintas:
+                        row_locators.nth(i).locator("td").nth(snapshot.indice[col_name]).highlight() # Resaltar la celda con el dato incorrecto
+                    self.tomar_captura(f"{nombre_base}_fila_{j+1}_datos_incorrectos", directorio, fallo=True)
+                except Error as col_playwright_e:
+                    # Solo puede ocurrir al resaltar (p. ej. si la tabla cambió tras la extracción).
+                    self.logger.error(f"\n  ❌ FALLO (Playwright): Error de Playwright al resaltar la Fila {i+1}. Detalles: {col_playwright_e}")
+            if diferencias.faltantes or diferencias.sobrantes or diferencias.reordenadas:
+                self.tomar_captura(f"{nombre_base}_filas_faltantes_sobrantes_o_reordenadas_fallo", directorio, fallo=True)
 
             # --- Medición de rendimiento: Fin de la verificación de datos de filas ---
             end_time_row_data_verification = time.time()
@@ -3703,7 +3740,7 @@ class Funciones_Globales:
                 return True
             else:
                 self.logger.error("\n❌ FALLO: Uno o más datos de las filas o checkboxes son incorrectos o faltan.")
-                self.tomar_captura(f"{nombre_base}_datos_filas_verificados_fallo", directorio)
+                self.tomar_captura(f"{nombre_base}_datos_filas_verificados_fallo", directorio, fallo=True)
                 return False
 
         except TimeoutError as e:
@@ -3717,7 +3754,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_verificar_datos_filas_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_verificar_datos_filas_timeout", directorio, fallo=True)
             # Elevar AssertionError para que la prueba falle claramente cuando la tabla no está lista.
             raise AssertionError(f"\nElementos de tabla no disponibles a tiempo para verificación de datos de filas: {tabla_selector}") from e
 
@@ -3729,7 +3766,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_verificar_datos_filas_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_verificar_datos_filas_error_playwright", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright al verificar datos de filas de tabla: {tabla_selector}") from e
 
         except Exception as e:
@@ -3739,13 +3776,13 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_verificar_datos_filas_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_verificar_datos_filas_error_inesperado", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al verificar datos de filas de tabla: {tabla_selector}") from e
 
         finally:
             # Este bloque se ejecuta siempre, haya o no una excepción.
             # Puedes eliminar esta espera si no es necesaria para la observación al final de la ejecución de la función.
-            self.esperar_fijo(1) # Pequeña espera final para observación.
+            self._espera_post_accion(1) # Pequeña espera final para observación.
     
     # 34- Función para seleccionar y verificar el estado de checkboxes de filas aleatorias, con pruebas de rendimiento.
     def seleccionar_y_verificar_checkboxes_aleatorios(self, tabla_selector: Locator, num_checkboxes_a_interactuar: int, nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5) -> bool:
@@ -3764,9 +3801,10 @@ class Funciones_Globales:
             tiempo_espera_tabla (Union[int, float]): **Tiempo máximo de espera** (en segundos)
                                                      para que la tabla y sus checkboxes estén
                                                      visibles y listos. Por defecto, `10.0` segundos.
-            pausa_interaccion (Union[int, float]): **Pausa opcional** (en segundos) después de
-                                                   cada interacción con un checkbox para permitir
-                                                   que el DOM se actualice visualmente. Por defecto, `0.5` segundos.
+            pausa_interaccion (Union[int, float]): **Pausa de observación opcional** (en segundos) tras
+                                                   resaltar cada checkbox (solo con `ESPERAS_FIJAS_HABILITADAS`).
+                                                   El nuevo estado del checkbox se espera con `expect`, no con
+                                                   esta pausa. Por defecto, `0.5` segundos.
 
         Returns:
             bool: `True` si todos los checkboxes seleccionados aleatoriamente fueron
@@ -3810,7 +3848,7 @@ class Funciones_Globales:
 
             if num_checkboxes_disponibles == 0:
                 self.logger.error(f"\n❌ --> FALLO: No se encontraron checkboxes en la tabla con locator '{tabla_selector.locator('tbody tr td input[type=\"checkbox\"]')}'.")
-                self.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados", directorio)
+                self.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados", directorio, fallo=True)
                 return False
             
             if num_checkboxes_a_interactuar <= 0:
@@ -3819,7 +3857,7 @@ class Funciones_Globales:
 
             if num_checkboxes_a_interactuar > num_checkboxes_disponibles:
                 self.logger.error(f"\n❌ --> FALLO: Se solicitaron {num_checkboxes_a_interactuar} checkboxes para interactuar, pero solo hay {num_checkboxes_disponibles} disponibles.")
-                self.tomar_captura(f"{nombre_base}_no_suficientes_checkboxes", directorio)
+                self.tomar_captura(f"{nombre_base}_no_suficientes_checkboxes", directorio, fallo=True)
                 return False
 
             self.logger.info(f"\nSe encontraron {num_checkboxes_disponibles} checkboxes. Seleccionando {num_checkboxes_a_interactuar} aleatoriamente...")
@@ -3840,7 +3878,7 @@ class Funciones_Globales:
                 # Resaltar el checkbox actual para la captura/visualización
                 checkbox_to_interact.highlight()
                 self.tomar_captura(f"{nombre_base}_checkbox_{i+1}_aleatorio_idx_{idx}_resaltado", directorio)
-                self.esperar_fijo(pausa_interaccion) # Pausa para ver el resaltado
+                self._espera_post_accion(pausa_interaccion) # Pausa para ver el resaltado
 
                 # Obtener el ID del producto asociado a esta fila (asumiendo ID en la primera columna)
                 product_id = "N/A" # Default en caso de error
@@ -3867,12 +3905,12 @@ class Funciones_Globales:
                 if initial_state: # Si ya está marcado, lo desmarcamos primero para asegurar la acción de marcar
                     self.logger.info(f"\n  El checkbox del Producto ID: {product_id} ya está MARCADO. Haciendo clic para desmarcar antes de seleccionar.")
                     checkbox_to_interact.uncheck()
-                    self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
 
-                    if checkbox_to_interact.is_checked(): # Si después de uncheck sigue marcado, es un fallo
+                    # Postcondición: espera (con reintentos) a que quede desmarcado, en lugar de una pausa fija.
+                    if not self._checkbox_en_estado(checkbox_to_interact, False): # Si después de uncheck sigue marcado, es un fallo
                         self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no se desmarcó correctamente para la interacción.")
                         checkbox_to_interact.highlight()
-                        self.tomar_captura(f"{nombre_base}_fila_{idx+1}_no_se_desmarco", directorio)
+                        self.tomar_captura(f"{nombre_base}_fila_{idx+1}_no_se_desmarco", directorio, fallo=True)
                         todos_correctos = False
                         # No es necesario continuar con la verificación de 'check' si el 'uncheck' ya falló.
                         # Continua al siguiente checkbox aleatorio.
@@ -3881,13 +3919,13 @@ class Funciones_Globales:
                 # Ahora el checkbox debería estar DESMARCADO (o siempre lo estuvo si initial_state era False)
                 self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para MARCARLO...")
                 checkbox_to_interact.check() # Marca el checkbox
-                self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
 
-                final_state = checkbox_to_interact.is_checked()
+                # Postcondición: espera (con reintentos) a que quede marcado, en lugar de una pausa fija.
+                final_state = self._checkbox_en_estado(checkbox_to_interact, True)
                 if not final_state: # Si no está marcado (seleccionado) después del clic
                     self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a MARCADO después del clic. Sigue DESMARCADO.")
                     checkbox_to_interact.highlight()
-                    self.tomar_captura(f"{nombre_base}_fila_{idx+1}_no_se_marco", directorio)
+                    self.tomar_captura(f"{nombre_base}_fila_{idx+1}_no_se_marco", directorio, fallo=True)
                     todos_correctos = False
                 else:
                     self.logger.info(f"\n  ✅ ÉXITO: El checkbox del Producto ID: {product_id} ahora está MARCADO (seleccionado).")
@@ -3914,7 +3952,7 @@ class Funciones_Globales:
                 return True
             else:
                 self.logger.error(f"\n❌ FALLO: Uno o más checkbox(es) aleatorio(s) no pudieron ser seleccionados o verificados.")
-                self.tomar_captura(f"{nombre_base}_fallo_general_seleccion", directorio)
+                self.tomar_captura(f"{nombre_base}_fallo_general_seleccion", directorio, fallo=True)
                 return False
 
         except TimeoutError as e:
@@ -3927,7 +3965,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_seleccion_checkbox_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_seleccion_checkbox_timeout", directorio, fallo=True)
             raise AssertionError(f"\nElementos de tabla/checkboxes no disponibles a tiempo para interacción: {tabla_selector}") from e
 
         except Error as e:
@@ -3938,7 +3976,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_seleccion_checkbox_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_seleccion_checkbox_error_playwright", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright al interactuar con checkboxes: {tabla_selector}") from e
 
         except Exception as e:
@@ -3948,12 +3986,12 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_seleccion_checkbox_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_seleccion_checkbox_error_inesperado", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al interactuar con checkboxes: {tabla_selector}") from e
 
         finally:
             # Este bloque se ejecuta siempre.
-            self.esperar_fijo(1) # Pequeña espera final para observación.
+            self._espera_post_accion(1) # Pequeña espera final para observación.
     
     # 35- Función para seleccionar y verificar el estado de checkboxes de filas CONSECUTIVAS, con pruebas de rendimiento.
     def seleccionar_y_verificar_checkboxes_consecutivos(self, tabla_selector: Locator, start_index: int, num_checkboxes_a_interactuar: int, nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5) -> bool:
@@ -3975,9 +4013,10 @@ class Funciones_Globales:
             tiempo_espera_tabla (Union[int, float]): **Tiempo máximo de espera** (en segundos)
                                                      para que la tabla y sus checkboxes estén
                                                      visibles y listos. Por defecto, `10.0` segundos.
-            pausa_interaccion (Union[int, float]): **Pausa opcional** (en segundos) después de
-                                                   cada interacción con un checkbox para permitir
-                                                   que el DOM se actualice visualmente. Por defecto, `0.5` segundos.
+            pausa_interaccion (Union[int, float]): **Pausa de observación opcional** (en segundos) tras
+                                                   resaltar cada checkbox (solo con `ESPERAS_FIJAS_HABILITADAS`).
+                                                   El nuevo estado del checkbox se espera con `expect`, no con
+                                                   esta pausa. Por defecto, `0.5` segundos.
 
         Returns:
             bool: `True` si todos los checkboxes consecutivos fueron interactuados y
@@ -4028,7 +4067,7 @@ class Funciones_Globales:
             # 3. Validaciones de precondición
             if num_checkboxes_disponibles == 0:
                 self.logger.error(f"\n❌ --> FALLO: No se encontraron checkboxes en la tabla con locator '{tabla_selector.locator('tbody tr td input[type=\"checkbox\"]')}'.")
-                self.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados_consec", directorio)
+                self.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados_consec", directorio, fallo=True)
                 return False
             
             if num_checkboxes_a_interactuar <= 0:
@@ -4037,13 +4076,13 @@ class Funciones_Globales:
 
             if start_index < 0 or start_index >= num_checkboxes_disponibles:
                 self.logger.error(f"\n❌ --> FALLO: El 'posición de inicio' ({start_index}) está fuera del rango válido de checkboxes disponibles (0 a {num_checkboxes_disponibles - 1}).")
-                self.tomar_captura(f"{nombre_base}_start_index_invalido_consec", directorio)
+                self.tomar_captura(f"{nombre_base}_start_index_invalido_consec", directorio, fallo=True)
                 return False
             
             if (start_index + num_checkboxes_a_interactuar) > num_checkboxes_disponibles:
                 self.logger.error(f"\n❌ --> FALLO: Se solicitaron {num_checkboxes_a_interactuar} checkboxes a partir del índice {start_index}, "
                                   f"pero solo hay {num_checkboxes_disponibles} disponibles. El rango excede los límites de la tabla.")
-                self.tomar_captura(f"{nombre_base}_rango_excedido_consec", directorio)
+                self.tomar_captura(f"{nombre_base}_rango_excedido_consec", directorio, fallo=True)
                 return False
 
             self.logger.info(f"\nInteractuando con {num_checkboxes_a_interactuar} checkbox(es) consecutivo(s) "
@@ -4063,7 +4102,7 @@ class Funciones_Globales:
                 # Resaltar el checkbox actual para la captura/visualización
                 checkbox_to_interact.highlight()
                 self.tomar_captura(f"{nombre_base}_checkbox_consecutivo_{i+1}_idx_{current_idx}_resaltado", directorio)
-                self.esperar_fijo(pausa_interaccion) # Pausa para ver el resaltado
+                self._espera_post_accion(pausa_interaccion) # Pausa para ver el resaltado
 
                 # Obtener el ID del producto asociado a esta fila (asumiendo ID en la primera columna)
                 product_id = "N/A" # Default en caso de error
@@ -4085,12 +4124,12 @@ class Funciones_Globales:
                 if initial_state: # Si ya está marcado, lo desmarcamos primero para asegurar la acción de marcar
                     self.logger.info(f"\n  El checkbox del Producto ID: {product_id} ya está MARCADO. Haciendo clic para desmarcar antes de seleccionar.")
                     checkbox_to_interact.uncheck()
-                    self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
 
-                    if checkbox_to_interact.is_checked(): # Si después de uncheck sigue marcado, es un fallo
+                    # Postcondición: espera (con reintentos) a que quede desmarcado, en lugar de una pausa fija.
+                    if not self._checkbox_en_estado(checkbox_to_interact, False): # Si después de uncheck sigue marcado, es un fallo
                         self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no se desmarcó correctamente para la interacción.")
                         checkbox_to_interact.highlight()
-                        self.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_no_se_desmarco_consec", directorio)
+                        self.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_no_se_desmarco_consec", directorio, fallo=True)
                         todos_correctos = False
                         # No es necesario continuar con la verificación de 'check' si el 'uncheck' ya falló.
                         continue 
@@ -4098,13 +4137,13 @@ class Funciones_Globales:
                 # Ahora el checkbox debería estar DESMARCADO (o siempre lo estuvo si initial_state era False)
                 self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para MARCARLO...")
                 checkbox_to_interact.check() # Marca el checkbox
-                self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
 
-                final_state = checkbox_to_interact.is_checked()
+                # Postcondición: espera (con reintentos) a que quede marcado, en lugar de una pausa fija.
+                final_state = self._checkbox_en_estado(checkbox_to_interact, True)
                 if not final_state: # Si no está marcado (seleccionado) después del clic
                     self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a MARCADO después del clic. Sigue DESMARCADO.")
                     checkbox_to_interact.highlight()
-                    self.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_no_se_marco_consec", directorio)
+                    self.tomar_captura(f"{nombre_base}_fila_{current_idx+1}_no_se_marco_consec", directorio, fallo=True)
                     todos_correctos = False
                 else:
                     self.logger.info(f"\n  ✅ ÉXITO: El checkbox del Producto ID: {product_id} ahora está MARCADO (seleccionado).")
@@ -4131,7 +4170,7 @@ class Funciones_Globales:
                 return True
             else:
                 self.logger.error(f"\n❌ FALLO: Uno o más checkbox(es) consecutivo(s) no pudieron ser seleccionados o verificados.")
-                self.tomar_captura(f"{nombre_base}_fallo_general_seleccion_consec", directorio)
+                self.tomar_captura(f"{nombre_base}_fallo_general_seleccion_consec", directorio, fallo=True)
                 return False
 
         except TimeoutError as e:
@@ -4144,7 +4183,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_timeout", directorio, fallo=True)
             raise AssertionError(f"\nElementos de tabla/checkboxes no disponibles a tiempo para interacción: {tabla_selector}") from e
 
         except Error as e:
@@ -4155,7 +4194,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_error_playwright", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright al interactuar con checkboxes: {tabla_selector}") from e
 
         except Exception as e:
@@ -4165,12 +4204,12 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_seleccion_consec_checkbox_error_inesperado", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al interactuar con checkboxes: {tabla_selector}") from e
 
         finally:
             # Este bloque se ejecuta siempre.
-            self.esperar_fijo(1) # Pequeña espera final para observación.
+            self._espera_post_accion(1) # Pequeña espera final para observación.
         
     # 36- Función para deseleccionar todos los checkboxes actualmente marcados y verificar su estado.
     def deseleccionar_y_verificar_checkbox_marcado(self, tabla_selector: Locator, nombre_base: str, directorio: str, tiempo_espera_tabla: Union[int, float] = 1.0, pausa_interaccion: Union[int, float] = 0.5) -> bool:
@@ -4188,9 +4227,10 @@ class Funciones_Globales:
             tiempo_espera_tabla (Union[int, float]): **Tiempo máximo de espera** (en segundos)
                                                      para que la tabla y sus checkboxes estén
                                                      visibles y listos. Por defecto, `10.0` segundos.
-            pausa_interaccion (Union[int, float]): **Pausa opcional** (en segundos) después de
-                                                   cada deselección con un checkbox para permitir
-                                                   que el DOM se actualice visualmente. Por defecto, `0.5` segundos.
+            pausa_interaccion (Union[int, float]): **Pausa de observación opcional** (en segundos) tras
+                                                   resaltar cada checkbox (solo con `ESPERAS_FIJAS_HABILITADAS`).
+                                                   El nuevo estado del checkbox se espera con `expect`, no con
+                                                   esta pausa. Por defecto, `0.5` segundos.
 
         Returns:
             bool: `True` si todos los checkboxes que estaban marcados fueron deseleccionados
@@ -4230,7 +4270,7 @@ class Funciones_Globales:
 
             if num_checkboxes_disponibles == 0:
                 self.logger.error(f"\n❌ --> FALLO: No se encontraron checkboxes en la tabla con locator '{tabla_selector.locator('tbody tr td input[type=\"checkbox\"]')}'.")
-                self.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados_todos", directorio)
+                self.tomar_captura(f"{nombre_base}_no_checkboxes_encontrados_todos", directorio, fallo=True)
                 return False
             
             # 3. Recolectar todos los checkboxes que están actualmente marcados para deseleccionar
@@ -4266,7 +4306,7 @@ class Funciones_Globales:
                 # Resaltar el checkbox actual
                 checkbox_to_interact.highlight()
                 self.tomar_captura(f"{nombre_base}_deseleccion_actual_{i+1}_idx_{original_idx}_resaltado", directorio)
-                self.esperar_fijo(pausa_interaccion)
+                self._espera_post_accion(pausa_interaccion)
 
                 # Obtener el ID del producto asociado a esta fila (asumiendo ID en la primera columna)
                 product_id = "N/A" # Default en caso de error
@@ -4287,13 +4327,13 @@ class Funciones_Globales:
                 self.logger.info(f"\n  Haciendo clic en el checkbox del Producto ID: {product_id} para DESMARCARLO...")
                 # Usar .uncheck() es más directo para desmarcar que .click() si ya sabes el estado esperado.
                 checkbox_to_interact.uncheck()
-                self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
 
-                final_state = checkbox_to_interact.is_checked()
+                # Postcondición: espera (con reintentos) a que quede desmarcado, en lugar de una pausa fija.
+                final_state = not self._checkbox_en_estado(checkbox_to_interact, False)
                 if final_state: # Si sigue marcado después de .uncheck()
                     self.logger.error(f"\n  ❌ FALLO: El checkbox del Producto ID: {product_id} no cambió a DESMARCADO después del clic. Sigue MARCADO.")
                     checkbox_to_interact.highlight()
-                    self.tomar_captura(f"{nombre_base}_fila_{original_idx+1}_no_desmarcado", directorio)
+                    self.tomar_captura(f"{nombre_base}_fila_{original_idx+1}_no_desmarcado", directorio, fallo=True)
                     todos_deseleccionados_correctamente = False
                 else:
                     self.logger.info(f"\n  ✅ ÉXITO: El checkbox del Producto ID: {product_id} ahora está DESMARCADO (deseleccionado).")
@@ -4321,7 +4361,7 @@ class Funciones_Globales:
                 return True
             else:
                 self.logger.error(f"\n❌ FALLO: Uno o más checkbox(es) marcados no pudieron ser deseleccionados o verificados.")
-                self.tomar_captura(f"{nombre_base}_fallo_general_deseleccion_todos", directorio)
+                self.tomar_captura(f"{nombre_base}_fallo_general_deseleccion_todos", directorio, fallo=True)
                 return False
 
         except TimeoutError as e:
@@ -4334,7 +4374,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_deseleccion_todos_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_deseleccion_todos_timeout", directorio, fallo=True)
             raise AssertionError(f"\nElementos de tabla/checkboxes no disponibles a tiempo para interacción: {tabla_selector}") from e
 
         except Error as e:
@@ -4345,7 +4385,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_deseleccion_todos_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_deseleccion_todos_error_playwright", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright al interactuar con checkboxes: {tabla_selector}") from e
 
         except Exception as e:
@@ -4355,12 +4395,12 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_deseleccion_todos_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_deseleccion_todos_error_inesperado", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al interactuar con checkboxes: {tabla_selector}") from e
 
         finally:
             # Este bloque se ejecuta siempre.
-            self.esperar_fijo(1) # Pequeña espera final para observación.
+            self._espera_post_accion(1) # Pequeña espera final para observación.
     
     # 37- Función para buscar un 'texto_a_buscar' en las celdas de una tabla (tbody) y, si lo encuentra,
     # intenta marcar el checkbox asociado en la misma fila. Incluye pruebas de rendimiento.
@@ -4382,9 +4422,10 @@ class Funciones_Globales:
             tiempo_espera_tabla (Union[int, float]): **Tiempo máximo de espera** (en segundos)
                                                      para que la tabla esté visible y cargada.
                                                      Por defecto, `10.0` segundos.
-            pausa_interaccion (Union[int, float]): **Pausa opcional** (en segundos) después de
-                                                   resaltar la fila y de marcar el checkbox,
-                                                   para permitir la actualización visual. Por defecto, `0.5` segundos.
+            pausa_interaccion (Union[int, float]): **Pausa de observación opcional** (en segundos) tras
+                                                   resaltar cada checkbox (solo con `ESPERAS_FIJAS_HABILITADAS`).
+                                                   El nuevo estado del checkbox se espera con `expect`, no con
+                                                   esta pausa. Por defecto, `0.5` segundos.
 
         Returns:
             bool: `True` si se encontró al menos una coincidencia y se pudo marcar un checkbox asociado;
@@ -4417,7 +4458,7 @@ class Funciones_Globales:
 
             if num_filas == 0:
                 self.logger.error(f"\n❌ --> FALLO: No se encontraron filas en el 'tbody' de la tabla con locator '{tabla_selector}'.")
-                self.tomar_captura(f"{nombre_base}_no_filas_encontradas", directorio)
+                self.tomar_captura(f"{nombre_base}_no_filas_encontradas", directorio, fallo=True)
                 return False
 
             self.logger.info(f"\nSe encontraron {num_filas} filas en la tabla. Iniciando escaneo de celdas...")
@@ -4460,7 +4501,7 @@ class Funciones_Globales:
                             checkbox = checkbox_locator.first
                             checkbox.highlight()
                             self.tomar_captura(f"{nombre_base}_fila_{i+1}_coincidencia_resaltada", directorio)
-                            self.esperar_fijo(pausa_interaccion)
+                            self._espera_post_accion(pausa_interaccion)
 
                             # --- Medición de rendimiento: Inicio de interacción de checkbox ---
                             start_time_checkbox_interaction = time.time()
@@ -4468,15 +4509,15 @@ class Funciones_Globales:
                             if not checkbox.is_checked():
                                 self.logger.info(f"\n  --> Marcando checkbox en Fila {i+1} (texto '{celda_texto}')...")
                                 checkbox.check()
-                                self.esperar_fijo(pausa_interaccion) # Pausa para que el DOM se actualice
-                                
-                                if checkbox.is_checked():
+
+                                # Postcondición: espera (con reintentos) a que quede marcado, en lugar de una pausa fija.
+                                if self._checkbox_en_estado(checkbox, True):
                                     self.logger.info(f"\n  ✅ Checkbox en Fila {i+1} marcado correctamente.")
                                     checkboxes_marcados_exitosamente += 1
                                     self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_marcado", directorio)
                                 else:
                                     self.logger.error(f"\n  ❌ FALLO: No se pudo marcar el checkbox en Fila {i+1} (texto '{celda_texto}').")
-                                    self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_no_marcado", directorio)
+                                    self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_no_marcado", directorio, fallo=True)
                             else:
                                 self.logger.warning(f"\n  ⚠️ Checkbox en Fila {i+1} (texto '{celda_texto}') ya estaba marcado. No se requiere acción.")
                                 self.tomar_captura(f"{nombre_base}_fila_{i+1}_checkbox_ya_marcado", directorio)
@@ -4519,7 +4560,7 @@ class Funciones_Globales:
                  return True # Consideramos éxito si se encontró la coincidencia, aunque no se marcaran nuevos.
             else:
                 self.logger.warning(f"\n⚠️ ADVERTENCIA: No se encontraron coincidencias para '{texto_a_buscar}' en ninguna celda de la tabla.")
-                self.tomar_captura(f"{nombre_base}_busqueda_finalizada_sin_coincidencias", directorio)
+                self.tomar_captura(f"{nombre_base}_busqueda_finalizada_sin_coincidencias", directorio, fallo=True)
                 return False # Falla si no se encuentra ninguna coincidencia.
 
         except TimeoutError as e:
@@ -4532,7 +4573,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_timeout_tabla", directorio)
+            self.tomar_captura(f"{nombre_base}_timeout_tabla", directorio, fallo=True)
             raise AssertionError(f"\nTabla no disponible a tiempo: {tabla_selector}") from e
 
         except Error as e:
@@ -4543,7 +4584,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright durante la búsqueda/marcado: {tabla_selector}") from e
 
         except Exception as e:
@@ -4553,12 +4594,12 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado durante la búsqueda/marcado: {tabla_selector}") from e
 
         finally:
             # Este bloque se ejecuta siempre, independientemente del resultado.
-            self.esperar_fijo(1) # Pequeña espera final para observación o para liberar recursos si es necesario.
+            self._espera_post_accion(1) # Pequeña espera final para observación o para liberar recursos si es necesario.
         
     # 38- Función para verificar que la página inicial esperada esté seleccionada y resaltada en un componente de paginación.
     # Incluye pruebas de rendimiento.
@@ -4653,7 +4694,7 @@ class Funciones_Globales:
             else:
                 self.logger.error(f"\n  ❌ FALLO: La página '{texto_pagina_inicial}' no tiene la clase de resaltado esperada '{clase_resaltado}'.")
                 self.logger.info(f"\n  Clases actuales del elemento: '{current_classes_attribute}'")
-                self.tomar_captura(f"{nombre_base}_pagina_inicial_no_resaltada", directorio)
+                self.tomar_captura(f"{nombre_base}_pagina_inicial_no_resaltada", directorio, fallo=True)
                 success = False
             
             # --- Medición de rendimiento: Fin de verificación de estado ---
@@ -4680,7 +4721,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_timeout_paginacion", directorio)
+            self.tomar_captura(f"{nombre_base}_timeout_paginacion", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nComponente de paginación o página inicial no disponibles a tiempo: {selector_paginado}") from e
 
@@ -4692,7 +4733,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError de Playwright al verificar paginación: {selector_paginado}") from e
 
@@ -4703,17 +4744,17 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError inesperado al verificar paginación: {selector_paginado}") from e
 
         finally:
             # Este bloque se ejecuta siempre, independientemente del resultado.
-            self.esperar_fijo(0.5) # Pequeña espera final para observación o para liberar recursos si es necesario.
+            self._espera_post_accion(0.5) # Pequeña espera final para observación o para liberar recursos si es necesario.
         
     # 39- Función para navegar a un número de página específico en un componente de paginación y verificar su estado.
     # Incluye pruebas de rendimiento.
-    def navegar_y_verificar_pagina(self, selector_paginado: Locator, numero_pagina_a_navegar: str, nombre_base: str, directorio: str, clase_resaltado: str = "active", tiempo_espera_componente: Union[int, float] = 1.0, pausa_post_clic: Union[int, float] = 0.5) -> bool:
+    def navegar_y_verificar_pagina(self, selector_paginado: Locator, numero_pagina_a_navegar: str, nombre_base: str, directorio: str, clase_resaltado: str = "active", tiempo_espera_componente: Union[int, float] = 1.0, pausa_post_clic: Union[int, float] = 0) -> bool:
         """
         Navega a un número de página específico en un componente de paginación haciendo clic en el enlace
         correspondiente y verifica que la página de destino esté seleccionada y resaltada.
@@ -4735,10 +4776,11 @@ class Funciones_Globales:
                                                          para que el componente de paginación y
                                                          los elementos de página estén visibles.
                                                          Por defecto, `10.0` segundos.
-            pausa_post_clic (Union[int, float]): **Pausa opcional** (en segundos) después de
-                                                  hacer clic en un número de página, para permitir
-                                                  que la página cargue y los estilos se apliquen.
-                                                  Por defecto, `0.5` segundos.
+            pausa_post_clic (Union[int, float]): **Pausa fija adicional** (en segundos) después de
+                                                  hacer clic en un número de página. Solo se aplica si
+                                                  se indica explícitamente: el resaltado de la página de
+                                                  destino se espera con `expect(...).to_have_class`.
+                                                  Por defecto, `0` (sin pausa).
 
         Returns:
             bool: `True` si la navegación fue exitosa y la página de destino está resaltada;
@@ -4809,13 +4851,13 @@ class Funciones_Globales:
                 pagina_actual_int = int(pagina_actual_texto) if pagina_actual_texto.isdigit() else -1 # Usar -1 si es desconocido
             except ValueError:
                 self.logger.error(f"\n❌ FALLO: El número de página a navegar '{numero_pagina_a_navegar}' no es un número válido.")
-                self.tomar_captura(f"{nombre_base}_pagina_destino_invalida", directorio)
+                self.tomar_captura(f"{nombre_base}_pagina_destino_invalida", directorio, fallo=True)
                 return False
 
             # Condicional 1: Página de destino es mayor que el total de páginas
             if total_paginas > 0 and num_pagina_int > total_paginas:
                 self.logger.warning(f"\n⚠️ ADVERTENCIA: La página de destino '{numero_pagina_a_navegar}' es mayor que el número total de páginas disponibles '{total_paginas}'.")
-                self.tomar_captura(f"{nombre_base}_pagina_destino_fuera_rango", directorio)
+                self.tomar_captura(f"{nombre_base}_pagina_destino_fuera_rango", directorio, fallo=True)
                 return False # Considerar como fallo si la página está fuera de rango
 
             # Condicional 2: La página de destino es la misma que la página actual
@@ -4851,7 +4893,8 @@ class Funciones_Globales:
             # --- Medición de rendimiento: Inicio de click y espera de carga ---
             start_time_click_and_wait = time.time()
             pagina_destino_locator.click()
-            self.esperar_fijo(pausa_post_clic) # Pausa para permitir la carga de la página y la aplicación de estilos
+            if pausa_post_clic and pausa_post_clic > 0:
+                self.esperar_fijo(pausa_post_clic) # Pausa fija solo si el llamador la pidió explícitamente
             
             # --- Medición de rendimiento: Fin de click y espera de carga ---
             end_time_click_and_wait = time.time()
@@ -4870,21 +4913,21 @@ class Funciones_Globales:
             # --- Medición de rendimiento: Inicio de verificación de estado final ---
             start_time_final_verification = time.time()
 
-            current_classes_attribute = pagina_destino_locator.get_attribute("class")
-            
-            if current_classes_attribute is not None:
-                current_classes_list = current_classes_attribute.split()
-            else:
-                current_classes_list = []
+            # Postcondición del clic: espera (con reintentos) a que la página de destino tenga la clase de resaltado.
+            try:
+                expect(pagina_destino_locator).to_have_class(re.compile(rf"(^|\s){re.escape(clase_resaltado)}(\s|$)"))
+                pagina_resaltada = True
+            except AssertionError:
+                pagina_resaltada = False
 
-            if clase_resaltado in current_classes_list:
+            if pagina_resaltada:
                 self.logger.info(f"\n  ✅ ÉXITO: La página '{numero_pagina_a_navegar}' está seleccionada y resaltada con la clase '{clase_resaltado}'.")
                 self.tomar_captura(f"{nombre_base}_pagina_{numero_pagina_a_navegar}_seleccionada_ok", directorio)
                 success = True
             else:
                 self.logger.error(f"\n  ❌ FALLO: La página '{numero_pagina_a_navegar}' no tiene la clase de resaltado esperada '{clase_resaltado}'.")
-                self.logger.info(f"\n  Clases actuales del elemento: '{current_classes_attribute}'")
-                self.tomar_captura(f"{nombre_base}_pagina_{numero_pagina_a_navegar}_no_resaltada", directorio)
+                self.logger.info(f"\n  Clases actuales del elemento: '{pagina_destino_locator.get_attribute('class')}'")
+                self.tomar_captura(f"{nombre_base}_pagina_{numero_pagina_a_navegar}_no_resaltada", directorio, fallo=True)
                 success = False
 
             # --- Medición de rendimiento: Fin de verificación de estado final ---
@@ -4911,7 +4954,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_timeout_navegacion", directorio)
+            self.tomar_captura(f"{nombre_base}_timeout_navegacion", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nComponente de paginación o página de destino no disponibles a tiempo: {selector_paginado} o página {numero_pagina_a_navegar}") from e
 
@@ -4923,7 +4966,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError de Playwright al navegar/verificar paginación: {selector_paginado}") from e
 
@@ -4934,17 +4977,17 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError inesperado al navegar/verificar paginación: {selector_paginado}") from e
 
         finally:
             # Este bloque se ejecuta siempre, independientemente del resultado.
-            self.esperar_fijo(0.5) # Pequeña espera final para observación o para liberar recursos si es necesario.
+            self._espera_post_accion(0.5) # Pequeña espera final para observación o para liberar recursos si es necesario.
         
     # 40- Función para verificar una alerta simple utilizando page.expect_event().
     # Integra pruebas de rendimiento para medir la aparición y manejo de la alerta.
-    def verificar_alerta_simple_con_expect_event(self, selector: Locator, mensaje_esperado: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_espera_alerta: Union[int, float] = 0.5) -> bool:
+    def verificar_alerta_simple_con_expect_event(self, selector: Locator, mensaje_esperado: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_espera_alerta: Union[int, float] = 0.5, postcondicion: Any = None) -> bool:
         """
         Verifica una alerta de tipo 'alert' que aparece después de hacer clic en un selector dado.
         Utiliza `page.expect_event("dialog")` de Playwright para esperar y capturar el diálogo.
@@ -4965,6 +5008,10 @@ class Funciones_Globales:
             tiempo_espera_alerta (Union[int, float]): **Tiempo máximo de espera** (en segundos)
                                                       para que la alerta (diálogo) aparezca después
                                                       de hacer clic en el selector. Por defecto, `5.0` segundos.
+            postcondicion (Any, opcional): Postcondición que debe cumplirse tras aceptar la alerta (ver
+                                           `esperar_postcondicion`), p. ej. el Locator del mensaje de resultado.
+                                           Si no se cumple, la verificación falla. Si es `None`, se espera a que
+                                           el DOM de la página se estabilice. Por defecto `None`.
 
         Returns:
             bool: `True` si la alerta apareció, es del tipo 'alert', contiene el mensaje esperado
@@ -4990,7 +5037,7 @@ class Funciones_Globales:
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
             selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
+            self._espera_post_accion(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
             end_time_element_ready = time.time()
             duration_element_ready = end_time_element_ready - start_time_element_ready
@@ -5033,7 +5080,7 @@ class Funciones_Globales:
             # --- Medición de rendimiento: Inicio de verificación del mensaje ---
             start_time_message_verification = time.time()
             if mensaje_esperado not in dialogo.message:
-                self.tomar_captura(f"{nombre_base}_alerta_mensaje_incorrecto", directorio)
+                self.tomar_captura(f"{nombre_base}_alerta_mensaje_incorrecto", directorio, fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Mensaje de alerta incorrecto.\n"
                     f"  --> Esperado (contiene): '{mensaje_esperado}'\n"
@@ -5057,7 +5104,11 @@ class Funciones_Globales:
             # Si tu aplicación cambia el estado del DOM (ej. un mensaje de éxito/error)
             # después de que la alerta es aceptada, puedes verificarlo aquí.
             # Por ejemplo: expect(self.page.locator("#status_message")).to_have_text("Operación completada");
-            self.esperar_fijo(0.5) # Pequeña pausa para que el DOM se actualice si es necesario
+            # Postcondición: la declarada por el llamador o, en su defecto, que el DOM deje de cambiar.
+            if postcondicion is not None:
+                self._exigir_postcondicion(postcondicion, nombre_base, directorio)
+            else:
+                self.esperar_dom_estable(nombre_paso=f"{nombre_base}_post_alerta")
 
             self.tomar_captura(f"{nombre_base}_alerta_exitosa", directorio)
             self.logger.info(f"\n✅  --> ÉXITO: La alerta se mostró, mensaje verificado y aceptada correctamente.")
@@ -5080,7 +5131,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_alerta_NO_aparece_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_alerta_NO_aparece_timeout", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nTimeout al verificar alerta para selector '{selector}'") from e
 
@@ -5091,7 +5142,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError de Playwright al verificar alerta para selector '{selector}'") from e
 
@@ -5108,17 +5159,17 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError inesperado al verificar alerta para selector '{selector}'") from e
 
         finally:
             # Este bloque se ejecuta siempre, independientemente del resultado.
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o para liberar recursos.
     
     # 41- Función para verificar una alerta simple utilizando page.on("dialog") con page.once().
     # Integra pruebas de rendimiento para medir la aparición y manejo de la alerta a través de un listener.
-    def verificar_alerta_simple_con_on(self, selector: Locator, mensaje_alerta_esperado: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_max_deteccion_alerta: Union[int, float] = 0.7) -> bool:
+    def verificar_alerta_simple_con_on(self, selector: Locator, mensaje_alerta_esperado: str, nombre_base: str, directorio: str, tiempo_espera_elemento: Union[int, float] = 0.5, tiempo_max_deteccion_alerta: Union[int, float] = 0.7, postcondicion: Any = None) -> bool:
         """
         Verifica una alerta de tipo 'alert' que aparece después de hacer clic en un selector dado.
         Utiliza `page.once("dialog")` para registrar un manejador de eventos que captura
@@ -5140,6 +5191,10 @@ class Funciones_Globales:
                                                               detecte y maneje la alerta. Debe ser mayor que
                                                               el tiempo de procesamiento esperado de la alerta.
                                                               Por defecto, `7.0` segundos.
+            postcondicion (Any, opcional): Postcondición que debe cumplirse tras aceptar la alerta (ver
+                                           `esperar_postcondicion`), p. ej. el Locator del mensaje de resultado.
+                                           Si no se cumple, la verificación falla. Si es `None`, se espera a que
+                                           el DOM de la página se estabilice. Por defecto `None`.
 
         Returns:
             bool: `True` si la alerta apareció, es del tipo 'alert', contiene el mensaje esperado
@@ -5171,7 +5226,7 @@ class Funciones_Globales:
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
             selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
+            self._espera_post_accion(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
             end_time_element_ready = time.time()
             duration_element_ready = end_time_element_ready - start_time_element_ready
@@ -5196,8 +5251,9 @@ class Funciones_Globales:
             # Bucle de espera activa hasta que la bandera _alerta_detectada sea True
             # Se añade un timeout para el bucle, calculado a partir de tiempo_max_deteccion_alerta
             wait_end_time = time.time() + tiempo_max_deteccion_alerta
-            while not self._alerta_detectada and time.time() < wait_end_time:
-                time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
+            with contabilidad_esperas.medir(CATEGORIA_ESPERA_FIJA):
+                while not self._alerta_detectada and time.time() < wait_end_time:
+                    time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
 
             # --- Medición de rendimiento: Fin de click y espera de detección de alerta ---
             end_time_click_and_alert_detection = time.time()
@@ -5207,7 +5263,7 @@ class Funciones_Globales:
             if not self._alerta_detectada:
                 error_msg = f"\n❌ FALLO: La alerta no fue detectada por el listener después de {tiempo_max_deteccion_alerta} segundos."
                 self.logger.error(error_msg)
-                self.tomar_captura(f"{nombre_base}_alerta_NO_detectada_timeout", directorio)
+                self.tomar_captura(f"{nombre_base}_alerta_NO_detectada_timeout", directorio, fallo=True)
                 # Re-lanzar como AssertionError para un fallo claro de la prueba
                 raise AssertionError(error_msg)
             
@@ -5223,7 +5279,7 @@ class Funciones_Globales:
                 raise AssertionError(f"\nTipo de diálogo inesperado: '{self._alerta_tipo_capturado}'. Se esperaba 'alert'.")
 
             if mensaje_alerta_esperado not in self._alerta_mensaje_capturado:
-                self.tomar_captura(f"{nombre_base}_alerta_mensaje_incorrecto", directorio)
+                self.tomar_captura(f"{nombre_base}_alerta_mensaje_incorrecto", directorio, fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Mensaje de alerta incorrecto.\n"
                     f"  --> Esperado (contiene): '{mensaje_alerta_esperado}'\n"
@@ -5246,7 +5302,11 @@ class Funciones_Globales:
             # Si tu aplicación cambia el estado del DOM (ej. un mensaje de éxito/error)
             # después de que la alerta es aceptada, puedes verificarlo aquí.
             # Por ejemplo: expect(self.page.locator("#status_message")).to_have_text("Operación completada");
-            self.esperar_fijo(0.5) # Pequeña pausa para que el DOM se actualice si es necesario
+            # Postcondición: la declarada por el llamador o, en su defecto, que el DOM deje de cambiar.
+            if postcondicion is not None:
+                self._exigir_postcondicion(postcondicion, nombre_base, directorio)
+            else:
+                self.esperar_dom_estable(nombre_paso=f"{nombre_base}_post_alerta")
 
             self.tomar_captura(f"{nombre_base}_alerta_exitosa", directorio)
             self.logger.info(f"\n✅  --> ÉXITO: La alerta se mostró, mensaje verificado y aceptada correctamente.")
@@ -5269,7 +5329,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_elemento_NO_listo_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_elemento_NO_listo_timeout", directorio, fallo=True)
             raise AssertionError(f"\nTimeout al preparar el elemento disparador para '{selector}'") from e
 
         except Error as e:
@@ -5279,7 +5339,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright al verificar alerta para selector '{selector}'") from e
 
         except AssertionError as e:
@@ -5295,12 +5355,12 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al verificar alerta para selector '{selector}'") from e
 
         finally:
             # Este bloque se ejecuta siempre, independientemente del resultado.
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o para liberar recursos.
         
     # 42- Función para verificar una alerta de confirmación utilizando page.expect_event().
     # Este método maneja el diálogo exclusivamente con expect_event e integra pruebas de rendimiento.
@@ -5346,7 +5406,7 @@ class Funciones_Globales:
         if accion_confirmacion not in ['accept', 'dismiss']:
             error_msg = f"\n❌ FALLO: Acción de confirmación no válida: '{accion_confirmacion}'. Use 'accept' o 'dismiss'."
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_accion_invalida", directorio)
+            self.tomar_captura(f"{nombre_base}_accion_invalida", directorio, fallo=True)
             raise AssertionError(error_msg)
 
         # --- Medición de rendimiento: Inicio total de la función ---
@@ -5360,7 +5420,7 @@ class Funciones_Globales:
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
             selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
+            self._espera_post_accion(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
             end_time_element_ready = time.time()
             duration_element_ready = end_time_element_ready - start_time_element_ready
@@ -5404,7 +5464,7 @@ class Funciones_Globales:
             # --- Medición de rendimiento: Inicio de verificación del mensaje ---
             start_time_message_verification = time.time()
             if mensaje_esperado not in dialogo.message:
-                self.tomar_captura(f"{nombre_base}_confirmacion_mensaje_incorrecto", directorio)
+                self.tomar_captura(f"{nombre_base}_confirmacion_mensaje_incorrecto", directorio, fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Mensaje de confirmación incorrecto.\n"
                     f"  --> Esperado (contiene): '{mensaje_esperado}'\n"
@@ -5480,7 +5540,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_confirmacion_NO_aparece_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_confirmacion_NO_aparece_timeout", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nTimeout al verificar confirmación para selector '{selector}'") from e
 
@@ -5491,7 +5551,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError de Playwright al verificar confirmación para selector '{selector}'") from e
 
@@ -5508,12 +5568,12 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al verificar confirmación para selector '{selector}'") from e
 
         finally:
             # Este bloque se ejecuta siempre, independientemente del resultado.
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o para liberar recursos.
         
     # 43- Función para verificar una alerta de confirmación utilizando page.on("dialog") con page.once().
     # Integra pruebas de rendimiento para medir la aparición y manejo de la confirmación a través de un listener.
@@ -5560,7 +5620,7 @@ class Funciones_Globales:
         if accion_confirmacion not in ['accept', 'dismiss']:
             error_msg = f"\n❌ FALLO: Acción de confirmación no válida: '{accion_confirmacion}'. Use 'accept' o 'dismiss'."
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_accion_invalida", directorio)
+            self.tomar_captura(f"{nombre_base}_accion_invalida", directorio, fallo=True)
             raise AssertionError(error_msg)
 
         # Resetear el estado de las banderas para cada ejecución del test
@@ -5580,7 +5640,7 @@ class Funciones_Globales:
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
             selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
+            self._espera_post_accion(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
             end_time_element_ready = time.time()
             duration_element_ready = end_time_element_ready - start_time_element_ready
@@ -5605,8 +5665,9 @@ class Funciones_Globales:
             # Bucle de espera activa hasta que la bandera _dialogo_detectado sea True
             # Se añade un timeout para el bucle, calculado a partir de tiempo_max_deteccion_confirmacion
             wait_end_time = time.time() + tiempo_max_deteccion_confirmacion
-            while not self._dialogo_detectado and time.time() < wait_end_time:
-                time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
+            with contabilidad_esperas.medir(CATEGORIA_ESPERA_FIJA):
+                while not self._dialogo_detectado and time.time() < wait_end_time:
+                    time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
 
             # --- Medición de rendimiento: Fin de click y espera de detección de confirmación ---
             end_time_click_and_confirm_detection = time.time()
@@ -5616,7 +5677,7 @@ class Funciones_Globales:
             if not self._dialogo_detectado:
                 error_msg = f"\n❌ FALLO: La confirmación no fue detectada por el listener después de {tiempo_max_deteccion_confirmacion} segundos."
                 self.logger.error(error_msg)
-                self.tomar_captura(f"{nombre_base}_confirmacion_NO_detectada_timeout", directorio)
+                self.tomar_captura(f"{nombre_base}_confirmacion_NO_detectada_timeout", directorio, fallo=True)
                 # Re-lanzar como AssertionError para un fallo claro de la prueba
                 raise AssertionError(error_msg)
             
@@ -5632,7 +5693,7 @@ class Funciones_Globales:
                 raise AssertionError(f"\nTipo de diálogo inesperado: '{self._dialogo_tipo_capturado}'. Se esperaba 'confirm'.")
 
             if mensaje_esperado not in self._dialogo_mensaje_capturado:
-                self.tomar_captura(f"{nombre_base}_confirmacion_mensaje_incorrecto", directorio)
+                self.tomar_captura(f"{nombre_base}_confirmacion_mensaje_incorrecto", directorio, fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Mensaje de confirmación incorrecto.\n"
                     f"  --> Esperado (contiene): '{mensaje_esperado}'\n"
@@ -5690,7 +5751,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_confirmacion_NO_detectada_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_confirmacion_NO_detectada_timeout", directorio, fallo=True)
             raise AssertionError(f"\nTimeout al verificar confirmación para selector '{selector}'") from e
 
         except Error as e:
@@ -5700,7 +5761,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright al verificar confirmación para selector '{selector}'") from e
 
         except AssertionError as e:
@@ -5716,12 +5777,12 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al verificar confirmación para selector '{selector}'") from e
 
         finally:
             # Este bloque se ejecuta siempre, independientemente del resultado.
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o para liberar recursos.
     
     # 44- Función para verificar_prompt_expect_event (Implementación para Prompt Alert con expect_event).
     # Integra pruebas de rendimiento para medir la aparición, interacción y manejo de un diálogo prompt.
@@ -5773,12 +5834,12 @@ class Funciones_Globales:
         if accion_prompt not in ['accept', 'dismiss']:
             error_msg = f"\n❌ FALLO: Acción de prompt no válida: '{accion_prompt}'. Use 'accept' o 'dismiss'."
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_accion_invalida", directorio)
+            self.tomar_captura(f"{nombre_base}_accion_invalida", directorio, fallo=True)
             raise AssertionError(error_msg)
         if accion_prompt == 'accept' and input_text is None:
             error_msg = "\n❌ FALLO: 'input_text' no puede ser None cuando 'accion_prompt' es 'accept'."
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_input_text_missing", directorio)
+            self.tomar_captura(f"{nombre_base}_input_text_missing", directorio, fallo=True)
             raise AssertionError(error_msg)
         if accion_prompt == 'dismiss' and input_text is not None:
             self.logger.warning("\n⚠️ ADVERTENCIA: 'input_text' se ignora cuando 'accion_prompt' es 'dismiss'.")
@@ -5794,7 +5855,7 @@ class Funciones_Globales:
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
             selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
+            self._espera_post_accion(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
             end_time_element_ready = time.time()
             duration_element_ready = end_time_element_ready - start_time_element_ready
@@ -5837,7 +5898,7 @@ class Funciones_Globales:
             # --- Medición de rendimiento: Inicio de verificación del mensaje ---
             start_time_message_verification = time.time()
             if mensaje_prompt_esperado not in dialogo.message:
-                self.tomar_captura(f"{nombre_base}_prompt_mensaje_incorrecto", directorio)
+                self.tomar_captura(f"{nombre_base}_prompt_mensaje_incorrecto", directorio, fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Mensaje del prompt incorrecto.\n"
                     f"  --> Esperado (contiene): '{mensaje_prompt_esperado}'\n"
@@ -5914,7 +5975,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_prompt_NO_aparece_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_prompt_NO_aparece_timeout", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nTimeout al verificar prompt para selector '{selector}'") from e
 
@@ -5925,7 +5986,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nError de Playwright al verificar prompt para selector '{selector}'") from e
 
@@ -5942,12 +6003,12 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al verificar prompt para selector '{selector}'") from e
 
         finally:
             # Este bloque se ejecuta siempre, independientemente del resultado.
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o para liberar recursos.
         
     # 45- Función para verificar una alerta de tipo 'prompt' utilizando page.on("dialog") con page.once().
     # Integra pruebas de rendimiento para medir la aparición, interacción y manejo de un diálogo prompt.
@@ -5998,12 +6059,12 @@ class Funciones_Globales:
         if accion_prompt not in ['accept', 'dismiss']:
             error_msg = f"\n❌ FALLO: Acción de prompt no válida: '{accion_prompt}'. Use 'accept' o 'dismiss'."
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_accion_invalida", directorio)
+            self.tomar_captura(f"{nombre_base}_accion_invalida", directorio, fallo=True)
             raise AssertionError(error_msg)
         if accion_prompt == 'accept' and input_text is None:
             error_msg = "\n❌ FALLO: 'input_text' no puede ser None cuando 'accion_prompt' es 'accept'."
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_input_text_missing", directorio)
+            self.tomar_captura(f"{nombre_base}_input_text_missing", directorio, fallo=True)
             raise AssertionError(error_msg)
         if accion_prompt == 'dismiss' and input_text is not None:
             self.logger.warning("\n⚠️ ADVERTENCIA: 'input_text' se ignora cuando 'accion_prompt' es 'dismiss'.")
@@ -6026,7 +6087,7 @@ class Funciones_Globales:
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
             selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
+            self._espera_post_accion(0.2) # Pequeña pausa visual antes del clic
             # --- Medición de rendimiento: Fin de visibilidad y habilitación del elemento ---
             end_time_element_ready = time.time()
             duration_element_ready = end_time_element_ready - start_time_element_ready
@@ -6051,8 +6112,9 @@ class Funciones_Globales:
             # Bucle de espera activa hasta que la bandera _dialogo_detectado sea True
             # Se añade un timeout para el bucle, calculado a partir de tiempo_max_deteccion_prompt
             wait_end_time = time.time() + tiempo_max_deteccion_prompt
-            while not self._dialogo_detectado and time.time() < wait_end_time:
-                time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
+            with contabilidad_esperas.medir(CATEGORIA_ESPERA_FIJA):
+                while not self._dialogo_detectado and time.time() < wait_end_time:
+                    time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
 
             # --- Medición de rendimiento: Fin de click y espera de detección del prompt ---
             end_time_click_and_prompt_detection = time.time()
@@ -6062,7 +6124,7 @@ class Funciones_Globales:
             if not self._dialogo_detectado:
                 error_msg = f"\n❌ FALLO: El prompt no fue detectado por el listener después de {tiempo_max_deteccion_prompt} segundos."
                 self.logger.error(error_msg)
-                self.tomar_captura(f"{nombre_base}_prompt_NO_detectada_timeout", directorio)
+                self.tomar_captura(f"{nombre_base}_prompt_NO_detectada_timeout", directorio, fallo=True)
                 # Re-lanzar como AssertionError para un fallo claro de la prueba
                 raise AssertionError(error_msg)
             
@@ -6078,7 +6140,7 @@ class Funciones_Globales:
                 raise AssertionError(f"\nTipo de diálogo inesperado: '{self._dialogo_tipo_capturado}'. Se esperaba 'prompt'.")
 
             if mensaje_prompt_esperado not in self._dialogo_mensaje_capturado:
-                self.tomar_captura(f"{nombre_base}_prompt_mensaje_incorrecto", directorio)
+                self.tomar_captura(f"{nombre_base}_prompt_mensaje_incorrecto", directorio, fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Mensaje del prompt incorrecto.\n"
                     f"  --> Esperado (contiene): '{mensaje_prompt_esperado}'\n"
@@ -6090,7 +6152,7 @@ class Funciones_Globales:
             
             # Verificar que el texto introducido (si es el caso) se ha guardado correctamente
             if accion_prompt == 'accept' and self._dialogo_input_capturado != input_text:
-                self.tomar_captura(f"{nombre_base}_prompt_input_incorrecto", directorio)
+                self.tomar_captura(f"{nombre_base}_prompt_input_incorrecto", directorio, fallo=True)
                 error_msg = (
                     f"\n❌ FALLO: Texto introducido en el prompt incorrecto.\n"
                     f"  --> Esperado: '{input_text}'\n"
@@ -6133,7 +6195,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_prompt_NO_detectada_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_prompt_NO_detectada_timeout", directorio, fallo=True)
             raise AssertionError(f"\nTimeout al verificar prompt para selector '{selector}'") from e
 
         except Error as e:
@@ -6143,7 +6205,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright al verificar prompt para selector '{selector}'") from e
 
         except AssertionError as e:
@@ -6159,12 +6221,12 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al verificar prompt para selector '{selector}'") from e
 
         finally:
             # Este bloque se ejecuta siempre, independientemente del resultado.
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o para liberar recursos.
         
     # 46- Función para esperar por una nueva pestaña/página (popup) que se haya abierto
     # y cambia el foco de la instancia 'page' actual a esa nueva pestaña.
@@ -6207,7 +6269,7 @@ class Funciones_Globales:
             expect(selector_boton_apertura).to_be_visible()
             expect(selector_boton_apertura).to_be_enabled()
             selector_boton_apertura.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual
+            self._espera_post_accion(0.2) # Pequeña pausa visual
 
             # 2. Usar page.context.expect_event("page") para esperar la nueva página
             # y realizar la acción de click DENTRO de este contexto.
@@ -6272,7 +6334,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_no_se_detecto_popup_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_no_se_detecto_popup_timeout", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el framework de pruebas registre un fallo.
             raise AssertionError(f"\nTimeout al abrir o cargar nueva pestaña para selector '{selector_boton_apertura}'") from e
             # Retornar None si prefieres manejar el error en el nivel superior y no lanzar.
@@ -6284,7 +6346,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_abrir_pestana", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_abrir_pestana", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright al abrir y cambiar a nueva pestaña para selector '{selector_boton_apertura}'") from e
         except Exception as e:
             # Captura cualquier otra excepción inesperada.
@@ -6293,16 +6355,16 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_abrir_pestana", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_abrir_pestana", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al abrir y cambiar a nueva pestaña para selector '{selector_boton_apertura}'") from e
         finally:
             # Este bloque se ejecuta siempre, independientemente del resultado.
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o para liberar recursos.
 
     # 47- Función que cierra la pestaña actual y, si hay otras pestañas abiertas en el mismo contexto,
     # cambia el foco de la instancia 'page' a la primera pestaña disponible.
     # Integra mediciones de rendimiento para el cierre y el cambio de foco.
-    def cerrar_pestana_actual(self, nombre_base: str, directorio: str, tiempo_post_cierre: Union[int, float] = 1.0) -> None:
+    def cerrar_pestana_actual(self, nombre_base: str, directorio: str, tiempo_post_cierre: Union[int, float] = 0) -> None:
         """
         Cierra la pestaña Playwright actualmente activa (`self.page`).
         Si quedan otras pestañas abiertas en el mismo contexto del navegador,
@@ -6313,9 +6375,11 @@ class Funciones_Globales:
             nombre_base (str): Nombre base utilizado para la **captura de pantalla**
                                tomada antes de cerrar la pestaña.
             directorio (str): **Ruta del directorio** donde se guardarán las capturas de pantalla.
-            tiempo_post_cierre (Union[int, float]): **Tiempo de espera** (en segundos) después de
-                                                    cerrar la pestaña, antes de intentar cambiar el foco.
-                                                    Por defecto, `1.0` segundos.
+            tiempo_post_cierre (Union[int, float]): **Pausa fija adicional** (en segundos) después de
+                                                    cerrar la pestaña. Solo se aplica si se indica
+                                                    explícitamente: el cierre se verifica como postcondición
+                                                    (`page.is_closed()` y fuera de `context.pages`).
+                                                    Por defecto, `0` (sin pausa).
 
         Raises:
             AssertionError: Si ocurre un error inesperado durante el cierre o el cambio de foco.
@@ -6348,8 +6412,11 @@ class Funciones_Globales:
             
             self.logger.info(f"\n✅ Pestaña con URL '{current_page_url}' cerrada exitosamente.")
             
-            # Pequeña espera después de cerrar la pestaña para asegurar que el DOM se libere
-            self.esperar_fijo(tiempo_post_cierre) 
+            # Postcondición: la página está cerrada y ya no figura entre las páginas del contexto.
+            if not self.page.is_closed() or self.page in self.page.context.pages:
+                raise AssertionError(f"\nLa pestaña con URL '{current_page_url}' sigue abierta tras page.close().")
+            if tiempo_post_cierre and tiempo_post_cierre > 0:
+                self.esperar_fijo(tiempo_post_cierre) # Pausa fija solo si el llamador la pidió explícitamente
 
             # Verificar si hay otras páginas abiertas en el contexto y cambiar el foco
             self.logger.debug("\n  --> Verificando otras pestañas en el contexto para cambiar el foco...")
@@ -6398,7 +6465,7 @@ class Funciones_Globales:
             raise AssertionError(f"\nError inesperado al cerrar pestaña actual: {e}") from e
         finally:
             # Este bloque se ejecuta siempre, independientemente del resultado.
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o para liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o para liberar recursos.
         
     # 48- Función para hacer clic en un selector y esperar que se abran nuevas ventanas/pestañas.
     # Retorna una lista de objetos Page para las nuevas ventanas.
@@ -6445,7 +6512,7 @@ class Funciones_Globales:
             expect(selector).to_be_visible()
             expect(selector).to_be_enabled()
             selector.highlight()
-            self.esperar_fijo(0.2) # Pequeña pausa visual antes del clic
+            self._espera_post_accion(0.2) # Pequeña pausa visual antes del clic
 
             # 2. Hacer clic en el elemento que debería abrir la(s) nueva(s) ventana(s)
             self.logger.debug(f"\n  --> Realizando clic en '{selector}'...")
@@ -6463,8 +6530,9 @@ class Funciones_Globales:
             # --- Medición de rendimiento: Inicio de la espera de detección de páginas ---
             start_time_page_detection = time.time()
             wait_for_detection_end_time = time.time() + tiempo_espera_max_total
-            while not self._all_new_pages_opened_by_click and time.time() < wait_for_detection_end_time:
-                time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
+            with contabilidad_esperas.medir(CATEGORIA_ESPERA_FIJA):
+                while not self._all_new_pages_opened_by_click and time.time() < wait_for_detection_end_time:
+                    time.sleep(0.1) # Pausa breve para evitar consumo excesivo de CPU
 
             if not self._all_new_pages_opened_by_click:
                 raise TimeoutError(f"\nNo se detectó ninguna nueva ventana/pestaña después de hacer clic en '{selector}' dentro del tiempo de espera de {tiempo_espera_max_total} segundos.")
@@ -6502,17 +6570,17 @@ class Funciones_Globales:
 
                 except TimeoutError as te:
                     self.logger.error(f"\n  ❌ FALLO: Tiempo de espera excedido al cargar la página {i+1} (URL: {new_page.url}). Detalles: {te}")
-                    self.tomar_captura(f"{nombre_base}_pagina_no_cargada_{i+1}", directorio, page_to_capture=new_page)
+                    self.tomar_captura(f"{nombre_base}_pagina_no_cargada_{i+1}", directorio, page_to_capture=new_page, fallo=True)
                 except Error as pe:
                     self.logger.error(f"\n  ❌ FALLO: Error de Playwright al interactuar con la página {i+1} (URL: {new_page.url}). Detalles: {pe}")
-                    self.tomar_captura(f"{nombre_base}_pagina_error_playwright_{i+1}", directorio, page_to_capture=new_page)
+                    self.tomar_captura(f"{nombre_base}_pagina_error_playwright_{i+1}", directorio, page_to_capture=new_page, fallo=True)
                 except Exception as ex:
                     self.logger.error(f"\n  ❌ FALLO: Error inesperado al cargar la página {i+1} (URL: {new_page.url}). Detalles: {ex}")
-                    self.tomar_captura(f"{nombre_base}_pagina_error_inesperado_{i+1}", directorio, page_to_capture=new_page)
+                    self.tomar_captura(f"{nombre_base}_pagina_error_inesperado_{i+1}", directorio, page_to_capture=new_page, fallo=True)
 
             if not loaded_pages:
                 self.logger.error(f"\n ❌ FALLO: Ninguna de las nuevas ventanas/pestañas se cargó correctamente.")
-                self.tomar_captura(f"{nombre_base}_ninguna_ventana_cargada", directorio)
+                self.tomar_captura(f"{nombre_base}_ninguna_ventana_cargada", directorio, fallo=True)
                 # Re-lanzar un AssertionError si no se pudo cargar ninguna página
                 raise AssertionError("\nNinguna de las nuevas ventanas/pestañas se cargó correctamente.")
 
@@ -6533,7 +6601,7 @@ class Funciones_Globales:
                 f"o el elemento no estuvo visible/habilitado a tiempo.\nDetalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_no_nueva_ventana_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_no_nueva_ventana_timeout", directorio, fallo=True)
             # Re-lanzar como AssertionError para que el test falle correctamente.
             raise AssertionError(error_msg) from e
 
@@ -6542,7 +6610,7 @@ class Funciones_Globales:
                 f"\n❌ FALLO (Playwright) - {nombre_paso}: Error de Playwright al hacer clic o al detectar/interactuar con las nuevas ventanas.\nDetalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_abrir_ventanas", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_abrir_ventanas", directorio, fallo=True)
             raise AssertionError(error_msg) from e
 
         except AssertionError as e:
@@ -6555,11 +6623,11 @@ class Funciones_Globales:
                 f"\n❌ FALLO (Inesperado) - {nombre_paso}: Ocurrió un error inesperado al intentar abrir nuevas ventanas.\nDetalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_abrir_nueva_ventana", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_abrir_nueva_ventana", directorio, fallo=True)
             raise AssertionError(error_msg) from e
 
         finally:
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o liberar recursos.
 
     # 49- Función para cambiar el foco del navegador a una ventana/pestaña específica,
     # ya sea por su índice (int) o por una parte de su URL o título (str).
@@ -6626,7 +6694,7 @@ class Funciones_Globales:
                 else:
                     error_msg = f"\n❌ FALLO: El índice '{opcion_ventana}' está fuera del rango de pestañas abiertas (0-{len(all_pages_in_context)-1})."
                     self.logger.error(error_msg)
-                    self.tomar_captura(f"{nombre_base}_error_indice_invalido", directorio)
+                    self.tomar_captura(f"{nombre_base}_error_indice_invalido", directorio, fallo=True)
                     raise IndexError(error_msg)
             elif isinstance(opcion_ventana, str):
                 # Intentar encontrar por URL o título
@@ -6645,12 +6713,12 @@ class Funciones_Globales:
                 if not found_match:
                     error_msg = f"\n❌ FALLO: No se encontró ninguna pestaña con la URL o título que contenga '{opcion_ventana}'."
                     self.logger.error(error_msg)
-                    self.tomar_captura(f"{nombre_base}_error_no_coincidencia_foco", directorio)
+                    self.tomar_captura(f"{nombre_base}_error_no_coincidencia_foco", directorio, fallo=True)
                     raise ValueError(error_msg)
             else:
                 error_msg = f"\n❌ FALLO: El tipo de 'opcion_ventana' no es válido. Debe ser int o str (tipo recibido: {type(opcion_ventana).__name__})."
                 self.logger.error(error_msg)
-                self.tomar_captura(f"{nombre_base}_error_tipo_opcion_foco", directorio)
+                self.tomar_captura(f"{nombre_base}_error_tipo_opcion_foco", directorio, fallo=True)
                 raise TypeError(error_msg)
             
             # --- Medición de rendimiento: Fin de búsqueda de página objetivo ---
@@ -6698,7 +6766,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_cambiar_foco", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_cambiar_foco", directorio, fallo=True)
             raise AssertionError(error_msg) from e
 
         except Exception as e:
@@ -6708,10 +6776,10 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_cambiar_foco", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_cambiar_foco", directorio, fallo=True)
             raise AssertionError(error_msg) from e
         finally:
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o liberar recursos.
 
     # 50- Función que cierra un objeto 'Page' específico.
     # Si la página cerrada era la página activa (self.page), intenta cambiar el foco
@@ -6829,7 +6897,7 @@ class Funciones_Globales:
                     f"Detalles: {e}"
                 )
                 self.logger.critical(error_msg, exc_info=True)
-                self.tomar_captura(f"{nombre_base}_error_cerrar_pestana_playwright", directorio)
+                self.tomar_captura(f"{nombre_base}_error_cerrar_pestana_playwright", directorio, fallo=True)
                 raise AssertionError(error_msg) from e
         except Exception as e:
             error_msg = (
@@ -6837,10 +6905,10 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_cerrar_pestana", directorio)
+            self.tomar_captura(f"{nombre_base}_error_cerrar_pestana", directorio, fallo=True)
             raise AssertionError(error_msg) from e
         finally:
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o liberar recursos.
             
     #51- Función para realizar una operación de "Drag and Drop" de un elemento a otro.
     def realizar_drag_and_drop(self, elemento_origen: Locator, elemento_destino: Locator, nombre_base: str, directorio: str, nombre_paso: str = "", tiempo_espera_manual: float = 0.5, timeout_ms: int = 15000) -> None:
@@ -6911,7 +6979,7 @@ class Funciones_Globales:
                 # Captura errores específicos de Playwright (incluyendo TimeoutError de drag_to)
                 self.logger.warning(f"\n⚠️ Advertencia: El método directo 'locator.drag_to()' falló con error de Playwright: {type(e).__name__}: {e}")
                 self.logger.info("\n🔄 Recurriendo a 'Drag and Drop' con método manual de Playwright (mouse.hover, mouse.down, mouse.up)...")
-                self.tomar_captura(f"{nombre_base}_fallo_directo_intentando_manual", directorio)
+                self.tomar_captura(f"{nombre_base}_fallo_directo_intentando_manual", directorio, fallo=True)
                 
                 # Registrar el rendimiento del intento fallido de drag_to
                 end_time_drag_to = time.time() # Registrar el tiempo que tomó fallar
@@ -6929,7 +6997,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_drag_and_drop", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_drag_and_drop", directorio, fallo=True)
             raise AssertionError(error_msg) from e
         except Exception as e: # Captura cualquier otro error inesperado
             error_msg = (
@@ -6937,7 +7005,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_drag_and_drop", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_drag_and_drop", directorio, fallo=True)
             raise AssertionError(error_msg) from e
         finally:
             # --- Medición de rendimiento: Fin total de la función (si no se salió antes) ---
@@ -6946,7 +7014,7 @@ class Funciones_Globales:
                 duration_total_operation = end_time_total_operation - start_time_total_operation
                 self.logger.info(f"PERFORMANCE: Tiempo total de la operación (fallback manual D&D): {duration_total_operation:.4f} segundos.")
             
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o liberar recursos.
         
     # 52- Función para mover sliders de rango (con dos pulgares)
     # Integra pruebas de rendimiento para cada fase del movimiento de los pulgares.
@@ -6987,14 +7055,14 @@ class Funciones_Globales:
         if not (0.0 <= porcentaje_destino_izquierdo <= 1.0) or not (0.0 <= porcentaje_destino_derecho <= 1.0):
             error_msg = "\n❌ Los porcentajes de destino para ambos pulgares deben ser valores flotantes entre 0.0 (0%) y 1.0 (100%)."
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_validacion_porcentajes", directorio)
+            self.tomar_captura(f"{nombre_base}_error_validacion_porcentajes", directorio, fallo=True)
             raise ValueError(error_msg)
         
         # Validación de negocio: el porcentaje izquierdo no puede ser mayor que el derecho
         if porcentaje_destino_izquierdo > porcentaje_destino_derecho:
             error_msg = "\n❌ El porcentaje del pulgar izquierdo no puede ser mayor que el del pulgar derecho."
             self.logger.error(error_msg)
-            self.tomar_captura(f"{nombre_base}_error_validacion_orden_porcentajes", directorio)
+            self.tomar_captura(f"{nombre_base}_error_validacion_orden_porcentajes", directorio, fallo=True)
             raise ValueError(error_msg)
         
         elementos_a_validar: Dict[str, Locator] = {
@@ -7148,7 +7216,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_slider_rango", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_slider_rango", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Exception as e:
@@ -7158,14 +7226,14 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_slider_rango", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_slider_rango", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
         finally:
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o liberar recursos.
     
     # 53- Función para seleccionar una opción en un ComboBox (elemento <select>) por su atributo 'value'.
     # Integra pruebas de rendimiento para las fases de validación, selección y verificación.
-    def seleccionar_opcion_por_valor(self, combobox_locator: Locator, valor_a_seleccionar: str, nombre_base: str, directorio: str, nombre_paso: str = "", timeout_ms: int = 15000) -> None:
+    def seleccionar_opcion_por_valor(self, combobox_locator: Locator, valor_a_seleccionar: str, nombre_base: str, directorio: str, nombre_paso: str = "", timeout_ms: int = 15000, postcondicion: Any = None) -> None:
         """
         Selecciona una opción dentro de un elemento ComboBox (`<select>`) utilizando su atributo 'value'.
         La función valida la visibilidad y habilitación del ComboBox, realiza la selección y
@@ -7180,6 +7248,11 @@ class Funciones_Globales:
             nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para los logs y nombres de capturas. Por defecto "".
             timeout_ms (int, opcional): Tiempo máximo en milisegundos para esperar la visibilidad,
                                         habilitación y verificación de la selección. Por defecto `15000`ms (15 segundos).
+            postcondicion (Any, opcional): Postcondición que debe cumplirse tras la acción (ver `esperar_postcondicion`):
+                                           un Locator que debe quedar visible, "red_inactiva", "dom_estable",
+                                           "pagina_cargada", "dom_cargado" o una función que devuelva `True`.
+                                           Si se indica, se espera a que se cumpla tras la selección y, si no se
+                                           cumple, el paso falla con `AssertionError`. Por defecto `None`.
 
         Raises:
             AssertionError: Si el ComboBox no es visible/habilitado, la opción no se puede seleccionar,
@@ -7206,7 +7279,7 @@ class Funciones_Globales:
             self.logger.info(f"\n✅ ComboBox '{combobox_locator}' es visible y habilitado.")
             
             # 2. Tomar captura antes de la selección
-            self.tomar_captura(f"{nombre_base}_antes_de_seleccionar_combo", directorio)
+            self.tomar_captura(f"{nombre_base}_antes_de_seleccionar_combo", directorio, elemento=combobox_locator)
 
             # 3. Seleccionar la opción por su valor
             self.logger.info(f"\n🔄 Seleccionando opción '{valor_a_seleccionar}' en '{combobox_locator}'...")
@@ -7233,7 +7306,7 @@ class Funciones_Globales:
             self.logger.info(f"\n✅ ComboBox '{combobox_locator}' verificado con valor '{valor_a_seleccionar}'.")
 
             # 5. Tomar captura después de la selección exitosa
-            self.tomar_captura(f"{nombre_base}_despues_de_seleccionar_combo_exito", directorio)
+            self.tomar_captura(f"{nombre_base}_despues_de_seleccionar_combo_exito", directorio, elemento=combobox_locator)
             
             # --- Medición de rendimiento: Fin total de la función ---
             end_time_total_operation = time.time()
@@ -7248,7 +7321,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_combo", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_combo", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Error as e:
@@ -7259,7 +7332,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_combo", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_combo", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Exception as e:
@@ -7269,10 +7342,14 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_combo", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_inesperado_combo", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
         finally:
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
+            if postcondicion is None:
+                self._espera_post_accion(0.2) # Pequeña espera final para observación o liberar recursos.
+
+        # La postcondición declarada se exige solo si la acción terminó sin errores: si no se cumple, el paso falla.
+        self._exigir_postcondicion(postcondicion, nombre_base, directorio, nombre_paso)
         
     # 54- Función para seleccionar una opción en un ComboBox (elemento <select>) por su texto visible (label).
     # Integra pruebas de rendimiento para las fases de validación, selección y verificación.
@@ -7370,7 +7447,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_combo_label", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_combo_label", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Error as e:
@@ -7380,7 +7457,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_combo_label", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_combo_label", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Exception as e:
@@ -7389,10 +7466,10 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_combo_label", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_inesperado_combo_label", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
         finally:
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o liberar recursos.
     
     # 55- Función para presionar la tecla TAB en el teclado
     # Integra pruebas de rendimiento para medir el tiempo de ejecución de la acción.
@@ -7429,8 +7506,7 @@ class Funciones_Globales:
             self.logger.info("\nTecla TAB presionada exitosamente.")
 
             # Espera fija después de presionar TAB (configuracion por parametro)
-            if tiempo_espera_post_tab > 0:
-                self.esperar_fijo(tiempo_espera_post_tab)
+            self._espera_post_accion(tiempo_espera_post_tab)
 
         except Exception as e:
             error_msg = (
@@ -7543,7 +7619,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_multi_combo", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_multi_combo", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Error as e:
@@ -7553,7 +7629,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_multi_combo", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_multi_combo", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Exception as e:
@@ -7562,10 +7638,10 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_multi_combo", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_inesperado_multi_combo", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
         finally:
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o liberar recursos.
         
     # 57- Función que obtiene y imprime los valores y el texto de todas las opciones en un dropdown list.
     # Integra pruebas de rendimiento para medir el tiempo de extracción de datos del dropdown.
@@ -7663,7 +7739,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_dropdown_fallo_timeout", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Error as e:
@@ -7672,7 +7748,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_playwright_error", directorio)
+            self.tomar_captura(f"{nombre_base}_dropdown_fallo_playwright_error", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Exception as e:
@@ -7681,14 +7757,14 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_dropdown_fallo_inesperado", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
         finally:
             # --- Medición de rendimiento: Fin total de la función ---
             end_time_total_operation = time.time()
             duration_total_operation = end_time_total_operation - start_time_total_operation
             self.logger.info(f"PERFORMANCE: Tiempo total de la operación (obtener valores dropdown): {duration_total_operation:.4f} segundos.")
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o liberar recursos.
         
     # 58- Función que obtiene y compara los valores y el texto de todas las opciones en un dropdown list.
     # Integra pruebas de rendimiento para medir el tiempo de extracción y comparación de datos.
@@ -7839,12 +7915,12 @@ class Funciones_Globales:
                         if missing_in_expected:
                             error_msg += f"  - Opciones encontradas en el dropdown que no estaban esperadas: {missing_in_expected}\n"
                         self.logger.error(error_msg)
-                        self.tomar_captura(f"{nombre_base}_dropdown_comparacion_fallida", directorio)
+                        self.tomar_captura(f"{nombre_base}_dropdown_comparacion_fallida", directorio, fallo=True)
                         raise AssertionError(f"\nComparación de opciones del dropdown fallida para '{dropdown_locator}'. {error_msg.strip()}")
 
                 except Exception as e:
                     self.logger.critical(f"\n❌ FALLO: Ocurrió un error durante la comparación de opciones: {e}", exc_info=True)
-                    self.tomar_captura(f"{nombre_base}_dropdown_error_comparacion", directorio)
+                    self.tomar_captura(f"{nombre_base}_dropdown_error_comparacion", directorio, fallo=True)
                     raise AssertionError(f"\nError al comparar opciones del dropdown '{dropdown_locator}': {e}") from e
                 # --- Medición de rendimiento: Fin de la fase de comparación ---
                 end_time_comparison = time.time()
@@ -7860,7 +7936,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_timeout", directorio)
+            self.tomar_captura(f"{nombre_base}_dropdown_fallo_timeout", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Error as e:
@@ -7869,7 +7945,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_playwright_error", directorio)
+            self.tomar_captura(f"{nombre_base}_dropdown_fallo_playwright_error", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
 
         except Exception as e:
@@ -7878,14 +7954,14 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_dropdown_fallo_inesperado", directorio)
+            self.tomar_captura(f"{nombre_base}_dropdown_fallo_inesperado", directorio, fallo=True)
             raise AssertionError(mensaje_error) from e
         finally:
             # --- Medición de rendimiento: Fin total de la función ---
             end_time_total_operation = time.time()
             duration_total_operation = end_time_total_operation - start_time_total_operation
             self.logger.info(f"PERFORMANCE: Tiempo total de la operación (obtener y comparar valores dropdown): {duration_total_operation:.4f} segundos.")
-            self.esperar_fijo(0.2) # Pequeña espera final para observación o liberar recursos.
+            self._espera_post_accion(0.2) # Pequeña espera final para observación o liberar recursos.
     
     # 59- Función que detecta y devuelve el número total de filas ocupadas en una hoja específica de un archivo Excel.
     # Integra pruebas de rendimiento para medir el tiempo de lectura del archivo Excel.
@@ -7895,6 +7971,8 @@ class Funciones_Globales:
         Opcionalmente, descuenta una fila para el encabezado si 'has_header' es True.
         Esta función mide el tiempo que tarda en cargar el archivo Excel y obtener el número de filas,
         lo cual es útil para pruebas de rendimiento en escenarios de procesamiento de datos.
+        El libro se obtiene de la caché `cache_workbooks`, por lo que solo se parsea la primera vez
+        (o cuando el archivo cambia en disco).
 
         Args:
             archivo_excel_path (str): La **ruta completa al archivo Excel** (`.xlsx` o `.xlsm`).
@@ -7917,9 +7995,11 @@ class Funciones_Globales:
         num_data_rows = 0
 
         try:
-            self.logger.info(f"\n⏳ Cargando el libro de trabajo Excel: '{archivo_excel_path}'...")
-            workbook = openpyxl.load_workbook(archivo_excel_path) # Carga el libro de trabajo Excel
-            self.logger.info(f"\n✅ Libro de trabajo cargado. Seleccionando la hoja '{hoja}'...")
+            self.logger.info(f"\n⏳ Obteniendo el libro de trabajo Excel: '{archivo_excel_path}'...")
+            # El libro se resuelve a través de la caché: solo se parsea si no está en memoria o si cambió en disco.
+            workbook, desde_cache = cache_workbooks.obtener(archivo_excel_path)
+            origen = "desde caché" if desde_cache else "cargado desde disco"
+            self.logger.info(f"\n✅ Libro de trabajo {origen}. Seleccionando la hoja '{hoja}'...")
             sheet = workbook[hoja] # Selecciona la hoja específica del libro
             
             # Obtiene el número total de filas con contenido.
@@ -7959,9 +8039,7 @@ class Funciones_Globales:
             end_time_total_operation = time.time()
             duration_total_operation = end_time_total_operation - start_time_total_operation
             self.logger.info(f"PERFORMANCE: Tiempo total de la operación (num_Filas_excel): {duration_total_operation:.4f} segundos.")
-            # Es importante cerrar el workbook si se ha abierto explícitamente y no con 'with open()'
-            # Sin embargo, openpyxl.load_workbook no requiere un cierre explícito en la mayoría de los casos
-            # ya que maneja el archivo internamente. Aun así, se puede añadir un log de depuración.
+            # El workbook no se cierra: queda en la caché compartida para las siguientes lecturas.
             self.logger.debug("\nFinalizada la operación de lectura de Excel.")
 
     # 60- Función que obtiene el valor de una celda específica de una hoja Excel,
@@ -7974,6 +8052,8 @@ class Funciones_Globales:
         Permite especificar la columna por su nombre (si hay encabezado) o por su índice numérico.
         Esta función mide el tiempo que tarda en cargar el archivo, ubicar la columna/fila,
         y extraer el dato, lo cual es útil para identificar cuellos de botella en la lectura de datos.
+        El libro se obtiene de la caché `cache_workbooks`, de modo que las lecturas repetidas de celdas
+        del mismo archivo cuestan una búsqueda en diccionario en lugar de un parseo completo del .xlsx.
 
         Args:
             archivo_excel_path (str): La **ruta completa al archivo Excel** (`.xlsx` o `.xlsm`).
@@ -8003,9 +8083,11 @@ class Funciones_Globales:
         try:
             # --- Medición de rendimiento: Carga del Workbook y selección de hoja ---
             start_time_load_workbook = time.time()
-            self.logger.info(f"\n⏳ Cargando el libro de trabajo Excel: '{archivo_excel_path}'...")
-            workbook = openpyxl.load_workbook(archivo_excel_path)
-            self.logger.info(f"\n✅ Libro de trabajo cargado. Seleccionando la hoja '{hoja}'...")
+            self.logger.info(f"\n⏳ Obteniendo el libro de trabajo Excel: '{archivo_excel_path}'...")
+            # El libro se resuelve a través de la caché: solo se parsea si no está en memoria o si cambió en disco.
+            workbook, desde_cache = cache_workbooks.obtener(archivo_excel_path)
+            origen = "desde caché" if desde_cache else "cargado desde disco"
+            self.logger.info(f"\n✅ Libro de trabajo {origen}. Seleccionando la hoja '{hoja}'...")
             sheet = workbook[hoja]
             end_time_load_workbook = time.time()
             duration_load_workbook = end_time_load_workbook - start_time_load_workbook
@@ -8017,13 +8099,11 @@ class Funciones_Globales:
                 # --- Medición de rendimiento: Búsqueda de columna por nombre ---
                 start_time_find_column = time.time()
                 self.logger.info(f"\n🔎 Buscando columna por nombre: '{nombre_o_indice_columna}' en el encabezado de la hoja '{hoja}'...")
-                header_found = False
-                # sheet[1] se refiere a la primera fila física del Excel
-                for col_idx, cell in enumerate(sheet[1], 1):
-                    if cell.value is not None and str(cell.value).strip().lower() == nombre_o_indice_columna.strip().lower():
-                        col_index = col_idx
-                        header_found = True
-                        break
+                # El mapa 'encabezado -> índice' de la primera fila física se construye una sola vez
+                # por archivo y hoja; las búsquedas siguientes son una consulta al diccionario.
+                mapa_encabezados = cache_workbooks.mapa_encabezados(archivo_excel_path, hoja)
+                col_index = mapa_encabezados.get(normalizar_encabezado(nombre_o_indice_columna), -1)
+                header_found = col_index != -1
                 end_time_find_column = time.time()
                 duration_find_column = end_time_find_column - start_time_find_column
                 self.logger.info(f"PERFORMANCE: Tiempo de búsqueda de columna por nombre: {duration_find_column:.4f} segundos.")
@@ -8101,9 +8181,10 @@ class Funciones_Globales:
         """
         Detecta y devuelve el número total de filas de datos en un archivo CSV.
         Opcionalmente, descuenta una fila para el encabezado si 'has_header' es True.
-        Esta función mide el tiempo que tarda en abrir el archivo CSV, leer todas sus filas
-        y realizar el conteo, lo cual es útil para evaluar el rendimiento en escenarios
-        de procesamiento de grandes volúmenes de datos CSV.
+        Esta función mide el tiempo que tarda en obtener el conteo de filas, lo cual es útil para
+        evaluar el rendimiento en escenarios de procesamiento de grandes volúmenes de datos CSV.
+        El conteo sale del índice de líneas en caché (`cache_indices_csv`), por lo que solo la
+        primera llamada por versión del archivo recorre su contenido.
 
         Args:
             archivo_csv_path (str): La **ruta completa al archivo CSV**.
@@ -8127,17 +8208,14 @@ class Funciones_Globales:
         row_count = 0 # Inicializamos el contador de filas
 
         try:
-            self.logger.info(f"\n⏳ Abriendo y leyendo el archivo CSV: '{archivo_csv_path}'...")
-            with open(archivo_csv_path, 'r', newline='', encoding='utf-8') as csvfile:
-                # Crea un objeto reader para iterar sobre las líneas del CSV, usando el delimitador especificado.
-                # 'newline=''' es crucial para evitar problemas con saltos de línea en diferentes SO.
-                # 'encoding='utf-8'' es una buena práctica para manejar caracteres especiales.
-                csv_reader = csv.reader(csvfile, delimiter=delimiter)
-                
-                # Cuenta todas las filas en el CSV. sum(1 for row in csv_reader) es una forma eficiente.
-                row_count = sum(1 for row in csv_reader)
+            self.logger.info(f"\n⏳ Obteniendo el índice de líneas del archivo CSV: '{archivo_csv_path}'...")
+            # El índice de desplazamientos se construye una sola vez por versión del archivo (mtime/tamaño);
+            # a partir de ahí, contar filas es una consulta a la longitud del índice.
+            indice_csv, desde_cache = cache_indices_csv.obtener(archivo_csv_path)
+            row_count = indice_csv.num_filas
 
-            self.logger.info(f"\n✅ Lectura de archivo CSV completada. Filas totales encontradas: {row_count}.")
+            origen = "desde caché" if desde_cache else "construido"
+            self.logger.info(f"\n✅ Índice del archivo CSV {origen}. Filas totales encontradas: {row_count}.")
 
             if has_header and row_count > 0:
                 # Si tiene encabezado y el archivo no está vacío (es decir, hay al menos el encabezado)
@@ -8180,9 +8258,11 @@ class Funciones_Globales:
         """
         Obtiene el valor de una "celda" específica de un archivo CSV, ajustando el índice de la fila
         si se indica que la primera fila es un encabezado. Permite especificar el delimitador del CSV.
-        Esta función mide el tiempo que tarda en cargar el archivo CSV, leer todas sus filas
-        y extraer el dato de la celda solicitada, lo cual es crucial para evaluar el rendimiento
+        Esta función mide el tiempo que tarda en obtener el índice de líneas del CSV y extraer
+        el dato de la celda solicitada, lo cual es crucial para evaluar el rendimiento
         en escenarios de automatización basados en datos de archivos CSV.
+        Solo se parsea la fila solicitada: el índice de desplazamientos (`cache_indices_csv`) se
+        construye una vez por archivo, lo que permite trabajar con CSV de varios GB.
 
         Args:
             archivo_csv_path (str): La **ruta completa al archivo CSV**.
@@ -8220,30 +8300,34 @@ class Funciones_Globales:
 
             self.logger.info(f"\n🔎 Calculando índices físicos: Fila física (0-indexed): {actual_fila_0_indexed}, Columna física (0-indexed): {actual_col_0_indexed}.")
 
-            # --- Medición de rendimiento: Carga del archivo CSV y lectura de todas las filas ---
+            # --- Medición de rendimiento: Obtención del índice de líneas del CSV ---
             start_time_load_csv = time.time()
-            self.logger.info(f"\n⏳ Abriendo y leyendo todas las filas del archivo CSV: '{archivo_csv_path}'...")
-            with open(archivo_csv_path, 'r', newline='', encoding='utf-8') as csvfile:
-                csv_reader = csv.reader(csvfile, delimiter=delimiter)
-                rows = list(csv_reader) # Lee todas las filas del CSV en una lista de listas (cada sublista es una fila)
+            self.logger.info(f"\n⏳ Obteniendo el índice de líneas del archivo CSV: '{archivo_csv_path}'...")
+            # Solo la primera lectura de cada versión del archivo recorre el CSV completo (vía mmap);
+            # el resto reutiliza el índice en caché.
+            indice_csv, desde_cache = cache_indices_csv.obtener(archivo_csv_path)
+            total_filas = indice_csv.num_filas
             end_time_load_csv = time.time()
             duration_load_csv = end_time_load_csv - start_time_load_csv
-            self.logger.info(f"PERFORMANCE: Tiempo de carga del archivo CSV y lectura de todas las filas: {duration_load_csv:.4f} segundos.")
+            self.logger.info(f"PERFORMANCE: Tiempo de obtención del índice del archivo CSV ({'caché' if desde_cache else 'construido'}): {duration_load_csv:.4f} segundos.")
             
-            self.logger.info(f"\n✅ Archivo CSV leído. Total de filas físicas encontradas: {len(rows)}.")
+            self.logger.info(f"\n✅ Índice del archivo CSV disponible. Total de filas físicas encontradas: {total_filas}.")
 
             # Validación de límites para la fila
-            if actual_fila_0_indexed < 0 or actual_fila_0_indexed >= len(rows):
-                self.logger.error(f"\n❌ Error: La fila lógica {fila_logica} (física 0-indexed: {actual_fila_0_indexed}) está fuera de los límites del archivo CSV '{archivo_csv_path}'. Total filas físicas: {len(rows)}.")
+            if actual_fila_0_indexed < 0 or actual_fila_0_indexed >= total_filas:
+                self.logger.error(f"\n❌ Error: La fila lógica {fila_logica} (física 0-indexed: {actual_fila_0_indexed}) está fuera de los límites del archivo CSV '{archivo_csv_path}'. Total filas físicas: {total_filas}.")
                 return None
 
+            # Lee y parsea únicamente la fila solicitada (un 'seek' más el parseo de una línea).
+            fila = indice_csv.leer_fila(actual_fila_0_indexed, delimiter)
+
             # Validación de límites para la columna en la fila específica
-            if actual_col_0_indexed < 0 or actual_col_0_indexed >= len(rows[actual_fila_0_indexed]):
-                self.logger.error(f"\n❌ Error: La columna lógica {columna_logica} (física 0-indexed: {actual_col_0_indexed}) está fuera de los límites de la fila física {actual_fila_0_indexed} del archivo CSV '{archivo_csv_path}'. Total columnas en esa fila: {len(rows[actual_fila_0_indexed])}.")
+            if actual_col_0_indexed < 0 or actual_col_0_indexed >= len(fila):
+                self.logger.error(f"\n❌ Error: La columna lógica {columna_logica} (física 0-indexed: {actual_col_0_indexed}) está fuera de los límites de la fila física {actual_fila_0_indexed} del archivo CSV '{archivo_csv_path}'. Total columnas en esa fila: {len(fila)}.")
                 return None
 
             # Obtiene el valor de la celda especificada
-            cell_value = rows[actual_fila_0_indexed][actual_col_0_indexed]
+            cell_value = fila[actual_col_0_indexed]
             
             self.logger.info(f"\n✅ Dato obtenido de (Fila lógica: {fila_logica}, Columna lógica: {columna_logica}) en '{archivo_csv_path}': '{cell_value}'.")
             return cell_value
@@ -8649,7 +8733,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_timeout_click_derecho", directorio)
+            self.tomar_captura(f"{nombre_base}_error_timeout_click_derecho", directorio, fallo=True)
             # Re-lanzamos la excepción TimeoutError que ya es específica de Playwright
             raise 
 
@@ -8660,7 +8744,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_click_derecho", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_click_derecho", directorio, fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -8669,7 +8753,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_click_derecho", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_click_derecho", directorio, fallo=True)
             raise # Re-lanza la excepción
 
         finally:
@@ -8680,9 +8764,7 @@ class Funciones_Globales:
             
             # Espera fija después de la interacción, si se especificó
             # Nota: el parámetro de entrada 'tiempo' se ha renombrado a 'tiempo_espera_post_click' para mayor claridad.
-            if tiempo_espera_post_click > 0:
-                self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_click} segundos después del click derecho.")
-                self.esperar_fijo(tiempo_espera_post_click) # Asegúrate de que esta función exista
+            self._espera_post_accion(tiempo_espera_post_click)
     
     # 68- Función que realiza una acción de 'mouse down' (presionar el botón del ratón) sobre un elemento.
     # Esta versión utiliza page.mouse.down() para una simulación más precisa de solo presionar.
@@ -8777,7 +8859,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_timeout_mouse_down", directorio)
+            self.tomar_captura(f"{nombre_base}_error_timeout_mouse_down", directorio, fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
@@ -8787,7 +8869,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_mouse_down", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_mouse_down", directorio, fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -8796,7 +8878,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_mouse_down", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_mouse_down", directorio, fallo=True)
             raise # Re-lanza la excepción
 
         finally:
@@ -8806,9 +8888,7 @@ class Funciones_Globales:
             self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer_mouse_down_en_elemento): {duration_total_operation:.4f} segundos.")
             
             # Espera fija después de la interacción, si se especificó
-            if tiempo_espera_post_accion > 0:
-                self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_accion} segundos después de la acción de 'mouse down'.")
-                self.esperar_fijo(tiempo_espera_post_accion) # Asegúrate de que esta función exista
+            self._espera_post_accion(tiempo_espera_post_accion)
     
     # 69- Función que realiza una acción de 'mouse up' (soltar el botón del ratón) sobre un elemento.
     # Esta versión utiliza page.mouse.up() para una simulación precisa de solo soltar el botón.
@@ -8903,7 +8983,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_timeout_mouse_up", directorio)
+            self.tomar_captura(f"{nombre_base}_error_timeout_mouse_up", directorio, fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
@@ -8913,7 +8993,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_mouse_up", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_mouse_up", directorio, fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -8922,7 +9002,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_mouse_up", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_mouse_up", directorio, fallo=True)
             raise # Re-lanza la excepción
 
         finally:
@@ -8932,9 +9012,7 @@ class Funciones_Globales:
             self.logger.info(f"PERFORMANCE: Tiempo total de la operación (hacer_mouse_up_de_elemento): {duration_total_operation:.4f} segundos.")
             
             # Espera fija después de la interacción, si se especificó
-            if tiempo_espera_post_accion > 0:
-                self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_accion} segundos después de la acción de 'mouse up'.")
-                self.esperar_fijo(tiempo_espera_post_accion) # Asegúrate de que esta función exista
+            self._espera_post_accion(tiempo_espera_post_accion)
     
     # 70- Función que realiza una acción de 'focus' (enfocar) sobre un elemento.
     # Integra pruebas de rendimiento utilizando Playwright y captura métricas de tiempo.
@@ -9019,7 +9097,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_timeout_focus", directorio)
+            self.tomar_captura(f"{nombre_base}_error_timeout_focus", directorio, fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
@@ -9029,7 +9107,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_focus", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_focus", directorio, fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -9038,7 +9116,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_focus", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_focus", directorio, fallo=True)
             raise # Re-lanza la excepción
 
         finally:
@@ -9049,9 +9127,7 @@ class Funciones_Globales:
             
             # Espera fija después de la interacción, si se especificó
             # Nota: el parámetro de entrada original 'tiempo' se ha renombrado a 'tiempo_espera_post_accion' para mayor claridad.
-            if tiempo_espera_post_accion > 0:
-                self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_accion} segundos después de la acción de 'focus'.")
-                self.esperar_fijo(tiempo_espera_post_accion) # Asegúrate de que esta función exista
+            self._espera_post_accion(tiempo_espera_post_accion)
     
     # 71- Función que realiza una acción de 'blur' (desenfocar) sobre un elemento.
     # Integra pruebas de rendimiento utilizando Playwright y captura métricas de tiempo.
@@ -9139,7 +9215,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_timeout_blur", directorio)
+            self.tomar_captura(f"{nombre_base}_error_timeout_blur", directorio, fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
@@ -9149,7 +9225,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_blur", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_blur", directorio, fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -9158,7 +9234,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_blur", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_blur", directorio, fallo=True)
             raise # Re-lanza la excepción
 
         finally:
@@ -9169,9 +9245,7 @@ class Funciones_Globales:
             
             # Espera fija después de la interacción, si se especificó
             # Nota: el parámetro de entrada original 'tiempo' se ha renombrado a 'tiempo_espera_post_accion' para mayor claridad.
-            if tiempo_espera_post_accion > 0:
-                self.logger.info(f"\n⏳ Esperando {tiempo_espera_post_accion} segundos después de la acción de 'blur'.")
-                self.esperar_fijo(tiempo_espera_post_accion) # Asegúrate de que esta función exista
+            self._espera_post_accion(tiempo_espera_post_accion)
     
     # 72- Función que verifica el estado de un checkbox (marcado/desmarcado) o el valor de una opción seleccionada en un select.
     # Integra pruebas de rendimiento utilizando Playwright y captura métricas de tiempo.
@@ -9287,7 +9361,7 @@ class Funciones_Globales:
                 f"Estado actual: '{valor_actual_str}'. Detalles: {e}"
             )
             self.logger.warning(error_msg)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_estado", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_verificar_estado", directorio, fallo=True)
             return False
 
         except AssertionError as e:
@@ -9298,7 +9372,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.warning(error_msg)
-            self.tomar_captura(f"{nombre_base}_fallo_verificar_estado", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_verificar_estado", directorio, fallo=True)
             return False
 
         except ValueError as e:
@@ -9307,7 +9381,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True) # Incluir exc_info para ValueError también
-            self.tomar_captura(f"{nombre_base}_error_valor_invalido_verificar_estado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_valor_invalido_verificar_estado", directorio, fallo=True)
             raise # Re-lanzamos el ValueError ya que es un error de uso de la función.
 
         except Error as e: # Captura errores específicos de Playwright (directamente 'Error' sin alias)
@@ -9316,7 +9390,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_playwright_verificar_estado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_playwright_verificar_estado", directorio, fallo=True)
             raise # Re-lanza la excepción original de Playwright
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -9325,7 +9399,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_inesperado_verificar_estado", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_verificar_estado", directorio, fallo=True)
             raise # Re-lanza la excepción
 
         finally:
@@ -9453,7 +9527,7 @@ class Funciones_Globales:
                 return valor_final
             else:
                 self.logger.warning(f"\n❌ No se pudo extraer ningún valor significativo del elemento '{selector}'.")
-                self.tomar_captura(f"{nombre_base}_fallo_extraccion_valor_no_encontrado", directorio)
+                self.tomar_captura(f"{nombre_base}_fallo_extraccion_valor_no_encontrado", directorio, fallo=True)
                 return None
 
         except TimeoutError as e:
@@ -9462,7 +9536,7 @@ class Funciones_Globales:
                 f"no se volvió visible a tiempo ({tiempo_max_espera_visibilidad}s) para extraer su valor. Detalles: {e}"
             )
             self.logger.error(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_timeout_extraccion_valor", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_timeout_extraccion_valor", directorio, fallo=True)
             # Elevar una excepción clara para que el flujo de la prueba se detenga si el elemento no está disponible
             raise AssertionError(f"\nElemento no disponible para extracción de valor: {selector}. Error: {e.message if hasattr(e, 'message') else str(e)}") from e
 
@@ -9472,7 +9546,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.error(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_extraccion_valor", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_playwright_error_extraccion_valor", directorio, fallo=True)
             raise AssertionError(f"\nError de Playwright al extraer valor: {selector}. Error: {e.message if hasattr(e, 'message') else str(e)}") from e
 
         except Exception as e: # Captura cualquier otro error inesperado
@@ -9481,7 +9555,7 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(mensaje_error, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_fallo_inesperado_extraccion_valor", directorio)
+            self.tomar_captura(f"{nombre_base}_fallo_inesperado_extraccion_valor", directorio, fallo=True)
             raise AssertionError(f"\nError inesperado al extraer valor: {selector}. Error: {e}") from e
 
         finally:
@@ -9497,6 +9571,560 @@ class Funciones_Globales:
             # adicional después de la extracción, se debería añadir un nuevo parámetro.
             pass
         
+    # 74- Función que recorre las filas de una hoja Excel en una sola pasada (streaming).
+    # Integra pruebas de rendimiento para medir el tiempo total del recorrido y las filas por segundo.
+    def iterar_filas_excel(self, archivo_excel_path: str, hoja: str, has_header: bool = True, como: str = "dict",
+                           columnas: Optional[List[Union[str, int]]] = None, como_texto: bool = False, nombre_paso: str = ""):
+        """
+        Recorre las filas de datos de una hoja Excel devolviéndolas una a una como diccionarios o tuplas.
+        Utiliza el modo streaming de openpyxl (`read_only=True`, `values_only=True`), por lo que la memoria
+        se mantiene constante incluso en hojas de cientos de miles de filas, y resuelve el mapa
+        'encabezado -> columna' una única vez al inicio (en lugar de buscarlo en cada celda como
+        `dato_Columna_excel`). Las filas completamente vacías se omiten, por lo que el número de filas
+        recorridas puede ser menor que el calculado a partir de `sheet.max_row` (que sí las incluye).
+
+        Args:
+            archivo_excel_path (str): La **ruta completa al archivo Excel** (`.xlsx` o `.xlsm`).
+            hoja (str): El **nombre de la hoja/pestaña** dentro del archivo Excel.
+            has_header (bool, opcional): Si es `True`, la primera fila se interpreta como encabezado. Por defecto es `True`.
+            como (str, opcional): `"dict"` para obtener cada fila como diccionario (claves = encabezados)
+                                  o `"tupla"` para obtenerla como tupla de valores. Por defecto es `"dict"`.
+            columnas (List[Union[str, int]], opcional): Columnas a devolver, por nombre de encabezado
+                                                        (sin distinguir mayúsculas) o por índice basado en 1.
+                                                        Si es `None`, se devuelven todas. Por defecto es `None`.
+            como_texto (bool, opcional): Si es `True`, los valores no vacíos se convierten a `str`
+                                         (igual que hace `dato_Columna_excel`). Por defecto es `False`.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para los logs. Por defecto "".
+
+        Yields:
+            Union[Dict, Tuple]: Cada fila de datos de la hoja.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            KeyError: Si la hoja o alguna de las columnas indicadas no existen.
+            ValueError: Si `como` no es un formato admitido.
+            Exception: Cualquier otro error de lectura. Todos se registran y se relanzan, para que un
+                       archivo u hoja inexistente no se confunda con un conjunto de datos vacío.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Iniciando recorrido de filas de la hoja '{hoja}' en el archivo '{archivo_excel_path}' (tiene encabezado: {has_header}, formato: {como}). ---")
+
+        # --- Medición de rendimiento: Inicio total del recorrido ---
+        start_time_total_operation = time.time()
+        filas_leidas = 0
+
+        try:
+            for fila in iterar_filas_hoja(archivo_excel_path, hoja, has_header, como, columnas):
+                if como_texto:
+                    if isinstance(fila, dict):
+                        fila = {clave: (str(valor) if valor is not None else None) for clave, valor in fila.items()}
+                    else:
+                        fila = tuple(str(valor) if valor is not None else None for valor in fila)
+                filas_leidas += 1
+                yield fila
+
+            self.logger.info(f"\n✅ Recorrido de la hoja '{hoja}' completado. Filas de datos leídas: {filas_leidas}.")
+
+        except FileNotFoundError:
+            error_msg = f"\n❌ FALLO (Archivo no encontrado): El archivo Excel no se encontró en la ruta: '{archivo_excel_path}'."
+            self.logger.critical(error_msg)
+            raise
+        except KeyError as e:
+            error_msg = f"\n❌ FALLO (Hoja o columna no encontrada): {e} Archivo Excel: '{archivo_excel_path}', Hoja: '{hoja}'."
+            self.logger.critical(error_msg)
+            raise
+        except ValueError as e:
+            error_msg = f"\n❌ FALLO (Parámetro inválido): {e}"
+            self.logger.critical(error_msg)
+            raise
+        except Exception as e:
+            error_msg = (
+                f"\n❌ FALLO (Error Inesperado): Ocurrió un error inesperado al recorrer las filas del Excel.\n"
+                f"Archivo: '{archivo_excel_path}', Hoja: '{hoja}'.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace
+            raise
+        finally:
+            # --- Medición de rendimiento: Fin total del recorrido ---
+            end_time_total_operation = time.time()
+            duration_total_operation = end_time_total_operation - start_time_total_operation
+            filas_por_segundo = filas_leidas / duration_total_operation if duration_total_operation > 0 else 0.0
+            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (iterar_filas_excel): {duration_total_operation:.4f} segundos ({filas_leidas} filas, {filas_por_segundo:.1f} filas/s).")
+
+    # 75- Función que recorre los registros de un archivo XML de forma incremental (iterparse).
+    # Integra pruebas de rendimiento para medir el tiempo hasta el primer registro y el tiempo total.
+    def iterar_registros_xml(self, xml_file_path: str, etiqueta_registro: str = "record", nombre_paso: str = ""):
+        """
+        Recorre los registros de un archivo XML devolviéndolos uno a uno como diccionarios
+        'etiqueta hija -> texto' (por ejemplo `{'Nombre': ..., 'Apellido': ..., 'Teléfono': ...}`).
+        A diferencia de `leer_xml`, no construye el árbol completo: usa `ET.iterparse` y libera cada
+        registro una vez procesado, por lo que la memoria se mantiene estable sin importar el tamaño
+        del archivo y el primer registro está disponible antes de terminar el parseo.
+
+        Args:
+            xml_file_path (str): La **ruta completa al archivo XML**.
+            etiqueta_registro (str, opcional): La etiqueta de los elementos que representan un registro.
+                                               Por defecto es `"record"`.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+                                         Por defecto es una cadena vacía "".
+
+        Yields:
+            Dict[str, Optional[str]]: El contenido de cada registro.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            ET.ParseError: Si el XML está mal formado. Al tratarse de una lectura incremental, el error
+                           puede aparecer después de haber entregado registros, por lo que se relanza
+                           para no confundir un recorrido parcial con uno completo.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Iniciando lectura incremental de registros '<{etiqueta_registro}>' del archivo XML: '{xml_file_path}'. ---")
+
+        # --- Medición de rendimiento: Inicio de la operación total de la función ---
+        start_time_total_operation = time.time()
+        registros_leidos = 0
+
+        try:
+            for registro in iterar_registros_xml(xml_file_path, etiqueta_registro):
+                if registros_leidos == 0:
+                    duration_first_record = time.time() - start_time_total_operation
+                    self.logger.info(f"PERFORMANCE: Tiempo hasta el primer registro XML: {duration_first_record:.4f} segundos.")
+                registros_leidos += 1
+                yield registro
+
+            self.logger.info(f"\n✅ Lectura incremental del archivo XML '{xml_file_path}' completada. Registros leídos: {registros_leidos}.")
+
+        except FileNotFoundError:
+            error_msg = f"\n❌ FALLO (Archivo no encontrado): El archivo XML no se encontró en la ruta: '{xml_file_path}'."
+            self.logger.critical(error_msg)
+            raise
+        except ET.ParseError as e:
+            error_msg = f"\n❌ FALLO (Error de formato XML): Ocurrió un error al parsear el archivo XML '{xml_file_path}' después de {registros_leidos} registros.\nDetalles: {e}"
+            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace completo para errores de parseo XML
+            raise
+        finally:
+            # --- Medición de rendimiento: Fin de la operación total de la función ---
+            end_time_total_operation = time.time()
+            duration_total_operation = end_time_total_operation - start_time_total_operation
+            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (iterar_registros_xml): {duration_total_operation:.4f} segundos ({registros_leidos} registros).")
+
+    # 76- Función que recorre los registros de un archivo JSON (array o NDJSON) uno a uno con memoria acotada.
+    # Integra pruebas de rendimiento para medir el tiempo hasta el primer registro y el tiempo total.
+    def iterar_registros_json(self, json_file_path: str, formato: Optional[str] = None, nombre_paso: str = ""):
+        """
+        Recorre los registros de un archivo JSON devolviéndolos uno a uno. Es la alternativa en streaming
+        a `leer_json` para archivos grandes: admite un array JSON en el nivel superior (`[{...}, {...}]`)
+        o NDJSON (un documento por línea) y nunca carga el archivo completo en memoria.
+
+        Args:
+            json_file_path (str): La **ruta completa al archivo JSON**.
+            formato (str, opcional): `"array"`, `"ndjson"` o `None` para detectarlo automáticamente
+                                     a partir del primer carácter significativo. Por defecto es `None`.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+                                         Por defecto es una cadena vacía "".
+
+        Yields:
+            Any: Cada registro del archivo (normalmente un diccionario).
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            json.JSONDecodeError: Si el contenido no es JSON válido. Al tratarse de una lectura incremental,
+                                  el error puede aparecer después de haber entregado registros, por lo que
+                                  se relanza para no confundir un recorrido parcial con uno completo.
+            ValueError: Si el formato indicado no es válido.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Iniciando lectura en streaming del archivo JSON: '{json_file_path}' (formato: {formato or 'autodetectado'}). ---")
+
+        # --- Medición de rendimiento: Inicio de la operación total de la función ---
+        start_time_total_operation = time.time()
+        registros_leidos = 0
+
+        try:
+            for registro in iterar_registros_json(json_file_path, formato):
+                if registros_leidos == 0:
+                    duration_first_record = time.time() - start_time_total_operation
+                    self.logger.info(f"PERFORMANCE: Tiempo hasta el primer registro JSON: {duration_first_record:.4f} segundos.")
+                registros_leidos += 1
+                yield registro
+
+            self.logger.info(f"\n✅ Lectura en streaming del archivo JSON '{json_file_path}' completada. Registros leídos: {registros_leidos}.")
+
+        except FileNotFoundError:
+            error_msg = f"\n❌ FALLO (Archivo no encontrado): El archivo JSON no se encontró en la ruta: '{json_file_path}'."
+            self.logger.critical(error_msg)
+            raise
+        except json.JSONDecodeError as e:
+            error_msg = f"\n❌ FALLO (Error de formato JSON): Error al decodificar JSON desde '{json_file_path}' después de {registros_leidos} registros.\nDetalles: {e}"
+            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace completo para errores de decodificación JSON
+            raise
+        except ValueError as e:
+            error_msg = f"\n❌ FALLO (Parámetro inválido): {e}"
+            self.logger.critical(error_msg)
+            raise
+        finally:
+            # --- Medición de rendimiento: Fin de la operación total de la función ---
+            end_time_total_operation = time.time()
+            duration_total_operation = end_time_total_operation - start_time_total_operation
+            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (iterar_registros_json): {duration_total_operation:.4f} segundos ({registros_leidos} registros).")
+
+    # 77- Función que cuenta los registros de un archivo JSON (array o NDJSON) sin construir sus objetos.
+    # Integra pruebas de rendimiento para medir el tiempo del conteo.
+    def contar_registros_json(self, json_file_path: str, formato: Optional[str] = None, nombre_paso: str = "") -> int:
+        """
+        Cuenta los registros de un archivo JSON sin decodificarlos: en un array se reduce el contenido a
+        su estructura (`[]{},`) bloque a bloque y se cuentan las comas del primer nivel; en NDJSON se
+        cuentan las líneas no vacías. La memoria usada no depende del tamaño del archivo.
+
+        Args:
+            json_file_path (str): La **ruta completa al archivo JSON**.
+            formato (str, opcional): `"array"`, `"ndjson"` o `None` para detectarlo automáticamente. Por defecto es `None`.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+                                         Por defecto es una cadena vacía "".
+
+        Returns:
+            int: El **número de registros** del archivo. Retorna `0` si el archivo no se encuentra,
+                 no tiene el formato esperado o si ocurre un error inesperado.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Contando registros del archivo JSON: '{json_file_path}' (formato: {formato or 'autodetectado'}). ---")
+
+        # --- Medición de rendimiento: Inicio de la operación total de la función ---
+        start_time_total_operation = time.time()
+
+        try:
+            total_registros = contar_registros_json(json_file_path, formato)
+            self.logger.info(f"\n✅ Se encontraron {total_registros} registros en el archivo JSON '{json_file_path}'.")
+            return total_registros
+
+        except FileNotFoundError:
+            error_msg = f"\n❌ FALLO (Archivo no encontrado): El archivo JSON no se encontró en la ruta: '{json_file_path}'."
+            self.logger.critical(error_msg)
+            return 0
+        except ValueError as e:
+            error_msg = f"\n❌ FALLO (Formato JSON no soportado): No se pudieron contar los registros de '{json_file_path}'.\nDetalles: {e}"
+            self.logger.critical(error_msg)
+            return 0
+        except Exception as e:
+            error_msg = (
+                f"\n❌ FALLO (Error Inesperado): Ocurrió un error inesperado al contar los registros del archivo JSON.\n"
+                f"Archivo: '{json_file_path}'.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace completo para errores inesperados
+            return 0
+        finally:
+            # --- Medición de rendimiento: Fin de la operación total de la función ---
+            end_time_total_operation = time.time()
+            duration_total_operation = end_time_total_operation - start_time_total_operation
+            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (contar_registros_json): {duration_total_operation:.4f} segundos.")
+
+    # 78- Función que abre un archivo de datos (Excel, CSV, JSON o XML) como tabla columnar tipada (DataSource).
+    # Integra pruebas de rendimiento para medir el tiempo de apertura, indicando si se usó la caché binaria.
+    def abrir_data_source(self, file_path: str, hoja: Optional[str] = None, etiqueta_registro: str = "record", nombre_paso: str = "") -> DataSource:
+        """
+        Abre un archivo de datos como `DataSource`: una tabla columnar con las columnas canónicas
+        (Nombre, Apellido, Teléfono...) independientemente del formato de origen. La primera lectura
+        escribe una caché binaria junto al archivo; las siguientes la mapean en memoria sin parsear la fuente.
+
+        Args:
+            file_path (str): La **ruta completa al archivo** (`.xlsx`, `.xlsm`, `.csv`, `.json`, `.ndjson`, `.jsonl` o `.xml`).
+            hoja (str, opcional): Nombre de la hoja para archivos Excel. Por defecto, la primera hoja.
+            etiqueta_registro (str, opcional): Etiqueta de cada registro para archivos XML. Por defecto es `"record"`.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+                                         Por defecto es una cadena vacía "".
+
+        Returns:
+            DataSource: La tabla columnar. Debe cerrarse con `cerrar()` (o usarse con `with`) al terminar.
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe.
+            ValueError: Si el formato del archivo no está soportado.
+        """
+        self.logger.info(f"\n--- {nombre_paso}: Abriendo DataSource para el archivo: '{file_path}'. ---")
+
+        # --- Medición de rendimiento: Inicio de la operación total de la función ---
+        start_time_total_operation = time.time()
+
+        try:
+            data_source = DataSource.abrir(file_path, hoja=hoja, etiqueta_registro=etiqueta_registro)
+            origen = "caché columnar" if data_source.desde_cache else "archivo fuente"
+            self.logger.info(f"\n✅ DataSource abierto desde {origen}: {data_source.num_filas} filas, columnas {list(data_source.columnas)}.")
+            return data_source
+
+        except FileNotFoundError:
+            error_msg = f"\n❌ FALLO (Archivo no encontrado): El archivo no se encontró en la ruta: '{file_path}'."
+            self.logger.critical(error_msg)
+            raise
+        except ValueError as e:
+            error_msg = f"\n❌ FALLO (Formato no soportado): No se pudo abrir '{file_path}' como DataSource.\nDetalles: {e}"
+            self.logger.critical(error_msg)
+            raise
+        except Exception as e:
+            error_msg = (
+                f"\n❌ FALLO (Error Inesperado): Ocurrió un error inesperado al abrir el DataSource.\n"
+                f"Archivo: '{file_path}'.\n"
+                f"Detalles: {e}"
+            )
+            self.logger.critical(error_msg, exc_info=True) # Incluye el stack trace completo para errores inesperados
+            raise
+        finally:
+            # --- Medición de rendimiento: Fin de la operación total de la función ---
+            end_time_total_operation = time.time()
+            duration_total_operation = end_time_total_operation - start_time_total_operation
+            self.logger.info(f"PERFORMANCE: Tiempo total de la operación (abrir_data_source): {duration_total_operation:.4f} segundos.")
+
+    # 79- Función que espera a que se cumpla la postcondición de una acción (en lugar de una espera fija).
+    # Integra pruebas de rendimiento para medir cuánto tardó realmente en cumplirse.
+    def esperar_postcondicion(self, postcondicion: Any, timeout_ms: Optional[int] = None, nombre_paso: str = "") -> bool:
+        """
+        Espera a que se cumpla una postcondición y retorna en cuanto se cumple, sin dormir un tiempo fijo.
+
+        Postcondiciones admitidas:
+            - `Locator`: el elemento debe estar visible (p. ej. un modal abierto o un mensaje 'toast').
+            - `"red_inactiva"`: no hay peticiones de red en curso (`networkidle`).
+            - `"pagina_cargada"` / `"dom_cargado"`: eventos `load` / `DOMContentLoaded` de la página.
+            - `"dom_estable"`: el DOM de la página no cambia durante `DOM_ESTABLE_QUIETUD_MS` (p. ej. tabla redibujada).
+            - `Callable[[], bool]`: función que se evalúa periódicamente hasta que devuelve un valor verdadero.
+
+        Args:
+            postcondicion (Any): La postcondición a esperar.
+            timeout_ms (Optional[int]): Tiempo máximo en milisegundos. Por defecto `POSTCONDICION_TIMEOUT_MS` de config.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+
+        Returns:
+            bool: `True` si la postcondición se cumplió dentro del tiempo máximo, `False` en caso contrario.
+
+        Raises:
+            ValueError: Si la postcondición no es de un tipo admitido.
+        """
+        timeout = POSTCONDICION_TIMEOUT_MS if timeout_ms is None else timeout_ms
+        estados_carga = {"red_inactiva": "networkidle", "pagina_cargada": "load", "dom_cargado": "domcontentloaded"}
+        self.logger.debug(f"\n--- {nombre_paso}: Esperando postcondición '{postcondicion}' (máximo {timeout} ms). ---")
+
+        # --- Medición de rendimiento: Inicio de la espera de la postcondición ---
+        start_time_postcondicion = time.time()
+        try:
+            if isinstance(postcondicion, Locator):
+                expect(postcondicion).to_be_visible(timeout=timeout)
+            elif isinstance(postcondicion, str) and postcondicion in estados_carga:
+                with contabilidad_esperas.medir(CATEGORIA_AUTO_ESPERA):
+                    self.page.wait_for_load_state(estados_carga[postcondicion], timeout=timeout)
+            elif postcondicion == "dom_estable":
+                if not self.esperar_dom_estable(timeout_ms=timeout, nombre_paso=nombre_paso):
+                    raise TimeoutError(f"El DOM no se estabilizó en {timeout} ms.")
+            elif callable(postcondicion):
+                limite = time.monotonic() + timeout / 1000
+                with contabilidad_esperas.medir(CATEGORIA_AUTO_ESPERA):
+                    while not postcondicion():
+                        if time.monotonic() >= limite:
+                            raise TimeoutError(f"La función de postcondición no devolvió True en {timeout} ms.")
+                        # Sondeo breve; wait_for_timeout permite que Playwright procese eventos entre comprobaciones.
+                        self.page.wait_for_timeout(50)
+            else:
+                raise ValueError(f"Postcondición no admitida: {postcondicion!r}")
+
+            self.logger.info(f"✅ Postcondición '{postcondicion}' cumplida.")
+            return True
+
+        except (TimeoutError, AssertionError) as e:
+            self.logger.warning(f"\n⚠️ {nombre_paso}: La postcondición '{postcondicion}' no se cumplió en {timeout} ms. Detalles: {e}")
+            return False
+        finally:
+            # --- Medición de rendimiento: Fin de la espera de la postcondición ---
+            duration_postcondicion = time.time() - start_time_postcondicion
+            self.logger.info(f"PERFORMANCE: Tiempo de espera de la postcondición '{postcondicion}': {duration_postcondicion:.4f} segundos.")
+
+    # 80- Función que espera a que una zona del DOM (o la página completa) deje de cambiar.
+    # Útil tras acciones que redibujan una tabla o insertan mensajes, en lugar de una espera fija.
+    def esperar_dom_estable(self, selector: Optional[Union[str, Locator]] = None, quietud_ms: int = DOM_ESTABLE_QUIETUD_MS,
+                            timeout_ms: Optional[int] = None, nombre_paso: str = "") -> bool:
+        """
+        Espera a que el elemento indicado (o `document.body` si no se indica) pase `quietud_ms`
+        milisegundos sin mutaciones (nodos, atributos o texto), usando un `MutationObserver` en el navegador.
+
+        Args:
+            selector (Optional[Union[str, Locator]]): Elemento a observar (p. ej. la tabla). Por defecto, toda la página.
+            quietud_ms (int): Milisegundos sin cambios para considerar el DOM estable. Por defecto `DOM_ESTABLE_QUIETUD_MS`.
+            timeout_ms (Optional[int]): Tiempo máximo en milisegundos. Por defecto `POSTCONDICION_TIMEOUT_MS`.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+
+        Returns:
+            bool: `True` si el DOM se estabilizó dentro del tiempo máximo, `False` en caso contrario.
+        """
+        timeout = POSTCONDICION_TIMEOUT_MS if timeout_ms is None else timeout_ms
+        script = """([el, quietud, maximo]) => new Promise(resolve => {
+            const objetivo = el || document.body;
+            let temporizador;
+            const terminar = (estable) => { observador.disconnect(); clearTimeout(temporizador); clearTimeout(limite); resolve(estable); };
+            const observador = new MutationObserver(() => { clearTimeout(temporizador); temporizador = setTimeout(() => terminar(true), quietud); });
+            observador.observe(objetivo, {childList: true, subtree: true, attributes: true, characterData: true});
+            temporizador = setTimeout(() => terminar(true), quietud);
+            const limite = setTimeout(() => terminar(false), maximo);
+        })"""
+
+        # --- Medición de rendimiento: Inicio de la espera de estabilidad del DOM ---
+        start_time_dom_estable = time.time()
+        try:
+            with contabilidad_esperas.medir(CATEGORIA_AUTO_ESPERA):
+                if selector is None:
+                    estable = self.page.evaluate(script, [None, quietud_ms, timeout])
+                else:
+                    locator = self.page.locator(selector) if isinstance(selector, str) else selector
+                    estable = locator.evaluate("(el, args) => (" + script + ")([el, ...args])", [quietud_ms, timeout], timeout=timeout)
+            if not estable:
+                self.logger.warning(f"\n⚠️ {nombre_paso}: El DOM de '{selector or 'la página'}' siguió cambiando durante {timeout} ms.")
+            return bool(estable)
+        except Error as e:
+            self.logger.warning(f"\n⚠️ {nombre_paso}: No se pudo observar la estabilidad del DOM de '{selector or 'la página'}'. Detalles: {e}")
+            return False
+        finally:
+            # --- Medición de rendimiento: Fin de la espera de estabilidad del DOM ---
+            duration_dom_estable = time.time() - start_time_dom_estable
+            self.logger.info(f"PERFORMANCE: Tiempo hasta DOM estable ('{selector or 'página'}'): {duration_dom_estable:.4f} segundos.")
+
+    # 81- Función que valida en bloque una columna numérica de una tabla (rango, monotonía y suma).
+    def validar_columna_numerica_tabla(self, tabla_selector: Locator, columna_nombre: str, nombre_base: str, directorio: str,
+                                       minimo: Optional[float] = None, maximo: Optional[float] = None,
+                                       monotonia: Optional[str] = None, estricta: bool = False,
+                                       suma_esperada: Optional[float] = None, tolerancia: float = 1e-9,
+                                       max_capturas_fallo: int = 10, nombre_paso: str = "") -> bool:
+        """
+        Valida una columna numérica completa de una tabla con un único viaje al navegador: la columna se
+        extrae con un `evaluate`, se convierte en bloque a un `array('d')` con máscara de fallos y se
+        comprueban las reglas indicadas en Python.
+
+        Args:
+            tabla_selector (Locator): El Locator del elemento `<table>`.
+            columna_nombre (str): El texto exacto del encabezado `<th>` de la columna.
+            nombre_base (str): Nombre base para las capturas de pantalla.
+            directorio (str): Directorio donde se guardarán las capturas de pantalla.
+            minimo (Optional[float]): Valor mínimo admitido (opcional).
+            maximo (Optional[float]): Valor máximo admitido (opcional).
+            monotonia (Optional[str]): 'creciente' o 'decreciente' (opcional).
+            estricta (bool): Si la monotonía no admite valores iguales consecutivos.
+            suma_esperada (Optional[float]): Suma esperada de la columna (opcional).
+            tolerancia (float): Tolerancia absoluta para los límites, la monotonía y la suma.
+            max_capturas_fallo (int): Número máximo de celdas con fallos que se resaltan y capturan.
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+
+        Returns:
+            bool: `True` si todos los valores son numéricos y cumplen las reglas; `False` en caso contrario
+                  o si la columna no existe.
+
+        Raises:
+            AssertionError: Si la tabla no está disponible a tiempo o se produce un error de Playwright.
+            ValueError: Si `monotonia` no es un valor admitido.
+        """
+        self.logger.info(f"\n⚙️ {nombre_paso}: Validando la columna '{columna_nombre}' de la tabla '{tabla_selector}' "
+                         f"(mínimo={minimo}, máximo={maximo}, monotonía={monotonia}, suma={suma_esperada}, tolerancia={tolerancia}).")
+
+        # --- Medición de rendimiento: Inicio de la validación de la columna ---
+        start_time_validacion = time.time()
+        try:
+            expect(tabla_selector).to_be_visible()
+            expect(tabla_selector.locator("tbody tr").first).to_be_visible()
+            header_texts, col_index, textos_columna = extraer_columna(tabla_selector, columna_nombre)
+            duration_extraccion = time.time() - start_time_validacion
+        except Error as e:
+            self.logger.error(f"\n❌ {nombre_paso}: La tabla '{tabla_selector}' no está disponible para validar la columna '{columna_nombre}'. Detalles: {e}")
+            self.tomar_captura(f"{nombre_base}_validacion_columna_error_tabla", directorio, fallo=True)
+            raise AssertionError(f"\nTabla no disponible para validar la columna '{columna_nombre}': {tabla_selector}") from e
+
+        if textos_columna is None:
+            self.logger.error(f"\n❌ {nombre_paso}: No se encontró la columna '{columna_nombre}'. Cabeceras disponibles: {header_texts}")
+            self.tomar_captura(f"{nombre_base}_columna_no_encontrada", directorio, fallo=True)
+            return False
+
+        start_time_reglas = time.time()
+        resultado = validar_valores_columna(textos_columna, minimo=minimo, maximo=maximo, monotonia=monotonia, estricta=estricta,
+                                            suma_esperada=suma_esperada, tolerancia=tolerancia)
+        duration_reglas = time.time() - start_time_reglas
+
+        # --- Medición de rendimiento: Fin de la validación de la columna ---
+        self.logger.info(f"PERFORMANCE: Validación de {len(textos_columna)} valores de la columna '{columna_nombre}': "
+                         f"extracción {duration_extraccion:.4f} s, reglas {duration_reglas:.4f} s.")
+
+        if resultado.suma is not None:
+            self.logger.info(f"\n🔍 Suma de la columna '{columna_nombre}': {resultado.suma} (esperada: {suma_esperada}).")
+        filas_con_fallo = []
+        for regla, filas in resultado.fallos.items():
+            if filas:
+                self.logger.error(f"\n❌ {nombre_paso}: {len(filas)} fallo(s) de la regla '{regla}' en la columna '{columna_nombre}'. "
+                                  f"Primeras filas: {[i + 1 for i in filas[:20] if i >= 0]}")
+                filas_con_fallo.extend(i for i in filas if i >= 0)
+
+        if resultado.ok:
+            self.logger.info(f"\n✅ {nombre_paso}: La columna '{columna_nombre}' cumple todas las reglas.")
+            return True
+
+        filas_locator = tabla_selector.locator("tbody tr")
+        for i in sorted(set(filas_con_fallo))[:max_capturas_fallo]:
+            try:
+                filas_locator.nth(i).locator("td").nth(col_index).highlight()
+                self.tomar_captura(f"{nombre_base}_columna_{columna_nombre}_fila_{i+1}_fallo", directorio, fallo=True)
+            except Error as e:
+                self.logger.warning(f"\n⚠️ {nombre_paso}: No se pudo resaltar la fila {i+1}. Detalles: {e}")
+        if not filas_con_fallo:
+            self.tomar_captura(f"{nombre_base}_columna_{columna_nombre}_suma_fallo", directorio, fallo=True)
+        return False
+
+    # 82- Función que obtiene todas las filas de una tabla paginada (DataTables) en una sola instantánea.
+    # Sustituye la navegación página a página (navegar_y_verificar_pagina) cuando lo que se necesita son los datos.
+    def obtener_tabla_paginada_completa(self, tabla_selector: Locator, nombre_base: str, directorio: str,
+                                        selector_longitud: Optional[Locator] = None, filas_esperadas: Optional[int] = None,
+                                        nombre_paso: str = "") -> TableSnapshot:
+        """
+        Obtiene todas las filas de una tabla paginada en una única `TableSnapshot`. Primero lee la API de
+        DataTables (sin cambiar de página); si no está disponible, recorre la paginación dentro del navegador
+        en un solo `evaluate`, tras elegir la mayor longitud de página en `selector_longitud`, esperando el
+        redibujado de cada página en lugar de una pausa fija.
+
+        Args:
+            tabla_selector (Locator): El Locator del elemento `<table>` (p. ej. '#dataTable').
+            nombre_base (str): Nombre base para las capturas de pantalla.
+            directorio (str): Directorio donde se guardarán las capturas de pantalla.
+            selector_longitud (Optional[Locator]): El Locator del `<select>` 'Show entries' (opcional).
+            filas_esperadas (Optional[int]): Número de filas esperado (opcional). Si no se indica, se usa el
+                                             total que informa la tabla ("Showing 1 to 10 of N entries").
+            nombre_paso (str, opcional): Una descripción del paso que se está ejecutando para el registro (logs).
+
+        Returns:
+            TableSnapshot: La instantánea con todas las filas de la tabla.
+
+        Raises:
+            AssertionError: Si la tabla no está disponible, el recorrido no llega a la última página o el
+                            número de filas obtenidas no coincide con el esperado.
+        """
+        self.logger.info(f"\n⚙️ {nombre_paso}: Obteniendo todas las filas de la tabla paginada '{tabla_selector}'.")
+
+        # --- Medición de rendimiento: Inicio de la lectura de la tabla paginada ---
+        start_time_recorrido = time.time()
+        try:
+            expect(tabla_selector).to_be_visible()
+            snapshot, estadisticas = recorrer_tabla_paginada(tabla_selector, selector_longitud)
+        except Error as e:
+            self.logger.error(f"\n❌ {nombre_paso}: No se pudo leer la tabla paginada '{tabla_selector}'. Detalles: {e}")
+            self.tomar_captura(f"{nombre_base}_tabla_paginada_error", directorio, fallo=True)
+            raise AssertionError(f"\nNo se pudo leer la tabla paginada '{tabla_selector}'") from e
+
+        # --- Medición de rendimiento: Fin de la lectura de la tabla paginada ---
+        duration_recorrido = time.time() - start_time_recorrido
+        self.logger.info(f"PERFORMANCE: Tabla paginada leída con la estrategia '{estadisticas.estrategia}': {estadisticas.filas} filas, "
+                         f"{estadisticas.paginas} página(s) en {duration_recorrido:.4f} segundos ({estadisticas.filas_por_segundo:.1f} filas/s).")
+
+        if not estadisticas.completo:
+            self.logger.error(f"\n❌ {nombre_paso}: El recorrido de la tabla se detuvo tras {estadisticas.paginas} página(s): {estadisticas.motivo}.")
+            self.tomar_captura(f"{nombre_base}_tabla_paginada_incompleta_fallo", directorio, fallo=True)
+            raise AssertionError(f"\nRecorrido incompleto de la tabla paginada '{tabla_selector}': {estadisticas.motivo}")
+
+        esperadas = filas_esperadas if filas_esperadas is not None else estadisticas.total_esperado
+        if esperadas is not None and estadisticas.filas != esperadas:
+            self.logger.error(f"\n❌ {nombre_paso}: Se obtuvieron {estadisticas.filas} filas, pero se esperaban {esperadas}.")
+            self.tomar_captura(f"{nombre_base}_tabla_paginada_filas_incorrectas", directorio, fallo=True)
+            raise AssertionError(f"\nLa tabla paginada '{tabla_selector}' tiene {estadisticas.filas} filas; se esperaban {esperadas}.")
+
+        self.logger.info(f"\n✅ {nombre_paso}: Se obtuvieron las {estadisticas.filas} filas de la tabla paginada.")
+        self.tomar_captura(f"{nombre_base}_tabla_paginada_completa", directorio, elemento=tabla_selector)
+        return snapshot
+
     # --- Manejadores y funciones para Alertas y Confirmaciones ---
 
     # Handler para alertas simples (usado con page.once).
@@ -9865,7 +10493,7 @@ class Funciones_Globales:
                 f"Asegúrate de que los elementos sean visibles e interactuables. Detalles: {e}"
             )
             self.logger.error(error_msg, exc_info=True)
-            self.tomar_captura(f"{nombre_base}_error_manual_drag_and_drop_playwright", directorio)
+            self.tomar_captura(f"{nombre_base}_error_manual_drag_and_drop_playwright", directorio, fallo=True)
             raise # Re-lanza la excepción original de Playwright.
         
         except Exception as e:
@@ -9874,11 +10502,15 @@ class Funciones_Globales:
                 f"Detalles: {e}"
             )
             self.logger.critical(error_msg, exc_info=True) # Uso critical para errores inesperados graves.
-            self.tomar_captura(f"{nombre_base}_error_inesperado_manual_drag_and_drop", directorio)
+            self.tomar_captura(f"{nombre_base}_error_inesperado_manual_drag_and_drop", directorio, fallo=True)
             raise # Re-lanza la excepción.
         
         finally:
             # --- Medición de rendimiento: Fin de la operación total de Drag and Drop manual ---
             end_time_total_drag_drop = time.time()
             duration_total_drag_drop = end_time_total_drag_drop - start_time_total_drag_drop
-            self.logger.info(f"PERFORMANCE: Tiempo total de la operación 'Drag and Drop' manual: {duration_total_drag_drop:.4f} segundos.")
\ No newline at end of file
+            self.logger.info(f"PERFORMANCE: Tiempo total de la operación 'Drag and Drop' manual: {duration_total_drag_drop:.4f} segundos.")
+
+
+# Atribuye el tiempo de cada método público al presupuesto de esperas del test en curso (wait_budget).
+contabilidad_esperas.instrumentar_clase(Funciones_Globales)
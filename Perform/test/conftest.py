@@ -10,6 +10,145 @@ from typing import Generator
 from Perform.utils import config
 from Perform.pages.base_page import Funciones_Globales
 from Perform.locator.locator_barraNavegacion import BarraNavLocatorPage
+from Perform.utils.data_source import PrecargaDataSources
+from Perform.utils.browser_pool import BrowserPool
+from Perform.utils.navigation_cache import NavegacionCache
+from Perform.utils.evidence import escritor_capturas, politica_capturas, POLITICA_SIEMPRE, grabacion_activa, conservar_grabacion
+from Perform.utils.evidence import MODO_GRABACION_PRIMER_REINTENTO
+from Perform.utils.evidence_budget import gestor_evidencias
+from Perform.utils.logger import establecer_test_actual, restablecer_test_actual
+from Perform.utils.wait_budget import contabilidad_esperas, combinar_resumenes, lineas_informe, agregar_historico
+import glob
+import re
+
+# --- Presupuesto de esperas (tiempo dormido vs. tiempo trabajando) por test ---
+
+def _id_worker(pytest_config) -> str:
+    """
+    Devuelve el identificador del worker de pytest-xdist ('gw0', 'gw1'...) o 'main' sin xdist.
+    """
+    return getattr(pytest_config, "workerinput", {}).get("workerid", "main")
+
+def pytest_sessionstart(session):
+    # 'on-first-retry' depende del contador de intentos de pytest-rerunfailures ('execution_count'):
+    # sin el plugin cada test es siempre el intento 1 y no se grabaría ninguna traza ni video.
+    modos_reintento = [nombre for nombre, modo in (("TRAZAS_MODO", config.TRAZAS_MODO), ("VIDEO_MODO", config.VIDEO_MODO))
+                       if modo == MODO_GRABACION_PRIMER_REINTENTO]
+    if modos_reintento and not session.config.pluginmanager.hasplugin("rerunfailures"):
+        raise pytest.UsageError(f"{', '.join(modos_reintento)}='{MODO_GRABACION_PRIMER_REINTENTO}' necesita pytest-rerunfailures "
+                                f"(pip install -r requirements.txt) y ejecutar con reintentos (p. ej. --reruns 1).")
+    # Solo el proceso principal limpia los resúmenes de la ejecución anterior.
+    if not hasattr(session.config, "workerinput"):
+        for ruta in glob.glob(os.path.join(config.WAIT_BUDGET_DIR, "wait_budget_*.json")):
+            os.remove(ruta)
+        # Compresión de logs fríos en segundo plano; el desalojo se aplica en pytest_sessionfinish.
+        gestor_evidencias.iniciar_en_segundo_plano()
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    # Mide el test completo (preparación, ejecución y cierre de fixtures).
+    # Los registros del logger emitidos durante el test llevan su id en el campo 'test_id'.
+    token_log = establecer_test_actual(item.nodeid)
+    # El fixture playwright_page lo consulta para precalentar solo si el siguiente test usa su misma combinación.
+    item.siguiente_item = nextitem
+    contabilidad_esperas.iniciar_test(item.nodeid)
+    inicio = time.perf_counter()
+    yield
+    contabilidad_esperas.finalizar_test(time.perf_counter() - inicio)
+    restablecer_test_actual(token_log)
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Si el test falla (en cualquier fase), se vuelcan a disco las capturas retenidas en memoria
+    # y se toma una captura final de la página para documentar el estado en el momento del fallo.
+    outcome = yield
+    report = outcome.get_result()
+    # Deja el resultado de cada fase en el item (item.rep_setup, item.rep_call...) para los fixtures.
+    setattr(item, f"rep_{report.when}", report)
+    if not report.failed or politica_capturas.politica == POLITICA_SIEMPRE:
+        return
+    politica_capturas.volcar()
+    page = item.funcargs.get("playwright_page")
+    if page is not None and not page.is_closed():
+        nombre = re.sub(r"[^\w.-]+", "_", item.nodeid.split("::")[-1])
+        try:
+            escritor_capturas.encolar(
+                os.path.join(config.SCREENSHOT_DIR, f"{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}_fallo_test_{nombre}_{report.when}.png"),
+                page.screenshot(), fallo=True)
+        except Exception as e:
+            print(f"\nNo se pudo tomar la captura del test fallido: {e}")
+
+def pytest_sessionfinish(session):
+    # Cada worker escribe su propio JSON; el proceso principal los combina en el resumen final.
+    if contabilidad_esperas.tests:
+        contabilidad_esperas.escribir_json(os.path.join(config.WAIT_BUDGET_DIR, f"wait_budget_{_id_worker(session.config)}.json"))
+    # El proceso principal vuelve a aplicar el presupuesto con las evidencias de esta ejecución.
+    if not hasattr(session.config, "workerinput"):
+        gestor_evidencias.esperar()
+        try:
+            gestor_evidencias.aplicar_presupuesto()
+        except OSError as e:
+            print(f"\nNo se pudo aplicar el presupuesto de evidencias: {e}")
+
+def _test_fallido(item) -> bool:
+    """
+    Indica si alguna fase ya reportada del test (preparación o ejecución) ha fallado.
+    """
+    return any(getattr(getattr(item, f"rep_{fase}", None), "failed", False) for fase in ("setup", "call"))
+
+def _orden_combinacion(item) -> int:
+    # Posición de la combinación de 'playwright_page' del test en COMBINACIONES_NAVEGADOR (-1 si no la usa).
+    callspec = getattr(item, "callspec", None)
+    param = callspec.params.get("playwright_page") if callspec is not None else None
+    return COMBINACIONES_NAVEGADOR.index(param) if param in COMBINACIONES_NAVEGADOR else -1
+
+def pytest_collection_modifyitems(config, items):
+    # pytest ordena los tests parametrizados test a test (test_x[chromium...], test_x[firefox...], ...), de modo
+    # que el siguiente test nunca usaría la misma combinación y el pool no tendría a quién precalentar el contexto.
+    # Se agrupan por combinación con una ordenación estable: dentro de cada una se mantiene el orden original
+    # (p. ej. test_navegacion_modal_datatable sigue siendo el primero de cada perfil).
+    items.sort(key=_orden_combinacion)
+
+def _siguiente_usa_combinacion(item, param) -> bool:
+    """
+    Indica si el siguiente test de este worker usa la misma combinación navegador/dispositivo de `playwright_page`.
+    """
+    callspec = getattr(getattr(item, "siguiente_item", None), "callspec", None)
+    return callspec is not None and callspec.params.get("playwright_page") == param
+
+def pytest_terminal_summary(terminalreporter):
+    if hasattr(terminalreporter.config, "workerinput"):
+        return
+    resumen = combinar_resumenes(config.WAIT_BUDGET_DIR)
+    if not resumen["tests"]:
+        return
+    terminalreporter.section("Presupuesto de esperas (tiempo dormido vs. tiempo trabajando)")
+    for linea in lineas_informe(resumen):
+        terminalreporter.write_line(linea)
+    agregar_historico(resumen, os.path.join(config.WAIT_BUDGET_DIR, "wait_budget_historico.jsonl"))
+
+@pytest.fixture(scope="session", autouse=True)
+def datos_fuente() -> Generator[PrecargaDataSources, None, None]:
+    """
+    Fixture de sesión que pre-parsea en un pool de procesos todos los archivos de datos de
+    `config.SOURCE_FILES_DIR_DATA_FUENTE` (Excel, CSV, JSON y XML) y los comparte con los tests
+    como `DataSource` de solo lectura: `datos_fuente["MOCK_DATA.xlsx"]`.
+    Es 'autouse' para que el parseo arranque al inicio de la sesión y se solape con el lanzamiento
+    del navegador; cada archivo solo se espera cuando un test lo pide.
+    """
+    precarga = PrecargaDataSources(config.SOURCE_FILES_DIR_DATA_FUENTE)
+    yield precarga
+    precarga.cerrar()
+
+@pytest.fixture(scope="session")
+def browser_pool(playwright: Playwright) -> Generator[BrowserPool, None, None]:
+    """
+    Fixture de sesión (una por worker de pytest-xdist) con el pool de navegadores: cada motor se lanza
+    una sola vez y se relanza solo si se cae o tras `config.BROWSER_POOL_MAX_CONTEXTOS` contextos.
+    """
+    pool = BrowserPool(playwright, {"headless": True, "slow_mo": 500}, opciones_traza=config.TRAZAS_OPCIONES)
+    yield pool
+    pool.cerrar()
 
 # Función para generar IDs legibles
 def generar_ids_browser(param):
@@ -25,58 +164,68 @@ def generar_ids_browser(param):
     else:
         return f"{browser}-{resolution['width']}x{resolution['height']}"
 
+# Combinaciones navegador/dispositivo de 'playwright_page' (también fijan el orden de los tests).
+COMBINACIONES_NAVEGADOR = [
+    # Resoluciones de escritorio
+    {"browser": "chromium", "resolution": {"width": 1920, "height": 1080}, "device": None},
+    {"browser": "firefox", "resolution": {"width": 1920, "height": 1080}, "device": None},
+    {"browser": "webkit", "resolution": {"width": 1920, "height": 1080}, "device": None},
+    # Emulación de dispositivos móviles
+    {"browser": "chromium", "device": "iPhone 12", "resolution": None},
+    {"browser": "webkit", "device": "Pixel 5", "resolution": None}
+]
+
 @pytest.fixture(
     scope="function",
-    params=[
-        # Resoluciones de escritorio
-        {"browser": "chromium", "resolution": {"width": 1920, "height": 1080}, "device": None},
-        {"browser": "firefox", "resolution": {"width": 1920, "height": 1080}, "device": None},
-        {"browser": "webkit", "resolution": {"width": 1920, "height": 1080}, "device": None},
-        # Emulación de dispositivos móviles
-        {"browser": "chromium", "device": "iPhone 12", "resolution": None},
-        {"browser": "webkit", "device": "Pixel 5", "resolution": None}
-    ],
+    params=COMBINACIONES_NAVEGADOR,
     ids=generar_ids_browser # <--- Usar la función para generar IDs
 )
-def playwright_page(playwright: Playwright, request) -> Generator[Page, None, None]:
+def playwright_page(playwright: Playwright, browser_pool: BrowserPool, request) -> Generator[Page, None, None]:
     """
     Fixture base para configurar el navegador, contexto y página de Playwright con configuraciones comunes.
-    Maneja el lanzamiento del navegador, la creación del contexto (con grabación de video y emulación de dispositivos),
+    El navegador se obtiene del pool de sesión (`browser_pool`) y cada test recibe un contexto nuevo,
+    tomado de la cola de contextos precalentados de su combinación navegador/dispositivo; al terminar,
+    la cola se repone solo si el siguiente test de este worker usa la misma combinación (los tests se
+    agrupan por combinación en `pytest_collection_modifyitems`) y no graba video; en otro caso se cierran
+    los contextos que quedaran en ella. Con `config.VIDEO_MODO` distinto de 'off' (también con el valor
+    por defecto) no hay precalentamiento y cada test crea su contexto en la preparación.
+    Maneja la creación del contexto (con grabación de video y emulación de dispositivos),
     el rastreo (tracing) y la navegación de la página a una URL específica. También renombra el archivo de video al finalizar.
+    La traza y el video se graban y conservan según `config.TRAZAS_MODO` y `config.VIDEO_MODO`
+    ('off', 'on', 'retain-on-failure' u 'on-first-retry'): con 'retain-on-failure', los de un test
+    que pasa se descartan sin escribir el archivo de traza y borrando el video.
     """
     param = request.param
     browser_type = param["browser"]
     resolution = param["resolution"]
     device_name = param["device"]
+    # 'execution_count' lo añade pytest-rerunfailures; sin reintentos, cada test es el intento 1.
+    intento = getattr(request.node, "execution_count", 1)
+    grabar_traza = grabacion_activa(config.TRAZAS_MODO, intento)
+    grabar_video = grabacion_activa(config.VIDEO_MODO, intento)
+    # Los contextos con video no se precalientan (grabarían mientras esperan en la cola), pero usan su propia
+    # clave para no tomar un contexto sin grabación de la cola de la misma combinación.
+    clave_pool = generar_ids_browser(param) + ("-video" if grabar_video else "")
 
-    browser_instance = None
     context = None
     page = None
+    trace_path = None
 
     try:
-        if browser_type == "chromium":
-            browser_instance = playwright.chromium.launch(headless=True, slow_mo=500)
-        elif browser_type == "firefox":
-            browser_instance = playwright.firefox.launch(headless=True, slow_mo=500)
-        elif browser_type == "webkit":
-            browser_instance = playwright.webkit.launch(headless=True, slow_mo=500)
-        else:
-            raise ValueError(f"\nEl tipo de navegador '{browser_type}' no es compatible.")
-
-        context_options = {
-            "record_video_dir": config.VIDEO_DIR,
-            "record_video_size": {"width": 1920, "height": 1080}
-        }
+        context_options = {}
+        if grabar_video:
+            context_options = {
+                "record_video_dir": config.VIDEO_DIR,
+                "record_video_size": config.VIDEO_TAMANO
+            }
 
         if device_name:
             device = playwright.devices[device_name]
-            context = browser_instance.new_context(**device, **context_options)
+            context, page = browser_pool.tomar_contexto(clave_pool, browser_type, trazar=grabar_traza, **device, **context_options)
         elif resolution:
-            context = browser_instance.new_context(viewport=resolution, **context_options)
+            context, page = browser_pool.tomar_contexto(clave_pool, browser_type, trazar=grabar_traza, viewport=resolution, **context_options)
         else:
-            context = browser_instance.new_context(**context_options)
-
-        page = context.new_page()
+            context, page = browser_pool.tomar_contexto(clave_pool, browser_type, trazar=grabar_traza, **context_options)
 
         current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
         trace_name_suffix = ""
@@ -88,54 +237,125 @@ def playwright_page(playwright: Playwright, request) -> Generator[Page, None, No
         trace_file_name = f"traceview_{current_time}_{browser_type}_{trace_name_suffix}.zip"
         trace_path = os.path.join(config.TRACEVIEW_DIR, trace_file_name)
 
-        context.tracing.start(screenshots=True, snapshots=True, sources=True)
+        # El rastreo ya está iniciado en el contexto del pool: el test solo abre su fragmento.
+        if grabar_traza:
+            context.tracing.start_chunk(title=request.node.nodeid)
 
         yield page
 
     finally:
+        # Las capturas retenidas en memoria (política 'last_N') de un test sin fallos se descartan;
+        # si el test falló, ya se volcaron en pytest_runtest_makereport.
+        politica_capturas.descartar()
+        # Espera a que el hilo escritor guarde todas las capturas del test antes de cerrar.
+        for error in escritor_capturas.vaciar():
+            print(f"\nError al guardar una captura de pantalla: {error}")
+
+        fallido = _test_fallido(request.node)
         if context:
-            context.tracing.stop(path=trace_path)
+            if grabar_traza and trace_path:
+                try:
+                    if conservar_grabacion(config.TRAZAS_MODO, fallido):
+                        context.tracing.stop_chunk(path=trace_path)
+                        gestor_evidencias.registrar(trace_path, fallido, request.node.nodeid)
+                    else:
+                        context.tracing.stop_chunk() # Sin 'path' el fragmento se descarta
+                except Exception as e:
+                    print(f"\nError al detener la traza: {e}")
             context.close()
             
-        if browser_instance:
-            browser_instance.close()
-            
         if page and page.video:
-            video_path = page.video.path()
-            new_video_name = datetime.now().strftime("%Y%m%d-%H%M%S") + ".webm"
-            new_video_path = os.path.join(config.VIDEO_DIR, new_video_name)
-            try:
-                os.rename(video_path, new_video_path)
-                print(f"\nVideo guardado como: {new_video_path}")
-            except Exception as e:
-                print(f"\nError al renombrar el video: {e}")
+            if conservar_grabacion(config.VIDEO_MODO, fallido):
+                video_path = page.video.path()
+                new_video_name = datetime.now().strftime("%Y%m%d-%H%M%S") + ".webm"
+                new_video_path = os.path.join(config.VIDEO_DIR, new_video_name)
+                try:
+                    os.rename(video_path, new_video_path)
+                    gestor_evidencias.registrar(new_video_path, fallido, request.node.nodeid)
+                    print(f"\nVideo guardado como: {new_video_path}")
+                except Exception as e:
+                    print(f"\nError al renombrar el video: {e}")
+            else:
+                try:
+                    page.video.delete()
+                except Exception as e:
+                    print(f"\nError al descartar el video: {e}")
 
-@pytest.fixture(scope="function") # Cambiado a 'function' como en tu ejemplo más reciente
-def set_up_DataTable(playwright_page: Page) -> Generator[Page, None, None]:
+        # Deja listo el contexto del próximo test si usa esta misma combinación y no graba video
+        # (fuera de su fase de preparación).
+        # La API síncrona de Playwright no admite llamadas desde otro hilo, por eso se hace aquí.
+        try:
+            if not grabar_video and _siguiente_usa_combinacion(request.node, param):
+                browser_pool.reponer(clave_pool)
+            else:
+                browser_pool.descartar(clave_pool)
+        except Exception as e:
+            print(f"\nNo se pudo precalentar el contexto para '{clave_pool}': {e}")
+
+@pytest.fixture(scope="session")
+def cache_navegacion() -> NavegacionCache:
     """
-    Fixture para pruebas que interactúan con la funcionalidad "Modal Data table",
-    incluyendo el manejo del menú móvil.
+    Fixture de sesión (una por worker) con la URL final y el storage_state de cada ruta de navegación
+    ya recorrida, por perfil de navegador/dispositivo.
     """
-    playwright_page.goto(config.FORM_URL)
-    playwright_page.set_default_timeout(5000)
+    return NavegacionCache()
+
+def _recorrer_menu_DataTable(page: Page) -> Funciones_Globales:
+    """
+    Recorre el menú completo desde `config.FORM_URL` hasta la página "Modal Data table",
+    incluyendo el manejo del menú móvil, y valida la URL y el título de destino.
+    """
+    page.goto(config.FORM_URL)
+    page.set_default_timeout(5000)
     
-    fg = Funciones_Globales(playwright_page)
-    bnl = BarraNavLocatorPage(playwright_page)
+    fg = Funciones_Globales(page)
+    bnl = BarraNavLocatorPage(page)
     
-    fg.esperar_fijo(2)
+    # Espera a que la página termine de cargar en lugar de una pausa fija.
+    page.wait_for_load_state("load")
     
-    ancho_viewport = playwright_page.viewport_size['width']
+    ancho_viewport = page.viewport_size['width']
     if ancho_viewport <= 768:
-        fg.hacer_click_en_elemento(bnl.menuHaburguesaFormulario, "clic_menu_hamburguesa", config.SCREENSHOT_DIR, None, 1)
-        fg.esperar_fijo(1)
+        # Postcondición: el menú desplegado muestra la opción 'Formulario Tres'.
+        fg.hacer_click_en_elemento(bnl.menuHaburguesaFormulario, "clic_menu_hamburguesa", config.SCREENSHOT_DIR, None, 1, postcondicion=bnl.menuFormularioTres)
     else:
         fg.logger.info(f"Detectada resolución de escritorio ({ancho_viewport}px). No se hace clic en el menú hamburguesa.")
 
-    fg.hacer_click_en_elemento(bnl.menuFormularioTres, "hacer_click_en_elemento_menú_Formulario_Uno", config.SCREENSHOT_DIR, None, 1)
-    fg.hacer_click_en_elemento(bnl.opcionModalDataTable, "hacer_click_en_elemento_link_Modal_dataTable", config.SCREENSHOT_DIR, None, 1)
+    fg.hacer_click_en_elemento(bnl.menuFormularioTres, "hacer_click_en_elemento_menú_Formulario_Uno", config.SCREENSHOT_DIR, None, 1, postcondicion=bnl.opcionModalDataTable)
+    fg.hacer_click_en_elemento(bnl.opcionModalDataTable, "hacer_click_en_elemento_link_Modal_dataTable", config.SCREENSHOT_DIR, None, 1, postcondicion="dom_cargado")
     
     fg.validar_url_actual(".*/Datatables_OK.html")
     fg.validar_titulo_de_web("Formulario de Ejemplo", "validar_titulo_de_web", config.SCREENSHOT_DIR)
-    #fg.esperar_fijo(2)
+    return fg
+
+@pytest.fixture(scope="function")
+def navegacion_DataTable(playwright_page: Page, cache_navegacion: NavegacionCache, request) -> Generator[Page, None, None]:
+    """
+    Fixture que SIEMPRE recorre el menú completo hasta "Modal Data table" (para el test de navegación)
+    y registra la URL final y el storage_state en `cache_navegacion` para el resto de tests del perfil.
+    """
+    _recorrer_menu_DataTable(playwright_page)
+    cache_navegacion.registrar(generar_ids_browser(request.node.callspec.params["playwright_page"]), playwright_page)
+    yield playwright_page
+
+@pytest.fixture(scope="function") # Cambiado a 'function' como en tu ejemplo más reciente
+def set_up_DataTable(playwright_page: Page, cache_navegacion: NavegacionCache, request) -> Generator[Page, None, None]:
+    """
+    Fixture para pruebas que interactúan con la funcionalidad "Modal Data table".
+    Si la ruta ya se recorrió en esta sesión para el mismo perfil de navegador/dispositivo, restaura el
+    storage_state guardado y navega directamente a la URL final; si no, recorre el menú completo
+    (incluyendo el menú móvil) y lo registra en `cache_navegacion`.
+    """
+    clave_perfil = generar_ids_browser(request.node.callspec.params["playwright_page"])
+    playwright_page.set_default_timeout(5000)
+
+    if cache_navegacion.aplicar(clave_perfil, playwright_page):
+        fg = Funciones_Globales(playwright_page)
+        fg.logger.info(f"Navegación directa a '{playwright_page.url}' desde la caché de navegación ({clave_perfil}).")
+        fg.validar_url_actual(".*/Datatables_OK.html")
+        fg.validar_titulo_de_web("Formulario de Ejemplo", "validar_titulo_de_web", config.SCREENSHOT_DIR)
+    else:
+        _recorrer_menu_DataTable(playwright_page)
+        cache_navegacion.registrar(clave_perfil, playwright_page)
     
     yield playwright_page
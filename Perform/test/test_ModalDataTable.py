@@ -1,3 +1,4 @@
+import itertools
 import random
 import pytest
 import re
@@ -8,6 +9,27 @@ from Perform.pages.base_page import Funciones_Globales
 from Perform.locator.locator_ModalDataTable import ModalDataTableLocatorPage
 from Perform.utils import config
 
+def test_navegacion_modal_datatable(navegacion_DataTable):
+    """
+    Verifica la ruta de navegación completa hasta la página "Modal Data table": carga `config.FORM_URL`,
+    abre el menú (hamburguesa en resoluciones móviles), entra en "Formulario Tres" y selecciona
+    "Modal Data table", validando la URL y el título de destino.
+
+    Es el único test que recorre el menú: el fixture 'navegacion_DataTable' guarda la URL final y el
+    storage_state para que el resto de tests del mismo perfil naveguen directamente.
+
+    Args:
+        navegacion_DataTable (Page): Objeto de página de Playwright ya situado en la Datatable
+        tras recorrer el menú completo.
+    """
+    page = navegacion_DataTable
+    fg = Funciones_Globales(page)
+    mdt = ModalDataTableLocatorPage(page)
+
+    # La tabla debe estar disponible al final del recorrido.
+    fg.validar_elemento_visible(mdt.dataTable, "validar_elemento_visible_data_table", config.SCREENSHOT_DIR)
+    fg.logger.info("Fin de la prueba de navegación hasta la página Modal Data table.")
+
 def test_buscar_dato(set_up_DataTable):
     """
     Realiza una prueba end-to-end para la funcionalidad de agregar, buscar y verificar
@@ -60,10 +82,11 @@ def test_buscar_dato(set_up_DataTable):
     # Esta lista se utilizará posteriormente para buscar y verificar los datos en la tabla.
     datos_registrados = [] 
     
-    # Obtiene el número total de filas con datos en el archivo Excel.
-    num_filas = fg.num_Filas_excel(excel_file_path, sheet_name, has_header)
     # Determina el índice de la primera fila de datos en el Excel (considerando si hay encabezado o no).
     start_row_index = 2 if has_header else 1
+    # Recorre la hoja en una sola pasada: el mapa de encabezados se resuelve una vez y
+    # cada fila llega ya con 'Nombre', 'Apellidos' y 'Teléfono' convertidos a texto.
+    filas_excel = fg.iterar_filas_excel(excel_file_path, sheet_name, has_header, columnas=["Nombre", "Apellidos", "Teléfono"], como_texto=True)
 
     fg.logger.info("--- Iniciando registro de datos desde Excel en la datatable ---")
     
@@ -71,14 +94,14 @@ def test_buscar_dato(set_up_DataTable):
     start_time_registro = time.time()
 
     # Itera sobre cada fila de datos en el archivo Excel para registrarlas en la Datatable.
-    for n in range(start_row_index, num_filas + start_row_index):
-        # Hace clic en el botón para agregar un nuevo registro a la tabla.
-        fg.hacer_click_en_elemento(mdt.botonAgregarRegistro, "hacer_click_en_elemento_agregar_registro", config.SCREENSHOT_DIR)
+    for n, fila in enumerate(filas_excel, start=start_row_index):
+        # Hace clic en el botón para agregar un nuevo registro a la tabla (postcondición: el modal muestra el campo 'Nombre').
+        fg.hacer_click_en_elemento(mdt.botonAgregarRegistro, "hacer_click_en_elemento_agregar_registro", config.SCREENSHOT_DIR, postcondicion=mdt.campoNombre)
         
         # Obtiene los datos de 'Nombre', 'Apellidos' y 'Teléfono' de la fila actual del Excel.
-        nombre = fg.dato_Columna_excel(excel_file_path, sheet_name, n, "Nombre")
-        apellido = fg.dato_Columna_excel(excel_file_path, sheet_name, n, "Apellidos")
-        telef = fg.dato_Columna_excel(excel_file_path, sheet_name, n, "Teléfono")
+        nombre = fila["Nombre"]
+        apellido = fila["Apellidos"]
+        telef = fila["Teléfono"]
 
         # Almacena los datos de la fila actual en la lista 'datos_registrados' para su posterior verificación.
         datos_registrados.append({"Nombre": nombre, "Apellidos": apellido, "Teléfono": str(telef)}) 
@@ -126,8 +149,8 @@ def test_buscar_dato(set_up_DataTable):
     start_time_busqueda = time.time()
     # Rellena el campo de búsqueda de la tabla con el valor seleccionado aleatoriamente.
     fg.rellenar_campo_de_texto(mdt.campoBuscar, valor_a_buscar, "rellenar_campo_buscar", config.SCREENSHOT_DIR, tiempo=0.5)
-    # Espera un breve momento para que la tabla se filtre y se actualice después de la búsqueda.
-    page.wait_for_timeout(1000) # (1000 milisegundos = 1 segundo)
+    # Espera a que la tabla termine de filtrarse y redibujarse (DOM estable) en lugar de una pausa fija.
+    fg.esperar_dom_estable(mdt.dataTable, nombre_paso="tabla_filtrada")
     # --- Medición de rendimiento: Fin de la acción de búsqueda ---
     end_time_busqueda = time.time()
     total_time_busqueda = end_time_busqueda - start_time_busqueda
@@ -158,8 +181,8 @@ def test_buscar_dato(set_up_DataTable):
         # Rellena el campo de búsqueda con una cadena vacía para limpiar el filtro.
         fg.rellenar_campo_de_texto(mdt.campoBuscar, "", "limpiar_campo_buscar", config.SCREENSHOT_DIR, tiempo=0.5)
         fg.logger.info("Campo de búsqueda limpiado.")
-        # Espera un momento para que la tabla se restablezca después de limpiar el campo.
-        page.wait_for_timeout(1000) 
+        # Espera a que la tabla se restablezca (DOM estable) después de limpiar el campo.
+        fg.esperar_dom_estable(mdt.dataTable, nombre_paso="tabla_restablecida")
         
         fg.logger.info("Verificando que la tabla ha vuelto a mostrar todos los registros después de limpiar la búsqueda.")
         
@@ -193,7 +216,7 @@ def test_buscar_dato(set_up_DataTable):
 
     fg.logger.info("Fin de la prueba de búsqueda y verificación.")
 
-def test_registrar_data_xml(set_up_DataTable):
+def test_registrar_data_xml(set_up_DataTable, datos_fuente):
     """
     Realiza una prueba end-to-end para registrar datos desde un archivo XML en una tabla
     interactiva (Datatable) y verificar la funcionalidad de paginación y el conteo de entradas.
@@ -215,6 +238,7 @@ def test_registrar_data_xml(set_up_DataTable):
     Args:
         set_up_DataTable (Page): Objeto de página de Playwright, proporcionado por el fixture
         'set_up_DataTable', que ya ha navegado a la URL inicial de la Datatable.
+        datos_fuente (PrecargaDataSources): Archivos de datos pre-parseados al inicio de la sesión.
     """
 
     # Inicializa el objeto 'page' de Playwright a partir del fixture.
@@ -243,33 +267,29 @@ def test_registrar_data_xml(set_up_DataTable):
     try:
         fg.logger.info("--- Iniciando lectura y registro de datos desde XML en la datatable ---")
 
-        # Intenta leer el archivo XML. Se espera que la función 'leer_xml' devuelva el elemento raíz.
-        root_element = fg.leer_xml(xml_file_path)
-
-        # Verifica si el elemento raíz se pudo leer correctamente. Si no, registra un error y lanza una excepción.
-        if root_element is None:
-            fg.logger.error("\n ❌ Error: No se pudo leer el archivo XML o está vacío/mal formado.")
-            raise ValueError("No se pudo procesar el archivo XML.")
+        # Obtiene el XML ya pre-parseado por el fixture de sesión 'datos_fuente' (caché columnar
+        # mapeada en memoria); cada '<record>' llega como diccionario sin volver a parsear el archivo.
+        fg.logger.info(f"Usando datos pre-parseados de '{xml_file_path}'.")
+        registros = iter(datos_fuente[xml_file_name])
 
-        # Busca todos los elementos 'record' dentro del XML. Se asume que cada 'record' representa una fila de datos.
-        records = root_element.findall('record')
+        # Obtiene el primer registro para comprobar que el XML contiene datos antes de abrir el formulario.
+        primer_registro = next(registros, None)
 
         # Si no se encuentran registros '<record>', se registra una advertencia y la función termina.
-        if not records:
+        if primer_registro is None:
             fg.logger.warning(f"\n ⚠️ Advertencia: El archivo XML '{xml_file_path}' no contiene elementos '<record>' o está vacío.")
             return # Termina la prueba si no hay datos para procesar
         
         # Hace clic en el botón para abrir el formulario de agregar un nuevo registro.
         fg.hacer_click_en_elemento(mdt.botonAgregarRegistro, "hacer_click_en_elemento_agregar_registro", config.SCREENSHOT_DIR)
 
-        # Itera sobre cada elemento 'record' encontrado en el XML.
-        for i, record_element in enumerate(records):
-            # Obtiene los datos de 'Nombre', 'Apellido' y 'Teléfono' del elemento 'record' actual.
-            # Se usa .find('TagName').text para obtener el contenido, y se añade una verificación
-            # para 'None' para evitar errores si un tag no existe.
-            nombre = record_element.find('Nombre').text if record_element.find('Nombre') is not None else ""
-            apellido = record_element.find('Apellido').text if record_element.find('Apellido') is not None else ""
-            tlf = record_element.find('Teléfono').text if record_element.find('Teléfono') is not None else ""
+        # Itera sobre cada registro del XML (el primero ya leído seguido del resto del flujo).
+        for i, registro in enumerate(itertools.chain([primer_registro], registros)):
+            # Obtiene los datos de 'Nombre', 'Apellido' y 'Teléfono' del registro actual.
+            # Si un tag no existe en el registro (valor nulo), se usa una cadena vacía.
+            nombre = registro.get('Nombre') or ""
+            apellido = registro.get('Apellido') or ""
+            tlf = registro.get('Teléfono') or ""
 
             # La 'fila lógica' se usa para propósitos de log y capturas de pantalla, indicando
             # la posición del registro actual en el XML.
@@ -329,11 +349,8 @@ def test_registrar_data_xml(set_up_DataTable):
     # Selecciona la opción deseada en el ComboBox de paginación.
     fg.seleccionar_opcion_por_valor(mdt.comboBoxMostrar, entries_to_show, f"seleccionar_opcion_por_valor_{entries_to_show}", config.SCREENSHOT_DIR)
     
-    # Espera un momento para que la tabla se actualice después de la selección.
-    # NOTA: Aunque esta espera es fija, es necesaria para permitir que el DOM se actualice.
-    # Una alternativa más robusta sería esperar por una condición específica en el DOM,
-    # como un cambio en el texto de `infoDataTable`.
-    page.wait_for_timeout(1000)
+    # Espera a que la tabla se redibuje con la nueva paginación (DOM estable) en lugar de una pausa fija.
+    fg.esperar_dom_estable(mdt.dataTable, nombre_paso=f"tabla_paginada_{entries_to_show}")
 
     fg.logger.info("Verificando el texto de información de la tabla.")
     
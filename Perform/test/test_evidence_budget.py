@@ -0,0 +1,99 @@
+import os
+import time
+from Perform.utils.evidence import EscritorCapturas, leer_manifiesto
+from Perform.utils.evidence_budget import GestorEvidencias
+
+DIAS = 86400
+
+
+def _gestor(tmp_path, directorio, **opciones) -> GestorEvidencias:
+    return GestorEvidencias([str(directorio)], ruta_indice=str(tmp_path / "evidence_index.jsonl"),
+                            directorio_logs=str(tmp_path / "log"), **opciones)
+
+
+def _capturar(escritor: EscritorCapturas, directorio, nombre: str, datos: bytes, fallo: bool = False) -> None:
+    escritor.encolar(os.path.join(str(directorio), f"{nombre}.png"), datos, fallo)
+    assert escritor.vaciar() == []
+
+
+def _blobs(directorio):
+    return [os.path.join(raiz, nombre) for raiz, _, nombres in os.walk(str(directorio / "blobs")) for nombre in nombres]
+
+
+def test_blob_antiguo_reutilizado_por_un_fallo_no_caduca(tmp_path):
+    """
+    Un blob escrito hace 20 días y reutilizado hoy por una captura de fallo no se elimina por antigüedad,
+    y la entrada de hoy en el manifiesto se conserva.
+    """
+    capturas = tmp_path / "imagen"
+    escritor = EscritorCapturas(deduplicar=True)
+    _capturar(escritor, capturas, "paso_antiguo", b"mismo fotograma")
+    (blob,) = _blobs(capturas)
+    hace_20_dias = time.time() - 20 * DIAS
+    os.utime(blob, (hace_20_dias, hace_20_dias))
+
+    _capturar(escritor, capturas, "paso_de_hoy_fallo", b"mismo fotograma", fallo=True)
+
+    assert os.path.getmtime(blob) > hace_20_dias + DIAS
+    resultado = _gestor(tmp_path, capturas, edad_max_dias=14).aplicar_presupuesto()
+    assert os.path.exists(blob)
+    assert resultado["eliminados"] == 0
+    assert resultado["entradas_podadas"] == 0
+    assert [e["paso"] for e in leer_manifiesto(str(capturas))] == ["paso_antiguo", "paso_de_hoy_fallo"]
+
+
+def test_presupuesto_por_tamano_desaloja_primero_los_blobs_no_reutilizados(tmp_path):
+    """
+    Con el presupuesto excedido se desaloja el blob que nadie reutilizó, no el que acaba de reutilizarse.
+    """
+    capturas = tmp_path / "imagen"
+    escritor = EscritorCapturas(deduplicar=True)
+    _capturar(escritor, capturas, "reutilizado", b"A" * 1000)
+    _capturar(escritor, capturas, "sin_reutilizar", b"B" * 1000)
+    hace_2_dias = time.time() - 2 * DIAS
+    for blob in _blobs(capturas):
+        os.utime(blob, (hace_2_dias, hace_2_dias))
+    _capturar(escritor, capturas, "reutilizado_hoy", b"A" * 1000)
+
+    _gestor(tmp_path, capturas, presupuesto_bytes=1500).aplicar_presupuesto()
+
+    assert [open(blob, "rb").read(1) for blob in _blobs(capturas)] == [b"A"]
+
+
+def test_blob_desalojado_durante_la_sesion_se_vuelve_a_escribir(tmp_path):
+    """
+    Si un blob desaparece después de que el escritor lo haya usado, la siguiente captura idéntica lo
+    vuelve a escribir en lugar de dejar la entrada del manifiesto apuntando a un archivo inexistente.
+    """
+    capturas = tmp_path / "imagen"
+    escritor = EscritorCapturas(deduplicar=True)
+    _capturar(escritor, capturas, "primera", b"mismo fotograma")
+    (blob,) = _blobs(capturas)
+    os.remove(blob)
+
+    _capturar(escritor, capturas, "segunda", b"mismo fotograma")
+
+    assert os.path.exists(blob)
+    assert [e["nuevo"] for e in leer_manifiesto(str(capturas))] == [True, True]
+
+
+def test_mantenimiento_de_inicio_no_desaloja(tmp_path):
+    """
+    El mantenimiento en segundo plano del inicio de sesión solo comprime logs: no desaloja blobs
+    aunque se exceda el presupuesto, porque los tests pueden estar deduplicando contra ellos.
+    """
+    capturas = tmp_path / "imagen"
+    _capturar(EscritorCapturas(deduplicar=True), capturas, "paso", b"fotograma")
+    logs = tmp_path / "log"
+    logs.mkdir()
+    log = logs / "ejecucion.log"
+    log.write_text("registro\n", encoding="utf-8")
+    hace_2_horas = time.time() - 7200
+    os.utime(log, (hace_2_horas, hace_2_horas))
+
+    gestor = _gestor(tmp_path, capturas, presupuesto_bytes=0, logs_frios_minutos=60)
+    gestor.iniciar_en_segundo_plano()
+    gestor.esperar(10)
+
+    assert len(_blobs(capturas)) == 1
+    assert not log.exists() and (logs / "ejecucion.log.gz").exists()
@@ -0,0 +1,173 @@
+from collections import deque
+from typing import Any, Deque, Dict, Hashable, Optional, Tuple
+from playwright.sync_api import Browser, BrowserContext, Error, Page, Playwright # Clases y excepciones de Playwright
+from .config import BROWSER_POOL_MAX_CONTEXTOS, BROWSER_POOL_CONTEXTOS_PRECALENTADOS # Límites del pool definidos en config.py
+
+_NAVEGADORES_SOPORTADOS = ("chromium", "firefox", "webkit")
+
+
+class BrowserPool:
+    """
+    Pool de navegadores por proceso (cada worker de pytest-xdist tiene el suyo).
+
+    Lanza cada motor (chromium, firefox, webkit) una sola vez y entrega un `BrowserContext` nuevo por
+    test, de modo que el aislamiento entre tests es el mismo que con un navegador por test (cookies,
+    almacenamiento y caché viven en el contexto) pero el coste de lanzamiento se paga una vez.
+
+    Un navegador se relanza únicamente si se ha desconectado (crash) o si ya ha servido
+    `max_contextos` contextos, para acotar posibles fugas de memoria del proceso del navegador.
+
+    Además mantiene hasta `contextos_precalentados` pares (contexto, página) listos por cada combinación
+    de navegador y dispositivo/resolución (`clave`), de modo que la preparación de un test se reduce a
+    sacar un elemento de la cola (`tomar_contexto`). La API síncrona de Playwright no admite llamadas
+    desde otro hilo, así que `reponer` crea el siguiente contexto en el hilo del test (en su teardown):
+    en un único worker no reduce el tiempo total, solo saca la creación del contexto de la fase de
+    preparación. Por eso solo debe reponerse cuando el siguiente test usa la misma combinación; los
+    contextos que ya no se van a usar se cierran (`descartar`). Los contextos que graban video
+    (`record_video_dir`) no se precalientan: grabarían desde su creación, mientras esperan en la cola.
+
+    Con `trazar=True` el rastreo (`tracing.start`) se arranca al crear el contexto, también fuera de la
+    fase de preparación; cada test graba solo su propio fragmento con `tracing.start_chunk` /
+    `tracing.stop_chunk`, y decide al terminar si lo guarda en disco o lo descarta.
+    """
+
+    def __init__(self, playwright: Playwright, opciones_lanzamiento: Optional[Dict[str, Any]] = None,
+                 max_contextos: int = BROWSER_POOL_MAX_CONTEXTOS,
+                 contextos_precalentados: int = BROWSER_POOL_CONTEXTOS_PRECALENTADOS,
+                 opciones_traza: Optional[Dict[str, Any]] = None):
+        self.playwright = playwright
+        self.opciones_lanzamiento = opciones_lanzamiento or {}
+        self.max_contextos = max_contextos
+        self.contextos_precalentados = contextos_precalentados
+        self.opciones_traza = opciones_traza or {"screenshots": True, "snapshots": True, "sources": True}
+        self._navegadores: Dict[str, Browser] = {}
+        self._contextos_servidos: Dict[str, int] = {}
+        self._listos: Dict[Hashable, Deque[Tuple[BrowserContext, Page]]] = {}
+        self._opciones_por_clave: Dict[Hashable, Tuple[str, bool, Dict[str, Any]]] = {}
+        self.lanzamientos = 0
+        self.contextos_reutilizados = 0
+
+    def obtener_navegador(self, browser_type: str) -> Browser:
+        """
+        Devuelve el navegador del motor indicado, lanzándolo (o relanzándolo) si es necesario.
+
+        Raises:
+            ValueError: Si el tipo de navegador no es compatible.
+        """
+        if browser_type not in _NAVEGADORES_SOPORTADOS:
+            raise ValueError(f"\nEl tipo de navegador '{browser_type}' no es compatible.")
+
+        navegador = self._navegadores.get(browser_type)
+        if navegador is not None and navegador.is_connected() and self._contextos_servidos[browser_type] < self.max_contextos:
+            return navegador
+
+        if navegador is not None:
+            self._cerrar_navegador(browser_type)
+
+        navegador = getattr(self.playwright, browser_type).launch(**self.opciones_lanzamiento)
+        self._navegadores[browser_type] = navegador
+        self._contextos_servidos[browser_type] = 0
+        self.lanzamientos += 1
+        return navegador
+
+    def nuevo_contexto(self, browser_type: str, **opciones_contexto: Any) -> BrowserContext:
+        """
+        Crea un `BrowserContext` nuevo en el navegador del motor indicado. Si el navegador se cayó
+        entre la comprobación y la creación del contexto, se relanza y se reintenta una vez.
+        """
+        navegador = self.obtener_navegador(browser_type)
+        try:
+            contexto = navegador.new_context(**opciones_contexto)
+        except Error:
+            if navegador.is_connected():
+                raise
+            self._cerrar_navegador(browser_type)
+            contexto = self.obtener_navegador(browser_type).new_context(**opciones_contexto)
+        self._contextos_servidos[browser_type] += 1
+        return contexto
+
+    def _crear_par(self, browser_type: str, trazar: bool, opciones_contexto: Dict[str, Any]) -> Tuple[BrowserContext, Page]:
+        contexto = self.nuevo_contexto(browser_type, **opciones_contexto)
+        if trazar:
+            # Arranca el rastreo y cierra el fragmento inicial sin guardarlo: el test abre el suyo con start_chunk.
+            contexto.tracing.start(**self.opciones_traza)
+            contexto.tracing.stop_chunk()
+        return contexto, contexto.new_page()
+
+    def tomar_contexto(self, clave: Hashable, browser_type: str, trazar: bool = False,
+                       **opciones_contexto: Any) -> Tuple[BrowserContext, Page]:
+        """
+        Devuelve un contexto con su página para la combinación `clave`, sacándolo de la cola de contextos
+        precalentados si hay alguno válido o creándolo en el momento en caso contrario.
+
+        Args:
+            clave (Hashable): Identificador de la combinación navegador/dispositivo (p. ej. 'chromium-iPhone 12').
+            browser_type (str): Motor del navegador ('chromium', 'firefox' o 'webkit').
+            trazar (bool): Si el contexto debe entregarse con el rastreo iniciado (listo para `start_chunk`).
+            **opciones_contexto: Opciones de `new_context`; se recuerdan para reponer la cola de esta clave.
+
+        Returns:
+            Tuple[BrowserContext, Page]: El contexto y su página, sin usar.
+        """
+        self._opciones_por_clave[clave] = (browser_type, trazar, opciones_contexto)
+        cola = self._listos.get(clave)
+        while cola:
+            contexto, pagina = cola.popleft()
+            # Descarta contextos cuyo navegador se cayó o se relanzó mientras esperaban en la cola.
+            if contexto.browser is not None and contexto.browser.is_connected() and not pagina.is_closed():
+                self.contextos_reutilizados += 1
+                return contexto, pagina
+            self._cerrar_par(contexto, pagina)
+        return self._crear_par(browser_type, trazar, opciones_contexto)
+
+    def reponer(self, clave: Hashable) -> None:
+        """
+        Rellena la cola de contextos precalentados de `clave` hasta `contextos_precalentados`, salvo que
+        sus contextos graben video. Debe llamarse desde el mismo hilo que usa Playwright (p. ej. en el teardown de un test).
+        """
+        if clave not in self._opciones_por_clave or self.contextos_precalentados <= 0:
+            return
+        browser_type, trazar, opciones_contexto = self._opciones_por_clave[clave]
+        if opciones_contexto.get("record_video_dir"):
+            return
+        cola = self._listos.setdefault(clave, deque())
+        while len(cola) < self.contextos_precalentados:
+            cola.append(self._crear_par(browser_type, trazar, opciones_contexto))
+
+    def descartar(self, clave: Hashable) -> None:
+        """
+        Cierra los contextos precalentados de `clave` (p. ej. cuando ningún test próximo usa esa combinación).
+        """
+        for contexto, pagina in self._listos.pop(clave, ()):
+            self._cerrar_par(contexto, pagina)
+
+    def _cerrar_par(self, contexto: BrowserContext, pagina: Page) -> None:
+        # Un contexto que no llegó a usarse no deja evidencias: también se borra su video, si lo grababa.
+        try:
+            contexto.close()
+            if pagina.video:
+                pagina.video.delete()
+        except Error:
+            pass  # El navegador del contexto ya estaba caído o cerrado.
+
+    def _cerrar_navegador(self, browser_type: str) -> None:
+        # Los contextos precalentados de este motor dejan de ser válidos al cerrar el navegador.
+        for clave, (tipo, _, _) in self._opciones_por_clave.items():
+            if tipo == browser_type:
+                self.descartar(clave)
+        navegador = self._navegadores.pop(browser_type, None)
+        self._contextos_servidos.pop(browser_type, None)
+        if navegador is not None:
+            try:
+                navegador.close()
+            except Error:
+                pass  # El navegador ya estaba caído.
+
+    def cerrar(self) -> None:
+        """
+        Cierra todos los contextos precalentados que queden en las colas y después todos los navegadores del pool.
+        """
+        for clave in list(self._listos):
+            self.descartar(clave)
+        for browser_type in list(self._navegadores):
+            self._cerrar_navegador(browser_type)
@@ -0,0 +1,131 @@
+import math
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+from playwright.sync_api import Locator # Locator de Playwright
+
+# Devuelve, en una sola llamada, los encabezados 'th' de la tabla y el texto recortado de la celda 'td'
+# de la columna indicada en cada fila 'tbody tr' (null si la fila no tiene esa celda).
+_JS_EXTRAER_COLUMNA = """
+(tabla, nombre) => {
+    const encabezados = Array.from(tabla.querySelectorAll('th'), th => (th.textContent || '').trim());
+    const indice = encabezados.indexOf(nombre);
+    if (indice === -1) return {encabezados, indice, valores: null};
+    const valores = Array.from(tabla.querySelectorAll('tbody tr'), tr => {
+        const celda = tr.querySelectorAll('td')[indice];
+        return celda ? (celda.textContent || '').trim() : null;
+    });
+    return {encabezados, indice, valores};
+}
+"""
+
+MONOTONIA_CRECIENTE = "creciente"
+MONOTONIA_DECRECIENTE = "decreciente"
+
+REGLA_NUMERICO = "numerico"
+REGLA_RANGO = "rango"
+REGLA_MONOTONIA = "monotonia"
+REGLA_SUMA = "suma"
+
+
+def extraer_columna(tabla: Locator, nombre_columna: str) -> Tuple[List[str], int, Optional[List[Optional[str]]]]:
+    """
+    Obtiene una columna completa de la tabla con un único `evaluate`.
+
+    Returns:
+        Tuple[List[str], int, Optional[List[Optional[str]]]]: Los encabezados, el índice de la columna
+        (-1 si no existe) y los textos de sus celdas (`None` si la columna no existe).
+    """
+    datos = tabla.evaluate(_JS_EXTRAER_COLUMNA, nombre_columna)
+    return datos["encabezados"], datos["indice"], datos["valores"]
+
+
+def convertir_numeros(textos: Sequence[Optional[str]]) -> Tuple[array, bytearray]:
+    """
+    Convierte una columna de textos a `array('d')` en bloque, con la misma regla que `float(texto)`.
+
+    La conversión de toda la columna se intenta primero en una sola pasada en C (`array('d', map(float, ...))`);
+    solo si algún valor no es numérico se recorre la columna para marcarlo.
+
+    Returns:
+        Tuple[array, bytearray]: Los valores (NaN donde no hay número) y la máscara de fallos
+                                 (1 en las filas cuyo texto no es un número válido).
+    """
+    try:
+        return array('d', map(float, textos)), bytearray(len(textos))
+    except (TypeError, ValueError):
+        pass
+    valores = array('d', bytes(8 * len(textos)))
+    mascara = bytearray(len(textos))
+    for i, texto in enumerate(textos):
+        try:
+            valores[i] = float(texto)
+        except (TypeError, ValueError):
+            valores[i] = math.nan
+            mascara[i] = 1
+    return valores, mascara
+
+
+class ResultadoValidacionColumna:
+    """
+    Resultado de `validar_columna_numerica`: los valores convertidos, la máscara de fallos de conversión
+    y, por regla, las filas (índices desde 0) que la incumplen.
+    """
+
+    __slots__ = ("valores", "mascara_invalidos", "fallos", "suma")
+
+    def __init__(self, valores: array, mascara_invalidos: bytearray):
+        self.valores = valores
+        self.mascara_invalidos = mascara_invalidos
+        self.fallos: Dict[str, List[int]] = {}
+        self.suma: Optional[float] = None
+
+    @property
+    def ok(self) -> bool:
+        return not any(self.fallos.values())
+
+    @property
+    def invalidos(self) -> List[int]:
+        return self.fallos.get(REGLA_NUMERICO, [])
+
+
+def validar_columna_numerica(textos: Sequence[Optional[str]], minimo: Optional[float] = None, maximo: Optional[float] = None,
+                             monotonia: Optional[str] = None, estricta: bool = False,
+                             suma_esperada: Optional[float] = None, tolerancia: float = 1e-9) -> ResultadoValidacionColumna:
+    """
+    Valida en bloque una columna de textos numéricos.
+
+    Reglas (las filas no numéricas solo cuentan para la regla 'numerico'):
+    - 'numerico': cada texto debe ser un número válido para `float`.
+    - 'rango': `minimo - tolerancia <= valor <= maximo + tolerancia` (cada límite es opcional).
+    - 'monotonia': 'creciente' o 'decreciente' (`estricta` no admite valores iguales); se informa la fila
+      que rompe el orden respecto al valor numérico anterior.
+    - 'suma': la suma (`math.fsum`) debe estar a `tolerancia` de `suma_esperada`; se informa la fila -1.
+
+    Raises:
+        ValueError: Si `monotonia` no es 'creciente' ni 'decreciente'.
+    """
+    valores, mascara = convertir_numeros(textos)
+    resultado = ResultadoValidacionColumna(valores, mascara)
+    resultado.fallos[REGLA_NUMERICO] = [i for i, fallo in enumerate(mascara) if fallo]
+    indices_validos = range(len(valores)) if not resultado.fallos[REGLA_NUMERICO] else [i for i, fallo in enumerate(mascara) if not fallo]
+
+    if minimo is not None or maximo is not None:
+        bajo = -math.inf if minimo is None else minimo - tolerancia
+        alto = math.inf if maximo is None else maximo + tolerancia
+        resultado.fallos[REGLA_RANGO] = [i for i in indices_validos if not bajo <= valores[i] <= alto]
+
+    if monotonia is not None:
+        if monotonia not in (MONOTONIA_CRECIENTE, MONOTONIA_DECRECIENTE):
+            raise ValueError(f"Monotonía no soportada: '{monotonia}'. Valores admitidos: '{MONOTONIA_CRECIENTE}', '{MONOTONIA_DECRECIENTE}'.")
+        signo = 1 if monotonia == MONOTONIA_CRECIENTE else -1
+        indices = list(indices_validos)
+        if estricta:
+            resultado.fallos[REGLA_MONOTONIA] = [b for a, b in zip(indices, indices[1:]) if signo * (valores[b] - valores[a]) <= 0]
+        else:
+            resultado.fallos[REGLA_MONOTONIA] = [b for a, b in zip(indices, indices[1:]) if signo * (valores[b] - valores[a]) < -tolerancia]
+
+    if suma_esperada is not None:
+        resultado.suma = math.fsum(valores[i] for i in indices_validos)
+        resultado.fallos[REGLA_SUMA] = [] if abs(resultado.suma - suma_esperada) <= tolerancia else [-1]
+
+    return resultado
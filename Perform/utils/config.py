@@ -31,6 +31,10 @@ TRACEVIEW_DIR = os.path.join(EVIDENCE_BASE_DIR, "traceview")
 # Se creará '.../PRACTICA-RV/PRV/test/reportes/imagen'
 SCREENSHOT_DIR = os.path.join(EVIDENCE_BASE_DIR, "imagen")
 
+# Ruta para el presupuesto de esperas (JSON por worker e histórico de ejecuciones).
+# Se creará '.../PRACTICA-RV/PRV/test/reportes/wait_budget'
+WAIT_BUDGET_DIR = os.path.join(EVIDENCE_BASE_DIR, "wait_budget")
+
 # Ruta para logger.
 # Se creará '.../PRACTICA-RV/PRV/test/reportes/log'
 LOGGER_DIR = os.path.join(EVIDENCE_BASE_DIR, "log")
@@ -48,6 +52,133 @@ SOURCE_FILES_DIR_UPLOAD = os.path.join(PROJECT_ROOT, "test", "archivos", "archiv
 # Se creará '.../PRACTICA-RV/PRV/test/archivos_download'
 SOURCE_FILES_DIR_DOWNLOAD = os.path.join(PROJECT_ROOT, "test", "archivos", "archivos_download")
 
+# --- Caché de libros Excel ---
+
+# Número máximo de libros de trabajo (.xlsx) que se mantienen parseados en memoria por proceso.
+EXCEL_CACHE_MAX_LIBROS = 8
+
+# Memoria máxima estimada (en bytes) que puede ocupar la caché de libros Excel.
+# Al superarse, se desalojan los libros usados hace más tiempo (LRU).
+EXCEL_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# --- Índice de líneas para archivos CSV ---
+
+# Número máximo de archivos CSV cuyo índice de desplazamientos (offsets) se mantiene en memoria por proceso.
+CSV_INDEX_CACHE_MAX_ARCHIVOS = 16
+
+# --- DataSource (tabla columnar unificada sobre Excel/CSV/JSON/XML) ---
+
+# Extensión del archivo de caché binaria columnar que se guarda junto a cada archivo fuente.
+DATA_SOURCE_CACHE_EXTENSION = ".colcache"
+
+# Alias de nombres de columna: 'nombre normalizado (minúsculas, sin espacios extremos)' -> nombre canónico.
+# Permite que 'Apellidos' (Excel) y 'Apellido' (CSV/JSON/XML) lleguen como la misma columna.
+DATA_SOURCE_ALIAS_COLUMNAS = {
+    "nombre": "Nombre",
+    "apellido": "Apellido",
+    "apellidos": "Apellido",
+    "teléfono": "Teléfono",
+    "telefono": "Teléfono",
+}
+
+# --- Pool de navegadores ---
+
+# Número de contextos que sirve un mismo navegador antes de relanzarlo (además de relanzarlo si se cae).
+BROWSER_POOL_MAX_CONTEXTOS = 50
+
+# Número de contextos (con su página) que se mantienen listos por combinación navegador/dispositivo.
+# 0 desactiva el precalentamiento. Los contextos que graban video no se precalientan: con VIDEO_MODO
+# distinto de 'off' (incluido el valor por defecto, 'retain-on-failure') no hay precalentamiento.
+BROWSER_POOL_CONTEXTOS_PRECALENTADOS = 1
+
+# --- Esperas ---
+
+# Las esperas fijas posteriores a cada acción (parámetro 'tiempo' de Funciones_Globales) son un mecanismo
+# de respaldo opcional: por defecto las acciones esperan su postcondición y no duermen.
+# Se pueden reactivar (p. ej. para depurar visualmente) con la variable de entorno ESPERAS_FIJAS=1.
+ESPERAS_FIJAS_HABILITADAS = os.environ.get("ESPERAS_FIJAS", "0") == "1"
+
+# Tiempo máximo (en milisegundos) para que se cumpla la postcondición de una acción.
+POSTCONDICION_TIMEOUT_MS = 5000
+
+# Tiempo (en milisegundos) sin mutaciones en el DOM para considerar que una zona está estable
+# (p. ej. una tabla terminó de redibujarse o un mensaje terminó de insertarse).
+DOM_ESTABLE_QUIETUD_MS = 150
+
+# --- Capturas de pantalla ---
+
+# Número máximo de capturas pendientes de escribir a disco. Si se alcanza, el test espera a que el
+# hilo escritor libere hueco (contrapresión) en lugar de acumular imágenes en memoria.
+CAPTURAS_COLA_MAX = 64
+
+# Política de evidencias de capturas de pantalla:
+#   'always'     -> se guardan todas las capturas.
+#   'on_failure' -> solo se toman las capturas de pasos fallidos y la del test fallido.
+#   'last_N'     -> se mantienen en memoria las CAPTURAS_ULTIMAS_N más recientes y solo se escriben
+#                   a disco si falla un paso o el test (las ejecuciones en verde casi no escriben imágenes).
+# Se puede cambiar sin editar el archivo con la variable de entorno CAPTURAS_POLITICA.
+CAPTURAS_POLITICA = os.environ.get("CAPTURAS_POLITICA", "last_N")
+
+# Número de capturas recientes que conserva la política 'last_N'.
+CAPTURAS_ULTIMAS_N = 10
+
+# Almacenamiento de capturas por contenido: cada imagen distinta se guarda una sola vez en
+# '<directorio>/blobs/<aa>/<sha256>.png' y 'manifest.jsonl' relaciona cada paso con su blob.
+# Con CAPTURAS_DEDUPLICADAS=0 se vuelve a escribir un archivo por captura con su nombre con fecha.
+CAPTURAS_DEDUPLICADAS = os.environ.get("CAPTURAS_DEDUPLICADAS", "1") == "1"
+CAPTURAS_BLOBS_SUBDIR = "blobs"
+CAPTURAS_MANIFIESTO = "manifest.jsonl"
+
+# Formato y coste de las capturas de pantalla (valores globales; tomar_captura admite sobrescribirlos por llamada).
+# Formatos admitidos por Playwright: 'png' y 'jpeg' (WebP no está soportado por page.screenshot).
+CAPTURAS_FORMATO = os.environ.get("CAPTURAS_FORMATO", "png")
+# Calidad JPEG (0-100); se ignora con 'png'.
+CAPTURAS_CALIDAD = int(os.environ.get("CAPTURAS_CALIDAD", "70"))
+# 'css' guarda un píxel por píxel CSS (reduce 2-3x las capturas en dispositivos con device_scale_factor alto);
+# 'device' conserva la resolución física del dispositivo emulado. Es la única reducción de resolución que ofrece
+# Playwright: solo afecta a los perfiles móviles emulados (iPhone 12, Pixel 5). En los perfiles de escritorio
+# 1920x1080 (device_scale_factor 1) no cambia nada; allí el tamaño y el coste solo bajan con 'jpeg' o con el recorte.
+CAPTURAS_ESCALA = os.environ.get("CAPTURAS_ESCALA", "css")
+# Si es '1', las capturas de pasos correctos que indican su elemento se recortan a ese elemento
+# (las de fallo siempre son de la página completa, para conservar el contexto).
+CAPTURAS_RECORTE_ELEMENTO = os.environ.get("CAPTURAS_RECORTE_ELEMENTO", "0") == "1"
+# Tiempo máximo (ms) para capturar un elemento antes de volver a la captura de la página completa.
+CAPTURAS_RECORTE_TIMEOUT_MS = 1000
+
+# Tamaño de los videos grabados por el fixture playwright_page.
+VIDEO_TAMANO = {"width": int(os.environ.get("VIDEO_ANCHO", "1920")), "height": int(os.environ.get("VIDEO_ALTO", "1080"))}
+
+# Presupuesto de almacenamiento de evidencias (video, traceview, imagen y log).
+# Tamaño total máximo en MB; al superarlo se desalojan primero las evidencias de tests que pasaron.
+EVIDENCIAS_PRESUPUESTO_MB = int(os.environ.get("EVIDENCIAS_PRESUPUESTO_MB", "2048"))
+# Las evidencias más antiguas que este número de días se eliminan siempre.
+EVIDENCIAS_EDAD_MAX_DIAS = float(os.environ.get("EVIDENCIAS_EDAD_MAX_DIAS", "14"))
+# Los logs sin modificar desde hace estos minutos se comprimen con gzip.
+EVIDENCIAS_LOGS_FRIOS_MINUTOS = 60
+# Índice (en EVIDENCE_BASE_DIR) que anota si cada video/traza pertenece a un test fallido.
+EVIDENCIAS_INDICE = "evidence_index.jsonl"
+
+# Modos de grabación de trazas y videos por test: 'off', 'on', 'retain-on-failure' (se graba siempre,
+# pero solo se guarda si el test falla) u 'on-first-retry' (solo en el primer reintento).
+# 'on-first-retry' necesita pytest-rerunfailures (en requirements.txt) y ejecutar con reintentos
+# (p. ej. 'pytest --reruns 1'); sin el plugin la sesión no arranca, porque nunca se grabaría nada.
+TRAZAS_MODO = os.environ.get("TRAZAS_MODO", "retain-on-failure")
+VIDEO_MODO = os.environ.get("VIDEO_MODO", "retain-on-failure")
+# Opciones de context.tracing.start.
+TRAZAS_OPCIONES = {"screenshots": True, "snapshots": True, "sources": True}
+
+# Si es '1', los loggers de setup_logger encolan los registros y un hilo en segundo plano los formatea
+# y escribe en consola y archivo (QueueHandler/QueueListener). Con '0' se escribe en el hilo del test.
+LOGGER_EN_COLA = os.environ.get("LOGGER_EN_COLA", "1") == "1"
+
+# Número máximo de índices de búsqueda de tablas (uno por elemento <table>) que se mantienen en caché.
+TABLA_INDICE_CACHE_MAX_TABLAS = 16
+
+# Recorrido de tablas paginadas (DataTables): tiempo máximo (ms) para que se redibuje cada página tras
+# pulsar 'Siguiente' y número máximo de páginas que se recorren.
+TABLA_PAGINADA_TIMEOUT_PAGINA_MS = int(os.environ.get("TABLA_PAGINADA_TIMEOUT_PAGINA_MS", "5000"))
+TABLA_PAGINADA_MAX_PAGINAS = int(os.environ.get("TABLA_PAGINADA_MAX_PAGINAS", "1000"))
+
 # Función para asegurar que los directorios existan
 def ensure_directories_exist():
     """
@@ -61,6 +192,7 @@ def ensure_directories_exist():
     os.makedirs(SOURCE_FILES_DIR_UPLOAD, exist_ok=True)
     os.makedirs(SOURCE_FILES_DIR_DOWNLOAD, exist_ok=True)
     os.makedirs(LOGGER_DIR, exist_ok=True)
+    os.makedirs(WAIT_BUDGET_DIR, exist_ok=True)
     print(f"Directorios verificados/creados: {EVIDENCE_BASE_DIR}, \
         {SOURCE_FILES_DIR_UPLOAD}, \
             {SOURCE_FILES_DIR_DOWNLOAD}, \
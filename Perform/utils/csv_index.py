@@ -0,0 +1,139 @@
+import csv
+import io
+import mmap
+import os
+import threading
+from array import array
+from collections import OrderedDict
+from typing import List, Tuple
+from .config import CSV_INDEX_CACHE_MAX_ARCHIVOS # Límite de la caché definido en config.py
+
+
+class CsvLineIndex:
+    """
+    Índice de desplazamientos en bytes del inicio de cada fila de un archivo CSV.
+
+    El índice se construye una sola vez recorriendo el archivo mapeado en memoria (mmap), sin
+    decodificar ni parsear su contenido. Una vez construido:
+    - contar filas es una consulta a la longitud del índice, y
+    - leer la fila N cuesta un `seek` más el parseo de esa única fila.
+
+    Los saltos de línea dentro de campos entre comillas no se consideran fin de fila: una línea con
+    un número impar de comillas abre (o cierra) un campo multilínea, siguiendo la regla de RFC 4180
+    en la que una comilla escapada ("") siempre aporta un número par.
+    """
+
+    def __init__(self, archivo_csv_path: str, encoding: str = 'utf-8'):
+        self.archivo_csv_path = archivo_csv_path
+        self.encoding = encoding
+        stat = os.stat(archivo_csv_path)
+        self.mtime_ns = stat.st_mtime_ns
+        self.tamano = stat.st_size
+        # offsets[i] es el inicio de la fila física i; el último elemento es el tamaño del archivo (centinela).
+        self.offsets = self._construir_offsets()
+
+    def _construir_offsets(self) -> array:
+        offsets = array('Q')
+        if self.tamano == 0:
+            # mmap no admite archivos vacíos: un CSV vacío no tiene filas.
+            offsets.append(0)
+            return offsets
+
+        with open(self.archivo_csv_path, 'rb') as archivo:
+            with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                tamano = len(mm)
+                tiene_comillas = mm.find(b'"') != -1
+                dentro_de_comillas = False
+                pos = 0
+                while pos < tamano:
+                    if not dentro_de_comillas:
+                        offsets.append(pos)
+                    fin = mm.find(b'\n', pos)
+                    siguiente = tamano if fin == -1 else fin + 1
+                    if tiene_comillas and mm.find(b'"', pos, siguiente) != -1 and mm[pos:siguiente].count(b'"') % 2:
+                        dentro_de_comillas = not dentro_de_comillas
+                    pos = siguiente
+                offsets.append(tamano)
+        return offsets
+
+    @property
+    def num_filas(self) -> int:
+        """
+        Número de filas físicas del archivo (incluido el encabezado, si lo hay).
+        """
+        return len(self.offsets) - 1
+
+    def leer_fila(self, indice_fila: int, delimiter: str = ',') -> List[str]:
+        """
+        Lee y parsea una única fila física del archivo.
+
+        Args:
+            indice_fila (int): Índice 0-basado de la fila física.
+            delimiter (str): El carácter separador de campos.
+
+        Returns:
+            List[str]: Los campos de la fila (lista vacía si la línea está en blanco).
+
+        Raises:
+            IndexError: Si el índice está fuera de rango.
+            csv.Error: Si la fila no tiene un formato CSV válido.
+        """
+        if not 0 <= indice_fila < self.num_filas:
+            raise IndexError(f"La fila física {indice_fila} está fuera de rango (total: {self.num_filas}).")
+        inicio = self.offsets[indice_fila]
+        fin = self.offsets[indice_fila + 1]
+        with open(self.archivo_csv_path, 'rb') as archivo:
+            archivo.seek(inicio)
+            texto = archivo.read(fin - inicio).decode(self.encoding)
+        return next(csv.reader(io.StringIO(texto, newline=''), delimiter=delimiter), [])
+
+
+class CsvIndexCache:
+    """
+    Caché LRU de índices de líneas CSV, invalidada automáticamente cuando cambian el mtime o
+    el tamaño del archivo.
+    """
+
+    def __init__(self, max_archivos: int = CSV_INDEX_CACHE_MAX_ARCHIVOS):
+        self.max_archivos = max_archivos
+        self._indices: "OrderedDict[Tuple[str, str], CsvLineIndex]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obtener(self, archivo_csv_path: str, encoding: str = 'utf-8') -> Tuple[CsvLineIndex, bool]:
+        """
+        Devuelve el índice del archivo indicado, construyéndolo solo si no existe o está desactualizado.
+
+        Args:
+            archivo_csv_path (str): La ruta al archivo CSV.
+            encoding (str): La codificación del archivo.
+
+        Returns:
+            Tuple[CsvLineIndex, bool]: El índice y `True` si se obtuvo desde la caché.
+        """
+        # os.stat lanza FileNotFoundError si el archivo no existe.
+        stat = os.stat(archivo_csv_path)
+        clave = (os.path.abspath(archivo_csv_path), encoding)
+        with self._lock:
+            indice = self._indices.get(clave)
+            if indice is not None and indice.mtime_ns == stat.st_mtime_ns and indice.tamano == stat.st_size:
+                self._indices.move_to_end(clave)
+                return indice, True
+
+        indice = CsvLineIndex(archivo_csv_path, encoding)
+        with self._lock:
+            self._indices[clave] = indice
+            self._indices.move_to_end(clave)
+            while len(self._indices) > self.max_archivos:
+                self._indices.popitem(last=False)
+        return indice, False
+
+    def limpiar(self) -> None:
+        """
+        Vacía la caché por completo.
+        """
+        with self._lock:
+            self._indices.clear()
+
+
+# Instancia compartida por proceso (cada worker de pytest-xdist tiene la suya).
+cache_indices_csv = CsvIndexCache()
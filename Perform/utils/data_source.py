@@ -0,0 +1,539 @@
+import csv
+import json
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import openpyxl # Librería para hacer uso del excel (para archivos .xlsx)
+from .config import DATA_SOURCE_CACHE_EXTENSION, DATA_SOURCE_ALIAS_COLUMNAS # Parámetros de la caché columnar definidos en config.py
+from .excel_cache import iterar_filas_hoja, normalizar_encabezado # Lectura streaming de hojas Excel
+from .xml_stream import iterar_registros_xml # Lectura streaming de registros XML
+from .json_stream import iterar_registros_json # Lectura streaming de arrays JSON / NDJSON
+
+# Cabecera fija del archivo de caché: firma + versión del formato.
+_FIRMA = b"PFCOLCC\x00"
+_VERSION_FORMATO = 1
+
+# Tipos de columna almacenados en la caché.
+TIPO_ENTERO = "i"  # int64, array('q')
+TIPO_REAL = "f"    # float64, array('d')
+TIPO_TEXTO = "s"   # UTF-8: offsets array('Q') (num_filas + 1 entradas) + blob de bytes
+
+_EXTENSIONES_EXCEL = (".xlsx", ".xlsm")
+_MIN_INT64, _MAX_INT64 = -(2 ** 63), 2 ** 63 - 1
+
+
+def canonizar_columna(nombre: Any) -> str:
+    """
+    Devuelve el nombre canónico de una columna aplicando los alias de `config.DATA_SOURCE_ALIAS_COLUMNAS`.
+    Si el nombre no tiene alias, se devuelve tal cual (sin espacios extremos).
+    """
+    texto = str(nombre).strip()
+    return DATA_SOURCE_ALIAS_COLUMNAS.get(normalizar_encabezado(texto), texto)
+
+
+def ruta_cache(ruta_fuente: str, hoja: Optional[str] = None) -> str:
+    """
+    Devuelve la ruta del archivo de caché columnar asociado a un archivo fuente (y hoja, para Excel).
+    El archivo se guarda junto a la fuente: 'MOCK_DATA.xlsx' -> 'MOCK_DATA.xlsx.colcache'
+    (o 'MOCK_DATA.xlsx.Hoja1.colcache' si se indica la hoja).
+    """
+    sufijo = f".{hoja}" if hoja else ""
+    return f"{ruta_fuente}{sufijo}{DATA_SOURCE_CACHE_EXTENSION}"
+
+
+class _Columna(Sequence):
+    """
+    Vista de solo lectura sobre una columna tipada. Los valores nulos se devuelven como `None`.
+    Los datos pueden residir en memoria (array) o en el archivo de caché mapeado (memoryview).
+    """
+
+    __slots__ = ("nombre", "tipo", "_datos", "_offsets", "_validez", "_num_filas")
+
+    def __init__(self, nombre: str, tipo: str, datos, num_filas: int, offsets=None, validez=None):
+        self.nombre = nombre
+        self.tipo = tipo
+        self._datos = datos
+        self._offsets = offsets
+        self._validez = validez
+        self._num_filas = num_filas
+
+    def __len__(self) -> int:
+        return self._num_filas
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(self._num_filas))]
+        if indice < 0:
+            indice += self._num_filas
+        if not 0 <= indice < self._num_filas:
+            raise IndexError(f"Índice de fila fuera de rango en la columna '{self.nombre}': {indice}")
+        if self._validez is not None and not self._validez[indice]:
+            return None
+        if self.tipo == TIPO_TEXTO:
+            return bytes(self._datos[self._offsets[indice]:self._offsets[indice + 1]]).decode("utf-8")
+        return self._datos[indice]
+
+    def _liberar(self) -> None:
+        # Libera las memoryview sobre el mmap para que el archivo pueda cerrarse.
+        for vista in (self._datos, self._offsets, self._validez):
+            if isinstance(vista, memoryview):
+                vista.release()
+
+
+def _inferir_tipo(valores: List[Any]) -> str:
+    """
+    Infiere el tipo de una columna a partir de sus valores no nulos: entero si todos son `int`
+    dentro del rango int64, real si todos son numéricos y texto en cualquier otro caso.
+    Los booleanos se tratan como texto para no confundirlos con 0/1.
+    """
+    tipo = TIPO_ENTERO
+    for valor in valores:
+        if valor is None:
+            continue
+        if isinstance(valor, bool) or not isinstance(valor, (int, float)):
+            return TIPO_TEXTO
+        if isinstance(valor, float):
+            tipo = TIPO_REAL
+        elif not _MIN_INT64 <= valor <= _MAX_INT64:
+            return TIPO_TEXTO
+    return tipo
+
+
+def _construir_columna(nombre: str, valores: List[Any]) -> _Columna:
+    """
+    Convierte una lista de valores de Python en una columna tipada respaldada por arrays.
+    """
+    tipo = _inferir_tipo(valores)
+    num_filas = len(valores)
+    validez = None
+    if any(v is None for v in valores):
+        validez = array("B", (0 if v is None else 1 for v in valores))
+
+    if tipo == TIPO_TEXTO:
+        offsets = array("Q", [0])
+        partes = []
+        total = 0
+        for valor in valores:
+            if valor is not None:
+                codificado = str(valor).encode("utf-8")
+                partes.append(codificado)
+                total += len(codificado)
+            offsets.append(total)
+        return _Columna(nombre, tipo, b"".join(partes), num_filas, offsets=offsets, validez=validez)
+
+    codigo = "q" if tipo == TIPO_ENTERO else "d"
+    return _Columna(nombre, tipo, array(codigo, (0 if v is None else v for v in valores)), num_filas, validez=validez)
+
+
+def _leer_registros(ruta_fuente: str, hoja: Optional[str], etiqueta_registro: str) -> Iterator[Dict[Any, Any]]:
+    """
+    Devuelve un iterador de registros (diccionarios) del archivo fuente según su extensión,
+    reutilizando los lectores streaming de `Perform.utils`.
+    """
+    extension = os.path.splitext(ruta_fuente)[1].lower()
+    if extension in _EXTENSIONES_EXCEL:
+        return iterar_filas_hoja(ruta_fuente, hoja, has_header=True, como="dict")
+    if extension == ".csv":
+        return _iterar_csv(ruta_fuente)
+    if extension in (".json", ".ndjson", ".jsonl"):
+        return iterar_registros_json(ruta_fuente)
+    if extension == ".xml":
+        return iterar_registros_xml(ruta_fuente, etiqueta_registro=etiqueta_registro)
+    raise ValueError(f"Extensión de archivo no soportada por DataSource: '{extension}' ({ruta_fuente}).")
+
+
+def _iterar_csv(ruta_fuente: str) -> Iterator[Dict[str, str]]:
+    # La primera fila es el encabezado; las filas vacías se omiten.
+    with open(ruta_fuente, "r", newline="", encoding="utf-8") as f:
+        lector = csv.reader(f)
+        encabezados = next(lector, None)
+        if encabezados is None:
+            return
+        for fila in lector:
+            if fila:
+                yield dict(zip(encabezados, fila))
+
+
+def _primera_hoja(ruta_fuente: str) -> str:
+    workbook = openpyxl.load_workbook(ruta_fuente, read_only=True)
+    try:
+        return workbook.sheetnames[0]
+    finally:
+        workbook.close()
+
+
+def _alinear(desplazamiento: int, alineacion: int = 8) -> int:
+    return (desplazamiento + alineacion - 1) // alineacion * alineacion
+
+
+class DataSource:
+    """
+    Tabla columnar tipada y de solo lectura construida a partir de un archivo Excel, CSV, JSON o XML.
+
+    Los nombres de columna se canonizan con `config.DATA_SOURCE_ALIAS_COLUMNAS` (p. ej. 'Apellidos' ->
+    'Apellido'), de modo que las cuatro fuentes exponen la misma forma. Cada columna es entera (int64),
+    real (float64) o texto (UTF-8), con soporte de nulos.
+
+    En la primera lectura se escribe junto a la fuente una caché binaria (`*.colcache`) con las columnas
+    ya serializadas. Las lecturas posteriores (en esta u otras ejecuciones, o en otros workers de
+    pytest-xdist) mapean ese archivo en memoria con `mmap` y exponen las columnas como `memoryview`,
+    sin volver a parsear la fuente. La caché se invalida automáticamente si cambia el mtime o el tamaño
+    del archivo fuente, o la configuración de alias.
+
+    Uso:
+        with DataSource.abrir(ruta_csv) as datos:
+            for fila in datos:
+                print(fila["Nombre"], fila["Apellido"])
+    """
+
+    def __init__(self, ruta_fuente: str, columnas: List[_Columna], num_filas: int,
+                 desde_cache: bool = False, mmap_cache: Optional[mmap.mmap] = None):
+        self.ruta_fuente = ruta_fuente
+        self.num_filas = num_filas
+        self.desde_cache = desde_cache
+        self._columnas = columnas
+        self._por_nombre = {}
+        for columna in columnas:
+            self._por_nombre.setdefault(normalizar_encabezado(columna.nombre), columna)
+        self._mmap = mmap_cache
+
+    # --- Construcción ---
+
+    @classmethod
+    def abrir(cls, ruta_fuente: str, hoja: Optional[str] = None, etiqueta_registro: str = "record",
+              usar_cache: bool = True) -> "DataSource":
+        """
+        Abre un archivo fuente como `DataSource`, usando la caché columnar si es válida.
+
+        Args:
+            ruta_fuente (str): Ruta al archivo (`.xlsx`, `.xlsm`, `.csv`, `.json`, `.ndjson`, `.jsonl` o `.xml`).
+            hoja (Optional[str]): Hoja a leer en archivos Excel. Por defecto, la primera hoja.
+            etiqueta_registro (str): Etiqueta de cada registro en archivos XML.
+            usar_cache (bool): Si es `False`, se parsea la fuente sin leer ni escribir la caché.
+
+        Returns:
+            DataSource: La tabla columnar.
+
+        Raises:
+            FileNotFoundError: Si el archivo fuente no existe.
+            ValueError: Si la extensión no está soportada.
+        """
+        stat = os.stat(ruta_fuente)
+        ruta_colcache = ruta_cache(ruta_fuente, hoja)
+        firma_fuente = {"mtime_ns": stat.st_mtime_ns, "tamano": stat.st_size, "hoja": hoja,
+                        "etiqueta_registro": etiqueta_registro, "alias": DATA_SOURCE_ALIAS_COLUMNAS}
+
+        if usar_cache:
+            datos = cls._abrir_cache(ruta_fuente, ruta_colcache, firma_fuente)
+            if datos is not None:
+                return datos
+
+        # La primera hoja solo se resuelve al parsear, para que abrir desde caché no toque el libro.
+        hoja_lectura = hoja
+        if hoja_lectura is None and os.path.splitext(ruta_fuente)[1].lower() in _EXTENSIONES_EXCEL:
+            hoja_lectura = _primera_hoja(ruta_fuente)
+
+        datos = cls._desde_registros(ruta_fuente, _leer_registros(ruta_fuente, hoja_lectura, etiqueta_registro))
+        if usar_cache:
+            try:
+                datos._escribir_cache(ruta_colcache, firma_fuente)
+            except OSError:
+                # Directorio de solo lectura u otro problema de E/S: se sigue trabajando en memoria.
+                pass
+        return datos
+
+    @classmethod
+    def _desde_registros(cls, ruta_fuente: str, registros: Iterator[Dict[Any, Any]]) -> "DataSource":
+        """
+        Construye la tabla en memoria a partir de un iterador de registros. Las columnas aparecen en
+        el orden en que se ven por primera vez; los registros sin una columna aportan un nulo.
+        """
+        nombres: List[str] = []
+        valores_por_columna: Dict[str, List[Any]] = {}
+        num_filas = 0
+        for registro in registros:
+            vistos = set()
+            for clave, valor in registro.items():
+                nombre = canonizar_columna(clave)
+                if nombre in vistos:
+                    continue  # Columna duplicada tras aplicar alias: prevalece la primera.
+                vistos.add(nombre)
+                valores = valores_por_columna.get(nombre)
+                if valores is None:
+                    nombres.append(nombre)
+                    valores = valores_por_columna[nombre] = [None] * num_filas
+                valores.append(valor)
+            num_filas += 1
+            for nombre in nombres:
+                if nombre not in vistos:
+                    valores_por_columna[nombre].append(None)
+
+        columnas = [_construir_columna(nombre, valores_por_columna[nombre]) for nombre in nombres]
+        return cls(ruta_fuente, columnas, num_filas)
+
+    # --- Caché binaria ---
+    #
+    # Formato del archivo (little/big endian nativo, indicado en el encabezado):
+    #   [0:8]    firma _FIRMA
+    #   [8:16]   longitud N del encabezado JSON (uint64 little endian)
+    #   [16:16+N] encabezado JSON (versión, firma de la fuente, orden de bytes, columnas y desplazamientos)
+    #   ...      bloques de datos de cada columna, alineados a 8 bytes
+
+    def _escribir_cache(self, ruta_colcache: str, firma_fuente: Dict[str, Any]) -> None:
+        bloques: List[Tuple[int, bytes]] = []
+        descriptores = []
+        desplazamiento = 0
+
+        def reservar(datos) -> List[int]:
+            nonlocal desplazamiento
+            crudo = datos.tobytes() if isinstance(datos, array) else bytes(datos)
+            desplazamiento = _alinear(desplazamiento)
+            bloques.append((desplazamiento, crudo))
+            posicion = [desplazamiento, len(crudo)]
+            desplazamiento += len(crudo)
+            return posicion
+
+        for columna in self._columnas:
+            descriptores.append({
+                "nombre": columna.nombre,
+                "tipo": columna.tipo,
+                "datos": reservar(columna._datos),
+                "offsets": reservar(columna._offsets) if columna._offsets is not None else None,
+                "validez": reservar(columna._validez) if columna._validez is not None else None,
+            })
+
+        encabezado = json.dumps({
+            "version": _VERSION_FORMATO,
+            "orden_bytes": sys.byteorder,
+            "fuente": firma_fuente,
+            "num_filas": self.num_filas,
+            "columnas": descriptores,
+        }, ensure_ascii=False).encode("utf-8")
+        inicio_datos = _alinear(16 + len(encabezado))
+
+        # Escritura atómica: archivo temporal en el mismo directorio + os.replace, para que otros
+        # workers nunca vean un archivo a medio escribir.
+        directorio = os.path.dirname(os.path.abspath(ruta_colcache))
+        descriptor, ruta_temporal = tempfile.mkstemp(dir=directorio, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as f:
+                f.write(_FIRMA)
+                f.write(len(encabezado).to_bytes(8, "little"))
+                f.write(encabezado)
+                for posicion, crudo in bloques:
+                    f.seek(inicio_datos + posicion)
+                    f.write(crudo)
+                f.truncate(inicio_datos + desplazamiento)
+            os.replace(ruta_temporal, ruta_colcache)
+        except BaseException:
+            if os.path.exists(ruta_temporal):
+                os.remove(ruta_temporal)
+            raise
+
+    @classmethod
+    def _abrir_cache(cls, ruta_fuente: str, ruta_colcache: str, firma_fuente: Dict[str, Any]) -> Optional["DataSource"]:
+        """
+        Abre la caché columnar si existe y corresponde a la versión actual de la fuente.
+        Devuelve `None` si no existe, está obsoleta o dañada.
+        """
+        try:
+            with open(ruta_colcache, "rb") as f:
+                if os.fstat(f.fileno()).st_size < 16:
+                    return None
+                mapeo = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError:
+            return None
+
+        try:
+            if mapeo[0:8] != _FIRMA:
+                raise ValueError("firma")
+            longitud = int.from_bytes(mapeo[8:16], "little")
+            encabezado = json.loads(mapeo[16:16 + longitud].decode("utf-8"))
+            if (encabezado.get("version") != _VERSION_FORMATO or encabezado.get("orden_bytes") != sys.byteorder
+                    or encabezado.get("fuente") != firma_fuente):
+                raise ValueError("obsoleta")
+            inicio_datos = _alinear(16 + longitud)
+        except (ValueError, UnicodeDecodeError):
+            mapeo.close()
+            return None
+
+        vista = memoryview(mapeo)
+        num_filas = encabezado["num_filas"]
+        columnas = []
+
+        def seccion(posicion, formato: str):
+            if posicion is None:
+                return None
+            inicio = inicio_datos + posicion[0]
+            return vista[inicio:inicio + posicion[1]].cast(formato)
+
+        for descriptor in encabezado["columnas"]:
+            tipo = descriptor["tipo"]
+            if tipo == TIPO_TEXTO:
+                datos = seccion(descriptor["datos"], "B")
+            else:
+                datos = seccion(descriptor["datos"], "q" if tipo == TIPO_ENTERO else "d")
+            columnas.append(_Columna(descriptor["nombre"], tipo, datos, num_filas,
+                                     offsets=seccion(descriptor["offsets"], "Q"),
+                                     validez=seccion(descriptor["validez"], "B")))
+        vista.release()
+        return cls(ruta_fuente, columnas, num_filas, desde_cache=True, mmap_cache=mapeo)
+
+    # --- Acceso a los datos ---
+
+    @property
+    def columnas(self) -> Tuple[str, ...]:
+        """Nombres canónicos de las columnas, en orden."""
+        return tuple(columna.nombre for columna in self._columnas)
+
+    @property
+    def tipos(self) -> Dict[str, str]:
+        """Tipo de cada columna: 'i' (entero), 'f' (real) o 's' (texto)."""
+        return {columna.nombre: columna.tipo for columna in self._columnas}
+
+    def columna(self, nombre: str) -> _Columna:
+        """
+        Devuelve la columna indicada (sin distinguir mayúsculas; se aceptan alias).
+
+        Raises:
+            KeyError: Si la columna no existe.
+        """
+        columna = self._por_nombre.get(normalizar_encabezado(canonizar_columna(nombre)))
+        if columna is None:
+            raise KeyError(f"La columna '{nombre}' no existe en '{self.ruta_fuente}'. Columnas: {list(self.columnas)}")
+        return columna
+
+    def fila(self, indice: int) -> Dict[str, Any]:
+        """
+        Devuelve la fila indicada (basada en 0) como diccionario 'columna -> valor'.
+        """
+        return {columna.nombre: columna[indice] for columna in self._columnas}
+
+    def __len__(self) -> int:
+        return self.num_filas
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for indice in range(self.num_filas):
+            yield self.fila(indice)
+
+    def cerrar(self) -> None:
+        """
+        Libera el archivo de caché mapeado en memoria. Las columnas dejan de ser accesibles.
+        """
+        if self._mmap is not None:
+            for columna in self._columnas:
+                columna._liberar()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> "DataSource":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+
+# --- Pre-parseo en paralelo de archivos fuente ---
+
+EXTENSIONES_SOPORTADAS = _EXTENSIONES_EXCEL + (".csv", ".json", ".ndjson", ".jsonl", ".xml")
+
+
+def preparar_cache(ruta_fuente: str) -> Tuple[str, int, Tuple[str, ...]]:
+    """
+    Parsea un archivo fuente y escribe su caché columnar (si no existe o está obsoleta).
+    Pensada para ejecutarse en un proceso hijo: solo devuelve un resumen ligero, ya que los datos
+    se comparten con el proceso padre a través del archivo `.colcache`.
+
+    Returns:
+        Tuple[str, int, Tuple[str, ...]]: Ruta del archivo, número de filas y nombres de columnas.
+    """
+    with DataSource.abrir(ruta_fuente) as datos:
+        return ruta_fuente, datos.num_filas, datos.columnas
+
+
+class PrecargaDataSources:
+    """
+    Pre-parsea en un pool de procesos todos los archivos de datos de un directorio y los expone como
+    `DataSource` de solo lectura, indexados por nombre de archivo.
+
+    El trabajo se lanza al construir la instancia y no bloquea: cada archivo se resuelve la primera vez
+    que se accede a él (`precarga["MOCK_DATA.xlsx"]`), esperando solo a su propio futuro. Cuando el
+    proceso hijo termina, el archivo `.colcache` ya está escrito y el proceso actual lo abre con `mmap`
+    sin parsear nada. Si el pool de procesos no está disponible, los archivos se parsean en este proceso
+    bajo demanda.
+    """
+
+    def __init__(self, directorio: str, max_procesos: Optional[int] = None):
+        self.directorio = directorio
+        self._abiertos: Dict[str, DataSource] = {}
+        self._futuros: Dict[str, Any] = {}
+        self._executor = None
+
+        nombres = sorted(n for n in os.listdir(directorio)
+                         if os.path.splitext(n)[1].lower() in EXTENSIONES_SOPORTADAS
+                         and os.path.isfile(os.path.join(directorio, n)))
+        self.nombres: Tuple[str, ...] = tuple(nombres)
+        if not nombres:
+            return
+
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+            import multiprocessing
+            # 'spawn' evita heredar hilos del proceso padre (p. ej. los de pytest-xdist o Playwright).
+            self._executor = ProcessPoolExecutor(max_workers=max_procesos or min(len(nombres), os.cpu_count() or 1),
+                                                 mp_context=multiprocessing.get_context("spawn"))
+            for nombre in nombres:
+                self._futuros[nombre] = self._executor.submit(preparar_cache, os.path.join(directorio, nombre))
+        except (OSError, ImportError, NotImplementedError):
+            # Entornos sin soporte de multiprocessing: se parsea bajo demanda en este proceso.
+            self._executor = None
+            self._futuros.clear()
+
+    def __contains__(self, nombre: str) -> bool:
+        return nombre in self.nombres
+
+    def __getitem__(self, nombre: str) -> DataSource:
+        """
+        Devuelve el `DataSource` del archivo indicado, esperando a que termine su pre-parseo si es necesario.
+
+        Raises:
+            KeyError: Si el archivo no está en el directorio pre-parseado.
+            Exception: La excepción original si el parseo del archivo falló en el proceso hijo.
+        """
+        datos = self._abiertos.get(nombre)
+        if datos is not None:
+            return datos
+        if nombre not in self.nombres:
+            raise KeyError(f"El archivo '{nombre}' no está entre los archivos pre-parseados de '{self.directorio}': {list(self.nombres)}")
+
+        futuro = self._futuros.get(nombre)
+        if futuro is not None:
+            from concurrent.futures.process import BrokenProcessPool
+            try:
+                futuro.result()  # Propaga el error de parseo del proceso hijo, si lo hubo.
+            except BrokenProcessPool:
+                # El proceso hijo murió (no por un error de datos): se parsea en este proceso.
+                pass
+        datos = self._abiertos[nombre] = DataSource.abrir(os.path.join(self.directorio, nombre))
+        return datos
+
+    def esperar_todos(self) -> Dict[str, DataSource]:
+        """
+        Espera a que terminen todos los pre-parseos y devuelve los `DataSource` abiertos por nombre.
+        """
+        return {nombre: self[nombre] for nombre in self.nombres}
+
+    def cerrar(self) -> None:
+        """
+        Cancela los pre-parseos pendientes, detiene el pool y cierra los `DataSource` abiertos.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        for datos in self._abiertos.values():
+            datos.cerrar()
+        self._abiertos.clear()
@@ -0,0 +1,244 @@
+import hashlib
+import json
+import os
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from .config import CAPTURAS_COLA_MAX, CAPTURAS_POLITICA, CAPTURAS_ULTIMAS_N # Parámetros de las capturas definidos en config.py
+from .config import CAPTURAS_DEDUPLICADAS, CAPTURAS_BLOBS_SUBDIR, CAPTURAS_MANIFIESTO # Almacenamiento por contenido
+
+# Políticas de captura admitidas.
+POLITICA_SIEMPRE = "always"        # Se guardan todas las capturas.
+POLITICA_EN_FALLO = "on_failure"   # Solo se toman y guardan las capturas de pasos fallidos.
+POLITICA_ULTIMAS_N = "last_N"      # Se guardan en memoria las N últimas y se vuelcan a disco solo si hay un fallo.
+POLITICAS = (POLITICA_SIEMPRE, POLITICA_EN_FALLO, POLITICA_ULTIMAS_N)
+
+# Modos de grabación de trazas y videos (mismos nombres que en pytest-playwright).
+MODO_GRABACION_OFF = "off"
+MODO_GRABACION_ON = "on"
+MODO_GRABACION_RETENER_EN_FALLO = "retain-on-failure"
+MODO_GRABACION_PRIMER_REINTENTO = "on-first-retry"
+MODOS_GRABACION = (MODO_GRABACION_OFF, MODO_GRABACION_ON, MODO_GRABACION_RETENER_EN_FALLO, MODO_GRABACION_PRIMER_REINTENTO)
+
+
+def grabacion_activa(modo: str, intento: int = 1) -> bool:
+    """
+    Indica si hay que grabar (traza o video) en este intento del test.
+
+    Args:
+        modo (str): Uno de `MODOS_GRABACION`.
+        intento (int): Número de ejecución del test (1 la primera vez, 2 el primer reintento...).
+
+    Raises:
+        ValueError: Si el modo no está soportado.
+    """
+    if modo not in MODOS_GRABACION:
+        raise ValueError(f"Modo de grabación no soportado: '{modo}'. Valores admitidos: {MODOS_GRABACION}.")
+    if modo == MODO_GRABACION_PRIMER_REINTENTO:
+        return intento == 2
+    return modo != MODO_GRABACION_OFF
+
+
+def conservar_grabacion(modo: str, fallido: bool) -> bool:
+    """
+    Indica si una grabación ya hecha debe guardarse en disco al terminar el test.
+    """
+    return modo != MODO_GRABACION_RETENER_EN_FALLO or fallido
+
+
+class EscritorCapturas:
+    """
+    Escritor de capturas de pantalla en segundo plano.
+
+    El hilo del test obtiene los bytes de la captura (`page.screenshot()` sin `path`) y los encola; un
+    hilo escritor dedicado los guarda en disco. La cola está acotada (`max_pendientes`): si el disco
+    no da abasto, `encolar` bloquea al test hasta que haya hueco (contrapresión) en lugar de acumular
+    imágenes en memoria sin límite.
+
+    Con `deduplicar=True` las capturas se guardan por contenido: el hilo escritor calcula el SHA-256 de
+    la imagen y la escribe una sola vez en `<directorio>/blobs/<aa>/<sha256>.png`; cada captura añade una
+    línea a `<directorio>/manifest.jsonl` que relaciona su nombre (el de `ruta`) con el blob. Los fotogramas
+    idénticos (el mismo modal cerrado, el mismo formulario vacío...) ocupan así un único archivo. Cada entrada
+    indica también si la captura es evidencia de un fallo (`fallo`), para que el presupuesto de evidencias
+    conserve antes los blobs que documentan fallos.
+
+    `vaciar()` espera a que todas las capturas encoladas estén escritas; debe llamarse en el teardown
+    de los fixtures para no perder evidencias.
+    """
+
+    def __init__(self, max_pendientes: int = CAPTURAS_COLA_MAX, deduplicar: bool = CAPTURAS_DEDUPLICADAS):
+        self._cola: "queue.Queue[Tuple[str, bytes, bool]]" = queue.Queue(maxsize=max_pendientes)
+        self._hilo: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._errores: List[str] = []
+        self.deduplicar = deduplicar
+        self.escritas = 0
+        self.deduplicadas = 0
+
+    def _asegurar_hilo(self) -> None:
+        with self._lock:
+            if self._hilo is None or not self._hilo.is_alive():
+                self._hilo = threading.Thread(target=self._bucle_escritura, name="escritor-capturas", daemon=True)
+                self._hilo.start()
+
+    def _bucle_escritura(self) -> None:
+        while True:
+            ruta, datos, fallo = self._cola.get()
+            try:
+                if self.deduplicar:
+                    self._guardar_por_contenido(ruta, datos, fallo)
+                else:
+                    directorio = os.path.dirname(ruta)
+                    if directorio:
+                        os.makedirs(directorio, exist_ok=True)
+                    with open(ruta, "wb") as f:
+                        f.write(datos)
+                    self.escritas += 1
+            except OSError as e:
+                with self._lock:
+                    self._errores.append(f"{ruta}: {e}")
+            finally:
+                self._cola.task_done()
+
+    def _guardar_por_contenido(self, ruta: str, datos: bytes, fallo: bool) -> None:
+        directorio, nombre_archivo = os.path.split(ruta)
+        extension = os.path.splitext(nombre_archivo)[1] or ".png"
+        resumen = hashlib.sha256(datos).hexdigest()
+        relativa = os.path.join(CAPTURAS_BLOBS_SUBDIR, resumen[:2], resumen + extension)
+        ruta_blob = os.path.join(directorio, relativa)
+
+        try:
+            # El blob ya existe: se renueva su fecha para que el presupuesto de evidencias lo trate como
+            # reciente (también es evidencia de esta captura) y no lo desaloje por antigüedad.
+            os.utime(ruta_blob)
+            nuevo = False
+        except FileNotFoundError:
+            # No existe, o el presupuesto de evidencias lo eliminó: se escribe (de nuevo).
+            nuevo = True
+        if nuevo:
+            os.makedirs(os.path.dirname(ruta_blob), exist_ok=True)
+            # Escritura atómica: otro worker de pytest-xdist puede estar guardando el mismo blob.
+            temporal = f"{ruta_blob}.{os.getpid()}.tmp"
+            with open(temporal, "wb") as f:
+                f.write(datos)
+            os.replace(temporal, ruta_blob)
+            self.escritas += 1
+        else:
+            self.deduplicadas += 1
+
+        entrada = {"fecha": datetime.now().isoformat(timespec="milliseconds"),
+                   "paso": os.path.splitext(nombre_archivo)[0], "blob": relativa.replace(os.sep, "/"),
+                   "sha256": resumen, "bytes": len(datos), "nuevo": nuevo, "fallo": fallo}
+        with open(os.path.join(directorio, CAPTURAS_MANIFIESTO), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entrada, ensure_ascii=False) + "\n")
+
+    def encolar(self, ruta: str, datos: bytes, fallo: bool = False) -> None:
+        """
+        Encola una captura para escribirla en `ruta` (`fallo=True` si es evidencia de un fallo).
+        Bloquea solo si la cola está llena.
+        """
+        self._asegurar_hilo()
+        self._cola.put((ruta, datos, fallo))
+
+    def vaciar(self) -> List[str]:
+        """
+        Espera a que se escriban todas las capturas pendientes.
+
+        Returns:
+            List[str]: Los errores de escritura ocurridos desde el último vaciado (vacía si no hubo).
+        """
+        self._cola.join()
+        with self._lock:
+            errores, self._errores = self._errores, []
+        return errores
+
+    @property
+    def pendientes(self) -> int:
+        return self._cola.qsize()
+
+
+def leer_manifiesto(directorio: str) -> List[Dict[str, Any]]:
+    """
+    Lee el manifiesto de capturas de `directorio` (una entrada por captura, en orden de escritura).
+    La ruta del blob de cada entrada es `os.path.join(directorio, entrada['blob'])`.
+    """
+    ruta = os.path.join(directorio, CAPTURAS_MANIFIESTO)
+    if not os.path.exists(ruta):
+        return []
+    with open(ruta, "r", encoding="utf-8") as f:
+        return [json.loads(linea) for linea in f if linea.strip()]
+
+
+class PoliticaCapturas:
+    """
+    Aplica la política de evidencias (`config.CAPTURAS_POLITICA`) a las capturas de `tomar_captura`:
+
+    - `always`: cada captura se encola inmediatamente en el escritor.
+    - `on_failure`: solo se toman las capturas de pasos fallidos (y la del test fallido, desde conftest).
+    - `last_N`: las `N` capturas más recientes del test se guardan en un buffer circular en memoria y
+      solo se escriben a disco cuando falla un paso o el test; si el test pasa, se descartan.
+
+    Quien llama indica explícitamente si la captura es de un paso fallido (`tomar_captura(..., fallo=True)`).
+    """
+
+    def __init__(self, politica: str = CAPTURAS_POLITICA, ultimas_n: int = CAPTURAS_ULTIMAS_N,
+                 escritor: Optional[EscritorCapturas] = None):
+        if politica not in POLITICAS:
+            raise ValueError(f"Política de capturas no soportada: '{politica}'. Valores admitidos: {POLITICAS}.")
+        self.politica = politica
+        self.escritor = escritor or escritor_capturas
+        self._buffer: Deque[Tuple[str, bytes]] = deque(maxlen=max(1, ultimas_n))
+
+    def debe_capturar(self, fallo: bool = False) -> bool:
+        """
+        Indica si merece la pena tomar la captura (con `on_failure` se evita incluso obtener la imagen).
+        """
+        return self.politica != POLITICA_EN_FALLO or fallo
+
+    def registrar(self, ruta: str, datos: bytes, fallo: bool = False) -> bool:
+        """
+        Registra una captura según la política.
+
+        Args:
+            ruta (str): Ruta de destino de la captura.
+            datos (bytes): Imagen obtenida de Playwright.
+            fallo (bool): `True` si la captura documenta un paso fallido.
+
+        Returns:
+            bool: `True` si la captura se encoló para escribirse a disco, `False` si quedó en memoria o se descartó.
+        """
+        if self.politica == POLITICA_SIEMPRE or (self.politica == POLITICA_EN_FALLO and fallo):
+            self.escritor.encolar(ruta, datos, fallo)
+            return True
+        if self.politica == POLITICA_ULTIMAS_N:
+            self._buffer.append((ruta, datos))
+            if fallo:
+                self.volcar()
+                return True
+        return False
+
+    def volcar(self) -> int:
+        """
+        Encola para escritura todas las capturas del buffer circular (contexto previo a un fallo).
+        Se registran como evidencia del fallo: solo se vuelcan cuando falla un paso o el test.
+
+        Returns:
+            int: Número de capturas volcadas.
+        """
+        volcadas = len(self._buffer)
+        while self._buffer:
+            self.escritor.encolar(*self._buffer.popleft(), fallo=True)
+        return volcadas
+
+    def descartar(self) -> None:
+        """
+        Descarta las capturas en memoria (al terminar un test sin fallos).
+        """
+        self._buffer.clear()
+
+
+# Instancias compartidas por proceso (cada worker de pytest-xdist tiene las suyas).
+escritor_capturas = EscritorCapturas()
+politica_capturas = PoliticaCapturas(escritor=escritor_capturas)
@@ -0,0 +1,302 @@
+import gzip
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+from .config import EVIDENCE_BASE_DIR, VIDEO_DIR, TRACEVIEW_DIR, SCREENSHOT_DIR, LOGGER_DIR # Directorios de evidencias
+from .config import EVIDENCIAS_PRESUPUESTO_MB, EVIDENCIAS_EDAD_MAX_DIAS, EVIDENCIAS_LOGS_FRIOS_MINUTOS, EVIDENCIAS_INDICE # Límites del presupuesto
+from .config import CAPTURAS_MANIFIESTO # Manifiesto de capturas (nunca se elimina; se poda al desalojar blobs)
+
+# Prioridad de desalojo: primero las evidencias de tests que pasaron, luego las de origen desconocido
+# (capturas deduplicadas, logs, evidencias anteriores al índice) y por último las de tests fallidos.
+CLASE_PASADO = 0
+CLASE_DESCONOCIDO = 1
+CLASE_FALLIDO = 2
+
+
+class Artefacto(NamedTuple):
+    ruta: str
+    bytes: int
+    mtime: float
+    clase: int
+
+
+def _recorrer(directorio: str) -> Iterator[os.DirEntry]:
+    # os.scandir reutiliza la información de stat del listado: evita un stat por archivo en directorios grandes.
+    try:
+        with os.scandir(directorio) as entradas:
+            for entrada in entradas:
+                if entrada.is_dir(follow_symlinks=False):
+                    yield from _recorrer(entrada.path)
+                elif entrada.is_file(follow_symlinks=False):
+                    yield entrada
+    except FileNotFoundError:
+        return
+
+
+class GestorEvidencias:
+    """
+    Mantiene acotado el tamaño de los directorios de evidencias (video, traceview, imagen y log).
+
+    - Elimina todo artefacto más antiguo que `edad_max_dias`.
+    - Si el total sigue por encima de `presupuesto_bytes`, desaloja por orden de prioridad (evidencias
+      de tests que pasaron, luego de origen desconocido, luego de tests fallidos) y, dentro de cada
+      prioridad, del más antiguo al más reciente.
+    - Comprime con gzip los logs que no se modifican desde hace `logs_frios_minutos`.
+
+    El estado pasado/fallido de cada artefacto se conoce por el índice `evidence_index.jsonl`, que
+    alimenta `registrar()` desde el teardown de los fixtures. El de los blobs de capturas deduplicadas se
+    toma de los manifiestos de capturas: un blob es de un fallo si lo referencia alguna entrada con
+    `fallo=True`. Al compactar, las entradas de los manifiestos cuyo blob ya no existe se eliminan.
+    El desalojo solo debe aplicarse cuando no hay tests escribiendo evidencias (al terminar la sesión);
+    al inicio, `iniciar_en_segundo_plano` solo comprime los logs fríos, ya que no usa Playwright.
+    """
+
+    def __init__(self, directorios: Optional[Sequence[str]] = None,
+                 presupuesto_bytes: int = EVIDENCIAS_PRESUPUESTO_MB * 1024 * 1024,
+                 edad_max_dias: float = EVIDENCIAS_EDAD_MAX_DIAS,
+                 logs_frios_minutos: float = EVIDENCIAS_LOGS_FRIOS_MINUTOS,
+                 ruta_indice: str = os.path.join(EVIDENCE_BASE_DIR, EVIDENCIAS_INDICE),
+                 directorio_logs: str = LOGGER_DIR):
+        self.directorios = list(directorios or (VIDEO_DIR, TRACEVIEW_DIR, SCREENSHOT_DIR, directorio_logs))
+        self.directorio_logs = directorio_logs
+        self.presupuesto_bytes = presupuesto_bytes
+        self.edad_max_dias = edad_max_dias
+        self.logs_frios_minutos = logs_frios_minutos
+        self.ruta_indice = ruta_indice
+        self._hilo: Optional[threading.Thread] = None
+        self.ultimo_resultado: Dict[str, int] = {}
+
+    # --- Índice de estado por artefacto ---
+
+    def registrar(self, ruta: str, fallido: bool, test_id: str = "") -> None:
+        """
+        Anota en el índice si `ruta` es evidencia de un test fallido o de uno que pasó.
+        """
+        os.makedirs(os.path.dirname(self.ruta_indice), exist_ok=True)
+        entrada = {"ruta": os.path.abspath(ruta), "fallido": fallido, "test": test_id}
+        with open(self.ruta_indice, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entrada, ensure_ascii=False) + "\n")
+
+    def _leer_indice(self) -> Dict[str, bool]:
+        estados: Dict[str, bool] = {}
+        try:
+            with open(self.ruta_indice, "r", encoding="utf-8") as f:
+                for linea in f:
+                    # Una línea corrupta o incompleta (p. ej. escrita a medias) no debe detener el mantenimiento.
+                    try:
+                        entrada = json.loads(linea)
+                        estados[entrada["ruta"]] = bool(entrada["fallido"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+        return estados
+
+    def _reescribir_indice(self, existentes: Dict[str, bool]) -> None:
+        # Compacta el índice quitando las entradas de artefactos que ya no existen.
+        temporal = f"{self.ruta_indice}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as f:
+            for ruta, fallido in existentes.items():
+                f.write(json.dumps({"ruta": ruta, "fallido": fallido}, ensure_ascii=False) + "\n")
+        os.replace(temporal, self.ruta_indice)
+
+    # --- Manifiestos de capturas ---
+
+    @staticmethod
+    def _entradas_manifiesto(ruta_manifiesto: str) -> Iterator[Tuple[str, Optional[str], Optional[bool]]]:
+        # Devuelve (línea, ruta absoluta del blob, fallo) por entrada; blob None si la línea no se puede interpretar.
+        directorio = os.path.dirname(ruta_manifiesto)
+        with open(ruta_manifiesto, "r", encoding="utf-8") as f:
+            for linea in f:
+                if not linea.strip():
+                    continue
+                try:
+                    entrada = json.loads(linea)
+                    blob = os.path.abspath(os.path.join(directorio, entrada["blob"]))
+                    fallo = entrada.get("fallo")
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    yield linea, None, None
+                    continue
+                yield linea, blob, fallo
+
+    def _clases_de_blobs(self, manifiestos: Sequence[str]) -> Dict[str, int]:
+        """
+        Prioridad de desalojo de cada blob según las entradas que lo referencian: la más protectora de ellas
+        (fallido si alguna es de un fallo; desconocido si alguna es anterior al campo `fallo`).
+        """
+        clases: Dict[str, int] = {}
+        for ruta_manifiesto in manifiestos:
+            try:
+                for _, blob, fallo in self._entradas_manifiesto(ruta_manifiesto):
+                    if blob is None:
+                        continue
+                    clase = CLASE_DESCONOCIDO if fallo is None else (CLASE_FALLIDO if fallo else CLASE_PASADO)
+                    clases[blob] = max(clase, clases.get(blob, CLASE_PASADO))
+            except OSError:
+                continue
+        return clases
+
+    def _podar_manifiestos(self, manifiestos: Sequence[str], existentes: Set[str]) -> int:
+        """
+        Reescribe cada manifiesto sin las entradas cuyo blob ya no está en `existentes`.
+
+        Returns:
+            int: Número de entradas eliminadas.
+        """
+        podadas = 0
+        for ruta_manifiesto in manifiestos:
+            try:
+                entradas = list(self._entradas_manifiesto(ruta_manifiesto))
+            except OSError:
+                continue
+            # Las líneas que no se pueden interpretar se conservan: no hay blob que comprobar.
+            conservadas = [linea for linea, blob, _ in entradas if blob is None or blob in existentes]
+            if len(conservadas) == len(entradas):
+                continue
+            temporal = f"{ruta_manifiesto}.{os.getpid()}.tmp"
+            with open(temporal, "w", encoding="utf-8") as f:
+                f.writelines(linea if linea.endswith("\n") else linea + "\n" for linea in conservadas)
+            os.replace(temporal, ruta_manifiesto)
+            podadas += len(entradas) - len(conservadas)
+        return podadas
+
+    # --- Inventario ---
+
+    def _inventario_y_manifiestos(self) -> Tuple[List[Artefacto], List[str]]:
+        estados = self._leer_indice()
+        archivos = []
+        manifiestos = []
+        for directorio in self.directorios:
+            for entrada in _recorrer(directorio):
+                if entrada.name == CAPTURAS_MANIFIESTO:
+                    manifiestos.append(os.path.abspath(entrada.path))
+                elif not entrada.name.endswith(".tmp"):
+                    archivos.append(entrada)
+        clases_blobs = self._clases_de_blobs(manifiestos)
+        artefactos = []
+        for entrada in archivos:
+            info = entrada.stat(follow_symlinks=False)
+            ruta = os.path.abspath(entrada.path)
+            fallido = estados.get(ruta)
+            if fallido is not None:
+                clase = CLASE_FALLIDO if fallido else CLASE_PASADO
+            else:
+                clase = clases_blobs.get(ruta, CLASE_DESCONOCIDO)
+            artefactos.append(Artefacto(ruta, info.st_size, info.st_mtime, clase))
+        return artefactos, manifiestos
+
+    def inventario(self) -> List[Artefacto]:
+        """
+        Devuelve los artefactos de los directorios de evidencias con su tamaño, fecha y prioridad de desalojo.
+        El manifiesto de capturas y los temporales en escritura no se incluyen.
+        """
+        return self._inventario_y_manifiestos()[0]
+
+    # --- Mantenimiento ---
+
+    def comprimir_logs_frios(self) -> int:
+        """
+        Comprime con gzip los `.log` que no se modifican desde hace `logs_frios_minutos` (conserva su fecha).
+
+        Returns:
+            int: Número de logs comprimidos.
+        """
+        limite = time.time() - self.logs_frios_minutos * 60
+        comprimidos = 0
+        for entrada in _recorrer(self.directorio_logs):
+            if not entrada.name.endswith(".log"):
+                continue
+            info = entrada.stat()
+            if info.st_mtime > limite:
+                continue
+            destino = entrada.path + ".gz"
+            try:
+                with open(entrada.path, "rb") as origen, gzip.open(destino + ".tmp", "wb") as comprimido:
+                    shutil.copyfileobj(origen, comprimido)
+                os.replace(destino + ".tmp", destino)
+                os.utime(destino, (info.st_atime, info.st_mtime))
+                os.remove(entrada.path)
+                comprimidos += 1
+            except OSError:
+                continue
+        return comprimidos
+
+    def aplicar_presupuesto(self, compactar_indice: bool = True) -> Dict[str, int]:
+        """
+        Elimina los artefactos caducados y desaloja hasta dejar el total dentro del presupuesto.
+
+        Args:
+            compactar_indice (bool): Reescribe el índice y los manifiestos de capturas sin las entradas de
+                                     artefactos eliminados (también en ejecuciones anteriores). Debe ser
+                                     `False` mientras los workers puedan estar añadiendo entradas.
+
+        Returns:
+            Dict[str, int]: 'eliminados', 'bytes_liberados', 'bytes_totales' (tras el desalojo) y
+                            'entradas_podadas' (entradas de manifiestos eliminadas).
+        """
+        artefactos, manifiestos = self._inventario_y_manifiestos()
+        total = sum(a.bytes for a in artefactos)
+        caducidad = time.time() - self.edad_max_dias * 86400
+        eliminados = liberados = 0
+        conservados = []
+        # Orden de desalojo: prioridad y, dentro de ella, antigüedad.
+        for artefacto in sorted(artefactos, key=lambda a: (a.clase, a.mtime)):
+            if artefacto.mtime < caducidad or total > self.presupuesto_bytes:
+                try:
+                    os.remove(artefacto.ruta)
+                except OSError:
+                    conservados.append(artefacto)
+                    continue
+                total -= artefacto.bytes
+                liberados += artefacto.bytes
+                eliminados += 1
+            else:
+                conservados.append(artefacto)
+
+        podadas = 0
+        if compactar_indice:
+            if eliminados:
+                estados = self._leer_indice()
+                self._reescribir_indice({a.ruta: estados[a.ruta] for a in conservados if a.ruta in estados})
+            # Sin condición a 'eliminados': también se podan las entradas de blobs eliminados en ejecuciones anteriores.
+            podadas = self._podar_manifiestos(manifiestos, {a.ruta for a in conservados})
+        self.ultimo_resultado = {"eliminados": eliminados, "bytes_liberados": liberados, "bytes_totales": total,
+                                 "entradas_podadas": podadas}
+        return self.ultimo_resultado
+
+    def mantenimiento(self, compactar_indice: bool = True) -> Dict[str, int]:
+        """
+        Comprime los logs fríos y aplica el presupuesto.
+        """
+        comprimidos = self.comprimir_logs_frios()
+        resultado = self.aplicar_presupuesto(compactar_indice)
+        resultado["logs_comprimidos"] = comprimidos
+        return resultado
+
+    def iniciar_en_segundo_plano(self) -> None:
+        """
+        Comprime los logs fríos en un hilo en segundo plano, sin bloquear el arranque de la sesión.
+        No aplica el presupuesto: los tests pueden estar deduplicando capturas contra blobs existentes
+        y registrando evidencias a la vez; el desalojo se hace con `aplicar_presupuesto()` al terminar.
+        """
+        if self._hilo is not None and self._hilo.is_alive():
+            return
+        self._hilo = threading.Thread(target=self._mantenimiento_seguro, name="gestor-evidencias", daemon=True)
+        self._hilo.start()
+
+    def _mantenimiento_seguro(self) -> None:
+        try:
+            self.comprimir_logs_frios()
+        except Exception:
+            pass  # El mantenimiento de evidencias nunca debe interrumpir la ejecución de los tests.
+
+    def esperar(self, timeout: Optional[float] = None) -> None:
+        if self._hilo is not None:
+            self._hilo.join(timeout)
+
+
+# Instancia compartida por proceso.
+gestor_evidencias = GestorEvidencias()
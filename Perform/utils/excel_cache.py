@@ -0,0 +1,221 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import openpyxl # Librería para hacer uso del excel (para archivos .xlsx)
+from .config import EXCEL_CACHE_MAX_LIBROS, EXCEL_CACHE_MAX_BYTES # Límites de la caché definidos en config.py
+
+# Estimación del coste en memoria de una celda cargada por openpyxl (objeto Cell + entrada en el
+# diccionario interno de la hoja + valor). Se usa solo para aplicar el límite de memoria de la caché.
+_BYTES_ESTIMADOS_POR_CELDA = 300
+
+
+def normalizar_encabezado(valor: Any) -> str:
+    """
+    Normaliza el texto de un encabezado para compararlo sin distinguir mayúsculas ni espacios extremos.
+    """
+    return str(valor).strip().lower()
+
+
+def construir_mapa_encabezados(fila_encabezado) -> Dict[str, int]:
+    """
+    Construye el mapa 'encabezado normalizado -> índice de columna (basado en 1)' a partir de los
+    valores de la fila de encabezado. Si un encabezado se repite, prevalece la primera columna.
+    """
+    mapa: Dict[str, int] = {}
+    for col_idx, valor in enumerate(fila_encabezado, 1):
+        if valor is not None:
+            mapa.setdefault(normalizar_encabezado(valor), col_idx)
+    return mapa
+
+
+class WorkbookCache:
+    """
+    Caché LRU de libros de trabajo Excel ya parseados por openpyxl.
+
+    Cada entrada se indexa por (ruta absoluta, mtime, tamaño) del archivo, de modo que si el archivo
+    cambia en disco la entrada antigua deja de ser válida y se vuelve a cargar. La caché aplica dos
+    límites: un número máximo de libros y una memoria máxima estimada; al superarse cualquiera de ellos
+    se desalojan los libros usados hace más tiempo.
+
+    Los libros devueltos se comparten entre llamadas, por lo que deben tratarse como de solo lectura.
+    """
+
+    def __init__(self, max_libros: int = EXCEL_CACHE_MAX_LIBROS, max_bytes: int = EXCEL_CACHE_MAX_BYTES):
+        self.max_libros = max_libros
+        self.max_bytes = max_bytes
+        self._entradas: "OrderedDict[Tuple[str, int, int], Tuple[openpyxl.Workbook, int]]" = OrderedDict()
+        self._mapas_encabezados: Dict[Tuple[Tuple[str, int, int], str], Dict[str, int]] = {}
+        self._bytes_totales = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _clave(archivo_excel_path: str) -> Tuple[str, int, int]:
+        # os.stat lanza FileNotFoundError si el archivo no existe, igual que openpyxl.load_workbook.
+        stat = os.stat(archivo_excel_path)
+        return (os.path.abspath(archivo_excel_path), stat.st_mtime_ns, stat.st_size)
+
+    @staticmethod
+    def _estimar_bytes(workbook: openpyxl.Workbook) -> int:
+        celdas = sum(ws.max_row * ws.max_column for ws in workbook.worksheets)
+        return celdas * _BYTES_ESTIMADOS_POR_CELDA
+
+    def obtener(self, archivo_excel_path: str) -> Tuple[openpyxl.Workbook, bool]:
+        """
+        Devuelve el libro de trabajo del archivo indicado, cargándolo solo si no está en caché.
+
+        Args:
+            archivo_excel_path (str): La ruta al archivo Excel (`.xlsx` o `.xlsm`).
+
+        Returns:
+            Tuple[openpyxl.Workbook, bool]: El libro de trabajo y `True` si se obtuvo desde la caché
+                                            (`False` si fue necesario parsear el archivo).
+        """
+        clave = self._clave(archivo_excel_path)
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None:
+                self._entradas.move_to_end(clave)
+                return entrada[0], True
+
+        # La carga se hace fuera del lock para no bloquear otras lecturas mientras se parsea el archivo.
+        workbook = openpyxl.load_workbook(archivo_excel_path)
+        tamano_estimado = self._estimar_bytes(workbook)
+
+        with self._lock:
+            # Descarta versiones anteriores del mismo archivo (mtime o tamaño distintos).
+            for clave_antigua in [c for c in self._entradas if c[0] == clave[0] and c != clave]:
+                self._desalojar(clave_antigua)
+
+            if clave not in self._entradas:
+                self._entradas[clave] = (workbook, tamano_estimado)
+                self._bytes_totales += tamano_estimado
+            self._entradas.move_to_end(clave)
+
+            # Desalojo LRU: siempre se conserva al menos la entrada recién usada.
+            while len(self._entradas) > 1 and (len(self._entradas) > self.max_libros or self._bytes_totales > self.max_bytes):
+                self._desalojar(next(iter(self._entradas)))
+
+            return self._entradas[clave][0], False
+
+    def _desalojar(self, clave: Tuple[str, int, int]) -> None:
+        # Debe llamarse con el lock adquirido.
+        _, tamano = self._entradas.pop(clave)
+        self._bytes_totales -= tamano
+        for clave_mapa in [c for c in self._mapas_encabezados if c[0] == clave]:
+            del self._mapas_encabezados[clave_mapa]
+
+    def mapa_encabezados(self, archivo_excel_path: str, hoja: str) -> Dict[str, int]:
+        """
+        Devuelve el mapa 'encabezado normalizado -> índice de columna (basado en 1)' de la primera fila
+        de la hoja indicada. El mapa se construye una sola vez por versión del archivo y hoja.
+
+        Args:
+            archivo_excel_path (str): La ruta al archivo Excel.
+            hoja (str): El nombre de la hoja.
+
+        Returns:
+            Dict[str, int]: El mapa de encabezados. Lanza `KeyError` si la hoja no existe.
+        """
+        workbook, _ = self.obtener(archivo_excel_path)
+        clave_mapa = (self._clave(archivo_excel_path), hoja)
+        with self._lock:
+            mapa = self._mapas_encabezados.get(clave_mapa)
+        if mapa is None:
+            sheet = workbook[hoja]
+            mapa = construir_mapa_encabezados(cell.value for cell in sheet[1])
+            with self._lock:
+                if clave_mapa[0] in self._entradas:
+                    self._mapas_encabezados[clave_mapa] = mapa
+        return mapa
+
+    def limpiar(self) -> None:
+        """
+        Vacía la caché por completo.
+        """
+        with self._lock:
+            self._entradas.clear()
+            self._mapas_encabezados.clear()
+            self._bytes_totales = 0
+
+
+def iterar_filas_hoja(archivo_excel_path: str, hoja: str, has_header: bool = True, como: str = "dict",
+                      columnas: Optional[List[Union[str, int]]] = None) -> Iterator[Union[Dict[Any, Any], Tuple[Any, ...]]]:
+    """
+    Recorre las filas de datos de una hoja Excel en modo streaming (`read_only=True`, `values_only=True`),
+    con memoria constante independientemente del tamaño de la hoja. No pasa por `cache_workbooks`:
+    está pensado para recorridos completos de una sola pasada.
+
+    El mapa de encabezados se resuelve una única vez al inicio. Las filas completamente vacías se omiten.
+
+    Args:
+        archivo_excel_path (str): La ruta al archivo Excel.
+        hoja (str): El nombre de la hoja.
+        has_header (bool): Si es `True`, la primera fila se interpreta como encabezado.
+        como (str): `"dict"` para obtener diccionarios o `"tupla"` para obtener tuplas de valores.
+        columnas (Optional[List[Union[str, int]]]): Columnas a devolver, por nombre de encabezado
+                                                    (sin distinguir mayúsculas) o por índice basado en 1.
+                                                    Si es `None`, se devuelven todas.
+
+    Yields:
+        Union[Dict, Tuple]: Cada fila de datos. En modo `"dict"` las claves son los nombres de encabezado
+                            (o los índices basados en 1 si no hay encabezado).
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+        KeyError: Si la hoja o alguna de las columnas solicitadas no existe.
+        ValueError: Si `como` no es `"dict"` ni `"tupla"`.
+    """
+    if como not in ("dict", "tupla"):
+        raise ValueError(f"El parámetro 'como' debe ser 'dict' o 'tupla'. Se recibió: '{como}'.")
+
+    workbook = openpyxl.load_workbook(archivo_excel_path, read_only=True)
+    try:
+        filas = workbook[hoja].iter_rows(values_only=True)
+
+        encabezados: Optional[Tuple[Any, ...]] = None
+        if has_header:
+            primera_fila = next(filas, None)
+            if primera_fila is None:
+                return
+            encabezados = tuple(str(v).strip() if v is not None else None for v in primera_fila)
+
+        # Resolución única de las columnas solicitadas a índices 0-basados.
+        if columnas is None:
+            total = len(encabezados) if encabezados is not None else None
+            indices = list(range(total)) if total is not None else None
+        else:
+            mapa = construir_mapa_encabezados(encabezados) if encabezados is not None else {}
+            indices = []
+            for columna in columnas:
+                if isinstance(columna, int):
+                    indices.append(columna - 1)
+                elif normalizar_encabezado(columna) in mapa:
+                    indices.append(mapa[normalizar_encabezado(columna)] - 1)
+                else:
+                    raise KeyError(f"La columna '{columna}' no existe en el encabezado de la hoja '{hoja}'.")
+
+        claves: Optional[Tuple[Any, ...]] = None
+        if como == "dict" and indices is not None:
+            claves = tuple((encabezados[i] if encabezados is not None and i < len(encabezados) else None) or i + 1 for i in indices)
+
+        for fila in filas:
+            if all(v is None for v in fila):
+                continue
+            if indices is None:
+                valores = tuple(fila)
+                if como == "dict":
+                    yield dict(zip(range(1, len(valores) + 1), valores))
+                else:
+                    yield valores
+                continue
+            ancho = len(fila)
+            valores = tuple(fila[i] if i < ancho else None for i in indices)
+            yield dict(zip(claves, valores)) if claves is not None else valores
+    finally:
+        # En modo read_only openpyxl mantiene el archivo abierto hasta cerrarlo explícitamente.
+        workbook.close()
+
+
+# Instancia compartida por proceso (cada worker de pytest-xdist tiene la suya).
+cache_workbooks = WorkbookCache()
@@ -0,0 +1,241 @@
+import json # Importa la librería json para manejar archivos JSON
+import re
+from typing import Any, Iterator, Optional, Tuple
+
+# Tamaño de cada bloque leído del archivo. Acota la memoria usada por la lectura en streaming.
+_TAMANO_BLOQUE_POR_DEFECTO = 64 * 1024
+
+# Patrones usados por el conteo rápido de elementos de un array (ver _contar_elementos_array).
+_GRUPO_INTERNO = re.compile(rb'[\[{],*[\]}]')
+_BYTES_NO_ESTRUCTURALES = bytes(b for b in range(256) if b not in b'[]{},')
+
+# Caracteres que pueden seguir a un elemento completo dentro de un array.
+_DELIMITADORES = " \t\r\n,]"
+
+FORMATO_ARRAY = "array"
+FORMATO_NDJSON = "ndjson"
+
+
+def detectar_formato_json(json_file_path: str) -> str:
+    """
+    Detecta si el archivo contiene un array JSON en el nivel superior o registros NDJSON (uno por línea).
+
+    Args:
+        json_file_path (str): La ruta al archivo JSON.
+
+    Returns:
+        str: `"array"` si el primer carácter significativo es `[`; `"ndjson"` en cualquier otro caso.
+    """
+    with open(json_file_path, 'rb') as archivo:
+        while True:
+            bloque = archivo.read(_TAMANO_BLOQUE_POR_DEFECTO)
+            if not bloque:
+                return FORMATO_NDJSON
+            contenido = bloque.lstrip(b'\xef\xbb\xbf \t\r\n')
+            if contenido:
+                return FORMATO_ARRAY if contenido[:1] == b'[' else FORMATO_NDJSON
+
+
+def _iterar_array(json_file_path: str, tamano_bloque: int) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    with open(json_file_path, 'r', encoding='utf-8-sig') as archivo:
+        buffer = ""
+        pos = 0
+        fin_de_archivo = False
+        dentro_del_array = False
+        espera_separador = False
+
+        while True:
+            # Salta espacios en blanco; si se agota el buffer, lee el siguiente bloque.
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos >= len(buffer):
+                if fin_de_archivo:
+                    raise json.JSONDecodeError("Fin de archivo inesperado: el array JSON no está cerrado", buffer, pos)
+                buffer, pos = archivo.read(tamano_bloque), 0
+                fin_de_archivo = not buffer
+                continue
+
+            caracter = buffer[pos]
+            if not dentro_del_array:
+                if caracter != "[":
+                    raise json.JSONDecodeError("Se esperaba '[' al inicio del array JSON", buffer, pos)
+                dentro_del_array = True
+                pos += 1
+                continue
+            if caracter == "]":
+                return
+            if espera_separador:
+                if caracter != ",":
+                    raise json.JSONDecodeError("Se esperaba ',' o ']' entre elementos del array JSON", buffer, pos)
+                espera_separador = False
+                pos += 1
+                continue
+
+            error_decodificacion: Optional[json.JSONDecodeError] = None
+            try:
+                elemento, fin = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as e:
+                error_decodificacion, fin = e, -1
+            # Un elemento incompleto, o que no va seguido de un delimitador dentro del buffer (p. ej. un
+            # número cortado en '-2.5' de '-2.5e3'), obliga a leer más contenido antes de aceptarlo,
+            # salvo que ya no quede archivo por leer.
+            truncado = fin == -1 or fin == len(buffer) or buffer[fin] not in _DELIMITADORES
+            if truncado and not fin_de_archivo:
+                bloque = archivo.read(max(tamano_bloque, len(buffer) - pos))
+                if bloque:
+                    buffer, pos = buffer[pos:] + bloque, 0
+                else:
+                    fin_de_archivo = True
+                continue
+            if error_decodificacion is not None:
+                raise error_decodificacion
+
+            yield elemento
+            pos = fin
+            espera_separador = True
+
+
+def _iterar_ndjson(json_file_path: str) -> Iterator[Any]:
+    with open(json_file_path, 'r', encoding='utf-8-sig') as archivo:
+        for numero_linea, linea in enumerate(archivo, 1):
+            linea = linea.strip()
+            if not linea:
+                continue
+            try:
+                yield json.loads(linea)
+            except json.JSONDecodeError as e:
+                raise json.JSONDecodeError(f"Línea {numero_linea}: {e.msg}", e.doc, e.pos) from e
+
+
+def iterar_registros_json(json_file_path: str, formato: Optional[str] = None,
+                          tamano_bloque: int = _TAMANO_BLOQUE_POR_DEFECTO) -> Iterator[Any]:
+    """
+    Recorre un archivo JSON registro a registro con memoria acotada.
+
+    Admite dos formatos:
+    - `"array"`: un array JSON en el nivel superior (`[{...}, {...}]`). Se lee por bloques y cada
+      elemento se decodifica con `JSONDecoder.raw_decode` en cuanto está completo.
+    - `"ndjson"`: un documento JSON por línea.
+
+    Args:
+        json_file_path (str): La ruta al archivo JSON.
+        formato (Optional[str]): `"array"`, `"ndjson"` o `None` para detectarlo automáticamente.
+        tamano_bloque (int): Tamaño en caracteres de cada bloque leído en modo array.
+
+    Yields:
+        Any: Cada registro del archivo.
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+        json.JSONDecodeError: Si el contenido no es JSON válido (puede ocurrir después de haber entregado registros).
+        ValueError: Si el formato indicado no es válido.
+    """
+    formato = formato or detectar_formato_json(json_file_path)
+    if formato == FORMATO_ARRAY:
+        return _iterar_array(json_file_path, tamano_bloque)
+    if formato == FORMATO_NDJSON:
+        return _iterar_ndjson(json_file_path)
+    raise ValueError(f"Formato JSON no soportado: '{formato}'. Use '{FORMATO_ARRAY}' o '{FORMATO_NDJSON}'.")
+
+
+def _quitar_cadenas(datos: bytes) -> Tuple[bytes, bytes]:
+    # Elimina las cadenas completas del bloque y devuelve (bloque sin cadenas, cadena sin cerrar al final).
+    # Las únicas secuencias de escape que alteran la paridad de comillas son '\\\\' y '\\"': se eliminan
+    # primero (en ese orden) y a partir de ahí cada comilla abre o cierra una cadena. Una barra invertida
+    # suelta al final del bloque queda dentro de la cadena sin cerrar y se completa con el bloque siguiente.
+    partes = datos.replace(b'\\\\', b'').replace(b'\\"', b'').split(b'"')
+    if len(partes) % 2 == 0:
+        return b''.join(partes[0:-1:2]), b'"' + partes[-1]
+    return b''.join(partes[0::2]), b''
+
+
+def _contar_elementos_array(json_file_path: str, tamano_bloque: int) -> int:
+    # El conteo trabaja sobre la "estructura" de cada bloque, obtenida con operaciones en C:
+    # 1) se eliminan las cadenas completas (así sus comas y corchetes no cuentan),
+    # 2) se eliminan todos los bytes que no sean '[]{},',
+    # 3) se eliminan los grupos más internos '{,,}' / '[,]' hasta que no quedan grupos cerrados.
+    # Lo que queda en el primer nivel son solo las comas que separan elementos del array.
+    comas = 0
+    hay_elementos = False
+    array_abierto = False
+    array_cerrado = False
+    resto_crudo = b''   # Cadena sin cerrar al final del bloque anterior (bytes originales).
+    pendiente = b''     # Elemento sin cerrar al final del bloque anterior (ya en forma estructural).
+
+    with open(json_file_path, 'rb') as archivo:
+        for bloque in iter(lambda: archivo.read(tamano_bloque), b''):
+            datos = resto_crudo + bloque
+            if not array_abierto:
+                datos = datos.lstrip(b'\xef\xbb\xbf \t\r\n')
+                if not datos:
+                    resto_crudo = b''
+                    continue
+                if datos[:1] != b'[':
+                    raise ValueError("El archivo JSON no contiene un array en el nivel superior.")
+                datos = datos[1:]
+                array_abierto = True
+            if not hay_elementos:
+                # El array tiene elementos si tras '[' aparece algo distinto de espacios y ']'.
+                inicio = datos.lstrip(b' \t\r\n')[:1]
+                hay_elementos = bool(inicio) and inicio != b']'
+
+            datos, resto_crudo = _quitar_cadenas(datos)
+            estructura = pendiente + datos.translate(None, _BYTES_NO_ESTRUCTURALES)
+            while True:
+                colapsada = _GRUPO_INTERNO.sub(b'', estructura)
+                if len(colapsada) == len(estructura):
+                    break
+                estructura = colapsada
+
+            # Todo lo anterior al primer grupo sin cerrar pertenece al primer nivel del array.
+            aperturas = [i for i in (estructura.find(b'['), estructura.find(b'{')) if i != -1]
+            inicio_pendiente = min(aperturas) if aperturas else len(estructura)
+            primer_nivel = estructura[:inicio_pendiente]
+            cierre = primer_nivel.find(b']')
+            if cierre != -1:
+                comas += primer_nivel.count(b',', 0, cierre)
+                array_cerrado = True
+                break
+            comas += primer_nivel.count(b',')
+            pendiente = estructura[inicio_pendiente:]
+
+    if not array_abierto:
+        raise ValueError("El archivo JSON no contiene un array en el nivel superior.")
+    if not array_cerrado:
+        raise ValueError("Fin de archivo inesperado: el array JSON no está cerrado.")
+    return comas + 1 if hay_elementos else 0
+
+
+def _contar_lineas_ndjson(json_file_path: str) -> int:
+    with open(json_file_path, 'rb') as archivo:
+        return sum(1 for linea in archivo if linea.strip())
+
+
+def contar_registros_json(json_file_path: str, formato: Optional[str] = None,
+                          tamano_bloque: int = _TAMANO_BLOQUE_POR_DEFECTO) -> int:
+    """
+    Cuenta los registros de un archivo JSON sin construir objetos de Python para cada elemento.
+
+    En formato array el archivo se reduce bloque a bloque a su estructura ('[]{},') mediante `bytes.replace`,
+    `bytes.split`, `bytes.translate` y una expresión regular, y se cuentan las comas del primer nivel. En NDJSON se cuentan las líneas
+    no vacías. No se valida la sintaxis completa de cada registro.
+
+    Args:
+        json_file_path (str): La ruta al archivo JSON.
+        formato (Optional[str]): `"array"`, `"ndjson"` o `None` para detectarlo automáticamente.
+        tamano_bloque (int): Tamaño en bytes de cada bloque leído.
+
+    Returns:
+        int: El número de registros.
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+        ValueError: Si el formato indicado no es válido o el archivo no contiene un array en modo `"array"`.
+    """
+    formato = formato or detectar_formato_json(json_file_path)
+    if formato == FORMATO_ARRAY:
+        return _contar_elementos_array(json_file_path, tamano_bloque)
+    if formato == FORMATO_NDJSON:
+        return _contar_lineas_ndjson(json_file_path)
+    raise ValueError(f"Formato JSON no soportado: '{formato}'. Use '{FORMATO_ARRAY}' o '{FORMATO_NDJSON}'.")
@@ -1,23 +1,119 @@
+import atexit
+import contextvars
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
+from typing import Dict, Optional, Tuple
 from .config import LOGGER_DIR # Importa la ruta del directorio de logs desde config.py
+from .config import LOGGER_EN_COLA # Modo de logging en segundo plano (QueueHandler/QueueListener)
 
-def setup_logger(name='playwright_automation', console_level=logging.INFO, file_level=logging.DEBUG):
+# Listener en segundo plano de cada logger configurado en modo cola, por nombre.
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+# Loggers ya configurados en este proceso, por nombre, con la configuración con la que se crearon.
+_loggers: Dict[str, Tuple[Tuple[int, int, bool], logging.Logger]] = {}
+
+# Archivo de log de este proceso: uno por worker de pytest-xdist y sesión, compartido por todos los loggers.
+_ruta_log_proceso: Optional[str] = None
+
+# Test en curso, añadido a cada registro como campo 'test_id' (secciones por test sin crear handlers).
+_test_actual: contextvars.ContextVar[str] = contextvars.ContextVar("test_actual", default="-")
+
+
+class _FiltroTestActual(logging.Filter):
+    """
+    Añade al registro el test en curso (`record.test_id`). Va en el logger, así que se evalúa en el
+    hilo que emite el registro, antes de encolarlo.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.test_id = _test_actual.get()
+        return True
+
+
+def establecer_test_actual(test_id: str) -> contextvars.Token:
+    """
+    Marca `test_id` como test en curso para los registros siguientes. Devuelve el token para `restablecer_test_actual`.
+    """
+    return _test_actual.set(test_id)
+
+
+def restablecer_test_actual(token: contextvars.Token) -> None:
+    _test_actual.reset(token)
+
+
+def ruta_log_proceso() -> str:
+    """
+    Devuelve (y fija la primera vez) la ruta del archivo de log de este proceso:
+    'automation_log_<fecha>_<worker>.log', con worker 'gw0', 'gw1'... con pytest-xdist o 'main' sin él.
+    """
+    global _ruta_log_proceso
+    if _ruta_log_proceso is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        _ruta_log_proceso = os.path.join(LOGGER_DIR, f"automation_log_{timestamp}_{worker}.log")
+    return _ruta_log_proceso
+
+
+class _QueueHandlerSinFormato(logging.handlers.QueueHandler):
+    """
+    QueueHandler que encola el registro tal cual. El `QueueHandler` estándar formatea el mensaje (y la
+    traza de la excepción) en `prepare()`, es decir, en el hilo del test; aquí todo el formateo lo hacen
+    los handlers de consola y archivo en el hilo del `QueueListener`. Es seguro porque el listener vive
+    en el mismo proceso y los mensajes del framework se construyen con f-strings (sin argumentos mutables).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _detener_listener(name: str) -> None:
+    listener = _listeners.pop(name, None)
+    if listener is not None:
+        listener.stop() # Procesa los registros pendientes antes de terminar
+        for handler in listener.handlers:
+            handler.close()
+
+
+@atexit.register
+def _detener_listeners() -> None:
+    for name in list(_listeners):
+        _detener_listener(name)
+
+def setup_logger(name='playwright_automation', console_level=logging.INFO, file_level=logging.DEBUG, en_cola=LOGGER_EN_COLA):
     """
     Configura y devuelve una instancia de logger para el framework de automatización,
     permitiendo niveles de logging separados para consola y archivo.
 
+    En modo cola (`en_cola=True`, por defecto según `config.LOGGER_EN_COLA`) el logger solo tiene un
+    `QueueHandler`: el hilo del test se limita a encolar el registro y el formateo y la escritura en
+    consola y archivo los hace un `QueueListener` en segundo plano. Los registros por debajo de ambos
+    niveles se descartan antes de encolarse.
+
+    La configuración se memoriza por proceso: llamar de nuevo con el mismo nombre y los mismos niveles
+    (p. ej. en cada `Funciones_Globales(page)`) devuelve el logger existente sin tocar sus handlers.
+    Todos los loggers del proceso escriben en el mismo archivo (`ruta_log_proceso()`), y cada registro
+    lleva el test en curso en el campo `test_id` (ver `establecer_test_actual`).
+
     Args:
         name (str): El nombre del logger. Por defecto, 'playwright_automation'.
         console_level (int): El nivel mínimo de logging para los mensajes que se muestran en la consola.
                              Por defecto, logging.INFO.
         file_level (int): El nivel mínimo de logging para los mensajes que se escriben en el archivo.
                           Por defecto, logging.DEBUG.
+        en_cola (bool): Si se usa el modo cola con escritura en segundo plano.
 
     Returns:
         logging.Logger: Una instancia del logger configurado.
     """
+    # 0. Reutilizar el logger si ya se configuró en este proceso con los mismos parámetros
+    configuracion = (console_level, file_level, en_cola)
+    memorizado = _loggers.get(name)
+    if memorizado is not None and memorizado[0] == configuracion:
+        return memorizado[1]
+
     # 1. Obtener o crear una instancia del logger
     logger = logging.getLogger(name)
 
@@ -29,29 +125,44 @@ def setup_logger(name='playwright_automation', console_level=logging.INFO, file_
     logger.propagate = False
 
     # 4. Limpiar handlers existentes para evitar duplicación si la función se llama varias veces
+    _detener_listener(name)
     if logger.handlers:
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
+            handler.close()
 
     # 5. Definir el formato de los mensajes de log
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - [%(test_id)s] - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    for filtro in logger.filters[:]:
+        logger.removeFilter(filtro)
+    logger.addFilter(_FiltroTestActual())
 
     # 6. Configurar el handler para la consola (StreamHandler)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(console_level) # Nivel de log específico para la consola
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
-    # 7. Configurar el handler para el archivo (FileHandler)
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    log_file_name = f"automation_log_{timestamp}.log"
-    log_file_path = os.path.join(LOGGER_DIR, log_file_name)
+    # 7. Configurar el handler para el archivo (FileHandler), en el archivo único del proceso
+    log_file_path = ruta_log_proceso()
 
     file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
     file_handler.setLevel(file_level) # Nivel de log específico para el archivo
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
+    if en_cola:
+        # 8. Modo cola: el logger solo encola; el listener reparte a cada handler según su nivel.
+        cola = queue.SimpleQueue()
+        queue_handler = _QueueHandlerSinFormato(cola)
+        queue_handler.setLevel(min(console_level, file_level)) # Filtra antes de encolar
+        logger.addHandler(queue_handler)
+        listener = logging.handlers.QueueListener(cola, console_handler, file_handler, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = listener
+    else:
+        logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
+
+    _loggers[name] = (configuracion, logger)
     return logger
 
 """# --- Ejemplo de uso (opcional, para testing rápido del logger) ---
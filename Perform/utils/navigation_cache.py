@@ -0,0 +1,56 @@
+import json
+from typing import Any, Dict, Hashable, Optional
+from playwright.sync_api import Page # Página de Playwright
+
+
+class NavegacionCache:
+    """
+    Caché de rutas de navegación por perfil de dispositivo (una instancia por sesión/worker).
+
+    Tras recorrer una vez el menú hasta una página, se guarda la URL final y el `storage_state`
+    (cookies y localStorage) del contexto. Los tests siguientes con el mismo perfil restauran ese estado
+    en su contexto nuevo y navegan directamente a la URL, sin repetir el recorrido del menú.
+    """
+
+    def __init__(self):
+        self._entradas: Dict[Hashable, Dict[str, Any]] = {}
+
+    def registrar(self, clave: Hashable, page: Page) -> None:
+        """
+        Guarda la URL actual de la página y el estado de almacenamiento de su contexto bajo `clave`.
+        """
+        self._entradas[clave] = {"url": page.url, "storage_state": page.context.storage_state()}
+
+    def obtener(self, clave: Hashable) -> Optional[Dict[str, Any]]:
+        return self._entradas.get(clave)
+
+    def aplicar(self, clave: Hashable, page: Page, timeout: Optional[float] = None) -> bool:
+        """
+        Restaura en el contexto de `page` el estado guardado para `clave` y navega a su URL final.
+
+        Returns:
+            bool: `True` si había una entrada y se navegó directamente; `False` si no hay entrada
+                  (el llamador debe recorrer el menú y registrar el resultado).
+        """
+        entrada = self._entradas.get(clave)
+        if entrada is None:
+            return False
+
+        estado = entrada["storage_state"]
+        if estado.get("cookies"):
+            page.context.add_cookies(estado["cookies"])
+        # El localStorage solo puede escribirse desde su propio origen: se inyecta con un script de
+        # inicio que se ejecuta antes que los scripts de la página al cargar ese origen.
+        for origen in estado.get("origins", []):
+            valores = {item["name"]: item["value"] for item in origen.get("localStorage", [])}
+            if valores:
+                page.context.add_init_script(
+                    f"if (window.location.origin === {json.dumps(origen['origin'])}) {{"
+                    f" const valores = {json.dumps(valores)};"
+                    f" for (const [k, v] of Object.entries(valores)) window.localStorage.setItem(k, v); }}"
+                )
+        page.goto(entrada["url"], timeout=timeout)
+        return True
+
+    def limpiar(self) -> None:
+        self._entradas.clear()
@@ -0,0 +1,141 @@
+from collections import OrderedDict
+from typing import Dict, List, Set, Tuple
+from playwright.sync_api import Locator # Locator de Playwright
+from .config import TABLA_INDICE_CACHE_MAX_TABLAS # Límite de la caché definido en config.py
+
+# Instala (una sola vez por elemento) un MutationObserver que cuenta los cambios de contenido de la
+# tabla, y devuelve 'id:versión'. El id es aleatorio por elemento: si la tabla se sustituye por otra,
+# la clave cambia aunque el selector sea el mismo.
+_JS_INSTALAR_VERSION = """
+    if (!tabla.__pfIndice) {
+        const estado = {id: Math.random().toString(36).slice(2) + Date.now().toString(36), version: 0};
+        new MutationObserver(() => { estado.version++; })
+            .observe(tabla, {childList: true, subtree: true, characterData: true});
+        tabla.__pfIndice = estado;
+    }
+    const clave = tabla.__pfIndice.id + ':' + tabla.__pfIndice.version;
+"""
+
+_JS_VERSION_TABLA = "tabla => {" + _JS_INSTALAR_VERSION + " return clave; }"
+
+# Versión de la tabla más el contenido necesario para las búsquedas: el textContent completo de cada
+# fila ('tbody tr', como fila.text_content()) y el texto recortado de cada celda 'td'.
+_JS_EXTRAER_PARA_INDICE = "tabla => {" + _JS_INSTALAR_VERSION + """
+    const filas = [];
+    const celdas = [];
+    for (const tr of tabla.querySelectorAll('tbody tr')) {
+        filas.push(tr.textContent || '');
+        celdas.push(Array.from(tr.querySelectorAll('td'), td => (td.textContent || '').trim()));
+    }
+    return {clave, filas, celdas};
+}
+"""
+
+_LONGITUD_NGRAMA = 3
+
+
+def _ngramas(texto: str) -> Set[str]:
+    return {texto[i:i + _LONGITUD_NGRAMA] for i in range(len(texto) - _LONGITUD_NGRAMA + 1)}
+
+
+class IndiceBusquedaTabla:
+    """
+    Índice invertido del contenido de una tabla para responder búsquedas sin volver al navegador:
+
+    - Búsqueda parcial (sin distinguir mayúsculas/minúsculas) sobre el texto completo de cada fila:
+      índice de trigramas 'trigrama -> filas'; los candidatos (intersección de los trigramas del texto
+      buscado) se confirman con `in`. Los textos de menos de 3 caracteres se buscan recorriendo las filas.
+    - Búsqueda exacta sobre el texto recortado de cada celda: tabla hash 'texto -> [(fila, celda)]'.
+    """
+
+    __slots__ = ("clave", "filas", "celdas", "_filas_minusculas", "_trigramas", "_exactas")
+
+    def __init__(self, clave: str, filas: List[str], celdas: List[List[str]]):
+        self.clave = clave
+        self.filas = filas
+        self.celdas = celdas
+        self._filas_minusculas = [fila.lower() for fila in filas]
+        self._trigramas: Dict[str, Set[int]] = {}
+        for i, fila in enumerate(self._filas_minusculas):
+            for trigrama in _ngramas(fila):
+                self._trigramas.setdefault(trigrama, set()).add(i)
+        self._exactas: Dict[str, List[Tuple[int, int]]] = {}
+        for i, textos in enumerate(celdas):
+            for j, texto in enumerate(textos):
+                self._exactas.setdefault(texto, []).append((i, j))
+
+    def __len__(self) -> int:
+        return len(self.filas)
+
+    def buscar_parcial(self, texto_buscado: str) -> List[int]:
+        """
+        Devuelve, en orden, los índices de las filas cuyo texto contiene `texto_buscado` (sin distinguir mayúsculas/minúsculas).
+        """
+        buscado = texto_buscado.lower()
+        if len(buscado) < _LONGITUD_NGRAMA:
+            return [i for i, fila in enumerate(self._filas_minusculas) if buscado in fila]
+        candidatas = None
+        # Se intersecan primero los trigramas menos frecuentes para reducir el conjunto cuanto antes.
+        for trigrama in sorted(_ngramas(buscado), key=lambda t: len(self._trigramas.get(t, ()))):
+            filas = self._trigramas.get(trigrama)
+            if not filas:
+                return []
+            candidatas = set(filas) if candidatas is None else candidatas & filas
+            if not candidatas:
+                return []
+        return sorted(i for i in candidatas if buscado in self._filas_minusculas[i])
+
+    def buscar_exacto(self, texto_buscado: str) -> List[Tuple[int, int]]:
+        """
+        Devuelve, en orden, los pares (fila, celda) cuya celda es exactamente `texto_buscado` (tras recortar espacios).
+        """
+        return list(self._exactas.get(texto_buscado, ()))
+
+
+class TablaIndiceCache:
+    """
+    Caché LRU de índices de búsqueda por tabla, invalidada automáticamente cuando cambia el contenido.
+
+    Cada consulta cuesta una única llamada ligera al navegador (la versión que mantiene el
+    MutationObserver de la tabla); solo si la tabla cambió, o es otra, se vuelve a extraer su
+    contenido completo, también en una sola llamada.
+    """
+
+    def __init__(self, max_tablas: int = TABLA_INDICE_CACHE_MAX_TABLAS):
+        self.max_tablas = max_tablas
+        self._indices: "OrderedDict[str, IndiceBusquedaTabla]" = OrderedDict()
+
+    def obtener(self, tabla: Locator) -> Tuple[IndiceBusquedaTabla, bool]:
+        """
+        Devuelve el índice de la tabla, construyéndolo solo si no existe o la tabla ha cambiado.
+
+        Args:
+            tabla (Locator): Locator del elemento `<table>`.
+
+        Returns:
+            Tuple[IndiceBusquedaTabla, bool]: El índice y `True` si se obtuvo desde la caché.
+        """
+        clave = tabla.evaluate(_JS_VERSION_TABLA)
+        id_tabla = clave.split(":", 1)[0]
+        indice = self._indices.get(id_tabla)
+        if indice is not None and indice.clave == clave:
+            self._indices.move_to_end(id_tabla)
+            return indice, True
+
+        datos = tabla.evaluate(_JS_EXTRAER_PARA_INDICE)
+        indice = IndiceBusquedaTabla(datos["clave"], datos["filas"], datos["celdas"])
+        self._indices[id_tabla] = indice
+        self._indices.move_to_end(id_tabla)
+        while len(self._indices) > self.max_tablas:
+            self._indices.popitem(last=False)
+        return indice, False
+
+    def limpiar(self) -> None:
+        """
+        Vacía la caché por completo.
+        """
+        self._indices.clear()
+
+
+# Instancia compartida por proceso (cada worker de pytest-xdist tiene la suya).
+cache_indices_tabla = TablaIndiceCache()
@@ -0,0 +1,182 @@
+import time
+from typing import NamedTuple, Optional, Tuple
+from playwright.sync_api import Locator # Locator de Playwright
+from .config import TABLA_PAGINADA_TIMEOUT_PAGINA_MS, TABLA_PAGINADA_MAX_PAGINAS # Límites del recorrido definidos en config.py
+from .table_snapshot import TableSnapshot # Instantánea de tablas por columnas
+
+ESTRATEGIA_API = "api_datatables"        # Filas leídas de la API de DataTables, sin tocar la paginación.
+ESTRATEGIA_LONGITUD = "longitud_maxima"  # Todas las filas caben en una página tras elegir la mayor longitud.
+ESTRATEGIA_RECORRIDO = "recorrido"       # Recorrido de las páginas con el botón 'Siguiente'.
+
+# Lectura de una fila '<tr>' con las mismas reglas que _JS_EXTRAER_TABLA de table_snapshot.py.
+_JS_LEER_FILA = """
+    const encabezados = Array.from(tabla.querySelectorAll('thead th'), th => (th.textContent || '').trim());
+    const filas = [];
+    const checkboxes = [];
+    const leerFila = tr => {
+        const textos = [];
+        const estados = [];
+        for (const td of tr.querySelectorAll('td')) {
+            textos.push((td.textContent || '').trim());
+            const checkbox = td.querySelector("input[type='checkbox']");
+            estados.push(checkbox ? checkbox.checked : null);
+        }
+        filas.push(textos);
+        checkboxes.push(estados);
+    };
+"""
+
+# Si la tabla es una DataTable con procesamiento en el cliente, devuelve todas sus filas (filtro y orden
+# actuales) desde la API, sin cambiar de página; en otro caso devuelve null. Las filas que DataTables
+# aún no ha creado en el DOM (deferRender) se leen de su representación 'display'.
+_JS_LEER_API_DATATABLES = "tabla => {" + _JS_LEER_FILA + """
+    const $ = window.jQuery;
+    let api = null;
+    if ($ && $.fn && $.fn.dataTable && $.fn.dataTable.isDataTable(tabla)) {
+        api = $(tabla).DataTable();
+    } else if (window.DataTable && typeof window.DataTable.isDataTable === 'function' && window.DataTable.isDataTable(tabla)) {
+        api = new window.DataTable.Api(tabla);
+    }
+    if (!api || api.page.info().serverSide) return null;
+    const opciones = {order: 'current', search: 'applied'};
+    const indices = api.rows(opciones).indexes().toArray();
+    const nodos = api.rows(opciones).nodes().toArray();
+    const columnas = api.columns().indexes().toArray().filter(c => api.column(c).visible());
+    const plantilla = document.createElement('template');
+    nodos.forEach((tr, n) => {
+        if (tr) { leerFila(tr); return; }
+        const textos = [];
+        const estados = [];
+        for (const c of columnas) {
+            const html = api.cell(indices[n], c).render('display');
+            plantilla.innerHTML = html == null ? '' : String(html);
+            textos.push((plantilla.content.textContent || '').trim());
+            const checkbox = plantilla.content.querySelector("input[type='checkbox']");
+            estados.push(checkbox ? checkbox.hasAttribute('checked') : null);
+        }
+        filas.push(textos);
+        checkboxes.push(estados);
+    });
+    return {encabezados, filas, checkboxes, total: api.page.info().recordsDisplay, paginas: 1, completo: true, motivo: ''};
+}
+"""
+
+# Recorre la paginación en el navegador, en un único 'evaluate':
+# 1. Si se indica el <select> de longitud ('Show entries'), elige la opción mayor ('-1' = todas).
+# 2. Vuelve a la primera página y lee cada página pulsando 'Siguiente' hasta que se deshabilita. Tras
+#    cada acción espera la primera mutación de la tabla (el redibujado de DataTables), no una pausa fija.
+# 3. Restaura la longitud original y vuelve a la primera página.
+# El total esperado es el tercer número del texto '#<id>_info' ("Showing 1 to 10 of 57 entries").
+_JS_RECORRER_PAGINAS = "async (tabla, {longitud, esperaMs, maxPaginas}) => {" + _JS_LEER_FILA + """
+    const id = tabla.id;
+    const raiz = (id && document.getElementById(id + '_wrapper')) || tabla.parentElement || document;
+    const boton = tipo => (id && document.getElementById(id + '_' + tipo))
+        || raiz.querySelector('.paginate_button.' + tipo + ', .dt-paging-button.' + tipo);
+    const objetivo = el => el.querySelector('a, button') || el;
+    const deshabilitado = el => !el || el.classList.contains('disabled') || el.getAttribute('aria-disabled') === 'true'
+        || objetivo(el).disabled || objetivo(el).classList.contains('disabled');
+    const esperarCambio = accion => new Promise(resolve => {
+        const observador = new MutationObserver(() => { observador.disconnect(); clearTimeout(limite); resolve(true); });
+        observador.observe(tabla, {childList: true, subtree: true, characterData: true});
+        const limite = setTimeout(() => { observador.disconnect(); resolve(false); }, esperaMs);
+        accion();
+    });
+    const irAPrimera = async () => {
+        for (let i = 0; i < maxPaginas && !deshabilitado(boton('previous')); i++) {
+            if (!await esperarCambio(() => objetivo(boton('previous')).click())) return false;
+        }
+        return true;
+    };
+    const cambiarLongitud = valor => esperarCambio(() => {
+        longitud.value = valor;
+        longitud.dispatchEvent(new Event('change', {bubbles: true}));
+    });
+
+    let longitudOriginal = null;
+    if (longitud) {
+        const valores = Array.from(longitud.options, o => o.value);
+        const maxima = valores.includes('-1') ? '-1'
+            : valores.reduce((a, b) => (parseInt(b, 10) > parseInt(a, 10) ? b : a), longitud.value);
+        if (maxima !== longitud.value) {
+            longitudOriginal = longitud.value;
+            await cambiarLongitud(maxima);
+        }
+    }
+
+    let paginas = 0;
+    let completo = await irAPrimera();
+    let motivo = completo ? '' : 'la tabla no volvió a la primera página';
+    while (completo) {
+        for (const tr of tabla.querySelectorAll('tbody tr')) leerFila(tr);
+        paginas++;
+        const siguiente = boton('next');
+        if (deshabilitado(siguiente)) break;
+        if (paginas >= maxPaginas) { completo = false; motivo = 'se alcanzó el máximo de ' + maxPaginas + ' páginas'; break; }
+        if (!await esperarCambio(() => objetivo(siguiente).click())) {
+            completo = false;
+            motivo = 'la página ' + (paginas + 1) + ' no se redibujó en ' + esperaMs + ' ms';
+        }
+    }
+
+    const info = id && document.getElementById(id + '_info');
+    const numeros = info ? (info.textContent.match(/\\d[\\d.,]*/g) || []).map(n => parseInt(n.replace(/[.,]/g, ''), 10)) : [];
+    const total = numeros.length >= 3 ? numeros[2] : null;
+
+    if (longitudOriginal !== null) await cambiarLongitud(longitudOriginal);
+    await irAPrimera();
+    return {encabezados, filas, checkboxes, total, paginas, completo, motivo, longitudCambiada: longitudOriginal !== null};
+}
+"""
+
+
+class EstadisticasRecorrido(NamedTuple):
+    estrategia: str
+    paginas: int
+    filas: int
+    total_esperado: Optional[int]
+    completo: bool
+    motivo: str
+    segundos: float
+
+    @property
+    def filas_por_segundo(self) -> float:
+        return self.filas / self.segundos if self.segundos > 0 else float("inf")
+
+
+def recorrer_tabla_paginada(tabla: Locator, selector_longitud: Optional[Locator] = None,
+                            timeout_pagina_ms: int = TABLA_PAGINADA_TIMEOUT_PAGINA_MS,
+                            max_paginas: int = TABLA_PAGINADA_MAX_PAGINAS) -> Tuple[TableSnapshot, EstadisticasRecorrido]:
+    """
+    Obtiene todas las filas de una tabla paginada (DataTables) en una única `TableSnapshot`.
+
+    Se intenta, por este orden: leer la API de DataTables (una llamada, sin cambiar la página) y, si no
+    está disponible o el procesamiento es en el servidor, recorrer la paginación dentro del navegador
+    con un único `evaluate`, tras elegir la mayor longitud de página en `selector_longitud` (si se indica).
+
+    Args:
+        tabla (Locator): Locator del elemento `<table>`.
+        selector_longitud (Optional[Locator]): Locator del `<select>` de longitud de página ('Show entries').
+        timeout_pagina_ms (int): Tiempo máximo (ms) para que se redibuje cada página.
+        max_paginas (int): Número máximo de páginas que se recorren.
+
+    Returns:
+        Tuple[TableSnapshot, EstadisticasRecorrido]: La instantánea con todas las filas leídas y las estadísticas
+        del recorrido (estrategia, páginas, filas, total esperado según DataTables, si se completó y duración).
+    """
+    inicio = time.perf_counter()
+    datos = tabla.evaluate(_JS_LEER_API_DATATABLES)
+    if datos is not None:
+        estrategia = ESTRATEGIA_API
+    else:
+        longitud = selector_longitud.element_handle() if selector_longitud is not None else None
+        try:
+            datos = tabla.evaluate(_JS_RECORRER_PAGINAS, {"longitud": longitud, "esperaMs": timeout_pagina_ms, "maxPaginas": max_paginas})
+        finally:
+            if longitud is not None:
+                longitud.dispose()
+        estrategia = ESTRATEGIA_LONGITUD if datos["paginas"] == 1 and datos["longitudCambiada"] else ESTRATEGIA_RECORRIDO
+
+    snapshot = TableSnapshot.desde_extraccion(datos)
+    estadisticas = EstadisticasRecorrido(estrategia, datos["paginas"], len(snapshot), datos["total"],
+                                         datos["completo"], datos["motivo"], time.perf_counter() - inicio)
+    return snapshot, estadisticas
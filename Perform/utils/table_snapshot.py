@@ -0,0 +1,309 @@
+import bisect
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple
+from playwright.sync_api import Locator # Locator de Playwright
+
+# Extrae en el navegador, en una sola llamada, los encabezados ('thead th'), el texto de cada celda
+# ('tbody tr' -> 'td', con textContent recortado, igual que text_content().strip()) y el estado del
+# checkbox de cada celda (true/false, o null si la celda no tiene checkbox).
+_JS_EXTRAER_TABLA = """
+tabla => {
+    const encabezados = Array.from(tabla.querySelectorAll('thead th'), th => (th.textContent || '').trim());
+    const filas = [];
+    const checkboxes = [];
+    for (const tr of tabla.querySelectorAll('tbody tr')) {
+        const textos = [];
+        const estados = [];
+        for (const td of tr.querySelectorAll('td')) {
+            textos.push((td.textContent || '').trim());
+            const checkbox = td.querySelector("input[type='checkbox']");
+            estados.push(checkbox ? checkbox.checked : null);
+        }
+        filas.push(textos);
+        checkboxes.push(estados);
+    }
+    return {encabezados, filas, checkboxes};
+}
+"""
+
+
+def extraer_tabla(tabla: Locator, timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Obtiene el contenido completo de una tabla HTML con un único `evaluate` (un solo viaje de ida y
+    vuelta al navegador, sin importar el número de filas y columnas).
+
+    Args:
+        tabla (Locator): Locator del elemento `<table>`.
+        timeout (float): Tiempo máximo (ms) para resolver el locator.
+
+    Returns:
+        Dict[str, Any]: `encabezados` (List[str]), `filas` (List[List[str]], una lista de textos por fila)
+                        y `checkboxes` (List[List[Optional[bool]]], paralela a `filas`).
+    """
+    return tabla.evaluate(_JS_EXTRAER_TABLA, timeout=timeout)
+
+
+# Cómo se compara cada celda esperada con la tabla (ver `TableSnapshot.diferencias`).
+_TIPO_TEXTO = 0       # Texto de la celda frente a `str(valor).strip()`.
+_TIPO_ESTADO = 1      # Estado del checkbox de la celda frente a un valor booleano.
+_TIPO_PRESENCIA = 2   # Solo que la celda tenga checkbox (columna de checkboxes con valor no booleano).
+_CHECKBOX_PRESENTE = "checkbox presente"
+_SIN_CHECKBOX = "sin checkbox"
+
+
+def _tipo_comparacion(columna: str, esperado: Any, columnas_checkbox: Set[str]) -> int:
+    if isinstance(esperado, bool):
+        return _TIPO_ESTADO
+    if columna in columnas_checkbox:
+        return _TIPO_PRESENCIA
+    return _TIPO_TEXTO
+
+
+def _valor_esperado(esperado: Any, tipo: int) -> Any:
+    if tipo == _TIPO_ESTADO:
+        return esperado
+    if tipo == _TIPO_PRESENCIA:
+        return _CHECKBOX_PRESENTE
+    return str(esperado).strip()
+
+
+def _subsecuencia_creciente_maxima(valores: List[int]) -> Set[int]:
+    """
+    Devuelve las posiciones de `valores` que forman una subsecuencia estrictamente creciente de longitud
+    máxima (algoritmo de patience sorting, O(n log n)).
+    """
+    colas: List[int] = []          # Último valor de cada pila
+    indices_colas: List[int] = []  # Posición en 'valores' de ese último valor
+    previos = [-1] * len(valores)
+    for posicion, valor in enumerate(valores):
+        pila = bisect.bisect_left(colas, valor)
+        if pila == len(colas):
+            colas.append(valor)
+            indices_colas.append(posicion)
+        else:
+            colas[pila] = valor
+            indices_colas[pila] = posicion
+        previos[posicion] = indices_colas[pila - 1] if pila > 0 else -1
+    resultado: Set[int] = set()
+    posicion = indices_colas[-1] if indices_colas else -1
+    while posicion != -1:
+        resultado.add(posicion)
+        posicion = previos[posicion]
+    return resultado
+
+
+class DiferenciasTabla:
+    """
+    Resultado de `TableSnapshot.diferencias`. Los índices de filas empiezan en 0.
+
+    - `faltantes`: filas esperadas sin equivalente en la tabla.
+    - `sobrantes`: filas de la tabla que no corresponden a ninguna esperada.
+    - `reordenadas`: pares (fila esperada, fila actual) idénticos pero fuera del orden esperado.
+    - `discrepancias`: (fila esperada, fila actual, {columna: (esperado, actual)}) para filas que están
+      en su posición pero con valores distintos.
+    - `columnas_faltantes`: columnas esperadas que no existen en los encabezados de la tabla.
+    """
+
+    __slots__ = ("faltantes", "sobrantes", "reordenadas", "discrepancias", "columnas_faltantes")
+
+    def __init__(self):
+        self.faltantes: List[int] = []
+        self.sobrantes: List[int] = []
+        self.reordenadas: List[Tuple[int, int]] = []
+        self.discrepancias: List[Tuple[int, int, Dict[str, Tuple[Any, Any]]]] = []
+        self.columnas_faltantes: List[str] = []
+
+    @property
+    def ok(self) -> bool:
+        return not (self.faltantes or self.sobrantes or self.reordenadas or self.discrepancias or self.columnas_faltantes)
+
+    def lineas_informe(self, max_lineas: int = 50) -> List[str]:
+        """
+        Formatea el resultado como líneas de texto (filas numeradas desde 1), con un máximo de `max_lineas` por apartado.
+        """
+        lineas = []
+        if self.columnas_faltantes:
+            lineas.append(f"Columnas esperadas no encontradas: {self.columnas_faltantes}")
+        lineas.append(f"Filas faltantes: {len(self.faltantes)}, sobrantes: {len(self.sobrantes)}, "
+                      f"reordenadas: {len(self.reordenadas)}, con discrepancias: {len(self.discrepancias)}")
+        for esperada, actual, columnas in self.discrepancias[:max_lineas]:
+            detalle = ", ".join(f"{c}: se esperaba '{e}', se encontró '{a}'" for c, (e, a) in columnas.items())
+            lineas.append(f"  Fila esperada {esperada + 1} (fila {actual + 1} de la tabla): {detalle}")
+        lineas.extend(f"  Fila esperada {j + 1} no encontrada en la tabla" for j in self.faltantes[:max_lineas])
+        lineas.extend(f"  Fila {i + 1} de la tabla no esperada" for i in self.sobrantes[:max_lineas])
+        lineas.extend(f"  Fila esperada {j + 1} encontrada en la posición {i + 1}" for j, i in self.reordenadas[:max_lineas])
+        return lineas
+
+
+class TableSnapshot:
+    """
+    Instantánea inmutable del contenido de una tabla HTML, almacenada por columnas.
+
+    - `encabezados` y `indice` (encabezado -> posición de la primera columna con ese nombre).
+    - Una lista de textos y otra de estados de checkbox por columna (`None` si la fila no tiene esa
+      celda o la celda no tiene checkbox).
+    - Un hash por fila (textos y checkboxes), que permite comparar filas y tablas sin recorrer celdas.
+
+    Se construye con `desde_tabla(locator)` (un único `evaluate`) o `desde_extraccion(datos)`.
+    """
+
+    __slots__ = ("encabezados", "indice", "_textos", "_checkboxes", "hashes", "num_filas")
+
+    def __init__(self, encabezados: List[str], filas: List[List[str]], checkboxes: List[List[Optional[bool]]]):
+        self.encabezados = list(encabezados)
+        self.indice: Dict[str, int] = {}
+        for posicion, nombre in enumerate(self.encabezados):
+            self.indice.setdefault(nombre, posicion)
+        self.num_filas = len(filas)
+        ancho = max([len(self.encabezados)] + [len(fila) for fila in filas])
+        self._textos: List[List[Optional[str]]] = [[None] * self.num_filas for _ in range(ancho)]
+        self._checkboxes: List[List[Optional[bool]]] = [[None] * self.num_filas for _ in range(ancho)]
+        for i, (textos, estados) in enumerate(zip(filas, checkboxes)):
+            for c, texto in enumerate(textos):
+                self._textos[c][i] = texto
+            for c, estado in enumerate(estados):
+                self._checkboxes[c][i] = estado
+        self.hashes: List[int] = [hash((tuple(textos), tuple(estados))) for textos, estados in zip(filas, checkboxes)]
+
+    @classmethod
+    def desde_extraccion(cls, datos: Dict[str, Any]) -> "TableSnapshot":
+        return cls(datos["encabezados"], datos["filas"], datos["checkboxes"])
+
+    @classmethod
+    def desde_tabla(cls, tabla: Locator, timeout: Optional[float] = None) -> "TableSnapshot":
+        return cls.desde_extraccion(extraer_tabla(tabla, timeout))
+
+    def __len__(self) -> int:
+        return self.num_filas
+
+    @property
+    def hash_contenido(self) -> int:
+        """
+        Hash de la tabla completa (encabezados y todas las filas).
+        """
+        return hash((tuple(self.encabezados), tuple(self.hashes)))
+
+    def columna(self, nombre: str) -> List[Optional[str]]:
+        """
+        Devuelve los textos de la columna `nombre` (una entrada por fila).
+
+        Raises:
+            KeyError: Si la tabla no tiene esa columna.
+        """
+        return self._textos[self.indice[nombre]]
+
+    def checkboxes(self, nombre: str) -> List[Optional[bool]]:
+        return self._checkboxes[self.indice[nombre]]
+
+    def celda(self, fila: int, nombre: str) -> Optional[str]:
+        return self._textos[self.indice[nombre]][fila]
+
+    def fila(self, i: int) -> Dict[str, Optional[str]]:
+        """
+        Devuelve la fila `i` como diccionario 'encabezado -> texto'.
+        """
+        return {nombre: self._textos[posicion][i] for nombre, posicion in self.indice.items()}
+
+    def _valor(self, fila: int, posicion: int, tipo: int) -> Any:
+        if tipo == _TIPO_ESTADO:
+            return self._checkboxes[posicion][fila]
+        if tipo == _TIPO_PRESENCIA:
+            return _CHECKBOX_PRESENTE if self._checkboxes[posicion][fila] is not None else _SIN_CHECKBOX
+        return self._textos[posicion][fila]
+
+    def _clave(self, fila: int, firma: Tuple[Tuple[str, int, int], ...]) -> Tuple:
+        return tuple(self._valor(fila, posicion, tipo) for _, posicion, tipo in firma)
+
+    def diferencias(self, esperadas: Sequence[Dict[str, Any]], columnas_checkbox: Sequence[str] = ("Select",)) -> DiferenciasTabla:
+        """
+        Compara la tabla con las filas esperadas usando hashes, en tiempo lineal (más la ordenación de las
+        filas emparejadas fuera de orden), e informa de todas las diferencias en lugar de parar en la primera.
+
+        Se comparan todas las columnas que aparecen en alguna fila esperada; cada fila se compara solo en
+        las columnas que define. Cada celda se compara según su valor esperado:
+
+        - Booleano: con el estado del checkbox de la celda.
+        - Otro valor en una de `columnas_checkbox`: solo se exige que la celda tenga checkbox (su estado no se verifica).
+        - Cualquier otro: como texto (`str(valor).strip()`).
+
+        Args:
+            esperadas (Sequence[Dict[str, Any]]): Filas esperadas, en el orden esperado.
+            columnas_checkbox (Sequence[str]): Columnas cuyas celdas son checkboxes. Por defecto, `('Select',)`.
+
+        Returns:
+            DiferenciasTabla: Filas faltantes, sobrantes, reordenadas y con discrepancias.
+        """
+        resultado = DiferenciasTabla()
+        if not esperadas:
+            resultado.sobrantes = list(range(self.num_filas))
+            return resultado
+
+        columnas = list(dict.fromkeys(c for fila in esperadas for c in fila))
+        resultado.columnas_faltantes = [c for c in columnas if c not in self.indice]
+        checkbox = set(columnas_checkbox)
+
+        # Firma de cada fila esperada: (columna, posición, tipo de comparación) de las columnas que define.
+        firmas: List[Tuple[Tuple[str, int, int], ...]] = []
+        claves_esperadas: List[Tuple] = []
+        for fila in esperadas:
+            firma = tuple((c, self.indice[c], _tipo_comparacion(c, fila[c], checkbox)) for c in columnas if c in fila and c in self.indice)
+            firmas.append(firma)
+            claves_esperadas.append(tuple(_valor_esperado(fila[c], tipo) for c, _, tipo in firma))
+
+        # Índice hash por firma (normalmente una sola): clave de fila -> posiciones en la tabla (en orden).
+        por_firma: Dict[Tuple, Dict[Tuple, Deque[int]]] = {}
+
+        def indice_de(firma: Tuple[Tuple[str, int, int], ...]) -> Dict[Tuple, Deque[int]]:
+            por_clave = por_firma.get(firma)
+            if por_clave is None:
+                por_clave = por_firma[firma] = {}
+                for i in range(self.num_filas):
+                    por_clave.setdefault(self._clave(i, firma), deque()).append(i)
+            return por_clave
+
+        # 1. Emparejar filas idénticas (preferentemente en la misma posición).
+        emparejadas: List[Tuple[int, int]] = []
+        actual_usada = [False] * self.num_filas
+        esperada_usada = [False] * len(esperadas)
+        for j, clave in enumerate(claves_esperadas):
+            candidatas = indice_de(firmas[j]).get(clave)
+            if not candidatas:
+                continue
+            i = j if j < self.num_filas and not actual_usada[j] and clave == self._clave(j, firmas[j]) else None
+            if i is None:
+                while candidatas and actual_usada[candidatas[0]]:
+                    candidatas.popleft()
+                if not candidatas:
+                    continue
+                i = candidatas.popleft()
+            actual_usada[i] = True
+            esperada_usada[j] = True
+            emparejadas.append((j, i))
+
+        # 2. Las emparejadas fuera de la subsecuencia creciente máxima son las reordenadas.
+        en_orden = _subsecuencia_creciente_maxima([i for _, i in emparejadas])
+        resultado.reordenadas = [par for k, par in enumerate(emparejadas) if k not in en_orden]
+        anclas = {j: i for k, (j, i) in enumerate(emparejadas) if k in en_orden}
+
+        # 3. Una fila esperada sin pareja se compara con la fila de la tabla que ocupa su posición
+        # relativa a la última fila emparejada en orden (así los desplazamientos no rompen la comparación).
+        ultima_j, ultima_i = -1, -1
+        for j in range(len(esperadas)):
+            if j in anclas:
+                ultima_j, ultima_i = j, anclas[j]
+                continue
+            if esperada_usada[j]:
+                continue
+            i = ultima_i + (j - ultima_j)
+            if 0 <= i < self.num_filas and not actual_usada[i]:
+                actual_usada[i] = True
+                columnas_distintas = {}
+                for (c, p, tipo), e in zip(firmas[j], claves_esperadas[j]):
+                    actual = self._valor(i, p, tipo)
+                    if actual != e:
+                        columnas_distintas[c] = (e, actual)
+                resultado.discrepancias.append((j, i, columnas_distintas))
+            else:
+                resultado.faltantes.append(j)
+        resultado.sobrantes = [i for i in range(self.num_filas) if not actual_usada[i]]
+        return resultado
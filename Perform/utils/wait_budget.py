@@ -0,0 +1,258 @@
+import functools
+import glob
+import inspect
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+# Categorías de tiempo contabilizadas. El resto del tiempo (trabajo real del navegador y de Python)
+# se calcula como 'total - suma de categorías'.
+CATEGORIA_ESPERA_FIJA = "espera_fija"   # esperar_fijo / time.sleep
+CATEGORIA_AUTO_ESPERA = "auto_espera"   # aserciones expect(...), acciones de Locator (click, fill...) y postcondiciones
+CATEGORIA_CAPTURA = "captura"           # capturas de pantalla (screenshot + escritura a disco)
+CATEGORIAS = (CATEGORIA_ESPERA_FIJA, CATEGORIA_AUTO_ESPERA, CATEGORIA_CAPTURA)
+CATEGORIA_RESTO = "resto"
+
+# Acciones de Locator que esperan internamente la accionabilidad del elemento (visible, estable, habilitado...).
+# Se mide la llamada completa: el despacho del evento en sí es despreciable frente a la espera.
+ACCIONES_CON_AUTO_ESPERA = ("click", "dblclick", "tap", "hover", "focus", "fill", "clear", "type", "press",
+                            "press_sequentially", "check", "uncheck", "set_checked", "select_option",
+                            "select_text", "set_input_files", "drag_to", "wait_for")
+
+
+def _registro_vacio() -> Dict[str, float]:
+    registro = {"total": 0.0, "llamadas": 0}
+    registro.update({categoria: 0.0 for categoria in CATEGORIAS})
+    return registro
+
+
+class ContabilidadEsperas:
+    """
+    Contabiliza, por test y por método de `Funciones_Globales`, cuánto tiempo de reloj se dedica a
+    esperas fijas, a auto-esperas de Playwright (`expect`, acciones de Locator como `click` o `fill`,
+    postcondiciones) y a capturas de pantalla, frente al resto del tiempo (trabajo real en el navegador).
+
+    Solo se registra tiempo mientras hay un test activo (`iniciar_test` / `finalizar_test`, llamados
+    desde los hooks de pytest en `conftest.py`). Las mediciones anidadas no se cuentan dos veces: solo
+    cuenta la categoría más externa, y el tiempo de un método se atribuye al método de `Funciones_Globales`
+    más externo de la pila de llamadas. Pensada para el hilo principal de cada worker.
+    """
+
+    def __init__(self):
+        self.tests: Dict[str, Dict[str, Any]] = {}
+        self._test_actual: Optional[Dict[str, Any]] = None
+        self._metodo_actual: Optional[str] = None
+        self._categoria_activa = False
+
+    # --- Ciclo de vida del test ---
+
+    def iniciar_test(self, test_id: str) -> None:
+        registro = _registro_vacio()
+        registro["metodos"] = {}
+        self.tests[test_id] = registro
+        self._test_actual = registro
+
+    def finalizar_test(self, duracion: float) -> None:
+        if self._test_actual is not None:
+            self._test_actual["total"] = duracion
+            self._test_actual["llamadas"] = 1
+        self._test_actual = None
+        self._metodo_actual = None
+
+    # --- Medición ---
+
+    @contextmanager
+    def medir(self, categoria: str) -> Iterator[None]:
+        """
+        Suma el tiempo del bloque a `categoria` en el test actual y en el método de `Funciones_Globales`
+        en curso. Los bloques anidados dentro de otra medición no se suman de nuevo.
+        """
+        if self._test_actual is None or self._categoria_activa:
+            yield
+            return
+        self._categoria_activa = True
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            duracion = time.perf_counter() - inicio
+            self._categoria_activa = False
+            self._test_actual[categoria] += duracion
+            if self._metodo_actual is not None:
+                self._test_actual["metodos"][self._metodo_actual][categoria] += duracion
+
+    def envolver_metodo(self, nombre: str, funcion: Callable) -> Callable:
+        """
+        Devuelve `funcion` envuelta para atribuir su tiempo total (y las categorías medidas durante
+        su ejecución) al método `nombre`. Las llamadas anidadas se atribuyen al método más externo.
+        """
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if self._test_actual is None or self._metodo_actual is not None:
+                return funcion(*args, **kwargs)
+            self._metodo_actual = nombre
+            registro = self._test_actual["metodos"].setdefault(nombre, _registro_vacio())
+            inicio = time.perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                registro["total"] += time.perf_counter() - inicio
+                registro["llamadas"] += 1
+                self._metodo_actual = None
+        return envoltura
+
+    def instrumentar_clase(self, clase: type) -> type:
+        """
+        Envuelve todos los métodos públicos de `clase` con `envolver_metodo`. Los métodos generadores
+        (p. ej. `iterar_*`) se dejan sin envolver, ya que su trabajo ocurre fuera de la llamada.
+        """
+        for nombre, atributo in list(vars(clase).items()):
+            if nombre.startswith("_") or not inspect.isfunction(atributo) or inspect.isgeneratorfunction(atributo):
+                continue
+            setattr(clase, nombre, self.envolver_metodo(nombre, atributo))
+        return clase
+
+    def envolver_expect(self, expect_original: Callable) -> Callable:
+        """
+        Devuelve una versión de `expect` de Playwright cuyas aserciones se contabilizan como auto-espera.
+        """
+        contabilidad = self
+
+        class _AsercionesMedidas:
+            def __init__(self, aserciones):
+                self._aserciones = aserciones
+
+            def __getattr__(self, nombre):
+                atributo = getattr(self._aserciones, nombre)
+                if not callable(atributo):
+                    return atributo
+
+                @functools.wraps(atributo)
+                def asercion(*args, **kwargs):
+                    with contabilidad.medir(CATEGORIA_AUTO_ESPERA):
+                        return atributo(*args, **kwargs)
+                return asercion
+
+        class _ExpectMedido:
+            # Conserva el resto de la API de 'expect' (p. ej. expect.set_options) delegándola en el original.
+            def __call__(self, *args, **kwargs):
+                return _AsercionesMedidas(expect_original(*args, **kwargs))
+
+            def __getattr__(self, nombre):
+                return getattr(expect_original, nombre)
+
+        return _ExpectMedido()
+
+    def instrumentar_acciones(self, clase: type, nombres: Sequence[str] = ACCIONES_CON_AUTO_ESPERA) -> type:
+        """
+        Envuelve las acciones `nombres` de `clase` (p. ej. `Locator` de Playwright) para contabilizar cada
+        llamada como auto-espera. Llamarla varias veces sobre la misma clase no vuelve a envolverla.
+        """
+        if getattr(clase, "_acciones_medidas", False):
+            return clase
+        contabilidad = self
+        for nombre in nombres:
+            original = getattr(clase, nombre, None)
+            if not callable(original):
+                continue
+
+            def accion(*args, _original=original, **kwargs):
+                with contabilidad.medir(CATEGORIA_AUTO_ESPERA):
+                    return _original(*args, **kwargs)
+            setattr(clase, nombre, functools.wraps(original)(accion))
+        clase._acciones_medidas = True
+        return clase
+
+    # --- Informes ---
+
+    @staticmethod
+    def _con_resto(registro: Dict[str, Any]) -> Dict[str, Any]:
+        resultado = {clave: valor for clave, valor in registro.items() if clave != "metodos"}
+        resultado[CATEGORIA_RESTO] = max(0.0, registro["total"] - sum(registro[c] for c in CATEGORIAS))
+        return resultado
+
+    def resumen(self) -> Dict[str, Any]:
+        """
+        Devuelve el resumen serializable a JSON: por test, los totales por categoría y el desglose por método.
+        """
+        tests = {}
+        for test_id, registro in self.tests.items():
+            datos = self._con_resto(registro)
+            datos["metodos"] = {nombre: self._con_resto(m) for nombre, m in registro["metodos"].items()}
+            tests[test_id] = datos
+        return {"generado": datetime.now().isoformat(timespec="seconds"), "tests": tests}
+
+    def escribir_json(self, ruta: str) -> None:
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(self.resumen(), f, ensure_ascii=False, indent=2)
+
+
+def combinar_resumenes(directorio: str, patron: str = "wait_budget_*.json") -> Dict[str, Any]:
+    """
+    Combina los resúmenes JSON escritos por cada worker (pytest-xdist) en un único resumen.
+    """
+    tests: Dict[str, Any] = {}
+    for ruta in sorted(glob.glob(os.path.join(directorio, patron))):
+        try:
+            with open(ruta, "r", encoding="utf-8") as f:
+                tests.update(json.load(f).get("tests", {}))
+        except (OSError, ValueError):
+            continue
+    return {"generado": datetime.now().isoformat(timespec="seconds"), "tests": tests}
+
+
+def lineas_informe(resumen: Dict[str, Any], max_metodos: int = 3) -> List[str]:
+    """
+    Formatea el resumen como líneas de texto para el resumen final de pytest: por test, el porcentaje
+    de tiempo en esperas fijas, auto-esperas, capturas y resto, y los métodos con más tiempo de espera fija.
+    """
+    lineas = [f"{'test':<70} {'total(s)':>9} {'fija%':>6} {'auto%':>6} {'capt%':>6} {'resto%':>7}"]
+    totales = _registro_vacio()
+    for test_id, datos in sorted(resumen.get("tests", {}).items()):
+        total = datos["total"] or 1e-9
+        for clave in ("total",) + CATEGORIAS:
+            totales[clave] += datos[clave]
+        lineas.append(
+            f"{test_id[-70:]:<70} {datos['total']:>9.2f} "
+            f"{100 * datos[CATEGORIA_ESPERA_FIJA] / total:>6.1f} {100 * datos[CATEGORIA_AUTO_ESPERA] / total:>6.1f} "
+            f"{100 * datos[CATEGORIA_CAPTURA] / total:>6.1f} {100 * datos[CATEGORIA_RESTO] / total:>7.1f}"
+        )
+        metodos = sorted(datos.get("metodos", {}).items(),
+                         key=lambda item: item[1][CATEGORIA_ESPERA_FIJA] + item[1][CATEGORIA_CAPTURA], reverse=True)
+        for nombre, m in metodos[:max_metodos]:
+            if m[CATEGORIA_ESPERA_FIJA] + m[CATEGORIA_CAPTURA] > 0:
+                lineas.append(f"    {nombre} x{m['llamadas']}: total {m['total']:.2f}s, espera fija {m[CATEGORIA_ESPERA_FIJA]:.2f}s, "
+                              f"auto-espera {m[CATEGORIA_AUTO_ESPERA]:.2f}s, capturas {m[CATEGORIA_CAPTURA]:.2f}s")
+    if totales["total"] > 0:
+        resto = max(0.0, totales["total"] - sum(totales[c] for c in CATEGORIAS))
+        lineas.append(
+            f"{'TOTAL':<70} {totales['total']:>9.2f} {100 * totales[CATEGORIA_ESPERA_FIJA] / totales['total']:>6.1f} "
+            f"{100 * totales[CATEGORIA_AUTO_ESPERA] / totales['total']:>6.1f} {100 * totales[CATEGORIA_CAPTURA] / totales['total']:>6.1f} "
+            f"{100 * resto / totales['total']:>7.1f}"
+        )
+        lineas.append("auto% incluye expect(), las postcondiciones y las acciones de Locator completas (click, fill, check...); "
+                      "resto% incluye las llamadas a Page/ElementHandle y la navegación, que no se instrumentan.")
+    return lineas
+
+
+# Instancia compartida por proceso (cada worker de pytest-xdist tiene la suya).
+contabilidad_esperas = ContabilidadEsperas()
+
+
+def agregar_historico(resumen: Dict[str, Any], ruta_historico: str) -> None:
+    """
+    Añade una línea JSON al histórico de ejecuciones con el porcentaje de tiempo por categoría de cada
+    test, para seguir su evolución entre ejecuciones.
+    """
+    tests = {}
+    for test_id, datos in resumen.get("tests", {}).items():
+        total = datos["total"] or 1e-9
+        tests[test_id] = {"total": round(datos["total"], 3)}
+        tests[test_id].update({f"{c}_pct": round(100 * datos[c] / total, 1) for c in CATEGORIAS + (CATEGORIA_RESTO,)})
+    os.makedirs(os.path.dirname(ruta_historico), exist_ok=True)
+    with open(ruta_historico, "a", encoding="utf-8") as f:
+        f.write(json.dumps({"generado": resumen.get("generado"), "tests": tests}, ensure_ascii=False) + "\n")
@@ -0,0 +1,43 @@
+import xml.etree.ElementTree as ET # Importa el módulo para trabajar con XML
+from typing import Dict, Iterator, Optional
+
+
+def iterar_registros_xml(xml_file_path: str, etiqueta_registro: str = 'record') -> Iterator[Dict[str, Optional[str]]]:
+    """
+    Recorre un archivo XML de forma incremental con `ET.iterparse` y devuelve cada elemento
+    `etiqueta_registro` como un diccionario 'etiqueta hija -> texto'.
+
+    Cada registro se entrega en cuanto se cierra su etiqueta, sin esperar a que termine el parseo del
+    archivo, y después se libera (junto con los hijos ya procesados de la raíz), de modo que la memoria
+    se mantiene estable sin importar el tamaño del XML. Si una etiqueta hija se repite dentro del
+    registro, prevalece la primera aparición (igual que `Element.find`).
+
+    Args:
+        xml_file_path (str): La ruta al archivo XML.
+        etiqueta_registro (str): La etiqueta de los elementos que representan un registro. Por defecto 'record'.
+
+    Yields:
+        Dict[str, Optional[str]]: El contenido de cada registro.
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe.
+        ET.ParseError: Si el XML está mal formado (puede ocurrir después de haber entregado registros).
+    """
+    raiz: Optional[ET.Element] = None
+    for evento, elemento in ET.iterparse(xml_file_path, events=('start', 'end')):
+        if evento == 'start':
+            if raiz is None:
+                raiz = elemento
+            continue
+        if elemento.tag != etiqueta_registro:
+            continue
+
+        registro: Dict[str, Optional[str]] = {}
+        for hijo in elemento:
+            registro.setdefault(hijo.tag, hijo.text)
+        yield registro
+
+        # Libera el registro procesado y las referencias que la raíz mantiene hacia él.
+        elemento.clear()
+        if raiz is not None and raiz is not elemento:
+            raiz.clear()